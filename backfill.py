@@ -0,0 +1,364 @@
+"""
+Backfill scheduler: scrape several seasons and divisions in one bounded run.
+
+A backfill is the list of (dataset, division, season) store partitions the
+arguments select. Partitions that already have a complete scrape in the
+store are skipped, so an interrupted backfill resumes by running the same
+command again (a partition left behind by a stopped run is scraped again).
+Teams that fail are reported but do not keep a finished partition from
+being marked complete; --force scrapes it again.
+
+Two kinds of source fill a partition:
+
+- TeamSource (D1 schedules): every team page is one (division, season, team)
+  job. Jobs from all partitions share one queue, one set of fetch and parse
+  workers (row_stream) and one token bucket per host, so adding seasons
+  does not raise the request rate. Each partition is written by its own
+  PartitionWriter.
+- PartitionSource (ELO tables, D2 schedules, game logs): a scraper that
+  already schedules and rate limits its own teams; up to --partitions of
+  them run at the same time as the team queue.
+
+Usage:
+    python backfill.py --seasons 2021-2025                 # D1 ELO + schedules
+    python backfill.py --seasons 2024 2025 --divisions D2
+    python backfill.py --seasons 2019-2025 --datasets game_logs --rate 0.5
+    python backfill.py --seasons 2015-2025 --dry-run
+"""
+
+import argparse
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+
+import data_store
+import rate_limit
+import row_stream
+import run_metrics
+
+TEAM_IDS_PATH = './ncaa_team_ids.csv'
+
+
+class TeamSource:
+    """
+    A dataset filled one team page at a time by the shared job queue.
+
+    Parameters:
+    -----------
+    dataset : str
+        Store dataset
+    division : str
+        Division the source covers
+    prepare : callable
+        prepare(season) -> dict with
+        'jobs' ([(team, url), ...]),
+        'parse' (parse(team, response) -> rows),
+        'columns' (column names of the rows) and
+        'transform' (optional PartitionWriter batch transform)
+    """
+
+    def __init__(self, dataset, division, prepare):
+        self.dataset = dataset
+        self.division = division
+        self.prepare = prepare
+
+
+class PartitionSource:
+    """
+    A dataset filled by a scraper that writes a whole partition itself.
+
+    Parameters:
+    -----------
+    dataset, division :
+        See TeamSource
+    run : callable
+        run(season) -> list of (team, error) failures; writes the partition
+    """
+
+    def __init__(self, dataset, division, run):
+        self.dataset = dataset
+        self.division = division
+        self.run = run
+
+
+####################### Sources #######################
+
+# Imported inside each source so --dry-run stays fast
+
+def _elo(season):
+    import scrape_data
+    elo_data = scrape_data.get_elo_data(season)
+    if elo_data is None:
+        raise ValueError(f"No ELO table for {season}")
+    data_store.write_partition(elo_data, 'elo', 'D1', season)
+    return []
+
+def _d1_schedules(season):
+    import schedule_load
+    import scrape_data
+    elo_data = scrape_data.fetch_elo_table(season)
+    if elo_data is None:
+        raise ValueError(f"No ELO table for {season}")
+    elo_by_id = schedule_load.elo_by_team_id(elo_data)
+    return {
+        'jobs': schedule_load.schedule_jobs(elo_data),
+        'parse': schedule_load.parse_schedule_response,
+        'columns': schedule_load.SCHEDULE_COLUMNS,
+        'transform': lambda batch: schedule_load.finish_schedule_rows(batch, elo_by_id, season),
+    }
+
+def _d2_schedules(season):
+    import d2_schedule_scrape
+    _, failed = d2_schedule_scrape.scrape_schedules('D2', season)
+    return failed
+
+def _game_logs(season):
+    import pandas as pd
+    import game_by_game
+    _, failed = game_by_game.harvest_season(pd.read_csv(TEAM_IDS_PATH), season, division='D1')
+    return failed
+
+
+SOURCES = [
+    PartitionSource('elo', 'D1', _elo),
+    TeamSource('schedules', 'D1', _d1_schedules),
+    PartitionSource('schedules', 'D2', _d2_schedules),
+    PartitionSource('game_logs', 'D1', _game_logs),
+]
+
+
+####################### Scheduling #######################
+
+def parse_seasons(values):
+    """['2019-2021', '2024'] -> [2019, 2020, 2021, 2024]"""
+    seasons = set()
+    for value in values:
+        first, _, last = str(value).partition('-')
+        seasons.update(range(int(first), int(last or first) + 1))
+    return sorted(seasons)
+
+
+def plan(seasons, divisions, datasets, force=False, sources=SOURCES):
+    """
+    Split the selected partitions into those to scrape and those already stored.
+
+    Returns:
+    --------
+    tuple: ([(source, season), ...] to scrape, [(source, season), ...] complete)
+    """
+    todo, done = [], []
+    for season in seasons:
+        for source in sources:
+            if source.division not in divisions or source.dataset not in datasets:
+                continue
+            if not force and data_store.complete_scrape_dates(source.dataset, source.division, season):
+                done.append((source, season))
+            else:
+                todo.append((source, season))
+    return todo, done
+
+
+def _label(source, season):
+    return f"{source.dataset}/{source.division}/{season}"
+
+
+def run_team_partitions(partitions, fetch_workers=8, parse_workers=2, rate=4.0, burst=4,
+                        batch_size=5000, queue_size=32):
+    """
+    Scrape TeamSource partitions through one shared job queue.
+
+    Parameters:
+    -----------
+    partitions : list of (TeamSource, season)
+    fetch_workers, parse_workers, queue_size :
+        See row_stream.stream()
+    rate : float
+        Requests per second per host, across every partition
+    burst : int
+        Requests per host allowed back to back
+    batch_size : int
+        Rows per Parquet row group
+
+    Returns:
+    --------
+    dict: {(source, season): (rows written, [(team, error), ...])}
+    """
+    import http_cache
+    import http_client
+
+    session = http_client.make_session(pool_size=fetch_workers)
+    buckets = {}
+    buckets_lock = threading.Lock()
+
+    def bucket(url):
+        host = urlsplit(url).netloc.lower()
+        with buckets_lock:
+            if host not in buckets:
+                buckets[host] = rate_limit.TokenBucket(rate, burst=burst)
+            return buckets[host]
+
+    plans, writers, results = {}, {}, {}
+    for partition in partitions:
+        source, season = partition
+        try:
+            plans[partition] = source.prepare(season)
+        except Exception as e:
+            print(f"[Backfill Error] {_label(source, season)} → {e}")
+            results[partition] = (0, [('*', str(e)[:200])])
+            continue
+        writers[partition] = data_store.PartitionWriter(
+            source.dataset, source.division, season, columns=plans[partition]['columns'],
+            batch_size=batch_size, transform=plans[partition].get('transform'),
+        )
+        print(f"Queued {len(plans[partition]['jobs'])} teams for {_label(source, season)}")
+
+    # Job keys are (dataset, division, season, team); partitions are queued one after another
+    by_key = {(source.dataset, source.division, season): (source, season) for source, season in plans}
+
+    def jobs():
+        for (source, season), partition_plan in plans.items():
+            for team, url in partition_plan['jobs']:
+                yield (source.dataset, source.division, season, team), url
+
+    def fetch(job, url):
+        team = job[3]
+        bucket(url).acquire()
+        with run_metrics.span('fetch', 'backfill', team):
+            response = http_cache.get(url, session=session, timeout=10)
+            response.raise_for_status()
+            return response
+
+    def parse(job, response):
+        return plans[by_key[job[:3]]]['parse'](job[3], response)
+
+    def sink(job, rows):
+        writers[by_key[job[:3]]].write_rows(rows)
+
+    try:
+        streamed = row_stream.stream(jobs(), fetch, parse, sink, fetch_workers=fetch_workers,
+                                     parse_workers=parse_workers, queue_size=queue_size)
+    except BaseException:
+        for writer in writers.values():
+            writer.close(complete=False)
+        raise
+
+    failed = {}
+    for job, error in streamed['failed']:
+        failed.setdefault(by_key[job[:3]], []).append((job[3], error))
+    for partition, writer in writers.items():
+        writer.close()
+        results[partition] = (writer.rows_written, failed.get(partition, []))
+    return results
+
+
+def run_partition(source, season):
+    """Run one PartitionSource under its own metrics stage; returns its failures."""
+    with run_metrics.stage(f'backfill_{source.dataset}_{source.division}'):
+        return source.run(season)
+
+
+def backfill(seasons, divisions=('D1',), datasets=('elo', 'schedules'), force=False,
+             partitions=1, **team_options):
+    """
+    Scrape every selected partition that is not already complete.
+
+    Parameters:
+    -----------
+    seasons : list of int
+    divisions : iterable of str
+    datasets : iterable of str
+    force : bool
+        Scrape complete partitions again
+    partitions : int
+        PartitionSource partitions running at once
+    team_options :
+        Passed to run_team_partitions()
+
+    Returns:
+    --------
+    dict: {'label': [(team, error), ...]} failures per scraped partition
+    """
+    todo, done = plan(seasons, set(divisions), set(datasets), force)
+    for source, season in done:
+        print(f"[skip] {_label(source, season)}: complete in the store")
+
+    team_partitions = [(s, season) for s, season in todo if isinstance(s, TeamSource)]
+    whole_partitions = [(s, season) for s, season in todo if isinstance(s, PartitionSource)]
+    failures = {}
+
+    # Scrapers that own a whole partition run beside the shared team queue
+    with ThreadPoolExecutor(max_workers=max(1, partitions)) as executor:
+        futures = {executor.submit(run_partition, source, season): (source, season)
+                   for source, season in whole_partitions}
+
+        if team_partitions:
+            with run_metrics.stage('backfill'):
+                results = run_team_partitions(team_partitions, **team_options)
+            for (source, season), (rows, failed) in results.items():
+                failures[_label(source, season)] = failed
+                print(f"[done] {_label(source, season)}: {rows} rows, {len(failed)} teams failed")
+
+        for future in as_completed(futures):
+            source, season = futures[future]
+            label = _label(source, season)
+            try:
+                failures[label] = list(future.result() or [])
+                print(f"[done] {label}: {len(failures[label])} teams failed")
+            except Exception as e:
+                failures[label] = [('*', str(e)[:200])]
+                print(f"[fail] {label}: {e}")
+
+    run_metrics.metrics.count('backfill_partitions_skipped', len(done))
+    run_metrics.metrics.count('backfill_partitions_run', len(todo))
+    run_metrics.metrics.count('backfill_teams_failed', sum(len(f) for f in failures.values()))
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Backfill past seasons and divisions into the store.")
+    parser.add_argument('--seasons', nargs='+', required=True, help="seasons or ranges, e.g. 2019-2023 2025")
+    parser.add_argument('--divisions', nargs='+', default=['D1'])
+    parser.add_argument('--datasets', nargs='+', default=['elo', 'schedules'],
+                        help=f"any of {sorted({s.dataset for s in SOURCES})}")
+    parser.add_argument('--force', action='store_true', help='scrape complete partitions again')
+    parser.add_argument('--dry-run', action='store_true', help='show what would be scraped and exit')
+    parser.add_argument('--workers', type=int, default=8, help='concurrent team page fetches')
+    parser.add_argument('--rate', type=float, default=4.0, help='requests per second per host')
+    parser.add_argument('--burst', type=int, default=4)
+    parser.add_argument('--partitions', type=int, default=1,
+                        help='whole-partition scrapers (D2 schedules, game logs) running at once')
+    args = parser.parse_args(argv)
+
+    try:
+        seasons = parse_seasons(args.seasons)
+    except ValueError:
+        print(f"Could not read seasons {args.seasons}; use years or ranges like 2019-2023")
+        return 2
+
+    if args.dry_run:
+        todo, done = plan(seasons, set(args.divisions), set(args.datasets), args.force)
+        for source, season in todo:
+            kind = 'teams' if isinstance(source, TeamSource) else 'partition'
+            print(f"[scrape] {_label(source, season)} ({kind})")
+        for source, season in done:
+            print(f"[skip]   {_label(source, season)}")
+        return 0
+
+    failures = backfill(seasons, args.divisions, args.datasets, force=args.force,
+                        partitions=args.partitions, fetch_workers=args.workers,
+                        rate=args.rate, burst=args.burst)
+    run_metrics.write()
+
+    failed = {label: teams for label, teams in failures.items() if teams}
+    if failed:
+        print(f"\nFailures in {len(failed)} partitions:")
+        for label, teams in failed.items():
+            shown = ', '.join(team for team, _ in teams[:5])
+            print(f"  {label}: {len(teams)} ({shown}{', ...' if len(teams) > 5 else ''})")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
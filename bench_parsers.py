@@ -0,0 +1,294 @@
+"""
+Offline parser benchmark over recorded HTML pages.
+
+Every parser is run against the saved pages in bench_fixtures/ (no network)
+and timed on the best of --repeat passes. For each parser it reports
+
+- rows/sec and ms/page over the whole corpus,
+- peak traced memory per page (tracemalloc, worst page), and
+- blocks still allocated after a page is parsed while its rows are alive
+  (CPython has no per-call allocation counter; retained blocks are the
+  closest stable number tracemalloc gives).
+
+bench_fixtures/baseline.json stores the last accepted numbers. A parser
+fails the check when its rows/sec drops, or its peak memory grows, by more
+than --tolerance, or when it returns a different number of rows (a parser
+backend swap must not change the output).
+
+Usage:
+    python bench_parsers.py --record sidearm_v1 URL --team Augusta
+    python bench_parsers.py                      # compare against the baseline
+    python bench_parsers.py presto_card --repeat 10
+    python bench_parsers.py --backend soup       # force the BeautifulSoup fallbacks
+    python bench_parsers.py --save-baseline
+"""
+
+import argparse
+import gc
+import json
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench_fixtures')
+FIXTURES_NAME = 'fixtures.json'
+BASELINE_NAME = 'baseline.json'
+
+
+####################### Parsers #######################
+
+# Each entry takes (html, team_name) and returns the parsed rows (anything
+# with a len()). Modules are imported on first use so one broken parser
+# does not stop the others from running.
+
+def _soup(html):
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(html, 'html.parser')
+
+def _sidearm(version):
+    def parse(html, team_name):
+        import d2_schedule_scrape
+        return getattr(d2_schedule_scrape, f'parse_soup_{version}')(_soup(html), team_name)
+    return parse
+
+_presto = None
+
+def _presto_method(name):
+    def parse(html, team_name):
+        global _presto
+        import d2_schedule_scrape
+        if _presto is None:
+            _presto = d2_schedule_scrape.PrestoScraper({}, standardize_names=True)
+        return getattr(_presto, name)(_soup(html), team_name)
+    return parse
+
+def _warrennolan_schedule(html, team_name):
+    import schedule_load
+    return schedule_load.parse_schedule_page(team_name, html)
+
+def _warrennolan_rankings(html, team_name):
+    import scrape_data
+    return scrape_data.parse_warrennolan_table(html, ["RPI", "Team", "Conference"])
+
+def _warrennolan_elo(html, team_name):
+    import scrape_data
+    parsed = scrape_data.parse_elo_table(html)
+    return parsed[1] if parsed else []
+
+def _ncaa_stat_table(html, team_name):
+    import paginated_table
+    parsed = paginated_table.parse_table_page(_soup(html), with_links=True)
+    return paginated_table.table_dataframe(*parsed) if parsed else []
+
+
+PARSERS = {
+    'sidearm_v1': _sidearm('v1'),
+    'sidearm_v2': _sidearm('v2'),
+    'sidearm_v3': _sidearm('v3'),
+    'presto_table': _presto_method('_parse_presto_table_schedule'),
+    'presto_card': _presto_method('_parse_presto_card_schedule'),
+    'presto_div': _presto_method('_parse_presto_div_schedule'),
+    'presto_tbody': _presto_method('_parse_presto_tbody_schedule'),
+    'presto_direct': _presto_method('_parse_presto_direct_event_row_schedule'),
+    'warrennolan_schedule': _warrennolan_schedule,
+    'warrennolan_rankings': _warrennolan_rankings,
+    'warrennolan_elo': _warrennolan_elo,
+    'ncaa_stat_table': _ncaa_stat_table,
+}
+
+
+####################### Fixtures #######################
+
+def load_fixtures(fixture_dir=FIXTURE_DIR):
+    """{parser: [(team_name, html), ...]} for every recorded page."""
+    path = os.path.join(fixture_dir, FIXTURES_NAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        index = json.load(f)
+
+    corpus = {}
+    for entry in index:
+        with open(os.path.join(fixture_dir, entry['file']), encoding='utf-8') as f:
+            corpus.setdefault(entry['parser'], []).append((entry.get('team', ''), f.read()))
+    return corpus
+
+
+def record_fixture(parser, url, team_name='', fixture_dir=FIXTURE_DIR):
+    """Fetch url once and add it to the corpus for parser."""
+    import http_cache
+
+    if parser not in PARSERS:
+        raise ValueError(f"Unknown parser {parser!r}. Available: {list(PARSERS)}")
+
+    response = http_cache.get(url, headers={"User-Agent": "Mozilla/5.0"})
+    response.raise_for_status()
+
+    slug = re.sub(r'[^A-Za-z0-9]+', '_', team_name or url.split('//', 1)[-1]).strip('_')[:60]
+    rel_path = os.path.join(parser, f'{slug}.html')
+    os.makedirs(os.path.join(fixture_dir, parser), exist_ok=True)
+    with open(os.path.join(fixture_dir, rel_path), 'w', encoding='utf-8') as f:
+        f.write(response.text)
+
+    index_path = os.path.join(fixture_dir, FIXTURES_NAME)
+    index = []
+    if os.path.exists(index_path):
+        with open(index_path) as f:
+            index = json.load(f)
+    index = [e for e in index if e['file'] != rel_path]
+    index.append({'parser': parser, 'file': rel_path, 'team': team_name, 'url': url})
+    with open(index_path, 'w') as f:
+        json.dump(index, f, indent=1)
+
+    rows = len(PARSERS[parser](response.text, team_name))
+    print(f"Recorded {rel_path} ({len(response.text) / 1024:.0f} KB, {rows} rows)")
+    return rel_path
+
+
+####################### Measuring #######################
+
+def _memory(parse, pages):
+    """(worst peak KB, worst retained blocks) over the pages."""
+    peak_kb, retained = 0.0, 0
+    tracemalloc.start()
+    try:
+        for team_name, html in pages:
+            gc.collect()
+            tracemalloc.reset_peak()
+            before = tracemalloc.take_snapshot()
+            base, _ = tracemalloc.get_traced_memory()
+            rows = parse(html, team_name)
+            _, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename')
+                         if stat.count_diff > 0)
+            del rows
+            peak_kb = max(peak_kb, (peak - base) / 1024)
+            retained = max(retained, blocks)
+    finally:
+        tracemalloc.stop()
+    return peak_kb, retained
+
+
+def measure(parse, pages, repeat=5):
+    """
+    Benchmark one parser over its pages.
+
+    Returns:
+    --------
+    dict: pages, rows, rows_per_sec, ms_per_page, peak_kb, retained_blocks
+    """
+    rows = sum(len(parse(html, team_name)) for team_name, html in pages)  # warm-up
+
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        for team_name, html in pages:
+            parse(html, team_name)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    peak_kb, retained = _memory(parse, pages)
+    return {
+        'pages': len(pages),
+        'rows': rows,
+        'rows_per_sec': rows / best if best else 0.0,
+        'ms_per_page': best * 1000 / len(pages),
+        'peak_kb': peak_kb,
+        'retained_blocks': retained,
+    }
+
+
+def compare(result, baseline, tolerance):
+    """Reasons result is a regression against baseline (empty if it is not)."""
+    if baseline is None:
+        return []
+    problems = []
+    if result['rows'] != baseline['rows']:
+        problems.append(f"rows {baseline['rows']} -> {result['rows']}")
+    if result['rows_per_sec'] < baseline['rows_per_sec'] * (1 - tolerance):
+        problems.append(f"rows/sec {baseline['rows_per_sec']:.0f} -> {result['rows_per_sec']:.0f}")
+    if result['peak_kb'] > baseline['peak_kb'] * (1 + tolerance):
+        problems.append(f"peak {baseline['peak_kb']:.0f} KB -> {result['peak_kb']:.0f} KB")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the HTML parsers on recorded pages.")
+    parser.add_argument('parsers', nargs='*', help='only these parsers (default: all with fixtures)')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed slowdown / memory growth as a fraction of the baseline')
+    parser.add_argument('--backend', choices=['auto', 'soup'], default='auto',
+                        help='soup disables the lxml fast paths')
+    parser.add_argument('--save-baseline', action='store_true', help='accept these numbers')
+    parser.add_argument('--record', nargs=2, metavar=('PARSER', 'URL'), help='add a page to the corpus')
+    parser.add_argument('--team', default='', help='team name for --record')
+    parser.add_argument('--fixtures', default=FIXTURE_DIR)
+    args = parser.parse_args(argv)
+
+    if args.record:
+        record_fixture(args.record[0], args.record[1], args.team, args.fixtures)
+        return 0
+
+    if args.backend == 'soup':
+        import fast_parse
+        fast_parse.AVAILABLE = False
+
+    corpus = load_fixtures(args.fixtures)
+    names = args.parsers or [name for name in PARSERS if name in corpus]
+    if not names:
+        print(f"No fixtures in {args.fixtures}; add pages with --record PARSER URL")
+        return 1
+
+    baseline_path = os.path.join(args.fixtures, BASELINE_NAME)
+    baselines = {}
+    if os.path.exists(baseline_path):
+        with open(baseline_path) as f:
+            baselines = json.load(f)
+
+    results, regressions = {}, {}
+    print(f"{'parser':<22} {'pages':>5} {'rows':>6} {'rows/s':>9} {'ms/page':>8} {'peak KB':>8} {'blocks':>7}")
+    for name in names:
+        if name not in PARSERS:
+            print(f"{name:<22} unknown parser")
+            continue
+        if name not in corpus:
+            print(f"{name:<22} no fixtures")
+            continue
+
+        key = f"{name}[{args.backend}]"
+        try:
+            result = measure(PARSERS[name], corpus[name], args.repeat)
+        except Exception as e:
+            print(f"{name:<22} failed: {e}")
+            regressions[key] = [f"failed: {e}"]
+            continue
+
+        results[key] = result
+        print(f"{name:<22} {result['pages']:>5} {result['rows']:>6} {result['rows_per_sec']:>9.0f} "
+              f"{result['ms_per_page']:>8.2f} {result['peak_kb']:>8.0f} {result['retained_blocks']:>7}")
+        problems = compare(result, baselines.get(key), args.tolerance)
+        if problems:
+            regressions[key] = problems
+
+    if args.save_baseline:
+        baselines.update(results)
+        with open(baseline_path, 'w') as f:
+            json.dump(baselines, f, indent=1, sort_keys=True)
+        print(f"\nSaved {len(results)} baselines to {baseline_path}")
+        return 0
+
+    if regressions:
+        print(f"\nRegressions against {baseline_path}:")
+        for key, problems in regressions.items():
+            print(f"  {key}: {'; '.join(problems)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
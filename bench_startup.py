@@ -0,0 +1,117 @@
+"""
+Startup benchmark: how long each module takes to import.
+
+Every module is imported in a fresh interpreter with `python -X importtime`,
+so nothing is shared between measurements. Importing a module must not
+scrape anything, so this also catches run code that slipped out of a
+`if __name__ == "__main__":` block (the import would take seconds, not
+milliseconds).
+
+Usage:
+    python bench_startup.py                      # every module, best of 3
+    python bench_startup.py scrape_data --top 15
+    python bench_startup.py --budget-ms 800      # exit 1 if a module is slower
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+MODULES = [
+    'http_client', 'http_cache', 'rate_limit', 'fetch_engine', 'fast_parse',
+    'paginated_table', 'data_store', 'row_stream', 'schedule_snapshot', 'team_registry',
+    'driver_pool', 'scraper_meta', 'sidearm_data', 'logo_assets',
+    'scrape_data', 'schedule_load', 'game_by_game', 'logo_pull', 'd2_schedule_scrape',
+]
+
+# "import time:       412 |       1337 |   pandas.core"
+IMPORT_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def measure(module, python=sys.executable):
+    """
+    Import module once in a fresh interpreter.
+
+    Returns:
+    --------
+    tuple: (total_us, {package: cumulative_us} for the module's direct imports),
+    or (None, error text) if the import failed
+    """
+    proc = subprocess.run(
+        [python, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    if proc.returncode != 0:
+        lines = proc.stderr.strip().splitlines()
+        return None, lines[-1] if lines else f'exit code {proc.returncode}'
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            rows.append((int(match.group(2)), len(match.group(3)), match.group(4)))
+
+    # importtime prints children before their parent; the module's own line
+    # comes last and its direct imports are one indent level deeper
+    children = {}
+    for i in range(len(rows) - 1, -1, -1):
+        total, depth, package = rows[i]
+        if package != module:
+            continue
+        for cumulative, indent, child in reversed(rows[:i]):
+            if indent <= depth:
+                break
+            if indent == depth + 2:
+                children[child] = cumulative
+        return total, children
+    return 0, children
+
+
+def best_of(module, repeat):
+    """Fastest of repeat runs (the rest is disk cache and scheduler noise)."""
+    best = None
+    for _ in range(repeat):
+        total, children = measure(module)
+        if total is None:
+            return total, children
+        if best is None or total < best[0]:
+            best = (total, children)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('modules', nargs='*', default=MODULES)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--top', type=int, default=5, help='heaviest direct imports to list')
+    parser.add_argument('--budget-ms', type=float, help='fail if any module imports slower than this')
+    args = parser.parse_args(argv)
+
+    over_budget = []
+    failed = []
+    print(f"{'module':<22} {'import ms':>10}  heaviest direct imports")
+    for module in args.modules:
+        total, children = best_of(module, args.repeat)
+        if total is None:
+            failed.append(module)
+            print(f"{module:<22} {'failed':>10}  {children}")
+            continue
+
+        heaviest = sorted(children.items(), key=lambda item: item[1], reverse=True)[:args.top]
+        detail = ', '.join(f"{name} {us / 1000:.0f}" for name, us in heaviest)
+        print(f"{module:<22} {total / 1000:>10.1f}  {detail}")
+        if args.budget_ms is not None and total / 1000 > args.budget_ms:
+            over_budget.append(module)
+
+    if failed:
+        print(f"\n{len(failed)} modules failed to import: {', '.join(failed)}")
+    if over_budget:
+        print(f"\nOver the {args.budget_ms:.0f} ms budget: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,1079 +1,65 @@
+import argparse
+import sys
 from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
+import os
+import threading
 import pandas as pd
 import re
 import requests
 from requests.exceptions import HTTPError
 from functools import lru_cache
-from typing import Optional
 from datetime import datetime
+from urllib.parse import urlsplit
 import warnings
-import pytz
+import http_cache
+import http_client
+import fetch_engine
+import paginated_table
+import schedule_snapshot
+import data_store
+import team_registry
+import driver_pool
+import sidearm_data
+import scraper_meta
+import run_metrics
+from team_registry import TEAM_NAME_MAPPING
 warnings.filterwarnings('ignore')
-session = requests.Session()
-
-cst = pytz.timezone('America/Chicago')
-formatted_date = datetime.now(cst).strftime('%m_%d_%Y')
-current_season = datetime.today().year
-comparison_date = pd.to_datetime(formatted_date, format="%m_%d_%Y")
-
-# Mapping dictionary: scraped name variations -> standardized accepted names
-TEAM_NAME_MAPPING = {
-    # Adams State variations
-    'Adams State': 'Adams St.',
-    'Adams State University': 'Adams St.',
-    
-    # Adelphi
-    'Adelphi University': 'Adelphi',
-    
-    # Alabama A&M
-    'Alabama A&M': 'Alabama A&M',
-    'Alabama A&M University': 'Alabama A&M',
-    
-    # Alabama Huntsville
-    'Alabama Huntsville': 'UAH',
-    'The University of Alabama in Huntsville': 'UAH',
-    'University of Alabama in Huntsville': 'UAH',
-    'Alabama-Huntsville': 'UAH',
-    'Alabama - Huntsville': 'UAH',
-    
-    # Albany State
-    'Albany State': 'Albany St. (GA)',
-    'Albany State University': 'Albany St. (GA)',
-    
-    # American International
-    'American International': "American Int'l",
-    'American International College': "American Int'l",
-    
-    # Anderson
-    'Anderson': 'Anderson (SC)',
-    'Anderson University (SC)': 'Anderson (SC)',
-    'Anderson (S.C.)': 'Anderson (SC)',
-    
-    # Angelo State
-    'Angelo State': 'Angelo St.',
-    'Angelo State University': 'Angelo St.',
-    
-    # Arkansas Fort Smith
-    'Ark. - Fort Smith': 'Ark.-Fort Smith',
-    'Arkansas Fort Smith': 'Ark.-Fort Smith',
-    'Arkansas-Fort Smith': 'Ark.-Fort Smith',
-    'University of Arkansas Fort Smith': 'Ark.-Fort Smith',
-    'University of Arkansas-Fort Smith': 'Ark.-Fort Smith',
-    'Arkansas- Fort Smith': 'Ark.-Fort Smith',
-    'UA-Fort Smith': 'Ark.-Fort Smith',
-    
-    # Arkansas Monticello
-    'Arkansas Monticello': 'Ark.-Monticello',
-    'Arkansas-Monticello': 'Ark.-Monticello',
-    'Arkansas - Monticello': 'Ark.-Monticello',
-    'University of Arkansas at Monticello': 'Ark.-Monticello',
-    'Arkansas-Monticello (7)': 'Ark.-Monticello',
-    
-    # Arkansas Tech
-    'Arkansas Tech University': 'Arkansas Tech',
-    'Arkansas Tech (7)': 'Arkansas Tech',
-    
-    # Ashland
-    'Ashland (OH)': 'Ashland',
-    'Ashland University': 'Ashland',
-    
-    # Assumption
-    'Assumption (MA)': 'Assumption',
-    'Assumption University': 'Assumption',
-    
-    # Auburn Montgomery
-    'Auburn Montgomery': 'AUM',
-    'Auburn University Montgomery': 'AUM',
-    'Auburn University Montgomery (Ala.)': 'AUM',
-    
-    # Augusta
-    'Augusta University': 'Augusta',
-    
-    # Augustana
-    'Augustana': 'Augustana (SD)',
-    'Augustana (S.D.)': 'Augustana (SD)',
-    'Augustana University': 'Augustana (SD)',
-    'Augustana University (SD)': 'Augustana (SD)',
-    
-    # Azusa Pacific
-    'Azusa Pacific Cougars': 'Azusa Pacific',
-    'Azusa Pacific University': 'Azusa Pacific',
-    'APU': 'Azusa Pacific',
-    
-    # Barry
-    'Barry University': 'Barry',
-    
-    # Barton
-    'Barton College': 'Barton',
-    
-    # Belmont Abbey
-    'Belmont Abbey College': 'Belmont Abbey',
-    
-    # Bemidji State
-    'Bemidji State': 'Bemidji St.',
-    'Bemidji State University': 'Bemidji St.',
-    
-    # Benedict
-    'Benedict College': 'Benedict',
-    
-    # Bentley
-    'Bentley University': 'Bentley',
-    
-    # Biola
-    'Biola Eagles': 'Biola',
-    'Biola University (Calif.)': 'Biola',
-    
-    # Bloomfield
-    'Bloomfield College': 'Bloomfield',
-    'Bloomfield (NJ)': 'Bloomfield',
-    
-    # Bloomsburg
-    'Bloomsburg University': 'Bloomsburg',
-    
-    # Bluefield State
-    'Bluefield State': 'Bluefield St.',
-    'Bluefield State University': 'Bluefield St.',
-
-    # Bridgeport
-    'University of Bridgeport': 'Bridgeport',
-    
-    # Cal State variations
-    'CSU San Bernardino': 'CSUSB',
-    'Cal State San Bernardino': 'CSUSB',
-    'Cal State University San Bernardino': 'CSUSB',
-    'California State University, San Bernardino': 'CSUSB',
-    
-    'CSU San Marcos': 'Cal St. San Marcos',
-    'Cal State San Marcos': 'Cal St. San Marcos',
-    
-    'Cal State Dominguez Hills': 'Cal St. Dom. Hills',
-    'California State University, Dominguez Hills': 'Cal St. Dom. Hills',
-    'Seed Cal State Dominguez Hills': 'Cal St. Dom. Hills',
-    
-    'Cal State East Bay': 'Cal St. East Bay',
-    
-    'Cal State Los Angeles': 'Cal State LA',
-    'California State University, Los Angeles': 'Cal State LA',
-    'CSU Los Angeles': 'Cal State LA',
-    
-    'Cal State Monterey Bay': 'Cal St. Monterey Bay',
-    'California State University Monterey Bay': 'Cal St. Monterey Bay',
-    'Seed Cal State Monterey Bay': 'Cal St. Monterey Bay',
-    'CSU Monterey Bay': 'Cal St. Monterey Bay',
-
-    'Seed Cal State San Marcos': 'Cal St. San Marcos',
-    
-    'Cal State Stanislaus': 'Stanislaus St.',
-    'Stanislaus State': 'Stanislaus St.',
-    
-    # Caldwell
-    'Caldwell University': 'Caldwell',
-    
-    # California PA
-    'California (Pa.)': 'California (PA)',
-    'California University of Pennsylvania': 'California (PA)',
-    
-    # Cameron
-    'Cameron University': 'Cameron',
-    
-    # Carson-Newman
-    'Carson-Newman': 'Carson-Newman',
-    'Carson-Newman University': 'Carson-Newman',
-    
-    # Catawba
-    'Catawba College': 'Catawba',
-    
-    # Cedarville
-    'Cedarville University': 'Cedarville',
-    
-    # Central Missouri
-    'Central Missouri': 'Central Mo.',
-    'University of Central Missouri': 'Central Mo.',
-    
-    # Central Oklahoma
-    'Central Oklahoma': 'Central Okla.',
-    'University of Central Oklahoma': 'Central Okla.',
-    
-    # Central Washington
-    'Central Washington': 'Central Wash.',
-    'Central Washington University': 'Central Wash.',
-    
-    # Chaminade
-    'Chaminade Silverswords': 'Chaminade',
-    'Chaminade University': 'Chaminade',
-    'Chaminade (Hawaii)': 'Chaminade',
-    
-    # Charleston WV
-    'Concord University': 'Concord',
-    'University of Charleston': 'Charleston (WV)',
-    'University of Charleston (WV)': 'Charleston (WV)',
-    'Charleston': 'Charleston (WV)',
-    'Charleston (W.V)': 'Charleston (WV)',
-    'RV Charleston (W.V)': 'Charleston (WV)',
-    
-    # Chestnut Hill
-    'Chestnut Hill College': 'Chestnut Hill',
-    
-    # Chico State
-    'Chico State': 'Chico St.',
-    
-    # Chowan
-    'Chowan University': 'Chowan',
-    
-    # Christian Brothers
-    'Christian Brothers University': 'Christian Brothers',
-    
-    # Claflin
-    'Claflin University': 'Claflin',
-    
-    # Clarion
-    'Clarion University': 'Clarion',
-    
-    # Clark Atlanta
-    'Clark Atlanta University': 'Clark Atlanta',
-    'Clark-Atlanta University': 'Clark Atlanta',
-    
-    # Coker
-    'Coker': 'Coker',
-    'Coker University': 'Coker',
-    
-    # Colorado Christian
-    'Colorado Christian': 'Colo. Christian',
-    'Colorado Christian University': 'Colo. Christian',
-    
-    # Colorado Mesa
-    'Colorado Mesa University': 'Colorado Mesa',
-    
-    # Colorado School of Mines
-    'Colorado School of Mines': 'Colo. Sch. of Mines',
-    'Mines': 'Colo. Sch. of Mines',
-    
-    # Colorado State Pueblo
-    'Colorado State Pueblo': 'CSU Pueblo',
-    'Colorado State University Pueblo': 'CSU Pueblo',
-    
-    # Columbus State
-    'Columbus State': 'Columbus St.',
-    'Columbus State University': 'Columbus St.',
-    
-    # Concordia
-    'Concordia': 'CUI',
-    'Concordia Golden Eagles': 'CUI',
-    'Concordia University Irvine': 'CUI',
-    
-    # Concordia St. Paul
-    'Concordia - St. Paul': 'Concordia-St. Paul',
-    'Concordia University, St. Paul': 'Concordia-St. Paul',
-    'Concordia, St. Paul': 'Concordia-St. Paul',
-    
-    # D'Youville
-    "D'Youville University": "D'Youville",
-    
-    # Davenport
-    'Davenport University': 'Davenport',
-    
-    # Davis & Elkins
-    'Davis & Elkins College': 'Davis & Elkins',
-    
-    # Delta State
-    'Delta State': 'Delta St.',
-    'Delta State University': 'Delta St.',
-    
-    # Dominican
-    'Dominican (NY)': 'Dominican (NY)',
-    'Dominican (NY) University': 'Dominican (NY)',
-    'Dominican University': 'Dominican (NY)',
-    'Dominican University of New York': 'Dominican (NY)',
-    'Dominican': 'Dominican (NY)',
-    'Dominican (N.Y.)': 'Dominican (NY)',
-    'NDominican (N.Y.)': 'Dominican (NY)',
-
-    # Drury
-    'Drury University': 'Drury',
-    
-    # East Central
-    'East Central University': 'East Central',
-    'East Central (7)': 'East Central',
-    
-    # East Stroudsburg
-    'East Stroudsburg University': 'East Stroudsburg',
-    
-    # Eastern New Mexico
-    'Eastern New Mexico': 'Eastern N.M.',
-    'Eastern New Mexico University': 'Eastern N.M.',
-    
-    # Eckerd
-    'Eckerd College': 'Eckerd',
-    
-    # Edward Waters
-    'Edward Waters University': 'Edward Waters',
-    
-    # Embry-Riddle
-    'Embry-Riddle': 'Embry-Riddle (FL)',
-    'Embry-Riddle (Fla.)': 'Embry-Riddle (FL)',
-    'Embry-Riddle University (Fla.)': 'Embry-Riddle (FL)',
-    
-    # Emmanuel
-    'Emmanuel': 'Emmanuel (GA)',
-    'Emmanuel (Ga.)': 'Emmanuel (GA)',
-    'Emmanuel University (Ga.)': 'Emmanuel (GA)',
-    'Emmanuel University': 'Emmanuel (GA)',
-
-    # Emory & Henry
-    'Emory & Henry College': 'Emory & Henry',
-    'Emory & Henry University': 'Emory & Henry',
-
-    # Emporia State
-    'Emporia State': 'Emporia St.',
-    'Emporia State (Kan.)': 'Emporia St.',
-    'Emporia State University': 'Emporia St.',
-    
-    # Erskine
-    'Erskine College': 'Erskine',
-    
-    # Fairmont State
-    'Fairmont State': 'Fairmont St.',
-    'Fairmont State University': 'Fairmont St.',
-    
-    # Felician
-    'Felician University': 'Felician',
-    'NFelician': 'Felician',
-    
-    # Findlay
-    'University of Findlay': 'Findlay',
-    
-    # Florida Southern
-    'Florida Southern': 'Fla. Southern',
-    'Florida Southern College': 'Fla. Southern',
-    
-    # Florida Tech
-    'Florida Tech': 'Florida Tech',
-    
-    # Flagler
-    'Flagler College': 'Flagler',
-    
-    # Fort Hays State
-    'Fort Hays State': 'Fort Hays St.',
-    'Fort Hays State (Kan.)': 'Fort Hays St.',
-    'Fort Hays State University': 'Fort Hays St.',
-    
-    # Francis Marion
-    'Francis Marion University': 'Francis Marion',
-    
-    # Franklin Pierce
-    'Franklin Pierce University': 'Franklin Pierce',
-    
-    # Fresno Pacific
-    'Fresno Pacific Sunbirds': 'Fresno Pacific',
-    'Fresno Pacific University (Calif.)': 'Fresno Pacific',
-    'FPU': 'Fresno Pacific',
-    
-    # Frostburg State
-    'Frostburg State': 'Frostburg St.',
-    'Frostburg State (MD) University': 'Frostburg St.',
-    'Frostburg State University': 'Frostburg St.',
-    
-    # Gannon
-    'Gannon University': 'Gannon',
-    'Gannon (Pa.)': 'Gannon',
-    
-    # Georgia Southwestern
-    'Georgia Southwestern': 'Ga. Southwestern',
-    'Georgia Southwestern State': 'Ga. Southwestern',
-    'Georgia Southwestern State University': 'Ga. Southwestern',
-    
-    # GCSU
-    'GCSU': 'Georgia College',
-    'Georgia College and State University': 'Georgia College',
-    
-    # Georgian Court
-    'Georgian Court University': 'Georgian Court',
-    
-    # Glenville State
-    'Glenville State': 'Glenville St.',
-    'Glenville State University': 'Glenville St.',
-    
-    # Goldey-Beacom
-    'Goldey Beacom College': 'Goldey-Beacom',
-    'Goldey-Beacom College': 'Goldey-Beacom',
-    
-    # Grand Valley State
-    'Grand Valley State': 'Grand Valley St.',
-    'Grand Valley State University': 'Grand Valley St.',
-    'Grand Valley': 'Grand Valley St.',
-    
-    # Harding
-    'Harding (Ark.)': 'Harding',
-    'Harding University': 'Harding',
-    'Harding (7)': 'Harding',
-    
-    # Hawaii Hilo
-    "Hawai'i Hilo": 'Hawaii Hilo',
-    "Hawai'i": 'Hawaii Hilo',
-    'Hawaii at Hilo': 'Hawaii Hilo',
-    'University of Hawaii at Hilo': 'Hawaii Hilo',
-    'Hawaii-Hilo': 'Hawaii Hilo',
-    'UHH': 'Hawaii Hilo',
-    'University of Hawaii': 'Hawaii Hilo',
-    
-    # Hawaii Pacific
-    "Hawai'i Pacific": 'Hawaii Pacific',
-    'Hawaii Pacific University': 'Hawaii Pacific',
-    'HPU Sharks': 'Hawaii Pacific',
-    
-    # Henderson State
-    'Henderson State': 'Henderson St.',
-    'Henderson State University': 'Henderson St.',
-    'Henderson State (7)': 'Henderson St.',
-
-    # Hillsdale
-    'Hillsdale College': 'Hillsdale',
-    'Hillsdale': 'Hillsdale',
-
-    # Holy Family
-    'Holy Family University': 'Holy Family',
-    
-    # Illinois Springfield
-    'Illinois Springfield': 'Ill. Springfield',
-    'Illinois-Springfield': 'Ill. Springfield',
-    'University of Illinois Springfield': 'Ill. Springfield',
-    'Ill.-Springfield': 'Ill. Springfield',
-    
-    # Indiana PA
-    'Indiana (Pa.)': 'Indiana (PA)',
-    'Indiana University (PA)': 'Indiana (PA)',
-    'Indiana University (Pa.)': 'Indiana (PA)',
-    'Indiana University of Pennsylvania': 'Indiana (PA)',
-    'IUP': 'Indiana (PA)',
-    
-    # Indianapolis
-    'Indianapolis': 'UIndy',
-    'University of Indianapolis': 'UIndy',
-    
-    # Jefferson
-    'Jefferson University': 'Jefferson',
-    'Jefferson (Pa.)': 'Jefferson',
-    'SJefferson': 'Jefferson',
-    
-    # Kentucky State
-    'Kentucky State': 'Kentucky St.',
-    'Kentucky State University': 'Kentucky St.',
-    
-    # Kentucky Wesleyan
-    'Kentucky Wesleyan': 'Ky. Wesleyan',
-    'Kentucky Wesleyan College': 'Ky. Wesleyan',
-    
-    # King
-    'King': 'King (TN)',
-    'King (Tenn.)': 'King (TN)',
-    'King University (Tenn.)': 'King (TN)',
-    'King University': 'King (TN)',
-    
-    # Kutztown
-    'Kutztown University': 'Kutztown',
-    
-    # Lake Erie
-    'Lake Erie': 'Lake Erie',
-    'Lake Erie College': 'Lake Erie',
-    
-    # Lander
-    'Lander University': 'Lander',
-    
-    # Lane
-    'Lane College': 'Lane',
-    
-    # LeMoyne-Owen
-    'LeMoyne-Owen College': 'LeMoyne-Owen',
-    
-    # Lee
-    'Lee (Tenn.)': 'Lee',
-    'Lee University': 'Lee',
-    'Lee University (Tenn.)': 'Lee',
-    
-    # Lenoir-Rhyne
-    'Lenoir-Rhyne (NC) University': 'Lenoir-Rhyne',
-    'Lenoir-Rhyne University': 'Lenoir-Rhyne',
-    'Lenoir Rhyne University': 'Lenoir-Rhyne',
-    
-    # Lewis
-    'Lewis University': 'Lewis',
-    
-    # Limestone
-    'Limestone University': 'Limestone',
-    
-    # Lincoln MO
-    'Lincoln University of Missouri': 'Lincoln (MO)',
-    'Lincoln': 'Lincoln (MO)',
-    
-    # Lincoln PA
-    'Lincoln (Pa.)': 'Lincoln (PA)',
-    'Lincoln University': 'Lincoln (PA)',
-    'Lincoln University (Pa.)': 'Lincoln (PA)',
-    
-    # Lincoln Memorial
-    'Lincoln Memorial University': 'Lincoln Memorial',
-    
-    # Lock Haven
-    'Lock Haven University': 'Lock Haven',
-
-    # Lubbock Christian
-    'Lubbock Christian University (Texas)': 'Lubbock Christian',
-    'Lubbock Christian University': 'Lubbock Christian',
-    
-    # Lynn
-    'Lynn University': 'Lynn',
-    
-    # Malone
-    'Malone University': 'Malone',
-    'Malone (OH) University': 'Malone',
-    
-    # Mansfield
-    'Mansfield University': 'Mansfield',
-    
-    # Mars Hill
-    'Mars Hill': 'Mars Hill',
-    'Mars Hill University': 'Mars Hill',
-    
-    # Mary
-    'Mary (N.D.)': 'Mary',
-    'UMary': 'Mary',
-    'UMary (N.D.)': 'Mary',
-    'University of Mary': 'Mary',
-    
-    # Maryville
-    'Maryville': 'Maryville (MO)',
-    'Maryville University': 'Maryville (MO)',
-    'Maryville (Mo.)': 'Maryville (MO)',
-    
-    # McKendree
-    'McKendree University': 'McKendree',
-    
-    # Menlo
-    'Menlo College': 'Menlo',
-    'Menlo Oaks': 'Menlo',
-    
-    # Mercy
-    'Mercy University': 'Mercy',
-    
-    # Metropolitan State Denver
-    'Metropolitan State - Denver': 'MSU Denver',
-    'Metropolitan State University of Denver': 'MSU Denver',
-    'Metro State': 'MSU Denver',
-    
-    # Miles
-    'Miles College': 'Miles',
-    
-    # Millersville
-    'Millersville University': 'Millersville',
-    
-    # Minnesota Crookston
-    'Minnesota Crookston': 'Minn.-Crookston',
-    'Minnesota-Crookston': 'Minn.-Crookston',
-    'University of Minnesota Crookston': 'Minn.-Crookston',
-    
-    # Minnesota Duluth
-    'Minnesota Duluth': 'Minn. Duluth',
-    'University of Minnesota Duluth': 'Minn. Duluth',
-    
-    # Minnesota State
-    'Minnesota State': 'Minnesota St.',
-    'University of Minnesota State, Mankato': 'Minnesota St.',
-    'Minnesota State Mankato': 'Minnesota St.',
-    'Minnesota State - Mankato': 'Minnesota St.',
-    'Minnesota State University': 'Minnesota St.',
-    'Minnesota State, Mankato': 'Minnesota St.',
-    
-    # Minot State
-    'Minot State': 'Minot St.',
-    'Minot State University': 'Minot St.',
-    
-    # Mississippi College
-    'Mississippi College': 'Mississippi Col.',
-    
-    # Missouri S&T
-    'Missouri S&T': 'Missouri S&T',
-    
-    # Missouri Southern
-    'Missouri Southern': 'Mo. Southern St.',
-    'Missouri Southern State': 'Mo. Southern St.',
-    
-    # Missouri St. Louis
-    'Missouri - St. Louis': 'Mo.-St. Louis',
-    'Missouri-St. Louis': 'Mo.-St. Louis',
-    'University of Missouri - St. Louis': 'Mo.-St. Louis',
-    'UMSL': 'Mo.-St. Louis',
-    'Missouri - St Louis': 'Mo.-St. Louis',
-    'Missouri St. Louis': 'Mo.-St. Louis',
-    
-    # Missouri Western
-    'Missouri Western State University': 'Missouri Western',
-    'Missouri Western State': 'Missouri Western',
-    
-    # Molloy
-    'Molloy University': 'Molloy',
-    
-    # Montana State Billings
-    'Montana State Billings': 'Mont. St. Billings',
-    'Montana State University Billings': 'Mont. St. Billings',
-    'MSU Billings': 'Mont. St. Billings',
-    
-    # Montevallo
-    'University of Montevallo': 'Montevallo',
-    
-    # Morehouse
-    'Moorehouse College': 'Morehouse',
-    'Morehouse College': 'Morehouse',
-    
-    # Mount Olive
-    'University of Mount Olive': 'Mount Olive',
-    
-    # New Haven
-    'University of New Haven': 'New Haven',
-    
-    # New Mexico Highlands
-    'New Mexico Highlands': 'N.M. Highlands',
-    'New Mexico Highlands University': 'N.M. Highlands',
-    
-    # Newberry
-    'Newberry College': 'Newberry',
-    
-    # Newman
-    'Newman (Kan.)': 'Newman',
-    'Newman University': 'Newman',
-    
-    # North Georgia
-    'University of North Georgia': 'North Georgia',
-    
-    # North Greenville
-    'North Greenville University': 'North Greenville',
-    
-    # Northeastern State
-    'Northeastern State': 'Northeastern St.',
-    'Northeastern State (Okla.)': 'Northeastern St.',
-    'Northeastern State University': 'Northeastern St.',
-    
-    # Northern State
-    'Northern State': 'Northern St.',
-    'Northern State University': 'Northern St.',
-    
-    # Northwest Missouri State
-    'Northwest Missouri': 'Northwest Mo. St.',
-    'Northwest Missouri State': 'Northwest Mo. St.',
-    'Northwest Missouri State University': 'Northwest Mo. St.',
-    'NW Missouri State': 'Northwest Mo. St.',
-    
-    # Northwest Nazarene
-    'Northwest Nazarene University': 'Northwest Nazarene',
-    
-    # Northwestern Oklahoma
-    'Northwestern Oklahoma State': 'Northwestern Okla.',
-    'Northwestern Oklahoma State University': 'Northwestern Okla.',
-    'Northwestern Oklahoma': 'Northwestern Okla.',
-    'Northwestern Oklahoma State (7)': 'Northwestern Okla.',
-
-    # Northwood
-    'Northwood (MI)': 'Northwood',
-    'Northwood University': 'Northwood',
-    
-    # Nova Southeastern
-    'Nova Southeastern University': 'Nova Southeastern',
-    
-    # Ohio Dominican
-    'Ohio Dominican': 'Ohio Dominican',
-    'Ohio Dominican University': 'Ohio Dominican',
-    
-    # Oklahoma Baptist
-    'Oklahoma Baptist': 'Okla. Baptist',
-    'Oklahoma Baptist University': 'Okla. Baptist',
-    'Oklahoma Baptist (7)': 'Okla. Baptist',
-    
-    # Oklahoma Christian
-    'Oklahoma Christian': 'Okla. Christian',
-    'Oklahoma Christian University': 'Okla. Christian',
-    
-    # Ouachita Baptist
-    'Ouachita Baptist University': 'Ouachita Baptist',
-    'Ouachita Baprtist': 'Ouachita Baptist',
-    
-    # Pace
-    'Pace (NY) University': 'Pace',
-    'Pace University': 'Pace',
-    'NE10SW No. 2 Pace': 'Pace',
-    
-    # Palm Beach Atlantic
-    'Palm Beach Atlantic': 'Palm Beach Atl.',
-    'Palm Beach Atlantic University': 'Palm Beach Atl.',
-    
-    # Pitt-Johnstown
-    'Pitt-Johnstown': 'Pitt.-Johnstown',
-    'University of Pittsburgh at Johnstown': 'Pitt.-Johnstown',
-    
-    # Pittsburg State
-    'Pittsburg State': 'Pittsburg St.',
-    'Pittsburg State (Kan.)': 'Pittsburg St.',
-    'Pittsburg State University': 'Pittsburg St.',
-    '#16 Pittsburg State': 'Pittsburg St.',
-    
-    # Point Loma
-    'Point Loma Sea Lions': 'Point Loma',
-    'Point Loma Nazarene': 'Point Loma',
-    'PLNU': 'Point Loma',
-    
-    # Post
-    'Post University': 'Post',
-    
-    # Purdue Northwest
-    'Purdue Northwest': 'Purdue Northwest',
-    'Purdue University Northwest': 'Purdue Northwest',
-    
-    # Queens NY
-    'Queens College': 'Queens (NY)',
-    'Queens': 'Queens (NY)',
-    'Queens (N.Y.)': 'Queens (NY)',
-    
-    # Quincy
-    'Quincy University': 'Quincy',
-    
-    # Regis
-    'Regis': 'Regis (CO)',
-    'Regis University': 'Regis (CO)',
-
-    # Rockhurst
-    'Rockhurst University': 'Rockhurst',
-    
-    # Rogers State
-    'Rogers State': 'Rogers St.',
-    'Rogers State (Okla.)': 'Rogers St.',
-    'Rogers State University': 'Rogers St.',
-    'Rogers State University (Okla.)': 'Rogers St.',
-    
-    # Rollins
-    'Rollins College': 'Rollins',
-
-    # Saginaw Valley
-    'Saginaw Valley State University': 'Saginaw Valley',
-    'Saginaw Valley State': 'Saginaw Valley',
-    
-    # Saint Anselm
-    'Saint Anselm College': 'Saint Anselm',
-    
-    # Saint Leo
-    'Saint Leo University': 'Saint Leo',
-    
-    # Saint Martin's
-    "Saint Martin's University": "Saint Martin's",
-    
-    # Saint Michael's
-    "Saint Michael's College": "Saint Michael's",
-    "St. Michael's": "Saint Michael's",
-    
-    # Salem
-    'Salem': 'Salem (WV)',
-    'Salem University': 'Salem (WV)',
-    
-    # San Francisco State
-    'San Francisco State': 'San Fran. St.',
-    'San Francisco State University': 'San Fran. St.',
-    
-    # Savannah State
-    'Savannah State': 'Savannah St.',
-    'Savannah State University': 'Savannah St.',
-    
-    # Seton Hill
-    'Seton Hill (Pa.)': 'Seton Hill',
-    'Seton Hill University': 'Seton Hill',
-    
-    # Shepherd
-    'Shepherd (WV) University': 'Shepherd',
-    'Shepherd University': 'Shepherd',
-    
-    # Shippensburg
-    'Shippensburg University': 'Shippensburg',
-    
-    # Shorter
-    'Shorter University': 'Shorter',
-    'Shorter University (Ga.)': 'Shorter',
-    
-    # Sioux Falls
-    'Sioux Falls (S.D.)': 'Sioux Falls',
-    'Sioux Falls Cougars': 'Sioux Falls',
-    'University of Sioux Falls': 'Sioux Falls',
-    'University of Sioux Falls (S.D.)': 'Sioux Falls',
-    
-    # Slippery Rock
-    'Slippery Rock University': 'Slippery Rock',
-    
-    # Sonoma State
-    'Sonoma State': 'Sonoma St.',
-    'Sonoma State University': 'Sonoma St.',
-    
-    # South Carolina Aiken
-    'South Carolina Aiken': 'USC Aiken',
-    'USC Aiken': 'USC Aiken',
-    'University of South Carolina Aiken': 'USC Aiken',
-    'S.C. Aiken': 'USC Aiken',
-
-    # South Carolina Beaufort
-    'South Carolina Beaufort': 'USC Beaufort',
-    'USC Beaufort': 'USC Beaufort',
-    'University of South Carolina Beaufort': 'USC Beaufort',
-
-    # Southeastern Oklahoma
-    'Southeastern Oklahoma': 'Southeastern Okla.',
-    'Southeastern Oklahoma State': 'Southeastern Okla.',
-    'Southeastern Oklahoma State University': 'Southeastern Okla.',
-    'Southeastern Oklahoma State (7)': 'Southeastern Okla.',
-    
-    # Southern Arkansas
-    'Southern Arkansas': 'Southern Ark.',
-    'Southern Arkansas University': 'Southern Ark.',
-    'Southern Arkansas (7)': 'Southern Ark.',
-    'Southern Arkanas': 'Southern Ark.',
-    
-    # Southern Connecticut State
-    'Southern Connecticut': 'Southern Conn. St.',
-    'Southern Connecticut State': 'Southern Conn. St.',
-    'Southern Connecticut State University': 'Southern Conn. St.',
-    
-    # Southern New Hampshire
-    'Southern NH': 'Southern N.H.',
-    'Southern New Hampshire': 'Southern N.H.',
-    'Southern New Hampshire University': 'Southern N.H.',
-    'Southern N.H': 'Southern N.H.',
-    
-    # Southern Nazarene
-    'Southern Naz.': 'Southern Nazarene',
-    'Southern Nazarene University': 'Southern Nazarene',
-    'Southern Nazarene (7)': 'Southern Nazarene',
-    
-    # Southern Wesleyan
-    'Southern Wesleyan University (S.C.)': 'Southern Wesleyan',
-    'Southern Wesleyan University': 'Southern Wesleyan',
-    
-    # Southwest Baptist
-    'Southwest Baptist University': 'Southwest Baptist',
-    
-    # Southwest Minnesota State
-    'Southwest Minnesota State': 'Southwest Minn. St.',
-    'Southwest Minnesota State University': 'Southwest Minn. St.',
-    
-    # Southwestern Oklahoma
-    'Southwestern Oklahoma State': 'Southwestern Okla.',
-    'Southwestern Oklahoma State University': 'Southwestern Okla.',
-    'Southwestern Oklahoma': 'Southwestern Okla.',
-    'Southwestern Oklahoma State (7)': 'Southwestern Okla.',
-    'Southwestern OK': 'Southwestern Okla.',
-    
-    # Spring Hill
-    'Spring Hill College': 'Spring Hill',
-    'Spring Hill College (Ala.)': 'Spring Hill',
-    
-    # St. Cloud State
-    'St. Cloud State': 'St. Cloud St.',
-    'St. Cloud State University': 'St. Cloud St.',
-    
-    # St. Edward's
-    "St. Edward's University": "St. Edward's",
-    'St. Edwards': "St. Edward's",
-    
-    # St. Mary's
-    "St. Mary's": "St. Mary's (TX)",
-    "St. Mary's University (TX)": "St. Mary's (TX)",
-
-    # St. Thomas Aquinas
-    'Saint Thomas Aquinas': 'St. Thomas Aquinas',
-    'St. Thomas Aquinas College': 'St. Thomas Aquinas',
-    
-    # Staten Island
-    'College of Staten Island': 'Staten Island',
-
-    # Tampa
-    'University of Tampa': 'Tampa',
-
-    # Texas A&M International
-    'Texas A&M International': "Tex. A&M Int'l",
-    'Texas A&M International University': "Tex. A&M Int'l",
-    
-    # Texas A&M Kingsville
-    'Texas A&M - Kingsville': 'Tex. A&M-Kingsville',
-    'Texas A&M University - Kingsville': 'Tex. A&M-Kingsville',
-    'Texas A&M-Kingsville': 'Tex. A&M-Kingsville',
-    'Texas A&M Kingsville': 'Tex. A&M-Kingsville',
-
-    # Tiffin
-    'Tiffin (OH)': 'Tiffin',
-    'Tiffin University (Ohio)': 'Tiffin',
-    'Tiffin (Ohio)': 'Tiffin',
-    
-    # Trevecca Nazarene
-    'Trevecca Naz.': 'Trevecca Nazarene',
-    'Trevecca Nazarene University': 'Trevecca Nazarene',
-    
-    # Truman State
-    'Truman State': 'Truman St.',
-    'Truman State University': 'Truman St.',
-    'Truman': 'Truman St.',
-    
-    # Tusculum
-    'Tusculum': 'Tusculum',
-    'Tusculum University': 'Tusculum',
-    
-    # Tuskegee
-    'Tuskegee University': 'Tuskegee',
-    
-    # UNC Pembroke
-    'UNC Pembroke': 'UNC Pembroke',
-    'RV UNC Pembroke': 'UNC Pembroke',
-    
-    # UCCS
-    'University of Colorado at Colorado Springs': 'UCCS',
-    'University of Colorado Colorado Springs': 'UCCS',
-    'CU': 'UCCS',
-    'UC - Colorado Springs': 'UCCS',
-    'UC Colorado Springs': 'UCCS',
-    
-    # Union
-    'Union': 'Union (TN)',
-    'Union (Tenn.)': 'Union (TN)',
-    'Union University': 'Union (TN)',
-    'Union University (Tenn.)': 'Union (TN)',
-    
-    # Upper Iowa
-    'Upper Iowa University': 'Upper Iowa',
-
-    # UT Permian Basin
-    'Texas Permian Basin': 'UT Permian Basin',
-    'University of Texas of the Permian Basin': 'UT Permian Basin',
-    
-    # UT Tyler
-    'University of Texas at Tyler': 'UT Tyler',
-    'Texas-Tyler': 'UT Tyler',
-    
-    # UVA Wise
-    'UVA Wise': 'UVA Wise',
-    'UVA-Wise': 'UVA Wise',
-    'UVa.-Wise': 'UVA Wise',
-    'Virginia-Wise': 'UVA Wise',
-    
-    # Valdosta State
-    'Valdosta State': 'Valdosta St.',
-    'Valdosta State University': 'Valdosta St.',
-    
-    # Virginia State
-    'Virginia State': 'Virginia St.',
-    'Virginia State University': 'Virginia St.',
-    
-    # Walsh
-    'Walsh (OH)': 'Walsh',
-    'Walsh University': 'Walsh',
-    'Walsh (Ohio)': 'Walsh',
-    'Walsh University (Ohio)': 'Walsh',
-    
-    # Washburn
-    'Washburn (Kan.)': 'Washburn',
-    'Washburn University': 'Washburn',
-    
-    # Wayne State MI
-    'Wayne State': 'Wayne St. (MI)',
-    'Wayne State University': 'Wayne St. (MI)',
-    'Wayne State (Mich.)': 'Wayne St. (MI)',
-    
-    # Wayne State NE
-    'Wayne State College': 'Wayne St. (NE)',
-    'Wayne State (Neb.)': 'Wayne St. (NE)',
-    
-    # West Alabama
-    'West Alabama': 'West Ala.',
-    'University of West Alabama': 'West Ala.',
-    
-    # West Chester
-    'West Chester University of Pennsylvania': 'West Chester',
-    
-    # West Florida
-    'University of West Florida': 'West Florida',
-    
-    # West Liberty
-    'West Liberty University': 'West Liberty',
-    
-    # West Texas A&M
-    'West Texas A&M': 'West Tex. A&M',
-    'West Texas A&M University': 'West Tex. A&M',
-    
-    # West Virginia State
-    'West Virginia State': 'West Virginia St.',
-    'West Virginia State University': 'West Virginia St.',
-    
-    # West Virginia Wesleyan
-    'West Virginia Wesleyan': 'West Va. Wesleyan',
-    'West Virginia Wesleyan College': 'West Va. Wesleyan',
-    
-    # Western Oregon
-    'Western Oregon': 'Western Ore.',
-    'Western Oregon University': 'Western Ore.',
-    
-    # Westmont
-    'Westmont College (Calif.)': 'Westmont',
-    'Westmont Warriors': 'Westmont',
-    
-    # Wheeling (formerly Wheeling Jesuit)
-    'Wheeling University': 'Wheeling',
-    'Wheeling Jesuit University': 'Wheeling',
-
-    # Wilmington (DE)
-    'Wilmington': 'Wilmington (DE)',
-    'Wilmington (DE) University': 'Wilmington (DE)',
-    'Wilmington (Del.)': 'Wilmington (DE)',
-    'Wilmington University': 'Wilmington (DE)',
-    'Wilmington University (Del.)': 'Wilmington (DE)',
-    
-    # William Jewell
-    'William Jewell College (Mo.)': 'William Jewell',
-    'William Jewell': 'William Jewell',
-    
-    # Wingate
-    'Wingate University': 'Wingate',
-    
-    # Winona State
-    'Winona State': 'Winona St.',
-    'Winona State University': 'Winona St.',
-    
-    # Wisconsin-Parkside
-    'Wisconsin-Parkside': 'Wis.-Parkside',
-    'Parkside': 'Wis.-Parkside',
-    'UW Parkside': 'Wis.-Parkside',
-    
-    # Young Harris
-    'Young Harris College': 'Young Harris',
-    'Young Harris': 'Young Harris',
-    'RV Young Harris': 'Young Harris',
-}
 
 def get_soup(url):
-    response = requests.get(url, headers={"User-Agent": "Mozilla/5.0"})
+    response = http_cache.get(url, headers={"User-Agent": "Mozilla/5.0"})
     response.raise_for_status()
     return BeautifulSoup(response.text, "html.parser")
 
-def extract_social_links(team_url):
+# Limestone's schedule lives on the conference site (season is presto_season())
+LIMESTONE_URL = 'https://www.thesac.com/sports/bsb/{season}/schedule?teamId=6x43l4c55d380k6t&jsRendering=true'
+
+def presto_season(season):
+    """Presto sites name a season by its academic year: 2025 -> '2024-25'."""
+    season = int(season)
+    return f"{season - 1}-{season % 100:02d}"
+
+def extract_social_links(team_url, season=2025):
     """
     Given the URL to a team page, return the first href inside the .school-links block
-    with "/sports/baseball/schedule" appended.
+    with "/sports/baseball/schedule/<season>" appended.
     """
     try:
-        r = session.get("https://" + team_url, timeout=10)
+        r = http_cache.get("https://" + team_url, session=http_client.get_session(), timeout=10)
         r.raise_for_status()
     except Exception as e:
         print(f"Failed to fetch {team_url}: {e}")
         return None
 
+    # Team pages rarely change, so reuse the parsed link when the page is unchanged
+    return http_cache.cached_parse(r, f'social_link_{season}', lambda resp: _parse_social_link(resp.text, season),
+                                   version=http_cache.code_version(_parse_social_link))
+
+def _parse_social_link(html, season=2025):
+    """Return the first .school-links href with the schedule path appended."""
     # Use lxml parser - much faster than html.parser
-    soup = BeautifulSoup(r.text, "lxml")
+    soup = BeautifulSoup(html, "lxml")
 
     # Find the block
     block = soup.find("div", class_="school-links")
@@ -1085,41 +71,35 @@ def extract_social_links(team_url):
     if first_link is None:
         return None
     
-    return first_link["href"] + "/sports/baseball/schedule/2025"
+    return first_link["href"] + f"/sports/baseball/schedule/{int(season)}"
 
-def enrich_with_social_links(df, max_workers=10):
+def enrich_with_social_links(df, max_workers=10, season=2025):
     """
     Extract social links and return as dictionary with team names as keys.
     
     Args:
         df: DataFrame with 'Team' and 'link' columns
-        max_workers: Number of concurrent threads (default: 10)
+        max_workers: Maximum concurrent requests to ncaa.com (default: 10)
+        season: Season the schedule links point at (default: 2025)
     
     Returns:
         dict: {team_name: social_link, ...}
     """
     teams = df["Team"].tolist()
     urls = df["link"].tolist()
-    results = [None] * len(urls)
-    
-    # Parallel execution
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        future_to_idx = {
-            executor.submit(extract_social_links, url): idx 
-            for idx, url in enumerate(urls)
-        }
-        
-        # Collect results as they complete
-        for future in as_completed(future_to_idx):
-            idx = future_to_idx[future]
-            try:
-                results[idx] = future.result()
-            except Exception as e:
-                print(f"Error processing index {idx}: {e}")
-                results[idx] = None
+    jobs = [(idx, "https://" + url) for idx, url in enumerate(urls)]
     
-    return dict(zip(teams, results))
+    def parse(idx, response):
+        if not response.ok:
+            print(f"Failed to fetch {urls[idx]}: HTTP {response.status_code}")
+            return None
+        return http_cache.cached_parse(response, f'social_link_{season}', lambda r: _parse_social_link(r.text, season),
+                                       version=http_cache.code_version(_parse_social_link))
+    
+    # Async fetch, each page parsed as soon as it arrives
+    results = fetch_engine.fetch_all(jobs, parse, per_host=max_workers)
+    
+    return {team: results.get(idx) for idx, team in enumerate(teams)}
 
 def split_links_by_provider(team_links_dict, presto_list):
     """
@@ -1169,129 +149,195 @@ def apply_team_mapping(name, mapping_dict=TEAM_NAME_MAPPING):
     # Return original if no mapping found
     return name
     
+# Keyword sets for games that are dropped from the schedule
+_NON_GAME_TERMS = [
+    'alumni', 'alumni game', 'alumni golf tournament', 
+    'open', 'tba', 'tbd', 'trip'
+]
+_EXHIBITION_TERMS = ['exhibition', 'exh.', 'exh', 'scrimmage']
+_TOURNAMENT_TERMS = [
+    'tournament', 'championship', 'regional', 'super regional',
+    'world series', 'first round', 'second round', 'quarterfinal',
+    'semifinal', 'semi-final', 'selection show', 'finals',
+    'g-mac', 'gac tournament', 'glvc', 'gnac', 'gsc tournament',
+    'pbc', 'psac', 'rmac', 'ccaa', 'lsc', 'miaa', 'pacwest',
+    'conference carolinas tournament', 'best-of-three', 'best-of-3',
+    'double elimination', 'great american conference', 
+    'great lakes valley', 'gulf south conference', 'lone star conference',
+    'mountain east conference', 'northern sun intercollegiate',
+    'pacific west conference', 'southern intercollegiate', 'siac',
+    'russ matt', 'russmatt', 'great midwest athletic conference', 'ncaa'
+]
+
+def _term_group(name, terms):
+    """Case-insensitive named alternation, longest terms first so the most specific one is reported."""
+    alternatives = '|'.join(re.escape(term) for term in sorted(set(terms), key=len, reverse=True))
+    return f"(?P<{name}>(?i:{alternatives}))"
+
+# All removal rules in one regex; the named group that matched is the rule category
+_GAME_FILTER = re.compile('|'.join([
+    _term_group('non_game', _NON_GAME_TERMS),
+    _term_group('exhibition', _EXHIBITION_TERMS),
+    _term_group('tournament', _TOURNAMENT_TERMS),
+    # "vs." in the middle (not at start); " vs. " is case-sensitive, " vs " is not
+    r"(?P<matchup> vs\. |(?i: vs ))",
+]))
+
+@lru_cache(maxsize=None)
+def game_filter_rule(opponent):
+    """
+    Return the rule that removes this game as 'category:term'
+    (e.g. 'tournament:glvc'), 'missing' for empty opponents, or None to keep it.
+    """
+    if opponent is None or pd.isna(opponent):
+        return 'missing'
+    
+    match = _GAME_FILTER.search(opponent)
+    if match is None:
+        return None
+    return f"{match.lastgroup}:{match.group(0).strip().lower()}"
+
 def should_remove_game(opponent):
     """
     Determine if a game row should be removed entirely.
     
     Returns True if the game should be deleted.
     """
-    if opponent is None or pd.isna(opponent):
-        return True
-    
-    opponent_lower = opponent.lower()
-    
-    # Remove non-game entries
-    non_games = [
-        'alumni', 'alumni game', 'alumni golf tournament', 
-        'open', 'tba', 'tbd', 'trip'
-    ]
-    if any(ng in opponent_lower for ng in non_games):
-        return True
-    
-    # Remove exhibition/scrimmage games
-    exhibition_terms = ['exhibition', 'exh.', 'exh', 'scrimmage']
-    if any(term in opponent_lower for term in exhibition_terms):
-        return True
-    
-    # Remove tournament/championship/regional games
-    tournament_terms = [
-        'tournament', 'championship', 'regional', 'super regional',
-        'world series', 'first round', 'second round', 'quarterfinal',
-        'semifinal', 'semi-final', 'selection show', 'finals',
-        'g-mac', 'gac tournament', 'glvc', 'gnac', 'gsc tournament',
-        'pbc', 'psac', 'rmac', 'ccaa', 'lsc', 'miaa', 'pacwest',
-        'conference carolinas tournament', 'best-of-three', 'best-of-3',
-        'double elimination', 'great american conference', 
-        'great lakes valley', 'gulf south conference', 'lone star conference',
-        'mountain east conference', 'northern sun intercollegiate',
-        'pacific west conference', 'southern intercollegiate', 'siac',
-        'russ matt', 'russmatt', 'great midwest athletic conference', 'ncaa'
-    ]
-    if any(term in opponent_lower for term in tournament_terms):
-        return True
-    
-    # Remove games with "vs." in the middle (not at start)
-    if ' vs. ' in opponent or ' vs ' in opponent.lower():
-        return True
-    
-    return False
+    return game_filter_rule(opponent) is not None
 
-def clean_opponent_name(opponent):
+def game_filter_mask(series):
     """
-    Clean an opponent name by removing rankings, seeds, parenthetical info, and location details.
+    Evaluate the removal rules on a whole column (once per distinct value).
     
-    Returns cleaned name or None if game should be removed.
+    Returns:
+    --------
+    tuple: (mask, rules)
+        - mask: boolean Series, True for rows that should be removed
+        - rules: Series with the triggering rule per row (None for kept rows)
     """
-    if opponent is None or pd.isna(opponent):
-        return None
-    
-    # Check if game should be removed entirely
-    if should_remove_game(opponent):
-        return None
+    rules = _map_unique(series, game_filter_rule).where(series.notna(), 'missing')
+    rules = rules.where(rules.notna(), None)
+    return rules.notna(), rules
+
+def audit_removed_games(df, column='Opponent'):
+    """
+    Rows that clean_schedule_dataframe would drop, with the rule that dropped them.
     
+    Returns:
+    --------
+    pandas.DataFrame with an extra 'removal_rule' column
+    """
+    mask, rules = game_filter_mask(df[column])
+    return df[mask].assign(removal_rule=rules[mask])
+
+# Opponent clean-up rules, compiled once and applied in order: (pattern, replacement)
+_GAME_EVENTS = [
+    'Elimination Game', 'Senior Day', 'THO Games', 'Teal Out',
+    'Faculty/Staff Appreciation Night', 'Pink Out', 'Military Appreciation',
+    'Senior Night', 'Youth Day', 'Breast Cancer Awareness'
+]
+_OPPONENT_RULES = [
     # Strip leading "vs." or "vs "
-    opponent = re.sub(r'^vs\.?\s+', '', opponent, flags=re.IGNORECASE)
-    
+    (re.compile(r'^vs\.?\s+', re.IGNORECASE), ''),
     # Remove "No. X" rankings at the start (before removing other number patterns)
-    opponent = re.sub(r'^No\.\s+(?:RV|\d+)\s+', '', opponent, flags=re.IGNORECASE)
-    
+    (re.compile(r'^No\.\s+(?:RV|\d+)\s+', re.IGNORECASE), ''),
     # Remove rankings at the start: #1, #12, #22, #10/6, etc.
-    opponent = re.sub(r'^#\d+(?:/\d+)?\s+', '', opponent)
-    
+    (re.compile(r'^#\d+(?:/\d+)?\s+'), ''),
     # Remove seed numbers at the start: (1), (2), (6), etc.
-    opponent = re.sub(r'^\(\d+\)\s+', '', opponent)
-    
+    (re.compile(r'^\(\d+\)\s+'), ''),
     # Remove bracket rankings at the start: [27], [3], [RV], etc.
-    opponent = re.sub(r'^\[\d+\]\s+', '', opponent)
-    opponent = re.sub(r'^\[RV\]\s+', '', opponent, flags=re.IGNORECASE)
-    
+    (re.compile(r'^\[\d+\]\s+'), ''),
+    (re.compile(r'^\[RV\]\s+', re.IGNORECASE), ''),
     # Remove (RV) anywhere in the name
-    opponent = re.sub(r'\s*\(RV\)\s*', ' ', opponent, flags=re.IGNORECASE)
-    
+    (re.compile(r'\s*\(RV\)\s*', re.IGNORECASE), ' '),
     # Remove "X-seed" or "Seed" at the start
-    opponent = re.sub(r'^\d+-seed\s+', '', opponent, flags=re.IGNORECASE)
-    opponent = re.sub(r'^Seed\s+', '', opponent, flags=re.IGNORECASE)
-    
+    (re.compile(r'^\d+-seed\s+', re.IGNORECASE), ''),
+    (re.compile(r'^Seed\s+', re.IGNORECASE), ''),
     # Remove seed-related text: "Seed", "No. 8 Seed", "(No. 4 Seed)", etc.
-    opponent = re.sub(r'\s*\(No\.\s*\d+\s+Seed\)', '', opponent, flags=re.IGNORECASE)
-    opponent = re.sub(r'\s*No\.\s*\d+\s+Seed', '', opponent, flags=re.IGNORECASE)
-    opponent = re.sub(r'#?\d+\s+Seed\s+', '', opponent, flags=re.IGNORECASE)
-    opponent = re.sub(r'\s+Seed\s*$', '', opponent, flags=re.IGNORECASE)
-    
+    (re.compile(r'\s*\(No\.\s*\d+\s+Seed\)', re.IGNORECASE), ''),
+    (re.compile(r'\s*No\.\s*\d+\s+Seed', re.IGNORECASE), ''),
+    (re.compile(r'#?\d+\s+Seed\s+', re.IGNORECASE), ''),
+    (re.compile(r'\s+Seed\s*$', re.IGNORECASE), ''),
     # Remove game length notations: (7 inn.), (9 inn.), etc.
-    opponent = re.sub(r'\s*\(\d+\s+inn\.?\)', '', opponent, flags=re.IGNORECASE)
-    
+    (re.compile(r'\s*\(\d+\s+inn\.?\)', re.IGNORECASE), ''),
     # Remove location details: (at Location), (@ Location), (At Location)
-    opponent = re.sub(r'\s*\((?:at|@)\s+[^)]+\)', '', opponent, flags=re.IGNORECASE)
-    
+    (re.compile(r'\s*\((?:at|@)\s+[^)]+\)', re.IGNORECASE), ''),
     # Remove game type/event notations
-    game_events = [
-        'Elimination Game', 'Senior Day', 'THO Games', 'Teal Out',
-        'Faculty/Staff Appreciation Night', 'Pink Out', 'Military Appreciation',
-        'Senior Night', 'Youth Day', 'Breast Cancer Awareness'
-    ]
-    for event in game_events:
-        opponent = re.sub(r'\s*\(' + re.escape(event) + r'\)', '', opponent, flags=re.IGNORECASE)
-    
+    (re.compile(r'\s*\((?:' + '|'.join(re.escape(e) for e in _GAME_EVENTS) + r')\)', re.IGNORECASE), ''),
     # Remove parenthetical tournament/championship info
     # But keep state abbreviations like (Pa.), (Calif.), etc.
-    opponent = re.sub(r'\s*\([^)]*(?:Championship|Tournament|Conference)[^)]*\)', '', opponent, flags=re.IGNORECASE)
-    
+    (re.compile(r'\s*\([^)]*(?:Championship|Tournament|Conference)[^)]*\)', re.IGNORECASE), ''),
     # Remove game number notations: (0-1 game)
-    opponent = re.sub(r'\s*\(\d+-\d+\s+game\)', '', opponent, flags=re.IGNORECASE)
-    
+    (re.compile(r'\s*\(\d+-\d+\s+game\)', re.IGNORECASE), ''),
     # Remove (#3 Seed) style notations
-    opponent = re.sub(r'\s*\(#\d+\s+Seed\)', '', opponent, flags=re.IGNORECASE)
-    
+    (re.compile(r'\s*\(#\d+\s+Seed\)', re.IGNORECASE), ''),
     # Clean up extra whitespace
-    opponent = re.sub(r'\s+', ' ', opponent).strip()
+    (re.compile(r'\s+'), ' '),
+]
+
+@lru_cache(maxsize=None)
+def clean_opponent_name(opponent):
+    """
+    Clean an opponent name by removing rankings, seeds, parenthetical info, and location details.
+    
+    Results are memoized, so each distinct raw string is only cleaned once per process.
+    
+    Returns cleaned name or None if game should be removed.
+    """
+    if opponent is None or pd.isna(opponent):
+        return None
+    
+    # Check if game should be removed entirely
+    if should_remove_game(opponent):
+        return None
+    
+    for pattern, replacement in _OPPONENT_RULES:
+        opponent = pattern.sub(replacement, opponent)
+    opponent = opponent.strip()
     
     return opponent if opponent else None
 
+@lru_cache(maxsize=None)
+def _clean_team_name(name):
+    """Clean a home_team / away_team value (never removes the row)."""
+    if should_remove_game(name):
+        return name
+    cleaned = clean_opponent_name(name)
+    if cleaned is None:
+        return name
+    return apply_team_mapping(cleaned)
+
+def _map_unique(series, func):
+    """Apply func once per distinct non-null value and map the results back."""
+    uniques = series.dropna().unique()
+    return series.map({value: func(value) for value in uniques})
+
+def log_unmapped_teams(df):
+    """Print cleaned names that TEAM_NAME_MAPPING does not know, with registry suggestions."""
+    known_names = set(TEAM_NAME_MAPPING) | set(TEAM_NAME_MAPPING.values())
+    unmapped_teams = set()
+    for col in ['Opponent', 'home_team', 'away_team']:
+        if col in df.columns:
+            unmapped_teams.update(
+                team for team in df[col].dropna().unique() if team not in known_names
+            )
+    
+    if unmapped_teams:
+        registry = team_registry.get_registry()
+        print(f"\n⚠ Found {len(unmapped_teams)} unmapped team names:")
+        for team in sorted(unmapped_teams):
+            suggestions = ', '.join(f"{name} ({score:.2f})" for name, _, score in registry.candidates(team, limit=3))
+            print(f"  - {team}" + (f"  → {suggestions}" if suggestions else ""))
+        print("\nThese teams may need to be added to TEAM_NAME_MAPPING or the accepted list.")
+    return unmapped_teams
+
 def clean_schedule_dataframe(df, log_unmapped=True):
     """
     Clean a baseball schedule DataFrame by removing invalid games and cleaning opponent names.
     
+    Each distinct raw name is cleaned once (and cached across columns and calls),
+    then the results are mapped back onto the columns.
+    
     Parameters:
     -----------
     df : pandas.DataFrame
@@ -1304,50 +350,30 @@ def clean_schedule_dataframe(df, log_unmapped=True):
     pandas.DataFrame
         Cleaned DataFrame with invalid games removed and names cleaned
     """
-    df = df.copy()
-    
-    # Clean Opponent column
-    df['Opponent_cleaned'] = df['Opponent'].apply(clean_opponent_name)
-    
-    # Remove rows where opponent should be deleted
-    df_cleaned = df[df['Opponent_cleaned'].notna()].copy()
+    # Clean Opponent column and remove rows where opponent should be deleted
+    opponent_cleaned = _map_unique(df['Opponent'], clean_opponent_name)
+    keep = opponent_cleaned.notna()
+    df_cleaned = df[keep].copy()
     
     # Apply team name mapping to Opponent
-    df_cleaned['Opponent'] = df_cleaned['Opponent_cleaned'].apply(apply_team_mapping)
-    df_cleaned = df_cleaned.drop('Opponent_cleaned', axis=1)
+    df_cleaned['Opponent'] = _map_unique(opponent_cleaned[keep], apply_team_mapping)
     
     # Clean home_team and away_team columns (same logic, but don't remove rows)
-    def clean_team_name(x):
-        if pd.isna(x) or x is None:
-            return x
-        if should_remove_game(x):
-            return x
-        cleaned = clean_opponent_name(x)
-        if cleaned is None:
-            return x
-        return apply_team_mapping(cleaned)
-    
-    if 'home_team' in df_cleaned.columns:
-        df_cleaned['home_team'] = df_cleaned['home_team'].apply(clean_team_name)
-    
-    if 'away_team' in df_cleaned.columns:
-        df_cleaned['away_team'] = df_cleaned['away_team'].apply(clean_team_name)
+    for col in ['home_team', 'away_team']:
+        if col in df_cleaned.columns:
+            df_cleaned[col] = _map_unique(df_cleaned[col], _clean_team_name).where(
+                df_cleaned[col].notna(), df_cleaned[col]
+            )
     
     # Log unmapped teams
     if log_unmapped:
-        unmapped_teams = set()
-        for col in ['Opponent', 'home_team', 'away_team']:
-            if col in df_cleaned.columns:
-                teams = df_cleaned[col].dropna().unique()
-                for team in teams:
-                    if team not in TEAM_NAME_MAPPING.values() and team not in TEAM_NAME_MAPPING:
-                        unmapped_teams.add(team)
-        
-        if unmapped_teams:
-            print(f"\n⚠ Found {len(unmapped_teams)} unmapped team names:")
-            for team in sorted(unmapped_teams):
-                print(f"  - {team}")
-            print("\nThese teams may need to be added to TEAM_NAME_MAPPING or the accepted list.")
+        log_unmapped_teams(df_cleaned)
+    
+    # Integer team keys for joins against other sources; school-site spellings
+    # the alias tables miss fall back to confident fuzzy matches, cached on disk
+    for col in ['home_team', 'away_team']:
+        if col in df_cleaned.columns:
+            df_cleaned[f'{col}_id'] = team_registry.team_ids(df_cleaned[col], source='school_sites', fuzzy=True)
     
     # Reset index
     df_cleaned = df_cleaned.reset_index(drop=True)
@@ -1379,122 +405,38 @@ def parse_flexible_date(date_str, year=2025):
         print(f"Error parsing '{date_str}': {e}")
         return None
 
-def get_stat_dataframe_with_link(stat_name):
-    if stat_name not in stat_links:
-        print(f"Stat '{stat_name}' not found. Available stats: {list(stat_links.keys())}")
-        return None
-
-    all_data = []
-    page_num = 1
-
-    while page_num < 7:
-        url = stat_links[stat_name]
-        if page_num > 1:
-            url = f"{url}/p{page_num}"
-
-        try:
-            soup = get_soup(url)
-            table = soup.find("table")
-            if not table:
-                break
-
-            headers = [th.text.strip() for th in table.find_all("th")]
-            headers.append("link")   # <-- ADD A NEW COLUMN
-
-            for row in table.find_all("tr")[1:]:
-                cols = row.find_all("td")
-
-                row_data = []
-                link_val = None
-
-                for idx, col in enumerate(cols):
-                    # TEAM COLUMN (usually first column)
-                    if headers[idx] == "Team":
-                        a = col.find("a")
-                        if a:
-                            team_name = a.text.strip()
-                            link_val = "ncaa.com" + a["href"]
-                            row_data.append(team_name)
-                        else:
-                            # fallback if no <a>
-                            row_data.append(col.text.strip())
-                    else:
-                        row_data.append(col.text.strip())
-
-                # append the extracted link
-                row_data.append(link_val)
-
-                all_data.append(row_data)
-
-        except requests.exceptions.HTTPError:
-            break
-        except Exception as e:
-            print(f"Error for {stat_name}, page {page_num}: {e}")
-            break
-
-        page_num += 1
-
-    if all_data:
-        df = pd.DataFrame(all_data, columns=headers)
-
-        # convert numeric columns
-        for col in df.columns:
-            if col not in ("Team", "link"):
-                df[col] = pd.to_numeric(df[col], errors="coerce")
+_stat_links = {}
+
+# stat_name -> URL for every Team Stats page (fetched once per division per process)
+def get_stat_links(division='D1'):
+    if division not in _stat_links:
+        base_url = "https://www.ncaa.com"
+        soup = get_soup(f"{base_url}/stats/baseball/{division.lower()}")
+        dropdown = soup.find("select", {"id": "select-container-team"})
+        _stat_links[division] = {
+            option.text.strip(): base_url + option["value"]
+            for option in dropdown.find_all("option") if option.get("value")
+        }
+    return _stat_links[division]
 
-        return df
+def get_stat_dataframe_with_link(stat_name, links=None):
+    links = links or get_stat_links()
+    if stat_name not in links:
+        print(f"Stat '{stat_name}' not found. Available stats: {list(links.keys())}")
+        return None
 
-    return None
+    # Page count comes from page 1, remaining pages are fetched concurrently
+    try:
+        return paginated_table.get_paginated_table(links[stat_name], with_links=True, max_pages=6)
+    except Exception as e:
+        print(f"Error for {stat_name}: {e}")
+        return None
 
 """
 COMPLETE INTEGRATION with your existing scraping functions.
 This adapts SmartScraper to work with your scrape_sidearm_schedule_auto function.
 """
 
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import time
-import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import pickle
-import os
-
-
-def _create_driver():
-    """Create an optimized Chrome driver instance."""
-    chrome_options = Options()
-    chrome_options.add_argument('--headless')
-    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-    chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-    
-    # Performance optimizations
-    chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
-    
-    # Disable unnecessary features
-    chrome_options.add_experimental_option('prefs', {
-        'profile.default_content_setting_values': {
-            'images': 2,
-            'plugins': 2,
-            'popups': 2,
-            'geolocation': 2,
-            'notifications': 2,
-            'media_stream': 2,
-        }
-    })
-    
-    chrome_options.page_load_strategy = 'eager'
-    
-    return webdriver.Chrome(options=chrome_options)
-
 
 def _standardize_team_name(name):
     """
@@ -1823,35 +765,128 @@ def parse_soup_v2(soup, team_name):
     return df[columns]
 
 
-def scrape_with_selenium_single_format(team_name, url, driver, fmt):
+SIDEARM_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+
+def scrape_sidearm_data_sources(team_name, url, html=None):
+    """
+    Scrape a schedule from its embedded JSON-LD or linked .ics export (no browser).
+    
+    Returns:
+    --------
+    tuple: (DataFrame, source kind); raises ValueError if the page has neither
+    """
+    if html is None:
+        response = http_cache.get(url, timeout=15, headers=SIDEARM_HEADERS)
+        response.raise_for_status()
+        html = response.text
+    
+    sources = sidearm_data.find_sources(html, url)
+    return sidearm_data.parse_sources(
+        sources, team_name,
+        fetch=lambda link: http_cache.get(link, timeout=15, headers=SIDEARM_HEADERS),
+        standardize=_standardize_team_name,
+    )
+
+
+SELENIUM_GAME_CLASS = {
+    'v1': "sidearm-schedule-game",
+    'v2': "s-game-card",
+    'v3': "sidearm-schedule-game-wrapper",
+}
+
+
+def scrape_with_selenium_single_format(team_name, url, driver, fmt, pool=None):
     """Scrape using Selenium with known format."""
     try:
-        driver.get(url)
-        
-        wait = WebDriverWait(driver, 10)
-        
-        if fmt == 'v2':
-            wait.until(EC.presence_of_element_located((By.CLASS_NAME, "s-game-card")))
-        elif fmt == 'v3':
-            wait.until(EC.presence_of_element_located((By.CLASS_NAME, "sidearm-schedule-game-wrapper")))
-        else:  # v1
-            wait.until(EC.presence_of_element_located((By.CLASS_NAME, "sidearm-schedule-game")))
-        
-        time.sleep(1.5)
-        
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
+        from selenium.webdriver.common.by import By
+
+        with run_metrics.span('fetch', 'd2_sidearm', team_name):
+            if pool is not None:
+                pool.get(driver, url)
+            else:
+                driver.get(url)
+            
+            # Wait until the game list has rendered and stopped growing
+            driver_pool.wait_for_stable_dom(driver, (By.CLASS_NAME, SELENIUM_GAME_CLASS.get(fmt, SELENIUM_GAME_CLASS['v1'])))
+            page_source = driver.page_source
         
-        if fmt == 'v2':
-            return parse_soup_v2(soup, team_name)
-        elif fmt == 'v3':
-            return parse_soup_v3(soup, team_name)
-        else:
-            return parse_soup_v1(soup, team_name)
+        with run_metrics.span('parse', 'd2_sidearm', team_name):
+            return parse_sidearm_soup(BeautifulSoup(page_source, 'html.parser'), team_name, fmt)
             
     except Exception as e:
         raise Exception(f"Selenium scrape failed: {str(e)}")
 
 
+def sidearm_game_counts(soup):
+    """Number of games with an opponent name in each Sidearm layout."""
+    def named(elem):
+        return elem is not None and bool(elem.get_text(strip=True))
+    
+    v1 = sum(
+        named(game.find('span', class_='sidearm-schedule-game-opponent-name'))
+        for game in soup.find_all('li', class_='sidearm-schedule-game')
+    )
+    v2 = sum(
+        named(game.find('a', {'data-test-id': 's-game-card-standard__header-team-opponent-link'}))
+        for game in soup.find_all('div', {'data-test-id': 's-game-card-standard__root'})
+    )
+    v3 = 0
+    for wrapper in soup.find_all('li', class_='sidearm-schedule-game-wrapper'):
+        game = wrapper.find('div', class_='sidearm-schedule-game')
+        if game is not None:
+            v3 += named(game.find('span', class_='sidearm-schedule-game-opponent-name'))
+    return {'v1': v1, 'v2': v2, 'v3': v3}
+
+
+def detect_sidearm_format(soup):
+    """Layout of a Sidearm schedule page (same precedence as the old detector)."""
+    if soup.find('div', {'data-test-id': 's-game-card-standard__root'}):
+        return 'v2'
+    elif soup.find('li', class_='sidearm-schedule-game-wrapper'):
+        return 'v3'
+    elif soup.find('li', class_='sidearm-schedule-game'):
+        return 'v1'
+    return 'unknown'
+
+
+def parse_sidearm_soup(soup, team_name, fmt):
+    """Parse a schedule page with the parser for fmt."""
+    if fmt == 'v2':
+        return parse_soup_v2(soup, team_name)
+    elif fmt == 'v3':
+        return parse_soup_v3(soup, team_name)
+    return parse_soup_v1(soup, team_name)
+
+
+def probe_sidearm_page(url, timeout=10):
+    """
+    Fetch and parse a schedule page once and run every detector on it.
+    
+    Returns:
+    --------
+    dict: {'format', 'static', 'games', 'counts', 'error'}
+    """
+    try:
+        response = http_cache.get(url, timeout=timeout, headers=SIDEARM_HEADERS)
+        soup = BeautifulSoup(response.text, 'html.parser')
+    except Exception as e:
+        return {'format': 'unknown', 'static': False, 'games': 0,
+                'counts': {}, 'error': str(e)[:200]}
+    
+    counts = sidearm_game_counts(soup)
+    fmt = detect_sidearm_format(soup)
+    return {
+        'format': fmt,
+        'static': any(counts.values()),
+        'games': counts.get(fmt, 0),
+        'counts': counts,
+        'error': None,
+    }
+
+
 class SidearmScraper:
     """
     Intelligent scraper that learns and adapts.
@@ -1908,118 +943,77 @@ class SidearmScraper:
         
         print(f"Cache directory: {self.cache_dir}")
         
+        # Per-team metadata (format, static/dynamic, failures) in SQLite
+        self.meta = scraper_meta.ScraperMeta(os.path.join(self.cache_dir, 'scraper_meta.sqlite'))
+        self._sink = None
+        self.meta.migrate_pickles(self.cache_dir, self.url_dict)
+        
         # Load or build intelligence
-        self.format_map = self._load_or_detect_formats()
-        self.static_teams = self._load_or_detect_static_teams()
+        self.format_map, self.static_teams = self._load_or_probe()
     
-    def _load_or_detect_formats(self):
-        """Load cached format detection or detect formats."""
-        cache_file = os.path.join(self.cache_dir, 'format_map.pkl')
-        
-        if os.path.exists(cache_file):
-            print("Loading cached format map...")
-            with open(cache_file, 'rb') as f:
-                return pickle.load(f)
-        
-        print("Detecting formats (one-time setup)...")
-        format_map = {}
+    def _load_or_probe(self, max_workers=16):
+        """
+        Trust fresh metadata and re-probe only new, stale or failing teams in
+        one concurrent pass (each URL is fetched and parsed once).
+        """
+        stale = self.meta.stale_teams(self.url_dict)
+        
+        if stale:
+            print(f"Probing {len(stale)}/{len(self.url_dict)} schedule pages (new, stale or failing)...")
+            self.probe_results = self.probe_teams(stale, max_workers)
+            for team, result in self.probe_results.items():
+                self.meta.record_probe(team, self.url_dict[team], result['format'],
+                                       result['static'], result['games'], result['error'])
+        else:
+            print("Loading cached format map and static team list...")
         
-        for i, (team, url) in enumerate(self.url_dict.items(), 1):
-            try:
-                response = requests.get(url, timeout=10, headers={
-                    'User-Agent': 'Mozilla/5.0'
-                })
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                if soup.find('div', {'data-test-id': 's-game-card-standard__root'}):
-                    fmt = 'v2'
-                elif soup.find('li', class_='sidearm-schedule-game-wrapper'):
-                    fmt = 'v3'
-                elif soup.find('li', class_='sidearm-schedule-game'):
-                    fmt = 'v1'
-                else:
-                    fmt = 'unknown'
-                
-                format_map[team] = fmt
-                
-                if i % 20 == 0:
-                    print(f"  Detected {i}/{len(self.url_dict)}...")
-                    
-            except Exception as e:
-                format_map[team] = 'unknown'
+        format_map = self.meta.format_map(self.url_dict)
+        static_teams = self.meta.static_teams(self.url_dict)
         
-        with open(cache_file, 'wb') as f:
-            pickle.dump(format_map, f)
+        print(f"Found {len(static_teams)} static teams (fast), "
+              f"{len(self.url_dict) - len(static_teams)} dynamic (slow)")
         
-        print(f"Format detection complete. Results cached.")
-        return format_map
+        return format_map, static_teams
     
-    def _load_or_detect_static_teams(self):
-        """Detect which teams have static HTML."""
-        cache_file = os.path.join(self.cache_dir, 'static_teams.pkl')
-        
-        if os.path.exists(cache_file):
-            print("Loading cached static team list...")
-            with open(cache_file, 'rb') as f:
-                return pickle.load(f)
-        
-        print("Detecting static vs dynamic teams (one-time setup)...")
-        static_teams = set()
+    def _formats_to_try(self, team):
+        """
+        The stored format alone for trusted teams; otherwise the stored format
+        (if any) followed by the remaining layouts. Pages stored as dynamic
+        have no known layout yet, so every one is tried.
+        """
+        url = self.url_dict[team]
+        fmt = self.format_map.get(team, 'v1')
+        if fmt not in ('v1', 'v2', 'v3'):
+            return ['v1', 'v2', 'v3']
+        if self.meta.is_trusted(self.meta.get(team, url)):
+            return [fmt]
+        return [fmt] + [f for f in ['v1', 'v2', 'v3'] if f != fmt]
+    
+    def _record_result(self, team, fmt=None, error=None):
+        """Thread-safe metadata update after a scrape attempt."""
+        url = self.url_dict[team]
+        if error is None:
+            self.format_map[team] = fmt
+            self.meta.record_success(team, url, fmt)
+        else:
+            self.meta.record_failure(team, url, error)
+    
+    def probe_teams(self, teams, max_workers=16):
+        """
+        Probe schedule pages concurrently.
         
-        for i, (team, url) in enumerate(self.url_dict.items(), 1):
-            try:
-                response = requests.get(url, timeout=10, headers={
-                    'User-Agent': 'Mozilla/5.0'
-                })
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Check if we have game data with opponent names
-                has_games = False
-                
-                # Check v1
-                games_v1 = soup.find_all('li', class_='sidearm-schedule-game')
-                for game in games_v1:
-                    opponent = game.find('span', class_='sidearm-schedule-game-opponent-name')
-                    if opponent and opponent.get_text(strip=True):
-                        has_games = True
-                        break
-                
-                # Check v2
-                if not has_games:
-                    games_v2 = soup.find_all('div', {'data-test-id': 's-game-card-standard__root'})
-                    for game in games_v2:
-                        opponent = game.find('a', {'data-test-id': 's-game-card-standard__header-team-opponent-link'})
-                        if opponent and opponent.get_text(strip=True):
-                            has_games = True
-                            break
-                
-                # Check v3
-                if not has_games:
-                    wrappers = soup.find_all('li', class_='sidearm-schedule-game-wrapper')
-                    for wrapper in wrappers:
-                        game = wrapper.find('div', class_='sidearm-schedule-game')
-                        if game:
-                            opponent = game.find('span', class_='sidearm-schedule-game-opponent-name')
-                            if opponent and opponent.get_text(strip=True):
-                                has_games = True
-                                break
-                
-                if has_games:
-                    static_teams.add(team)
-                
+        Returns:
+        --------
+        dict: team -> probe_sidearm_page() result
+        """
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(probe_sidearm_page, self.url_dict[team]): team for team in teams}
+            for i, future in enumerate(as_completed(futures), 1):
+                results[futures[future]] = future.result()
                 if i % 20 == 0:
-                    print(f"  Checked {i}/{len(self.url_dict)}...")
-                    
-            except:
-                pass
-        
-        with open(cache_file, 'wb') as f:
-            pickle.dump(static_teams, f)
-        
-        print(f"Found {len(static_teams)} static teams (fast), "
-              f"{len(self.url_dict) - len(static_teams)} dynamic (slow)")
-        
-        return static_teams
+                    print(f"  Probed {i}/{len(teams)}...")
+        return results
     
     def test_links(self, max_workers=4):
         """
@@ -2045,60 +1039,56 @@ class SidearmScraper:
         
         successful_teams = []
         failed_teams = []
+        pool = driver_pool.get_pool(size=max_workers)
         
         def test_single_team(team):
             """Test a single team with all formats."""
             url = self.url_dict[team]
             formats_to_try = ['v1', 'v2', 'v3']
             
-            # First try with requests (fast)
-            for fmt in formats_to_try:
-                try:
-                    response = requests.get(url, timeout=8, headers={
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                    })
-                    response.raise_for_status()
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    
-                    if fmt == 'v2':
-                        df = parse_soup_v2(soup, team)
-                    elif fmt == 'v3':
-                        df = parse_soup_v3(soup, team)
-                    else:
-                        df = parse_soup_v1(soup, team)
-                    
-                    # Success with requests!
-                    return ('success', team, fmt, 'requests', len(df), None)
-                    
-                except Exception:
-                    continue
-            
-            # Requests failed all formats, try Selenium
-            driver = None
+            # First try with requests (fast): fetch and parse once, try every format
+            html = None
             try:
-                driver = _create_driver()
-                
+                response = http_cache.get(url, timeout=8, headers=SIDEARM_HEADERS)
+                response.raise_for_status()
+                html = response.text
+                soup = BeautifulSoup(html, 'html.parser')
+            except Exception:
+                soup = None
+            
+            if soup is not None:
                 for fmt in formats_to_try:
                     try:
-                        df = scrape_with_selenium_single_format(team, url, driver, fmt)
-                        # Success with Selenium!
-                        return ('success', team, fmt, 'selenium', len(df), None)
-                        
+                        df = parse_sidearm_soup(soup, team, fmt)
+                        # Success with requests!
+                        return ('success', team, fmt, 'requests', len(df), None)
                     except Exception:
                         continue
+            
+            # Embedded JSON-LD / .ics export (still no browser)
+            try:
+                df, source = scrape_sidearm_data_sources(team, url, html)
+                return ('success', team, source, 'requests', len(df), None)
+            except Exception:
+                pass
+            
+            # Requests failed all formats, try Selenium on a pooled driver
+            try:
+                with pool.driver() as driver:
+                    for fmt in formats_to_try:
+                        try:
+                            df = scrape_with_selenium_single_format(team, url, driver, fmt, pool)
+                            # Success with Selenium!
+                            return ('success', team, fmt, 'selenium', len(df), None)
+                            
+                        except Exception:
+                            continue
                 
                 # All formats failed with both methods
                 return ('failed', team, None, None, None, "All scraper formats failed")
                 
             except Exception as e:
                 return ('failed', team, None, None, None, str(e)[:200])
-                
-            finally:
-                if driver:
-                    try:
-                        driver.quit()
-                    except:
-                        pass
         
         # Test all teams in parallel
         start_time = time.time()
@@ -2150,12 +1140,6 @@ class SidearmScraper:
         
         return successful_teams, failed_teams
     
-    def _save_format_map(self):
-        """Save the format map to cache."""
-        cache_file = os.path.join(self.cache_dir, 'format_map.pkl')
-        with open(cache_file, 'wb') as f:
-            pickle.dump(self.format_map, f)
-    
     def reclassify_as_static(self, team_names):
         """
         Manually reclassify teams as static (works with requests).
@@ -2177,15 +1161,11 @@ class SidearmScraper:
         for team in team_names:
             if team in self.url_dict:
                 self.static_teams.add(team)
+                self.meta.set_static(team, self.url_dict[team], True)
                 print(f"✓ Reclassified {team} as static")
             else:
                 print(f"✗ {team} not found in URL dictionary")
         
-        # Save updated static teams list
-        cache_file = os.path.join(self.cache_dir, 'static_teams.pkl')
-        with open(cache_file, 'wb') as f:
-            pickle.dump(self.static_teams, f)
-        
         print(f"\nUpdated: {len(self.static_teams)} static teams, "
               f"{len(self.url_dict) - len(self.static_teams)} dynamic teams")
     
@@ -2238,40 +1218,14 @@ class SidearmScraper:
             url = self.url_dict[team]
             
             try:
-                response = requests.get(url, timeout=15, headers={
+                response = http_cache.get(url, timeout=15, headers={
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                 })
                 response.raise_for_status()
                 soup = BeautifulSoup(response.text, 'html.parser')
                 
                 # Check if it has games using all three format checks
-                has_v1_games = False
-                games_v1 = soup.find_all('li', class_='sidearm-schedule-game')
-                for game in games_v1:
-                    opponent = game.find('span', class_='sidearm-schedule-game-opponent-name')
-                    if opponent and opponent.get_text(strip=True):
-                        has_v1_games = True
-                        break
-                
-                has_v2_games = False
-                games_v2 = soup.find_all('div', {'data-test-id': 's-game-card-standard__root'})
-                for game in games_v2:
-                    opponent = game.find('a', {'data-test-id': 's-game-card-standard__header-team-opponent-link'})
-                    if opponent and opponent.get_text(strip=True):
-                        has_v2_games = True
-                        break
-                
-                has_v3_games = False
-                wrappers = soup.find_all('li', class_='sidearm-schedule-game-wrapper')
-                for wrapper in wrappers:
-                    game = wrapper.find('div', class_='sidearm-schedule-game')
-                    if game:
-                        opponent = game.find('span', class_='sidearm-schedule-game-opponent-name')
-                        if opponent and opponent.get_text(strip=True):
-                            has_v3_games = True
-                            break
-                
-                has_games = has_v1_games or has_v2_games or has_v3_games
+                has_games = any(sidearm_game_counts(soup).values())
                 
                 if has_games:
                     works_with_requests.append(team)
@@ -2309,18 +1263,44 @@ class SidearmScraper:
         
         return works_with_requests, needs_selenium
     
-    def scrape_all(self, max_workers=4):
+    def scrape_all(self, max_workers=4, refresh=False, sink=None):
         """
         Scrape all teams using optimal method for each.
         
+        Parameters:
+        -----------
+        max_workers : int
+            Number of parallel workers
+        refresh : bool
+            If True, only re-scrape teams with a game due since the stored
+            schedule snapshot (plus a periodic full sweep) and merge them in
+        sink : callable, optional
+            sink(team_name, df) receives each team's schedule as soon as it
+            is scraped instead of it being kept for the combined DataFrame
+            (e.g. a data_store.PartitionWriter); not with refresh=True
+        
         Returns:
         --------
         tuple: (dataframe, failed_teams_list)
             - dataframe: Combined DataFrame of all successful scrapes
+              (the whole merged snapshot when refresh=True, empty with a sink)
             - failed_teams_list: List of (team_name, error_message) tuples
         """
-        static = [t for t in self.url_dict.keys() if t in self.static_teams]
-        dynamic = [t for t in self.url_dict.keys() if t not in self.static_teams]
+        if refresh and sink is not None:
+            raise ValueError("refresh=True merges into the snapshot and cannot stream to a sink")
+        self._sink = sink
+        
+        teams = list(self.url_dict.keys())
+        snapshot = None
+        if refresh:
+            snapshot = schedule_snapshot.ScheduleSnapshot(self.division, self.year)
+            full_sweep = snapshot.needs_full_sweep()
+            teams = snapshot.teams_to_refresh(teams)
+            print(f"\nRefreshing {len(teams)}/{len(self.url_dict)} teams"
+                  f"{' (full sweep)' if full_sweep else ''}")
+        
+        static = [t for t in teams if t in self.static_teams]
+        dynamic = [t for t in teams if t not in self.static_teams]
         
         print(f"\nScraping strategy:")
         print(f"  {len(static)} teams: Fast (requests)")
@@ -2334,22 +1314,33 @@ class SidearmScraper:
             print("\n1. Scraping static teams (fast)...")
             static_results = self._scrape_static_teams(static, max_workers)
         
+        # Dynamic teams that publish their schedule as data skip the browser
+        data_results = []
+        if dynamic:
+            print("\n2. Checking dynamic teams for JSON-LD / calendar data...")
+            data_results, dynamic = self._scrape_data_source_teams(dynamic, max_workers)
+        
         # Slow path: Scrape dynamic teams
         dynamic_results = []
         if dynamic:
-            print("\n2. Scraping dynamic teams (slow)...")
+            print("\n3. Scraping dynamic teams (slow)...")
             dynamic_results = self._scrape_dynamic_teams_batched(dynamic, max_workers)
         
         total_time = time.time() - start_time
         
+        # How each team was served: plain requests, data source or browser
+        run_metrics.metrics.count('sidearm_teams_requests', len(static_results))
+        run_metrics.metrics.count('sidearm_teams_data_source', len(data_results))
+        run_metrics.metrics.count('sidearm_teams_selenium', len(dynamic_results))
+        
         # Combine results
-        all_results = static_results + dynamic_results
-        successes = [df for team, df, error in all_results if error is None]
+        all_results = static_results + data_results + dynamic_results
+        successes = [df for team, df, error in all_results if error is None and df is not None]
         failures = [(team, error) for team, df, error in all_results if error is not None]
         
         print(f"\n{'='*60}")
-        print(f"COMPLETE: {len(successes)}/{len(self.url_dict)} teams in {total_time:.1f}s")
-        print(f"Average: {total_time/len(self.url_dict):.2f}s per team")
+        print(f"COMPLETE: {len(successes)}/{len(teams)} teams in {total_time:.1f}s")
+        print(f"Average: {total_time/max(len(teams), 1):.2f}s per team")
         
         if failures:
             print(f"\n⚠ {len(failures)} failures:")
@@ -2358,91 +1349,145 @@ class SidearmScraper:
             if len(failures) > 10:
                 print(f"  ... and {len(failures) - 10} more")
         
+        if snapshot is not None:
+            new_rows = pd.concat(successes, ignore_index=True) if successes else pd.DataFrame()
+            diff = snapshot.merge(new_rows, teams, full_sweep=full_sweep)
+            snapshot.save()
+            print(f"Snapshot updated: {diff}")
+            return snapshot.rows.copy(), failures
+        
         if successes:
             df = pd.concat(successes, ignore_index=True)
             return df, failures
         else:
             return pd.DataFrame(), failures
     
+    def _deliver(self, team, df, error=None):
+        """
+        Hand a scraped schedule to the sink (if any).
+
+        Returns the (team, df, error) result the caller keeps; a sink that
+        raises turns the team into a failure instead of stopping the run.
+        """
+        if self._sink is None or df is None:
+            return (team, df, error)
+        try:
+            self._sink(team, df)
+        except Exception as e:
+            error = f"Sink error: {str(e)[:150]}"
+            print(f"    ✗ {team}: {error[:60]}")
+        return (team, None, error)
+    
     def _scrape_static_teams(self, teams, max_workers):
         """Scrape static teams using requests with retry logic."""
         results = []
         
         def scrape_static(team):
             url = self.url_dict[team]
-            fmt = self.format_map.get(team, 'v1')
             
-            # Try the cached format first
-            formats_to_try = [fmt]
-            # Add other formats as fallbacks
-            all_formats = ['v1', 'v2', 'v3']
-            for f in all_formats:
-                if f != fmt:
-                    formats_to_try.append(f)
+            # Trusted teams use their stored format only; others fall back
+            formats_to_try = self._formats_to_try(team)
             
             last_error = None
+            soup = None
             
-            # Try each format up to 2 times
-            for try_fmt in formats_to_try:
-                for attempt in range(2):
-                    try:
-                        response = requests.get(url, timeout=15, headers={
-                            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                        })
+            # Fetch the page once (one retry on timeout)
+            for attempt in range(2):
+                try:
+                    with run_metrics.span('fetch', 'd2_sidearm', team):
+                        response = http_cache.get(url, timeout=15, headers=SIDEARM_HEADERS)
                         response.raise_for_status()
+                    with run_metrics.span('parse', 'd2_sidearm', team):
                         soup = BeautifulSoup(response.text, 'html.parser')
-                        
-                        if try_fmt == 'v2':
-                            df = parse_soup_v2(soup, team)
-                        elif try_fmt == 'v3':
-                            df = parse_soup_v3(soup, team)
-                        else:
-                            df = parse_soup_v1(soup, team)
-                        
-                        # Success! Update cache if we used a different format
-                        if try_fmt != fmt:
-                            self.format_map[team] = try_fmt
-                            self._save_format_map()
-                        
-                        return (team, df, None)
-                        
-                    except requests.Timeout:
-                        last_error = "Request timeout"
-                        if attempt == 0:  # Retry once on timeout
-                            time.sleep(1)
-                            continue
-                    except requests.RequestException as e:
-                        last_error = f"Request error: {str(e)[:150]}"
-                        break  # Don't retry on connection errors
-                    except Exception as e:
-                        last_error = str(e)[:200]
-                        break  # Don't retry on parsing errors
+                    break
+                except requests.Timeout:
+                    last_error = "Request timeout"
+                    if attempt == 0:  # Retry once on timeout
+                        time.sleep(1)
+                        continue
+                except requests.RequestException as e:
+                    last_error = f"Request error: {str(e)[:150]}"
+                    break  # Don't retry on connection errors
+            
+            if soup is None:
+                self._record_result(team, error=last_error)
+                return (team, None, last_error)
+            
+            # Try each format on the same parsed page
+            for try_fmt in formats_to_try:
+                try:
+                    with run_metrics.span('parse', 'd2_sidearm', team):
+                        df = parse_sidearm_soup(soup, team, try_fmt)
+                    self._record_result(team, try_fmt)
+                    return (team, df, None)
+                    
+                except Exception as e:
+                    last_error = str(e)[:200]
             
-            # All formats failed
+            # All formats failed: the team is re-probed on the next run
+            self._record_result(team, error=last_error)
             return (team, None, last_error)
         
         with ThreadPoolExecutor(max_workers=max_workers*2) as executor:
             futures = {executor.submit(scrape_static, team): team for team in teams}
             
             for i, future in enumerate(as_completed(futures), 1):
-                result = future.result()
-                results.append(result)
-                team, df, error = result
+                team, df, error = future.result()
                 status = "✓" if error is None else "✗"
                 games_str = f": {len(df)} games" if df is not None else ""
                 print(f"  [{i}/{len(teams)}] {status} {team}{games_str}")
+                results.append(self._deliver(team, df, error))
         
         return results
     
+    def _scrape_data_source_teams(self, teams, max_workers):
+        """
+        Scrape dynamic teams from embedded JSON-LD or linked .ics exports.
+        
+        Returns:
+        --------
+        tuple: (results, remaining_teams) - remaining teams still need Selenium
+        """
+        results = []
+        remaining = []
+        
+        def scrape_data(team):
+            try:
+                with run_metrics.span('fetch', 'd2_sidearm', team):
+                    df, source = scrape_sidearm_data_sources(team, self.url_dict[team])
+                return team, df, source
+            except Exception:
+                return team, None, None
+        
+        with ThreadPoolExecutor(max_workers=max_workers*2) as executor:
+            for team, df, source in executor.map(scrape_data, teams):
+                if df is None:
+                    remaining.append(team)
+                else:
+                    print(f"  ✓ {team}: {len(df)} games ({source})")
+                    results.append(self._deliver(team, df))
+        
+        print(f"  {len(results)}/{len(teams)} dynamic teams served without a browser")
+        return results, remaining
+    
     def _scrape_dynamic_teams_batched(self, teams, max_workers, batch_size=8):
         """Scrape dynamic teams with Selenium, reusing drivers."""
         
+        pool = driver_pool.get_pool(size=max_workers)
+        
         def scrape_batch(batch):
-            driver = _create_driver()
+            driver = pool.acquire()
             batch_results = []
             
             try:
                 for team in batch:
+                    # Crashed or worn-out drivers are swapped for a fresh one;
+                    # a failed swap has already released the old driver
+                    try:
+                        driver = pool.renew(driver)
+                    except Exception:
+                        driver = None
+                        raise
                     url = self.url_dict[team]
                     
                     # Validate URL
@@ -2451,15 +1496,8 @@ class SidearmScraper:
                         print(f"    ✗ {team}: Invalid URL")
                         continue
                     
-                    fmt = self.format_map.get(team, 'v1')
-                    
-                    # Try the cached format first
-                    formats_to_try = [fmt]
-                    # Add other formats as fallbacks
-                    all_formats = ['v1', 'v2', 'v3']
-                    for f in all_formats:
-                        if f != fmt:
-                            formats_to_try.append(f)
+                    # Trusted teams use their stored format only; others fall back
+                    formats_to_try = self._formats_to_try(team)
                     
                     last_error = None
                     success = False
@@ -2468,12 +1506,8 @@ class SidearmScraper:
                     for try_fmt in formats_to_try:
                         for attempt in range(2):  # 2 attempts per format
                             try:
-                                df = scrape_with_selenium_single_format(team, url, driver, try_fmt)
-                                
-                                # Success! Update cache if we used a different format
-                                if try_fmt != fmt:
-                                    self.format_map[team] = try_fmt
-                                    self._save_format_map()
+                                df = scrape_with_selenium_single_format(team, url, driver, try_fmt, pool)
+                                self._record_result(team, try_fmt)
                                 
                                 batch_results.append((team, df, None))
                                 print(f"    ✓ {team}: {len(df)} games")
@@ -2492,6 +1526,7 @@ class SidearmScraper:
                             break
                     
                     if not success:
+                        self._record_result(team, error=last_error)
                         batch_results.append((team, None, last_error))
                         print(f"    ✗ {team}: {last_error[:60]}")
                         
@@ -2502,10 +1537,8 @@ class SidearmScraper:
                             pass
                         
             finally:
-                try:
-                    driver.quit()
-                except:
-                    pass
+                if driver is not None:
+                    pool.release(driver)
             
             return batch_results
         
@@ -2518,7 +1551,7 @@ class SidearmScraper:
             
             for i, future in enumerate(futures, 1):
                 batch_results = future.result()
-                results.extend(batch_results)
+                results.extend(self._deliver(team, df, error) for team, df, error in batch_results)
                 print(f"  Batch {i}/{len(batches)} complete")
         
         return results
@@ -2529,13 +1562,6 @@ Scrapes baseball schedules from ALL Presto Sports layout types.
 Special handling for Limestone University.
 """
 
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
-import time
-import re
-from requests.exceptions import HTTPError
-
 
 class PrestoScraper:
     """
@@ -2567,7 +1593,10 @@ class PrestoScraper:
         self.url_dict = url_dict
         self.year = year
         self.standardize_names = standardize_names
-        self.session = requests.Session()
+        
+        # Per-domain backoff: {host: {'lock', 'next_allowed', 'delay'}}
+        self._hosts = {}
+        self._hosts_lock = threading.Lock()
         
         # Default headers to avoid 403 errors
         self.headers = {
@@ -2582,6 +1611,10 @@ class PrestoScraper:
             'Sec-Fetch-Mode': 'navigate',
             'Sec-Fetch-Site': 'none'
         }
+        
+        # Pooled session sized to the worker pool; one adapter-level retry,
+        # repeated 403s are handled by the per-domain backoff below
+        self.session = http_client.make_session(pool_size=16, retries=1, headers=self.headers)
     
     @staticmethod
     def standardize_team_name(name):
@@ -2637,12 +1670,12 @@ class PrestoScraper:
         DataFrame with schedule data
         """
         team_name = "Limestone"
-        url = 'https://www.thesac.com/sports/bsb/2024-25/schedule?teamId=6x43l4c55d380k6t&jsRendering=true'
+        url = LIMESTONE_URL.format(season=presto_season(self.year))
         
         print(f"Scraping {team_name} schedule (special handling)...")
         
         try:
-            response = self.session.get(url, headers=self.headers, timeout=30)
+            response = http_cache.get(url, session=self.session, headers=self.headers, timeout=30)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -2656,6 +1689,35 @@ class PrestoScraper:
             print(f"Error scraping {team_name}: {e}")
             raise
     
+    def _host_state(self, url):
+        host = urlsplit(url).netloc.lower()
+        with self._hosts_lock:
+            if host not in self._hosts:
+                self._hosts[host] = {'lock': threading.Lock(), 'next_allowed': 0.0, 'delay': None}
+            return host, self._hosts[host]
+    
+    def _wait_for_host(self, url):
+        """Block this worker (only) until the domain's backoff has passed."""
+        _, state = self._host_state(url)
+        with state['lock']:
+            wait = state['next_allowed'] - time.time()
+        if wait > 0:
+            time.sleep(wait)
+    
+    def _backoff_host(self, url, retry_delay):
+        """Push the domain's next allowed request out; the delay grows 1.5x per 403."""
+        host, state = self._host_state(url)
+        with state['lock']:
+            delay = state['delay'] * 1.5 if state['delay'] else retry_delay
+            state['delay'] = delay
+            state['next_allowed'] = max(state['next_allowed'], time.time() + delay)
+        return host, delay
+    
+    def _reset_host(self, url):
+        _, state = self._host_state(url)
+        with state['lock']:
+            state['delay'] = None
+    
     def _scrape_presto_schedule(self, team_name, max_retries, retry_delay):
         """
         Scrape a Presto Sports schedule page with automatic format detection.
@@ -2678,21 +1740,26 @@ class PrestoScraper:
         
         for attempt in range(max_retries):
             try:
-                response = self.session.get(url, headers=self.headers, timeout=30)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, 'html.parser')
+                self._wait_for_host(url)
+                with run_metrics.span('fetch', 'd2_presto', team_name):
+                    response = http_cache.get(url, session=self.session, headers=self.headers, timeout=30)
+                    response.raise_for_status()
+                self._reset_host(url)
                 
-                # Auto-detect format
-                return self._detect_and_parse_format(soup, team_name)
+                with run_metrics.span('parse', 'd2_presto', team_name):
+                    soup = BeautifulSoup(response.text, 'html.parser')
+                    
+                    # Auto-detect format
+                    return self._detect_and_parse_format(soup, team_name)
             
             except HTTPError as e:
                 last_error = e
                 if e.response.status_code == 403:
                     if attempt < max_retries - 1:
-                        print(f"403 error for {team_name}, attempt {attempt + 1}/{max_retries}. Retrying in {retry_delay}s...")
-                        time.sleep(retry_delay)
-                        retry_delay *= 1.5
+                        # Only this domain backs off; other workers keep going
+                        host, delay = self._backoff_host(url, retry_delay)
+                        print(f"403 error for {team_name}, attempt {attempt + 1}/{max_retries}. "
+                              f"Backing off {host} for {delay:.1f}s...")
                     else:
                         print(f"Failed to scrape {team_name} after {max_retries} attempts")
                         raise
@@ -2721,52 +1788,57 @@ class PrestoScraper:
         --------
         DataFrame with schedule data
         """
-        # Check for Format 1: table format (most specific)
+        # Every layout whose markers are present is tried in a fixed order on
+        # the same document; the first parser that yields games wins
         month_sections = soup.find_all('div', class_='section-event-month')
-        for section in month_sections:
-            if section.find('table', class_='table'):
-                print(f"Detected Format 1 (table-based) for {team_name}")
-                return self._parse_presto_table_schedule(soup, team_name)
-        
-        # Check for Format 2: card format
-        card_games = soup.find_all('div', class_='card')
-        card_event_rows = [card for card in card_games if 'event-row' in card.get('class', [])]
-        
-        if card_event_rows:
-            has_card_body = any(card.find('div', class_='card-body') for card in card_event_rows)
-            
-            if has_card_body:
-                print(f"Detected Format 2 (card-based) for {team_name}")
-                return self._parse_presto_card_schedule(soup, team_name)
-        
-        # Check for Format 3: event-group divs
+        card_event_rows = [card for card in soup.find_all('div', class_='card')
+                           if 'event-row' in card.get('class', [])]
         event_groups = soup.find_all('div', class_='event-group')
-        if event_groups:
-            first_group = event_groups[0]
-            simple_event_rows = first_group.find_all('div', class_='event-row', recursive=False)
-            simple_event_rows = [row for row in simple_event_rows if 'card' not in row.get('class', [])]
-            
-            if simple_event_rows:
-                print(f"Detected Format 3 (event-group with divs) for {team_name}")
-                return self._parse_presto_div_schedule(soup, team_name)
-        
-        # Check for Format 4: tbody event-group table format
         tbody_event_groups = soup.find_all('tbody', class_='event-group')
-        if tbody_event_groups:
-            print(f"Detected Format 4 (tbody event-group table) for {team_name}")
-            return self._parse_presto_tbody_schedule(soup, team_name)
-        
-        # Check for Format 5: Direct event-row divs (no event-groups, no cards)
-        direct_event_rows = soup.find_all('div', class_='event-row')
-        # Filter out any that are inside event-groups or are cards
         direct_event_rows = [
-            row for row in direct_event_rows 
+            row for row in soup.find_all('div', class_='event-row')
             if not row.find_parent('div', class_='event-group')
             and 'card' not in row.get('class', [])
         ]
-        if direct_event_rows:
-            print(f"Detected Format 5 (direct event-row divs) for {team_name}")
-            return self._parse_presto_direct_event_row_schedule(soup, team_name)
+        
+        simple_event_rows = []
+        if event_groups:
+            simple_event_rows = [
+                row for row in event_groups[0].find_all('div', class_='event-row', recursive=False)
+                if 'card' not in row.get('class', [])
+            ]
+        
+        candidates = [
+            ("Format 1 (table-based)",
+             any(section.find('table', class_='table') for section in month_sections),
+             self._parse_presto_table_schedule),
+            ("Format 2 (card-based)",
+             any(card.find('div', class_='card-body') for card in card_event_rows),
+             self._parse_presto_card_schedule),
+            ("Format 3 (event-group with divs)",
+             bool(simple_event_rows),
+             self._parse_presto_div_schedule),
+            ("Format 4 (tbody event-group table)",
+             bool(tbody_event_groups),
+             self._parse_presto_tbody_schedule),
+            ("Format 5 (direct event-row divs)",
+             bool(direct_event_rows),
+             self._parse_presto_direct_event_row_schedule),
+        ]
+        
+        errors = []
+        for label, detected, parse in candidates:
+            if not detected:
+                continue
+            try:
+                df = parse(soup, team_name)
+            except Exception as e:
+                errors.append(f"{label}: {str(e)[:80]}")
+                continue
+            if df is not None and not df.empty:
+                print(f"Detected {label} for {team_name}")
+                return df
+            errors.append(f"{label}: no games")
         
         # Debug info if no format found
         print(f"Debug info for {team_name}:")
@@ -2775,6 +1847,8 @@ class PrestoScraper:
         print(f"  - Found {len(event_groups)} div event-group sections")
         print(f"  - Found {len(tbody_event_groups)} tbody event-group sections")
         print(f"  - Found {len(direct_event_rows)} direct event-row divs")
+        for error in errors:
+            print(f"  - {error}")
         
         raise ValueError(f"Could not detect Presto schedule format for {team_name}")
     
@@ -3686,50 +2760,67 @@ class PrestoScraper:
         print(f"Successfully parsed {len(df)} games for {team_name}")
         return df
     
-    def scrape_all(self, show_progress=True):
+    def scrape_all(self, show_progress=True, max_workers=8, sink=None):
         """
-        Scrape all teams in the URL dictionary.
+        Scrape all teams in the URL dictionary concurrently.
+        
+        Each school domain keeps its own backoff state, so a throttled host
+        only delays its own team.
         
         Parameters:
         -----------
         show_progress : bool
             Whether to print progress updates
+        max_workers : int
+            Number of parallel workers
+        sink : callable, optional
+            sink(team_name, df) receives each schedule as it completes
+            instead of it being kept for the combined DataFrame
         
         Returns:
         --------
         tuple: (dataframe, failed_teams_list)
-            - dataframe: Combined DataFrame of all successful scrapes
+            - dataframe: Combined DataFrame of all successful scrapes (empty with a sink)
             - failed_teams_list: List of (team_name, error_message) tuples
         """
-        all_schedules = []
+        schedules = {}
         failed_teams = []
         start_time = time.time()
         
-        for i, team_name in enumerate(self.url_dict.keys(), 1):
-            try:
-                df = self.scrape_team(team_name)
-                all_schedules.append(df)
-                
-                if show_progress:
-                    elapsed = time.time() - start_time
-                    avg_time = elapsed / i
-                    est_remaining = avg_time * (len(self.url_dict) - i)
-                    print(f"[{i}/{len(self.url_dict)}] ✓ {team_name}: {len(df)} games "
-                          f"(~{int(est_remaining)}s remaining)")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self.scrape_team, team_name): team_name
+                       for team_name in self.url_dict.keys()}
             
-            except Exception as e:
-                error_msg = str(e)[:200]
-                failed_teams.append((team_name, error_msg))
-                if show_progress:
-                    print(f"[{i}/{len(self.url_dict)}] ✗ {team_name}: {error_msg[:100]}")
+            for i, future in enumerate(as_completed(futures), 1):
+                team_name = futures[future]
+                try:
+                    df = future.result()
+                    if sink is not None:
+                        sink(team_name, df)
+                    else:
+                        schedules[team_name] = df
+                    
+                    if show_progress:
+                        print(f"[{i}/{len(self.url_dict)}] ✓ {team_name}: {len(df)} games "
+                              f"({time.time() - start_time:.1f}s elapsed)")
+                
+                except Exception as e:
+                    error_msg = str(e)[:200]
+                    failed_teams.append((team_name, error_msg))
+                    if show_progress:
+                        print(f"[{i}/{len(self.url_dict)}] ✗ {team_name}: {error_msg[:100]}")
+        
+        # Keep the URL dictionary order regardless of completion order
+        all_schedules = [schedules[team] for team in self.url_dict if team in schedules]
+        succeeded = len(self.url_dict) - len(failed_teams)
         
         total_time = time.time() - start_time
         
         if show_progress:
             print(f"\n✓ Completed in {total_time:.1f} seconds ({total_time/60:.1f} minutes)")
             print(f"  Average: {total_time/len(self.url_dict):.2f} seconds per team")
-            print(f"  Success rate: {len(all_schedules)}/{len(self.url_dict)} "
-                  f"({len(all_schedules)/len(self.url_dict)*100:.1f}%)")
+            print(f"  Success rate: {succeeded}/{len(self.url_dict)} "
+                  f"({succeeded/len(self.url_dict)*100:.1f}%)")
         
         if failed_teams and show_progress:
             print(f"\n⚠ Failed to scrape {len(failed_teams)} teams:")
@@ -3744,56 +2835,55 @@ class PrestoScraper:
         else:
             return pd.DataFrame(), failed_teams
 
-base_url = "https://www.ncaa.com"
-soup = get_soup(f"{base_url}/stats/baseball/d1")
-dropdown = soup.find("select", {"id": "select-container-team"})
-stat_links = {
-    option.text.strip(): base_url + option["value"]
-    for option in dropdown.find_all("option") if option.get("value")
-}
-team_links = get_stat_dataframe_with_link('Earned Run Average').sort_values('Team')[['Team', 'link']]
-schedule_links = enrich_with_social_links(team_links)
-schedule_links['Augusta'] = 'https://augustajags.com/sports/baseball/schedule/2025'
-schedule_links['Azusa Pacific'] = 'https://athletics.apu.edu/sports/baseball/schedule/2025'
-schedule_links['Bloomfield'] = 'https://bcbearsathletics.com/sports/baseball/schedule/2025'
-schedule_links['Bluefield St.'] = 'https://gobstate.com/sports/baseball/schedule/2025'
-schedule_links['Cal State LA'] = 'https://lagoldeneagles.com/sports/baseball/schedule/2025'
-schedule_links['Catawba'] = 'https://catawbaathletics.com/sports/baseball/schedule/2025'
-schedule_links["D'Youville"] = 'https://dyusaints.com/sports/baseball/schedule/2025'
-schedule_links['Colo. Sch. of Mines'] = 'https://minesathletics.com/sports/baseball/schedule/2025'
-schedule_links['Colorado Mesa'] = 'https://cmumavericks.com/sports/baseball/schedule/2025'
-schedule_links['Davenport'] = 'https://dupanthers.com/sports/baseball/schedule/2025'
-schedule_links['Edward Waters'] = 'https://ewutigerpride.com/sports/baseball/schedule/2025'
-schedule_links['Findlay'] = 'https://findlayoilers.com/sports/baseball/schedule/2025'
-schedule_links['Franklin Pierce'] = 'https://fpuravens.com/sports/baseball/schedule/2025'
-schedule_links['Glenville St.'] = 'https://gstatepioneers.com/sports/baseball/schedule/2025'
-schedule_links['Jefferson'] = 'https://jeffersonrams.com/sports/baseball/schedule/2025'
-schedule_links['Menlo'] = 'https://menloathletics.com/sports/baseball/schedule/2025'
-schedule_links['North Greenville'] = 'https://www.nguathletics.com/sports/baseball/schedule/2025'
-schedule_links['Purdue Northwest'] = 'https://pnwathletics.com/sports/baseball/schedule/2025'
-schedule_links['Pittsburg St.'] = 'https://pittstategorillas.com/sports/baseball/schedule/2025'
-# Salem (WV) - nothing to scrape
-schedule_links["St. Edward's"] = 'https://gohilltoppers.com/sports/baseball/schedule/2025'
-schedule_links['UIndy'] = 'https://athletics.uindy.edu/sports/baseball/schedule/2025'
-schedule_links['Upper Iowa'] = 'https://uiupeacocks.com/sports/baseball/schedule/2025'
-presto_teams = ['Bridgeport', 'Carson-Newman', 'Coker', 'Dominican (NY)', 
-               'Emory & Henry', 'Mars Hill', 'Northwood', 'Saginaw Valley', 
-               'St. Thomas Aquinas', 'Tampa', 'Tusculum', 'Wilmington (DE)', 'Limestone']
-presto_links, sidearm_links = split_links_by_provider(schedule_links, presto_teams)
-presto_links['Bridgeport'] = 'https://ubknights.com/sports/bsb/2024-25/schedule'
-presto_links['Carson-Newman'] = 'https://cneagles.com/sports/m-basebl/2024-25/schedule'
-presto_links['Coker'] = 'https://cokercobras.com/sports/bsb/2024-25/schedule'
-presto_links['Dominican (NY)'] = 'https://chargerathletics.com/sports/bsb/2024-25/schedule'
-presto_links['Emory & Henry'] = 'https://gowasps.com/sports/bsb/2024-25/schedule'
-presto_links['Mars Hill'] = 'https://www.marshilllions.com/sports/bsb/2024-25/schedule'
-presto_links['Northwood'] = 'https://timberwolves.gonorthwood.com/sports/bsb/2024-25/schedule'
-presto_links['Saginaw Valley'] = 'https://svsucardinals.com/sports/bsb/2024-25/schedule'
-presto_links['St. Thomas Aquinas'] = 'https://stacathletics.com/sports/bsb/2024-25/schedule'
-presto_links['Tampa'] = 'https://tampaspartans.com/sports/bsb/2024-25/schedule'
-presto_links['Tusculum'] = 'https://tusculumpioneers.com/sports/bsb/2024-25/schedule'
-presto_links['Wilmington (DE)'] = 'https://wildcats.athletics.wilmu.edu/sports/bsb/2024-25/schedule'
-presto_links['Limestone'] = 'https://www.thesac.com/sports/bsb/2024-25/schedule?teamId=6x43l4c55d380k6t&jsRendering=true'
-sidearm_teams = list(sidearm_links.keys())
+# Schedule page for every team in a division (NCAA team page social link plus
+# manual overrides), split into Presto and Sidearm sites
+# The team list comes from ncaa.com, which only lists the current season's teams
+# returns (presto_links, sidearm_links)
+def get_schedule_links(division='D2', season=2025):
+    presto = presto_season(season)
+    team_links = get_stat_dataframe_with_link('Earned Run Average', get_stat_links(division)).sort_values('Team')[['Team', 'link']]
+    schedule_links = enrich_with_social_links(team_links, season=season)
+    schedule_links['Augusta'] = f'https://augustajags.com/sports/baseball/schedule/{season}'
+    schedule_links['Azusa Pacific'] = f'https://athletics.apu.edu/sports/baseball/schedule/{season}'
+    schedule_links['Bloomfield'] = f'https://bcbearsathletics.com/sports/baseball/schedule/{season}'
+    schedule_links['Bluefield St.'] = f'https://gobstate.com/sports/baseball/schedule/{season}'
+    schedule_links['Cal State LA'] = f'https://lagoldeneagles.com/sports/baseball/schedule/{season}'
+    schedule_links['Catawba'] = f'https://catawbaathletics.com/sports/baseball/schedule/{season}'
+    schedule_links["D'Youville"] = f'https://dyusaints.com/sports/baseball/schedule/{season}'
+    schedule_links['Colo. Sch. of Mines'] = f'https://minesathletics.com/sports/baseball/schedule/{season}'
+    schedule_links['Colorado Mesa'] = f'https://cmumavericks.com/sports/baseball/schedule/{season}'
+    schedule_links['Davenport'] = f'https://dupanthers.com/sports/baseball/schedule/{season}'
+    schedule_links['Edward Waters'] = f'https://ewutigerpride.com/sports/baseball/schedule/{season}'
+    schedule_links['Findlay'] = f'https://findlayoilers.com/sports/baseball/schedule/{season}'
+    schedule_links['Franklin Pierce'] = f'https://fpuravens.com/sports/baseball/schedule/{season}'
+    schedule_links['Glenville St.'] = f'https://gstatepioneers.com/sports/baseball/schedule/{season}'
+    schedule_links['Jefferson'] = f'https://jeffersonrams.com/sports/baseball/schedule/{season}'
+    schedule_links['Menlo'] = f'https://menloathletics.com/sports/baseball/schedule/{season}'
+    schedule_links['North Greenville'] = f'https://www.nguathletics.com/sports/baseball/schedule/{season}'
+    schedule_links['Purdue Northwest'] = f'https://pnwathletics.com/sports/baseball/schedule/{season}'
+    schedule_links['Pittsburg St.'] = f'https://pittstategorillas.com/sports/baseball/schedule/{season}'
+    # Salem (WV) - nothing to scrape
+    schedule_links["St. Edward's"] = f'https://gohilltoppers.com/sports/baseball/schedule/{season}'
+    schedule_links['UIndy'] = f'https://athletics.uindy.edu/sports/baseball/schedule/{season}'
+    schedule_links['Upper Iowa'] = f'https://uiupeacocks.com/sports/baseball/schedule/{season}'
+    presto_teams = ['Bridgeport', 'Carson-Newman', 'Coker', 'Dominican (NY)', 
+                   'Emory & Henry', 'Mars Hill', 'Northwood', 'Saginaw Valley', 
+                   'St. Thomas Aquinas', 'Tampa', 'Tusculum', 'Wilmington (DE)', 'Limestone']
+    presto_links, sidearm_links = split_links_by_provider(schedule_links, presto_teams)
+    presto_links['Bridgeport'] = f'https://ubknights.com/sports/bsb/{presto}/schedule'
+    presto_links['Carson-Newman'] = f'https://cneagles.com/sports/m-basebl/{presto}/schedule'
+    presto_links['Coker'] = f'https://cokercobras.com/sports/bsb/{presto}/schedule'
+    presto_links['Dominican (NY)'] = f'https://chargerathletics.com/sports/bsb/{presto}/schedule'
+    presto_links['Emory & Henry'] = f'https://gowasps.com/sports/bsb/{presto}/schedule'
+    presto_links['Mars Hill'] = f'https://www.marshilllions.com/sports/bsb/{presto}/schedule'
+    presto_links['Northwood'] = f'https://timberwolves.gonorthwood.com/sports/bsb/{presto}/schedule'
+    presto_links['Saginaw Valley'] = f'https://svsucardinals.com/sports/bsb/{presto}/schedule'
+    presto_links['St. Thomas Aquinas'] = f'https://stacathletics.com/sports/bsb/{presto}/schedule'
+    presto_links['Tampa'] = f'https://tampaspartans.com/sports/bsb/{presto}/schedule'
+    presto_links['Tusculum'] = f'https://tusculumpioneers.com/sports/bsb/{presto}/schedule'
+    presto_links['Wilmington (DE)'] = f'https://wildcats.athletics.wilmu.edu/sports/bsb/{presto}/schedule'
+    presto_links['Limestone'] = LIMESTONE_URL.format(season=presto)
+    return presto_links, sidearm_links
 
 # USAGE:
 # ======
@@ -3826,11 +2916,8 @@ sidearm_teams = list(sidearm_links.keys())
 # print(f"\nReclassified {len(works)} teams as static!")
 #
 # THE FIRST RUN WILL TAKE ABOUT AN HOUR TO CACHE ALL OF THE NECESSARY SCRAPING INFORMATION
-
-scraper = SidearmScraper(sidearm_links, division = 'D2', year = 2025)
-sidearm_unclean_df, failed_sidearm = scraper.scrape_all()
-
-# USAGE:
+#
+# PrestoScraper USAGE:
 # ======
 # 
 # # Initialize scraper
@@ -3843,14 +2930,91 @@ sidearm_unclean_df, failed_sidearm = scraper.scrape_all()
 # # Scrape all teams
 # df, failed_teams = presto_scraper.scrape_all()
 
-presto_scraper = PrestoScraper(presto_links, year=2025, standardize_names=True)
-presto_unclean_df, failed_presto = presto_scraper.scrape_all()
-
-sidearm_clean = clean_schedule_dataframe(sidearm_unclean_df)
-presto_clean = clean_schedule_dataframe(presto_unclean_df)
-sidearm_clean["Date"] = pd.to_datetime(
-    sidearm_clean["Date"].apply(lambda x: parse_flexible_date(x, year=2025))
-)
-schedule_df = pd.concat([sidearm_clean, presto_clean], ignore_index=True)
-schedule_df = schedule_df[~schedule_df['Result'].isin(['Cancelled', 'Postponed', 'Canceled'])]
-schedule_df = schedule_df[schedule_df['Date'] < pd.Timestamp('2025-07-01')].sort_values('Date').reset_index(drop=True)
\ No newline at end of file
+# One team's scraped schedule, cleaned and filtered for the store
+# (row-wise, so each team is written as soon as it is scraped)
+def finish_team_schedule(df, parse_dates=False, season=2025):
+    df = clean_schedule_dataframe(df, log_unmapped=False)
+    if parse_dates:
+        df["Date"] = pd.to_datetime(
+            df["Date"].apply(lambda x: parse_flexible_date(x, year=season))
+        )
+    df = df[~df['Result'].isin(schedule_snapshot.CANCELED_RESULTS)]
+    return df[df['Date'] < pd.Timestamp(f'{season}-07-01')]
+
+# Scrape every schedule of a division/season into the store
+# returns (games written, failed teams)
+def scrape_schedules(division='D2', season=2025):
+    with run_metrics.stage('d2_links'):
+        presto_links, sidearm_links = get_schedule_links(division, season)
+
+    # Each team's games go straight to the store in batches; a stopped run
+    # still leaves the teams scraped so far readable
+    with data_store.PartitionWriter('schedules', division, season, batch_size=2000) as writer:
+        def sink(parse_dates):
+            def write(team_name, df):
+                with run_metrics.span('clean', team=team_name):
+                    writer.write_frame(finish_team_schedule(df, parse_dates=parse_dates, season=season))
+            return write
+
+        with run_metrics.stage('d2_sidearm'):
+            scraper = SidearmScraper(sidearm_links, division = division, year = season)
+            _, failed_sidearm = scraper.scrape_all(sink=sink(parse_dates=True))
+
+        with run_metrics.stage('d2_presto'):
+            presto_scraper = PrestoScraper(presto_links, year=season, standardize_names=True)
+            _, failed_presto = presto_scraper.scrape_all(sink=sink(parse_dates=False))
+
+    print(f"{division} schedules: {writer.rows_written} games written to {writer.path}")
+
+    # Name review over the stored rows (only the name columns are read back)
+    with run_metrics.stage('d2_clean'):
+        log_unmapped_teams(data_store.read('schedules', division, season, columns=['Opponent', 'home_team', 'away_team']))
+
+    return writer.rows_written, failed_sidearm + failed_presto
+
+# Whole-season schedules re-scraping only the Sidearm teams with a game due
+# since the stored snapshot (plus its periodic full sweep); Presto sites have
+# no snapshot and are scraped in full
+# returns (games written, failed teams)
+def refresh_schedules(division='D2', season=2025):
+    with run_metrics.stage('d2_links'):
+        presto_links, sidearm_links = get_schedule_links(division, season)
+
+    with run_metrics.stage('d2_sidearm'):
+        scraper = SidearmScraper(sidearm_links, division = division, year = season)
+        sidearm_df, failed_sidearm = scraper.scrape_all(refresh=True)
+
+    with run_metrics.stage('d2_presto'):
+        presto_scraper = PrestoScraper(presto_links, year=season, standardize_names=True)
+        presto_df, failed_presto = presto_scraper.scrape_all()
+
+    with run_metrics.stage('d2_clean'):
+        frames = [finish_team_schedule(df, parse_dates=parse_dates, season=season)
+                  for df, parse_dates in [(sidearm_df, True), (presto_df, False)] if not df.empty]
+        schedule_df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        log_unmapped_teams(schedule_df)
+
+    if not schedule_df.empty:
+        path = data_store.write_partition(schedule_df, 'schedules', division, season)
+        print(f"{division} schedules: {len(schedule_df)} games written to {path}")
+
+    return len(schedule_df), failed_sidearm + failed_presto
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape the Sidearm and Presto schedules of a division.")
+    parser.add_argument('--division', default='D2')
+    parser.add_argument('--season', type=int, default=2025)
+    parser.add_argument('--refresh', action='store_true',
+                        help='Sidearm: only re-scrape teams with a game due since the stored snapshot')
+    args = parser.parse_args(argv)
+
+    if args.refresh:
+        refresh_schedules(args.division, args.season)
+    else:
+        scrape_schedules(args.division, args.season)
+    run_metrics.write()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
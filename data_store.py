@@ -0,0 +1,394 @@
+"""
+Partitioned Parquet store for schedules, stats and ratings (ELO / RPI).
+
+Every scrape writes its DataFrames to a hive-partitioned directory tree:
+
+    ./PEAR/PEAR Baseball/store/<dataset>/division=D1/season=2025/scrape_date=2025-05-01/part-0.parquet
+
+Known columns are cast to the typed schemas in SCHEMAS so every partition of a
+dataset has the same layout. read() pushes division/season/scrape_date and
+any extra filters down to the Parquet reader and memory-maps the files, so
+loading one season's schedule does not touch the network.
+
+PartitionWriter streams a partition instead: rows arrive in batches and are
+written as Parquet row groups, so a scrape never holds a whole season in
+memory. A `_COMPLETE` marker is written next to a partition once it has been
+written in full; a run that stops early leaves a readable file without it,
+unless the partition was already complete, which is then left untouched.
+"""
+
+import os
+import threading
+import uuid
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+STORE_DIR = os.path.join('.', 'PEAR', 'PEAR Baseball', 'store')
+
+SCHEMAS = {
+    'schedules': {
+        'Team': pa.string(),
+        'Date': pa.timestamp('ns'),
+        'Opponent': pa.string(),
+        'Location': pa.string(),
+        'Result': pa.string(),
+        'home_team': pa.string(),
+        'away_team': pa.string(),
+        'home_score': pa.float64(),
+        'away_score': pa.float64(),
+        'home_elo': pa.float64(),
+        'away_elo': pa.float64(),
+        'home_team_id': pa.int64(),
+        'away_team_id': pa.int64(),
+    },
+    'stats': {
+        'Team': pa.string(),
+    },
+    'elo': {
+        'Team': pa.string(),
+        'Team Link': pa.string(),
+        'ELO': pa.float64(),
+        'ELO_Rank': pa.float64(),
+        'team_id': pa.int64(),
+    },
+}
+
+# Columns not listed in a schema: strings stay strings, integers (team ids)
+# stay int64, everything else float64
+DEFAULT_NUMERIC = pa.float64()
+
+COMPLETE_MARKER = '_COMPLETE'  # underscore files are skipped by dataset discovery
+
+
+def partition_dir(dataset, division, season, scrape_date):
+    return os.path.join(STORE_DIR, dataset, f'division={division}',
+                        f'season={int(season)}', f'scrape_date={scrape_date}')
+
+
+def _to_timestamps(values, dataset):
+    """
+    Datetime column for a timestamp field. Only values that already are
+    dates are kept: strings are not guessed at ("Sat, Mar 1" has no year),
+    so they are stored as null and reported, since those rows drop out of
+    every date query.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    is_date = values.map(lambda v: isinstance(v, (date, np.datetime64)))
+    unparsed = values[values.notna() & ~is_date]
+    if len(unparsed):
+        examples = ', '.join(repr(v) for v in unparsed.astype(str).unique()[:3])
+        print(f"⚠ {dataset}.{values.name}: {len(unparsed)} values are not dates and are stored "
+              f"as null (e.g. {examples})")
+    return pd.to_datetime(values.where(is_date), errors='coerce')
+
+
+def _conform(df, dataset, overrides=None):
+    """
+    Cast known columns to the dataset schema and return an Arrow table.
+
+    overrides ({column: arrow type}) take precedence over SCHEMAS; a
+    PartitionWriter passes its first batch's types so every row group
+    matches.
+    """
+    schema = dict(SCHEMAS.get(dataset, {}), **(overrides or {}))
+    df = df.copy()
+    fields = []
+    for col in df.columns:
+        arrow_type = schema.get(col)
+        if arrow_type is None:
+            if pd.api.types.is_integer_dtype(df[col]):
+                arrow_type = pa.int64()
+            elif pd.api.types.is_numeric_dtype(df[col]):
+                arrow_type = DEFAULT_NUMERIC
+            elif pd.api.types.is_datetime64_any_dtype(df[col]):
+                arrow_type = pa.timestamp('ns')
+            else:
+                arrow_type = pa.string()
+
+        if pa.types.is_timestamp(arrow_type):
+            df[col] = _to_timestamps(df[col], dataset)
+        elif pa.types.is_integer(arrow_type):
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype('Int64')
+        elif pa.types.is_floating(arrow_type):
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype('float64')
+        elif pa.types.is_string(arrow_type):
+            df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+        fields.append(pa.field(str(col), arrow_type))
+
+    return pa.Table.from_pandas(df, schema=pa.schema(fields), preserve_index=False)
+
+
+def write_partition(df, dataset, division, season, scrape_date=None):
+    """
+    Write (or overwrite) one partition of a dataset.
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        Rows to store
+    dataset : str
+        'schedules', 'stats', 'elo', ... (any name works; SCHEMAS is optional)
+    division : str
+        Division name (e.g., 'D1', 'D2')
+    season : int
+        Season year
+    scrape_date : str, optional
+        YYYY-MM-DD partition (defaults to today)
+
+    Returns:
+    --------
+    str: path of the written file
+    """
+    scrape_date = scrape_date or datetime.today().strftime('%Y-%m-%d')
+    out_dir = partition_dir(dataset, division, season, scrape_date)
+    os.makedirs(out_dir, exist_ok=True)
+
+    path = os.path.join(out_dir, 'part-0.parquet')
+    tmp = _tmp_path(out_dir)
+    pq.write_table(_conform(df, dataset), tmp, compression='zstd')
+    os.replace(tmp, path)
+    _mark_complete(out_dir)
+    return path
+
+
+def _tmp_path(out_dir):
+    # Run-specific, so two writers of one partition never share a file;
+    # dot-files are ignored by readers
+    return os.path.join(out_dir, f'.part-0.{os.getpid()}-{uuid.uuid4().hex[:8]}.parquet.tmp')
+
+
+def _mark_complete(out_dir):
+    with open(os.path.join(out_dir, COMPLETE_MARKER), 'w') as f:
+        f.write(datetime.now().isoformat(timespec='seconds'))
+
+
+def is_complete(dataset, division, season, scrape_date):
+    """True if the partition was written in full (not left behind by a stopped run)."""
+    return os.path.exists(os.path.join(partition_dir(dataset, division, season, scrape_date),
+                                       COMPLETE_MARKER))
+
+
+def complete_scrape_dates(dataset, division, season):
+    """Sorted scrape dates of a division/season that were written in full."""
+    return [date for date in scrape_dates(dataset, division, season)
+            if is_complete(dataset, division, season, date)]
+
+
+class PartitionWriter:
+    """
+    Stream one partition to Parquet in fixed-size row groups.
+
+    Rows are buffered until batch_size of them are waiting, then conformed
+    and written as one row group, so memory stays bounded by the batch
+    size however many teams or seasons are scraped. The file is written
+    under a run-specific dot-name and moved into place, with the _COMPLETE
+    marker, on a clean close(). When the run stops early the rows written
+    so far are moved into place without the marker, unless the partition
+    is already complete: then the complete file is kept and the partial
+    one is left beside it as .part-0.partial.parquet (ignored by readers).
+
+    Parameters:
+    -----------
+    dataset, division, season, scrape_date :
+        See write_partition()
+    columns : list, optional
+        Column names for write_rows() (lists of values)
+    batch_size : int
+        Rows per row group
+    transform : callable, optional
+        transform(DataFrame) -> DataFrame applied to each batch before it
+        is written (row-wise clean-up only; it sees one batch at a time)
+
+    Every batch must have the first batch's columns (in any order); a batch
+    with other columns raises ValueError.
+
+    Example:
+    --------
+    with PartitionWriter('schedules', 'D1', 2025, columns=SCHEDULE_COLUMNS) as writer:
+        for team_rows in rows_per_team:
+            writer.write_rows(team_rows)
+    """
+
+    def __init__(self, dataset, division, season, scrape_date=None, columns=None,
+                 batch_size=5000, transform=None):
+        self.dataset = dataset
+        self.columns = columns
+        self.batch_size = batch_size
+        self.transform = transform
+        self.rows_written = 0
+        self.out_dir = partition_dir(dataset, division, season,
+                                     scrape_date or datetime.today().strftime('%Y-%m-%d'))
+        self.path = os.path.join(self.out_dir, 'part-0.parquet')
+        self._tmp = _tmp_path(self.out_dir)
+        self._partial = os.path.join(self.out_dir, '.part-0.partial.parquet')
+        self._pending = []
+        self._pending_rows = 0
+        self._writer = None
+        self._schema = None
+        self._lock = threading.Lock()
+        os.makedirs(self.out_dir, exist_ok=True)
+
+    def write_rows(self, rows):
+        """Queue a list of row lists (in self.columns order)."""
+        if rows:
+            self.write_frame(pd.DataFrame(rows, columns=self.columns))
+
+    def write_frame(self, df):
+        """Queue a DataFrame; full batches are written straight away."""
+        if df is None or df.empty:
+            return
+        with self._lock:
+            self._pending.append(df)
+            self._pending_rows += len(df)
+            if self._pending_rows >= self.batch_size:
+                self._flush()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        batch = pd.concat(self._pending, ignore_index=True)
+        self._pending, self._pending_rows = [], 0
+        if self.transform is not None:
+            batch = self.transform(batch)
+            if batch is None or batch.empty:
+                return
+
+        if self._writer is None:
+            table = _conform(batch, self.dataset)
+            self._schema = table.schema
+            self._writer = pq.ParquetWriter(self._tmp, self._schema, compression='zstd')
+        else:
+            # Every row group has the first batch's columns; a batch that adds
+            # or loses one would otherwise be silently reshaped
+            if set(batch.columns) != set(self._schema.names):
+                added = sorted(map(str, set(batch.columns) - set(self._schema.names)))
+                missing = sorted(set(self._schema.names) - set(map(str, batch.columns)))
+                raise ValueError(f"Batch columns do not match {self.path}: "
+                                 f"added {added}, missing {missing}")
+            overrides = {field.name: field.type for field in self._schema}
+            table = _conform(batch[self._schema.names], self.dataset, overrides)
+        self._writer.write_table(table)
+        self.rows_written += table.num_rows
+
+    def close(self, complete=True):
+        """
+        Write the last batch and move the file into place.
+
+        Returns:
+        --------
+        str or None: path of the file (None if no rows were written)
+        """
+        with self._lock:
+            try:
+                self._flush()
+            except Exception as e:
+                if complete:
+                    self._finish(complete=False)
+                    raise
+                print(f"Could not write the last batch of {self.path}: {e}")
+
+            path = self._finish(complete)
+            if path is None:
+                return None
+            if complete:
+                _mark_complete(self.out_dir)
+            else:
+                print(f"Partial partition kept at {path} ({self.rows_written} rows)")
+            return path
+
+    def _finish(self, complete):
+        """
+        Close the Parquet file and move it into place; an incomplete file
+        never replaces a complete partition. Returns its path (None if
+        nothing was written).
+        """
+        if self._writer is None:
+            return None
+        self._writer.close()
+        self._writer = None
+        if complete or not os.path.exists(os.path.join(self.out_dir, COMPLETE_MARKER)):
+            path = self.path
+        else:
+            path = self._partial
+        os.replace(self._tmp, path)
+        return path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(complete=exc_type is None)
+
+
+def scrape_dates(dataset, division, season):
+    """Sorted scrape dates stored for a division/season."""
+    season_dir = os.path.dirname(partition_dir(dataset, division, season, ''))
+    if not os.path.isdir(season_dir):
+        return []
+    return sorted(
+        name.split('=', 1)[1] for name in os.listdir(season_dir)
+        if name.startswith('scrape_date=')
+    )
+
+
+def read(dataset, division=None, season=None, scrape_date='latest', columns=None, filters=None):
+    """
+    Load rows from the store.
+
+    Parameters:
+    -----------
+    dataset : str
+        Dataset name
+    division : str, optional
+        Only this division
+    season : int, optional
+        Only this season
+    scrape_date : str or None
+        'latest' (default, needs division and season) for the newest complete
+        scrape, a YYYY-MM-DD string for a specific one, or None for every scrape
+    columns : list, optional
+        Only read these columns
+    filters : list, optional
+        Extra pyarrow filters, e.g. [('home_team', '=', 'Arkansas')]
+
+    Returns:
+    --------
+    pandas.DataFrame (empty if nothing is stored)
+    """
+    root = os.path.join(STORE_DIR, dataset)
+    if not os.path.isdir(root):
+        return pd.DataFrame()
+
+    if scrape_date == 'latest':
+        if division is None or season is None:
+            raise ValueError("scrape_date='latest' needs both division and season")
+        # A partition left behind by a stopped run is never 'latest'
+        dates = complete_scrape_dates(dataset, division, season)
+        if not dates:
+            return pd.DataFrame()
+        scrape_date = dates[-1]
+
+    # A single partition is read directly (no directory discovery)
+    if division is not None and season is not None and scrape_date is not None:
+        path = os.path.join(partition_dir(dataset, division, season, scrape_date), 'part-0.parquet')
+        if not os.path.exists(path):
+            return pd.DataFrame()
+        table = pq.read_table(path, columns=columns, filters=filters or None, memory_map=True)
+        return table.to_pandas()
+
+    predicates = list(filters or [])
+    if division is not None:
+        predicates.append(('division', '=', division))
+    if season is not None:
+        predicates.append(('season', '=', int(season)))
+    if scrape_date is not None:
+        predicates.append(('scrape_date', '=', scrape_date))
+
+    table = pq.read_table(root, columns=columns, filters=predicates or None,
+                          partitioning='hive', memory_map=True)
+    return table.to_pandas()
@@ -0,0 +1,269 @@
+"""
+Shared pool of warm headless Chrome drivers.
+
+Chrome start-up is the most expensive part of the dynamic-team path, so
+drivers are started once and checked out to workers. A driver is recycled
+after max_pages page loads or as soon as it crashes. wait_for_stable_dom()
+replaces the fixed time.sleep() calls that followed every WebDriverWait.
+Selenium is imported on first use, so importing this module stays cheap for
+scripts that never open a browser.
+"""
+
+import atexit
+import threading
+import time
+from contextlib import contextmanager
+
+import run_metrics
+
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+
+
+def create_driver(stealth=False):
+    """
+    Create an optimized headless Chrome driver.
+
+    Parameters:
+    -----------
+    stealth : bool
+        Hide the automation flags (needed for stats.ncaa.org)
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    chrome_options.add_argument(f'user-agent={USER_AGENT}')
+
+    # Performance optimizations
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+
+    # Disable unnecessary features
+    chrome_options.add_experimental_option('prefs', {
+        'profile.default_content_setting_values': {
+            'images': 2,
+            'plugins': 2,
+            'popups': 2,
+            'geolocation': 2,
+            'notifications': 2,
+            'media_stream': 2,
+        }
+    })
+
+    if stealth:
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+
+    chrome_options.page_load_strategy = 'eager'
+
+    driver = webdriver.Chrome(options=chrome_options)
+    if stealth:
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return driver
+
+
+def wait_for_stable_dom(driver, locator, timeout=10, poll=0.25):
+    """
+    Wait until locator is present and the page has stopped changing.
+
+    The page counts as stable once document.readyState is 'complete' and the
+    number of elements matching locator is the same on two consecutive polls.
+    Raises TimeoutException if locator never appears.
+
+    Returns:
+    --------
+    int: number of matching elements
+    """
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    WebDriverWait(driver, timeout).until(EC.presence_of_element_located(locator))
+
+    deadline = time.time() + timeout
+    previous = -1
+    while True:
+        count = len(driver.find_elements(*locator))
+        ready = driver.execute_script("return document.readyState") == 'complete'
+        if ready and count == previous:
+            return count
+        if time.time() >= deadline:
+            return count
+        previous = count
+        time.sleep(poll)
+
+
+class DriverPool:
+    """
+    Pool of warm Chrome drivers.
+
+    Parameters:
+    -----------
+    size : int
+        Maximum number of live drivers
+    max_pages : int
+        Recycle a driver after this many page loads
+    factory : callable
+        Function that returns a new driver
+    """
+
+    def __init__(self, size=4, max_pages=50, factory=create_driver):
+        self.size = size
+        self.max_pages = max_pages
+        self.factory = factory
+        self._idle = []  # LIFO, so the warmest driver goes out first
+        self._pages = {}
+        self._live = 0
+        # Guards _idle, _pages and _live; notified whenever a driver is
+        # returned or a live slot frees up
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def _discard(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        with self._cond:
+            self._pages.pop(id(driver), None)
+            self._live -= 1
+            self._cond.notify()
+
+    def _healthy(self, driver):
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _page_count(self, driver):
+        with self._cond:
+            return self._pages.get(id(driver), 0)
+
+    def acquire(self, timeout=None):
+        """
+        Check out a driver: an idle one, else a new one if the pool is not
+        full, else wait until a driver is released or discarded.
+
+        Raises TimeoutError if none is free within timeout seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while not self._idle and self._live >= self.size:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No driver free after {timeout}s")
+                self._cond.wait(remaining)
+            if self._idle:
+                return self._idle.pop()
+            self._live += 1
+
+        # Started outside the lock; the slot is already reserved
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._cond:
+                self._live -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._pages[id(driver)] = 0
+        return driver
+
+    def release(self, driver, broken=False):
+        """Return a driver; broken, worn-out or crashed drivers are replaced lazily."""
+        worn_out = self._page_count(driver) >= self.max_pages
+        if broken or worn_out or self._closed or not self._healthy(driver):
+            self._discard(driver)
+            return
+        try:
+            driver.delete_all_cookies()
+        except Exception:
+            pass
+        with self._cond:
+            self._idle.append(driver)
+            self._cond.notify()
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """
+        Context manager for a checked-out driver.
+
+        A WebDriverException other than a timeout marks the driver as crashed.
+        """
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+
+        driver = self.acquire(timeout=timeout)
+        broken = False
+        try:
+            yield driver
+        except TimeoutException:
+            raise
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            self.release(driver, broken=broken)
+
+    def renew(self, driver):
+        """
+        Swap a long-held driver for a fresh one if it crashed or used up its
+        page budget (for workers that keep one driver across many pages).
+
+        The old driver is released before the new one is acquired, so if
+        acquire() raises the caller holds no driver and must not release it.
+        """
+        if self._page_count(driver) < self.max_pages and self._healthy(driver):
+            return driver
+        self.release(driver)
+        return self.acquire()
+
+    def get(self, driver, url):
+        """driver.get(url) that counts towards the driver's page budget."""
+        with self._cond:
+            self._pages[id(driver)] = self._pages.get(id(driver), 0) + 1
+        start = time.perf_counter()
+        try:
+            driver.get(url)
+        finally:
+            run_metrics.observe_request(url, time.perf_counter() - start, via='selenium')
+
+    def close(self):
+        """Quit every idle driver; checked-out drivers are quit on release."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._discard(driver)
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(size=4, max_pages=50, stealth=False):
+    """
+    Process-wide pool (one per stealth setting), created on first use and
+    closed at exit. A later call with a larger size grows the pool.
+    """
+    with _pools_lock:
+        pool = _pools.get(stealth)
+        if pool is None or pool._closed:
+            pool = DriverPool(size=size, max_pages=max_pages,
+                              factory=lambda: create_driver(stealth=stealth))
+            _pools[stealth] = pool
+        if size > pool.size:
+            with pool._cond:
+                pool.size = size
+                pool._cond.notify_all()
+        return pool
+
+
+@atexit.register
+def close_all():
+    for pool in list(_pools.values()):
+        pool.close()
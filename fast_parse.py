@@ -0,0 +1,214 @@
+"""
+lxml fast path for the Warren Nolan and NCAA table parsers.
+
+Instead of building a full BeautifulSoup tree and calling find_all('td') per
+row, each parser cuts the target table out of the page, parses only that
+fragment with lxml and walks it with XPath, returning column arrays that go
+straight into pd.DataFrame.
+
+AVAILABLE is False when lxml is not installed; callers keep their
+BeautifulSoup code as the fallback.
+"""
+
+import re
+
+try:
+    from lxml import html as lxml_html
+    AVAILABLE = True
+except ImportError:
+    lxml_html = None
+    AVAILABLE = False
+
+
+def _text(el):
+    """Equivalent of BeautifulSoup's .text.strip()."""
+    return el.text_content().strip()
+
+
+def _strip_text(el):
+    """Equivalent of BeautifulSoup's .get_text(strip=True)."""
+    return ''.join(s.strip() for s in el.itertext())
+
+
+def _has_class(cls):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+
+
+def _matching_close(html, tag, start):
+    """End offset of the close tag matching the <tag> at start (-1 if unclosed)."""
+    depth = 0
+    for match in re.compile(rf'<(/?){tag}\b[^>]*>', re.IGNORECASE).finditer(html, start):
+        depth += -1 if match.group(1) else 1
+        if depth == 0:
+            return match.end()
+    return -1
+
+
+def _fragment(html, tag, class_name):
+    """
+    Parse only the first <tag class="... class_name ..."> element.
+
+    The cut ends at the matching close tag, so elements of the same tag
+    nested inside it (e.g. a box score table in a table cell) are kept.
+    Falls back to parsing the whole document if the element cannot be cut out
+    of the raw HTML (e.g. attributes in an unexpected order).
+    """
+    start = re.search(rf'<{tag}\b[^>]*class="(?:[^"]*\s)?{re.escape(class_name)}(?:\s[^"]*)?"', html)
+    if start:
+        end = _matching_close(html, tag, start.start())
+        if end != -1:
+            try:
+                return lxml_html.fragment_fromstring(html[start.start():end])
+            except Exception:
+                pass
+
+    root = lxml_html.fromstring(html)
+    found = root.xpath(f"//{tag}[{_has_class(class_name)}]")
+    return found[0] if found else None
+
+
+def warrennolan_rankings(html):
+    """
+    Rank / team / conference columns from a Warren Nolan stats-table.
+
+    Returns:
+    --------
+    dict of column lists, or None if the table is missing
+    """
+    table = _fragment(html, 'table', 'stats-table')
+    if table is None:
+        return None
+
+    ranks, teams, conferences = [], [], []
+    for row in table.xpath('.//tbody/tr'):
+        cells = row.xpath('./td')
+        if len(cells) < 2:
+            continue
+        name_div = cells[1].xpath(f".//div[{_has_class('name-subcontainer')}]")
+        full_text = _text(name_div[0]) if name_div else _text(cells[1])
+        parts = full_text.split("\n")
+        ranks.append(_text(cells[0]))
+        teams.append(parts[0].strip())
+        conferences.append(parts[1].split("(")[0].strip() if len(parts) > 1 else "")
+
+    return {'rank': ranks, 'team': teams, 'conference': conferences}
+
+
+def elo_table(html):
+    """
+    Headers and rows of the Warren Nolan ELO table, with a 'Team Link' column
+    inserted after the team name.
+
+    Returns:
+    --------
+    tuple: (headers, rows), or None if the table is missing
+    """
+    table = _fragment(html, 'table', 'stats-table')
+    if table is None:
+        return None
+
+    headers = [_text(th) for th in table.xpath('.//thead//th')]
+    headers.insert(1, "Team Link")
+
+    rows = []
+    for row in table.xpath('.//tbody/tr'):
+        row_data = []
+        for i, cell in enumerate(row.xpath('./td')):
+            if i == 0:
+                name_container = cell.xpath(f".//div[{_has_class('name-subcontainer')}]")
+                if name_container:
+                    links = name_container[0].xpath('.//a/@href')
+                    row_data.append(_text(name_container[0]))
+                    row_data.append(links[0] if links else '')
+                else:
+                    row_data.append(_text(cell))
+                    row_data.append('')
+            else:
+                row_data.append(_text(cell))
+        rows.append(row_data)
+
+    return headers, rows
+
+
+def simple_table(html, class_name):
+    """
+    Headers (every <th>) and rows (every <tr> after the first) of a table,
+    e.g. the NCAA RPI table (class 'sticky').
+
+    Returns:
+    --------
+    tuple: (headers, rows), or None if the table is missing
+    """
+    table = _fragment(html, 'table', class_name)
+    if table is None:
+        return None
+
+    headers = [_text(th) for th in table.xpath('.//th')]
+    rows = [[_text(td) for td in tr.xpath('./td')] for tr in table.xpath('.//tr')[1:]]
+    return headers, rows
+
+
+def schedule_items(html, team_name):
+    """
+    Warren Nolan team schedule rows, same layout as parse_schedule_page.
+
+    Returns:
+    --------
+    list of rows (empty if the schedule list is missing)
+    """
+    schedule_list = _fragment(html, 'ul', 'team-schedule')
+    if schedule_list is None:
+        return []
+
+    def first(game, xpath):
+        found = game.xpath(xpath)
+        return found[0] if found else None
+
+    def by_class(tag, cls):
+        return f".//{tag}[{_has_class(cls)}]"
+
+    team_schedule = []
+    for game in schedule_list.xpath(f".//li[{_has_class('team-schedule')}]"):
+        try:
+            month = first(game, by_class('span', 'team-schedule__game-date--month'))
+            day = first(game, by_class('span', 'team-schedule__game-date--day'))
+            dow = first(game, by_class('span', 'team-schedule__game-date--dow'))
+            game_date = f"{_strip_text(month)} {_strip_text(day)} ({_strip_text(dow)})"
+
+            opponent_link = first(game, by_class('*', 'team-schedule__opp-line-link'))
+            opponent_name = _strip_text(opponent_link) if opponent_link is not None else ""
+
+            location_div = first(game, by_class('div', 'team-schedule__location'))
+            location_text = _strip_text(location_div) if location_div is not None else ""
+            if "VS" in location_text:
+                game_location = "Neutral"
+            elif "AT" in location_text:
+                game_location = "Away"
+            else:
+                game_location = "Home"
+
+            result_info = first(game, by_class('div', 'team-schedule__result'))
+            result_text = _strip_text(result_info) if result_info is not None else "N/A"
+
+            box_score_table = first(game, by_class('table', 'team-schedule-bottom__box-score'))
+            home_team = away_team = home_score = away_score = "N/A"
+
+            if box_score_table is not None:
+                rows = box_score_table.xpath('.//tr')
+                if len(rows) > 2:
+                    away_row = rows[1].xpath('./td')
+                    home_row = rows[2].xpath('./td')
+                    away_team = _strip_text(away_row[0])
+                    home_team = _strip_text(home_row[0])
+                    away_score = _strip_text(away_row[-3])
+                    home_score = _strip_text(home_row[-3])
+
+            team_schedule.append([
+                team_name, game_date, opponent_name, game_location,
+                result_text, home_team, away_team, home_score, away_score
+            ])
+        except Exception as e:
+            print(f"[Parse Error] {team_name} game row → {e}")
+            continue
+
+    return team_schedule
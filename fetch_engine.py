@@ -0,0 +1,233 @@
+"""
+Asyncio fetch engine with per-host concurrency limits.
+
+A single pooled aiohttp client keeps hundreds of requests in flight without a
+thread per request. Each host gets its own semaphore so one site can be driven
+harder than another, and every response goes through the http_cache
+validators (fresh hits never touch the network, stale ones are revalidated).
+
+If a host keeps answering 429/503 the whole run is cancelled cleanly and
+ThrottledError carries the results gathered so far. Requests also consult the
+http_client circuit breaker shared with the synchronous client.
+"""
+
+import asyncio
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+import aiohttp
+
+import http_cache
+import http_client
+import run_metrics
+
+DEFAULT_HEADERS = {"User-Agent": "Mozilla/5.0"}
+THROTTLE_STATUSES = (429, 503)
+
+
+class ThrottledError(Exception):
+    """Raised when a host keeps throttling us; holds the partial results."""
+
+    def __init__(self, host, results=None):
+        super().__init__(f"{host} is throttling requests, run cancelled")
+        self.host = host
+        self.results = results if results is not None else {}
+
+
+class AsyncFetcher:
+    """
+    Pooled async HTTP client with a semaphore per host.
+
+    Parameters:
+    -----------
+    per_host : int
+        Maximum concurrent requests to a single host
+    total : int
+        Maximum concurrent requests overall (connection pool size)
+    timeout : int
+        Per-request timeout in seconds
+    headers : dict, optional
+        Default request headers
+    max_throttled : int
+        Number of 429/503 responses from one host before the run is cancelled
+    """
+
+    def __init__(self, per_host=8, total=100, timeout=15, headers=None, max_throttled=5):
+        self.per_host = per_host
+        self.total = total
+        self.timeout = timeout
+        self.headers = headers or DEFAULT_HEADERS
+        self.max_throttled = max_throttled
+        self.session = None
+        self._semaphores = {}
+        self._throttled = defaultdict(int)
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.total, limit_per_host=0, ttl_dns_cache=300)
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.session.close()
+
+    def _semaphore(self, host):
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.per_host)
+        return self._semaphores[host]
+
+    async def fetch(self, url, headers=None):
+        """GET a URL through the cache; returns an http_cache.CachedResponse."""
+        meta, body = http_cache.load(url) if http_cache.ENABLED else (None, None)
+        if http_cache.ENABLED and http_cache.is_fresh(meta, http_cache.ttl_for(url)):
+            run_metrics.cache_result('fresh')
+            return http_cache._from_meta(meta, body)
+
+        host = urlsplit(url).netloc
+        request_headers = dict(headers or {})
+        request_headers.update(http_cache.conditional_headers(meta))
+
+        if not http_client.breaker.allow(host):
+            raise http_client.CircuitOpenError(f"Circuit open for {host}, request skipped")
+
+        async with self._semaphore(host):
+            start = time.perf_counter()
+            try:
+                async with self.session.get(url, headers=request_headers) as response:
+                    content = await response.read()
+                    status = response.status
+                    response_headers = dict(response.headers)
+                    encoding = response.get_encoding()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                http_client.breaker.record(host, ok=False)
+                run_metrics.observe_request(url, time.perf_counter() - start, via='aiohttp')
+                raise
+            run_metrics.observe_request(url, time.perf_counter() - start, status, len(content), via='aiohttp')
+
+        http_client.breaker.record(host, ok=status not in http_client.FAILURE_STATUSES)
+
+        if status in THROTTLE_STATUSES:
+            self._throttled[host] += 1
+            if self._throttled[host] >= self.max_throttled:
+                raise ThrottledError(host)
+
+        if status == 304 and meta is not None:
+            run_metrics.cache_result('revalidated')
+            return http_cache._from_meta(http_cache.touch(url, meta), body)
+
+        if http_cache.ENABLED:
+            run_metrics.cache_result('miss')
+
+        if status == 200 and http_cache.ENABLED:
+            meta = http_cache.store(url, status, response_headers, content, encoding=encoding)
+            return http_cache.CachedResponse(url, status, response_headers, content,
+                                             from_cache=False, meta=meta)
+
+        return http_cache.CachedResponse(url, status, response_headers, content,
+                                         from_cache=False, meta={'encoding': encoding})
+
+    async def fetch_and_parse(self, jobs, parse, parse_in_thread=True):
+        """
+        Fetch every (key, url) job and parse each response as soon as it arrives.
+
+        Parameters:
+        -----------
+        jobs : iterable of (key, url)
+            Keys identify the result (e.g. team name)
+        parse : callable
+            parse(key, response) -> result
+        parse_in_thread : bool
+            Run parse off the event loop so downloads keep flowing while parsing
+
+        Returns:
+        --------
+        dict: {key: result}; failed jobs are reported and left out
+        """
+        results = {}
+
+        async def one(key, url):
+            try:
+                response = await self.fetch(url)
+                if parse_in_thread:
+                    return key, await asyncio.to_thread(parse, key, response)
+                return key, parse(key, response)
+            except ThrottledError:
+                raise
+            except Exception as e:
+                print(f"[Fetch Error] {key} → {e}")
+                return key, None
+
+        tasks = [asyncio.create_task(one(key, url)) for key, url in jobs]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                key, value = await next_done
+                if value is not None:
+                    results[key] = value
+        except ThrottledError as e:
+            e.results = results
+            raise
+        finally:
+            await cancel_all(tasks)
+
+        return results
+
+
+async def cancel_all(tasks):
+    """Cancel unfinished tasks and wait for them to unwind."""
+    for task in tasks:
+        if not task.done():
+            task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _run_sync(coro):
+    """asyncio.run that also works when an event loop is already running (notebooks)."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    result = {}
+
+    def runner():
+        try:
+            result['value'] = asyncio.run(coro)
+        except BaseException as e:
+            result['error'] = e
+
+    # The loop's tasks inherit the caller's context (run_metrics stage)
+    thread = threading.Thread(target=run_metrics.bind(runner))
+    thread.start()
+    thread.join()
+    if 'error' in result:
+        raise result['error']
+    return result['value']
+
+
+def run(main, **fetcher_kwargs):
+    """Run main(fetcher) to completion with a fresh AsyncFetcher."""
+    async def wrapper():
+        async with AsyncFetcher(**fetcher_kwargs) as fetcher:
+            return await main(fetcher)
+    return _run_sync(wrapper())
+
+
+def fetch_all(jobs, parse, parse_in_thread=True, **fetcher_kwargs):
+    """
+    Synchronous entry point: fetch and parse every (key, url) job.
+
+    On throttling the partial results are returned and the error is reported.
+    """
+    async def main(fetcher):
+        return await fetcher.fetch_and_parse(jobs, parse, parse_in_thread=parse_in_thread)
+
+    try:
+        return run(main, **fetcher_kwargs)
+    except ThrottledError as e:
+        print(f"[Throttled] {e} ({len(e.results)} results kept)")
+        return e.results
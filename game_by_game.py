@@ -1,152 +1,362 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 import pandas as pd
 import time
 from io import StringIO
 import re
+import os
+import json
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urljoin
+import http_cache
+import driver_pool
+import rate_limit
+import data_store
 
 def setup_driver():
     """Setup Chrome driver with anti-detection options"""
-    chrome_options = Options()
-    chrome_options.add_argument('--headless')
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
-    chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    return driver_pool.create_driver(stealth=True)
+
+
+GAME_LOG_IDS_PATH = os.path.join('.', 'PEAR', 'PEAR Baseball', 'ncaa_game_log_ids.json')
+HEADERS = {'User-Agent': driver_pool.USER_AGENT}
+NUMERIC_COLUMNS = ['AB', 'BB', 'HBP', 'SF', 'SH', 'H', '2B', '3B', 'HR', 'R']
+GAME_BY_GAME_LINK = re.compile(r'<a[^>]*href="([^"]+)"[^>]*>\s*Game By Game\s*</a>', re.I)
+
+_team_index = {}
+_game_log_ids = None
+_ids_lock = threading.Lock()
+
+
+def team_year_id(df, team_name, season):
+    """
+    year_id for a (team, season) from the team ids frame.
+
+    The frame is indexed once (per DataFrame object) instead of being filtered
+    with boolean masks on every call.
+    """
+    cached = _team_index.get(id(df))
+    if cached is None or cached[0] is not df:
+        index = dict(zip(zip(df['team_name'], df['season'].astype(int)), df['year_id']))
+        cached = (df, index)
+        _team_index[id(df)] = cached
+
+    year_id = cached[1].get((team_name, int(season)))
+    if year_id is None:
+        raise ValueError(f"No data found for team '{team_name}' in season {season}")
+    return year_id
+
+
+def load_game_log_ids():
+    """{year_id: {'url', 'player_id'}} discovered so far."""
+    global _game_log_ids
+    with _ids_lock:
+        if _game_log_ids is None:
+            _game_log_ids = {}
+            if os.path.exists(GAME_LOG_IDS_PATH):
+                with open(GAME_LOG_IDS_PATH) as f:
+                    _game_log_ids = json.load(f)
+        return _game_log_ids
+
+
+def _save_game_log_id(year_id, url, player_id):
+    ids = load_game_log_ids()
+    with _ids_lock:
+        ids[str(year_id)] = {'url': url, 'player_id': player_id}
+        os.makedirs(os.path.dirname(GAME_LOG_IDS_PATH), exist_ok=True)
+        tmp = GAME_LOG_IDS_PATH + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(ids, f, indent=1)
+        os.replace(tmp, GAME_LOG_IDS_PATH)
+
+
+def _throttle(governor):
+    if governor is not None:
+        governor.acquire()
+
+
+def _http_get(url, governor=None):
+    """Plain HTTP fetch; None when the site refuses non-browser clients."""
+    _throttle(governor)
+    try:
+        response = http_cache.get(url, headers=HEADERS, timeout=10)
+    except Exception:
+        return None
+    return response.text if response.ok else None
+
+
+def discover_game_log(year_id, get_driver, pool, governor=None):
+    """
+    Game By Game URL and id for a team season, from the cache or the team page.
+
+    The team page is tried over plain HTTP first; the browser is only used
+    when that fails.
+    """
+    known = load_game_log_ids().get(str(year_id))
+    if known:
+        return known['url'], known['player_id']
+
+    team_url = f"https://stats.ncaa.org/teams/{year_id}"
+    game_by_game_url = None
+
+    html = _http_get(team_url, governor)
+    if html:
+        match = GAME_BY_GAME_LINK.search(html)
+        if match:
+            game_by_game_url = urljoin(team_url, match.group(1))
+
+    if game_by_game_url is None:
+        from selenium.webdriver.common.by import By
+
+        driver = get_driver()
+        _throttle(governor)
+        pool.get(driver, team_url)
+        driver_pool.wait_for_stable_dom(driver, (By.CSS_SELECTOR, "ul.nav.nav-tabs a.nav-link"))
+
+        for link in driver.find_elements(By.CSS_SELECTOR, "ul.nav.nav-tabs a.nav-link"):
+            if 'Game By Game' in link.text:
+                game_by_game_url = link.get_attribute('href')
+                break
+        else:
+            raise ValueError(f"Could not find 'Game By Game' link for team {year_id}")
+
+    player_id = game_by_game_url.rstrip('/').split('/')[-1]
+    _save_game_log_id(year_id, game_by_game_url, player_id)
+    return game_by_game_url, player_id
+
+
+def fetch_game_log_table(game_by_game_url, player_id, get_driver, pool, governor=None):
+    """Raw game log table, over plain HTTP when it is in the page source."""
+    table_id = f"game_log_{player_id}_player"
+
+    html = _http_get(game_by_game_url, governor)
+    if html and f'id="{table_id}"' in html:
+        return pd.read_html(StringIO(html), attrs={'id': table_id})[0]
+
+    from selenium.webdriver.common.by import By
+
+    driver = get_driver()
+    _throttle(governor)
+    pool.get(driver, game_by_game_url)
+
+    # Wait for the table rows to finish rendering
+    driver_pool.wait_for_stable_dom(driver, (By.CSS_SELECTOR, f"#{table_id} tr"))
+
+    table = driver.find_element(By.ID, table_id)
+    table_html = table.get_attribute('outerHTML')
+
+    # Parse the table into a DataFrame using StringIO to avoid FutureWarning
+    return pd.read_html(StringIO(table_html))[0]
+
+
+def clean_game_log(game_log_df):
+    """Clean a raw game log table and add PA / 1B."""
+    # Remove doubleheader indicators from Date column (e.g., "(1)" or "(2)")
+    if 'Date' in game_log_df.columns:
+        game_log_df['Date'] = game_log_df['Date'].astype(str).str.replace(r'\(\d+\)$', '', regex=True).str.strip()
+    
+    # Clean up Opponent column
+    if 'Opponent' in game_log_df.columns:
+        # Remove ranking numbers (e.g., "#15 " or "#6 ")
+        game_log_df['Opponent'] = game_log_df['Opponent'].astype(str).str.replace(r'^#\d+\s+', '', regex=True)
+        # Remove the @ symbol at the start (for away games)
+        game_log_df['Opponent'] = game_log_df['Opponent'].str.replace(r'^@', '', regex=True)
+        # Remove neutral site location (space followed by @ and location)
+        game_log_df['Opponent'] = game_log_df['Opponent'].str.replace(r'\s+@.*$', '', regex=True)
+        # Strip any leading or trailing whitespace
+        game_log_df['Opponent'] = game_log_df['Opponent'].str.strip()
+    
+    # Convert numeric columns to numeric types
+    for col in NUMERIC_COLUMNS:
+        if col in game_log_df.columns:
+            # Remove trailing "/" markers (e.g., "3/" becomes "3")
+            game_log_df[col] = game_log_df[col].astype(str).str.replace(r'/$', '', regex=True)
+            # Convert to numeric
+            game_log_df[col] = pd.to_numeric(game_log_df[col], errors='coerce')
     
-    driver = webdriver.Chrome(options=chrome_options)
-    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-    return driver
+    # Fill NaN values with 0 for numeric columns
+    game_log_df[NUMERIC_COLUMNS] = game_log_df[NUMERIC_COLUMNS].fillna(0)
+    
+    # Calculate PA and 1B
+    game_log_df['PA'] = game_log_df['AB'] + game_log_df['BB'] + game_log_df['HBP'] + game_log_df['SF'] + game_log_df['SH']
+    game_log_df['1B'] = game_log_df['H'] - game_log_df['2B'] - game_log_df['3B'] - game_log_df['HR']
+    
+    return game_log_df
 
 
-def scrape_ncaa_game_by_game(df, team_name, season, driver=None):
+def scrape_ncaa_game_by_game(df, team_name, season, driver=None, governor=None):
     """
     Scrape game-by-game stats for a team from NCAA.org
     
+    The game log URL is looked up in the discovery cache (the team landing
+    page is only visited the first time) and fetched over plain HTTP when
+    possible, so a browser is only started when the site requires one.
+    
     Parameters:
     -----------
     df : pandas.DataFrame
-        DataFrame containing 'team_id', 'team_name', and 'season' columns
+        DataFrame containing 'year_id', 'team_name', and 'season' columns
     team_name : str
         Name of the team to scrape
     season : int or str
         Season year
     driver : selenium.webdriver.Chrome, optional
-        Selenium webdriver instance. If None, a new driver will be created and closed after use.
+        Selenium webdriver instance. If None and a browser is needed, a warm
+        driver is checked out of the shared driver pool and returned afterwards.
+    governor : rate_limit.RateGovernor, optional
+        Shared rate governor; one token is taken before every request
     
     Returns:
     --------
     pandas.DataFrame
         Game-by-game statistics table
     """
+    year_id = team_year_id(df, team_name, season)
     
-    # Filter dataframe for the specified team and season
-    team_data = df[(df['team_name'] == team_name) & (df['season'] == season)]
+    pool = driver_pool.get_pool(stealth=True)
+    checked_out = []
+    broken = False
     
-    if team_data.empty:
-        raise ValueError(f"No data found for team '{team_name}' in season {season}")
-    
-    team_id = team_data['year_id'].iloc[0]
-    
-    # Determine if we need to create and manage the driver
-    driver_provided = driver is not None
-    if not driver_provided:
-        driver = setup_driver()
+    def get_driver():
+        if driver is not None:
+            return driver
+        if not checked_out:
+            checked_out.append(pool.acquire())
+        return checked_out[0]
     
     try:
-        # Step 1: Navigate to the team page
-        team_url = f"https://stats.ncaa.org/teams/{team_id}"
-        driver.get(team_url)
-        
-        # Wait for the navigation tabs to load
-        wait = WebDriverWait(driver, 10)
-        wait.until(EC.presence_of_element_located((By.CLASS_NAME, "nav-tabs")))
-        
-        time.sleep(2)  # Additional wait for page to fully load
-        
-        # Step 2: Find and click the Game By Game link
-        game_by_game_link = None
-        nav_links = driver.find_elements(By.CSS_SELECTOR, "ul.nav.nav-tabs a.nav-link")
-        
-        for link in nav_links:
-            if 'Game By Game' in link.text:
-                game_by_game_url = link.get_attribute('href')
-                player_id = game_by_game_url.split('/')[-1]
-                break
-        else:
-            raise ValueError(f"Could not find 'Game By Game' link for team {team_name}")
-        
-        # Step 3: Navigate to the game-by-game page
-        driver.get(game_by_game_url)
-        
-        # Wait for the table to load
-        table_id = f"game_log_{player_id}_player"
-        wait.until(EC.presence_of_element_located((By.ID, table_id)))
-        
-        time.sleep(2)  # Additional wait for table to fully render
-        
-        # Step 4: Get the table HTML and parse it
-        table = driver.find_element(By.ID, table_id)
-        table_html = table.get_attribute('outerHTML')
-        
-        # Parse the table into a DataFrame using StringIO to avoid FutureWarning
-        game_log_df = pd.read_html(StringIO(table_html))[0]
-        
-        # Step 5: Clean up the data
-        # Remove doubleheader indicators from Date column (e.g., "(1)" or "(2)")
-        if 'Date' in game_log_df.columns:
-            game_log_df['Date'] = game_log_df['Date'].astype(str).str.replace(r'\(\d+\)$', '', regex=True).str.strip()
-        
-        # Clean up Opponent column
-        if 'Opponent' in game_log_df.columns:
-            # Remove ranking numbers (e.g., "#15 " or "#6 ")
-            game_log_df['Opponent'] = game_log_df['Opponent'].astype(str).str.replace(r'^#\d+\s+', '', regex=True)
-            # Remove the @ symbol at the start (for away games)
-            game_log_df['Opponent'] = game_log_df['Opponent'].str.replace(r'^@', '', regex=True)
-            # Remove neutral site location (space followed by @ and location)
-            game_log_df['Opponent'] = game_log_df['Opponent'].str.replace(r'\s+@.*$', '', regex=True)
-            # Strip any leading or trailing whitespace
-            game_log_df['Opponent'] = game_log_df['Opponent'].str.strip()
-        
-        # Convert numeric columns to numeric types
-        numeric_columns = ['AB', 'BB', 'HBP', 'SF', 'SH', 'H', '2B', '3B', 'HR', 'R']
-        for col in numeric_columns:
-            if col in game_log_df.columns:
-                # Remove trailing "/" markers (e.g., "3/" becomes "3")
-                game_log_df[col] = game_log_df[col].astype(str).str.replace(r'/$', '', regex=True)
-                # Convert to numeric
-                game_log_df[col] = pd.to_numeric(game_log_df[col], errors='coerce')
-        
-        # Fill NaN values with 0 for numeric columns
-        game_log_df[numeric_columns] = game_log_df[numeric_columns].fillna(0)
-        
-        # Calculate PA and 1B
-        game_log_df['PA'] = game_log_df['AB'] + game_log_df['BB'] + game_log_df['HBP'] + game_log_df['SF'] + game_log_df['SH']
-        game_log_df['1B'] = game_log_df['H'] - game_log_df['2B'] - game_log_df['3B'] - game_log_df['HR']
-        
-        return game_log_df
+        game_by_game_url, player_id = discover_game_log(year_id, get_driver, pool, governor)
+        game_log_df = fetch_game_log_table(game_by_game_url, player_id, get_driver, pool, governor)
+        return clean_game_log(game_log_df)
         
     except Exception as e:
-        raise Exception(f"Error scraping game-by-game data: {str(e)}")
+        # A pooled driver only exists if the browser fallback ran, so selenium
+        # is importable here (an ImportError would hide the original error)
+        if checked_out:
+            from selenium.common.exceptions import TimeoutException, WebDriverException
+            broken = isinstance(e, WebDriverException) and not isinstance(e, TimeoutException)
+        raise Exception(f"Error scraping game-by-game data: {str(e)}") from e
     
     finally:
-        # Only quit the driver if we created it
-        if not driver_provided:
-            driver.quit()
+        # Only return the driver to the pool if we checked it out
+        for pooled in checked_out:
+            pool.release(pooled, broken=broken)
+
+def harvest_dir(season):
+    return os.path.join('.', 'PEAR', 'PEAR Baseball', 'game_logs', f'y{int(season)}')
+
+
+def _checkpoint_path(season, year_id):
+    return os.path.join(harvest_dir(season), f'{year_id}.pkl')
+
+
+def harvest_season(df, season, teams=None, workers=3, rate=0.5, burst=1,
+                   jitter=(0.1, 5.0), batch_size=50, cooldown=120, store=True, division='D1'):
+    """
+    Scrape the game log of every team in a season, resumably.
+
+    Each finished team is checkpointed to its own pickle under harvest_dir(),
+    so a crashed or interrupted run picks up where it stopped. All workers
+    share one rate governor (token bucket + random jitter + a cooldown after
+    every batch_size teams), so adding drivers does not raise the request
+    rate.
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        Team ids frame (ncaa_team_ids.csv)
+    season : int
+        Season year
+    teams : list, optional
+        Team names to scrape (default: every team listed for the season)
+    workers : int
+        Parallel scrapers (and pooled drivers)
+    rate : float
+        Sustained requests per second across all workers
+    burst : int
+        Requests allowed back to back
+    jitter : tuple
+        (min, max) random delay in seconds after each request slot
+    batch_size : int or None
+        Cool down after this many teams (finished or failed)
+    cooldown : float
+        Cooldown length in seconds
+    store : bool
+        Write the combined logs to the data store ('game_logs')
+    division : str
+        Store division of the teams in df
+
+    Returns:
+    --------
+    tuple: (dataframe, failed_teams_list)
+    """
+    season = int(season)
+    if teams is None:
+        teams = df.loc[df['season'].astype(int) == season, 'team_name'].drop_duplicates().tolist()
+
+    os.makedirs(harvest_dir(season), exist_ok=True)
+    todo = [team for team in teams
+            if not os.path.exists(_checkpoint_path(season, team_year_id(df, team, season)))]
+    print(f"Game logs {season}: {len(teams) - len(todo)}/{len(teams)} teams already harvested, "
+          f"{len(todo)} to go")
+
+    governor = rate_limit.RateGovernor(rate, burst=burst, jitter=jitter,
+                                       batch_size=batch_size, cooldown=cooldown)
+    driver_pool.get_pool(size=workers, stealth=True)
+
+    def harvest_team(team):
+        try:
+            game_log_df = scrape_ncaa_game_by_game(df, team, season, governor=governor)
+        finally:
+            governor.complete()
+        game_log_df.insert(0, 'Team', team)
+        path = _checkpoint_path(season, team_year_id(df, team, season))
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as f:
+            pickle.dump(game_log_df, f)
+        os.replace(tmp, path)
+        return len(game_log_df)
+
+    failures = []
+    start_time = time.time()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(harvest_team, team): team for team in todo}
+        for i, future in enumerate(as_completed(futures), 1):
+            team = futures[future]
+            try:
+                games = future.result()
+                print(f"  [{i}/{len(todo)}] ✓ {team}: {games} games")
+            except Exception as e:
+                failures.append((team, str(e)[:200]))
+                print(f"  [{i}/{len(todo)}] ✗ {team}: {str(e)[:80]}")
+
+    print(f"Harvest finished in {time.time() - start_time:.1f}s, {len(failures)} failures")
+
+    frames = []
+    for team in teams:
+        path = _checkpoint_path(season, team_year_id(df, team, season))
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                frames.append(pickle.load(f))
+    game_logs = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    if store and not game_logs.empty:
+        data_store.write_partition(game_logs, 'game_logs', division, season)
+
+    return game_logs, failures
+
+
+def main():
+    # must have this years_df dataframe saved and loaded
+    years_df = pd.read_csv("./ncaa_team_ids.csv")
+    # check years and teams available in the years_df dataframe
+    # (a browser is only started if the plain HTTP fetch is refused)
+    arkansas_game_by_game = scrape_ncaa_game_by_game(years_df, "Arkansas", 2025)
+    print(arkansas_game_by_game)
 
-# must have this years_df dataframe saved and loaded
-years_df = pd.read_csv("./ncaa_team_ids.csv")
-driver = setup_driver()
-# check years and teams available in the years_df dataframe
-arkansas_game_by_game = scrape_ncaa_game_by_game(years_df, "Arkansas", 2025, driver)
+    # Whole season, unattended: throttled, jittered, batched and resumable
+    # season_game_logs, failed_game_logs = harvest_season(years_df, 2025, workers=3)
 
 
-# IF YOU EVER PLAN ON SCRAPING MORE THAN ONE TEAM AT A TIME
-# USE A RANDOM SLEEP DELAY BETWEEN EACH SCRAPE (0.1 - 5 SECONDS)
-# ONLY DO 50 OR SO TEAMS AT A TIME, THEN WAIT FOR A COUPLE MINUTES
-# YOU HAVE TO BE VERY ROBUST / CAUTIOUS
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""
+On-disk HTTP response cache with conditional GET revalidation.
+
+Every page fetched through get() is stored under CACHE_DIR together with its
+ETag / Last-Modified validators. While an entry is fresh (see TTL_RULES) it is
+served without touching the network; once it goes stale the next request is
+sent with If-None-Match / If-Modified-Since, and a 304 reuses the stored body.
+
+cached_parse() memoizes the parsed result of a response on disk, keyed by the
+body hash and the parser's version, so an unchanged page skips the re-parse as
+well as the download until the parser itself changes.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import re
+import threading
+import time
+from datetime import datetime
+
+import requests
+
+import http_client
+import run_metrics
+
+CACHE_DIR = os.path.join('.', 'PEAR', 'PEAR Baseball', 'http_cache')
+
+# Set to False to bypass the cache entirely (every call hits the network)
+ENABLED = True
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+# (url pattern, ttl in seconds) - first match wins
+TTL_RULES = [
+    (r'\.(?:png|svg|jpe?g|gif)(?:\?|$)', 30 * DAY),   # logos / images
+    (r'ncaa\.com/schools/', 7 * DAY),                   # team pages (social links)
+    (r'stats\.ncaa\.org/teams/', 7 * DAY),              # team landing pages
+    (r'stats\.ncaa\.org/players/', 6 * HOUR),           # game-by-game logs
+    (r'warrennolan\.com/baseball/\d{4}/schedule', 6 * HOUR),
+    (r'warrennolan\.com/', 1 * HOUR),                   # ratings move daily
+    (r'ncaa\.com/stats/', 6 * HOUR),
+    (r'ncaa\.com/rankings/', 6 * HOUR),
+    (r'/schedule', 6 * HOUR),                           # Sidearm / Presto schedules
+]
+DEFAULT_TTL = 1 * HOUR
+
+# Pages for a season that has already finished never change
+PAST_SEASON_TTL = 365 * DAY
+
+# A season is over once the July 1 after it has passed (after the College World Series)
+SEASON_OVER = (7, 1)
+
+# Season in a URL path: /2025/ or an academic year /2024-25/ (Presto)
+SEASON_PATH = re.compile(r'/(\d{4})(?:-(\d{2}))?(?:/|$)')
+
+class CachedResponse:
+    """Minimal requests.Response look-alike backed by a cache entry."""
+
+    def __init__(self, url, status_code, headers, content, from_cache, meta=None):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.from_cache = from_cache
+        self.meta = meta or {}
+        self.encoding = self.meta.get('encoding') or 'utf-8'
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors='replace')
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def body_hash(self):
+        return self.meta.get('sha1') or hashlib.sha1(self.content).hexdigest()
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} Error for url: {self.url}", response=self
+            )
+
+
+def season_of(url):
+    """Season year named in a URL path ('2024-25' is the 2025 season), or None."""
+    match = SEASON_PATH.search(url)
+    if not match:
+        return None
+    start = int(match.group(1))
+    if match.group(2) is None:
+        return start
+    end = start // 100 * 100 + int(match.group(2))
+    return end if end > start else end + 100
+
+
+def ttl_for(url):
+    """Return the time-to-live in seconds for a URL."""
+    season = season_of(url)
+    if season is not None and datetime.today() >= datetime(season, *SEASON_OVER):
+        return PAST_SEASON_TTL
+
+    for pattern, ttl in TTL_RULES:
+        if re.search(pattern, url):
+            return ttl
+    return DEFAULT_TTL
+
+
+def _key(url):
+    return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+
+def _paths(url):
+    key = _key(url)
+    return (os.path.join(CACHE_DIR, key + '.json'),
+            os.path.join(CACHE_DIR, key + '.body'))
+
+
+def _atomic_write(path, data, mode='wb'):
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, mode) as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def load(url):
+    """Return (meta, body) for a cached URL, or (None, None)."""
+    meta_path, body_path = _paths(url)
+    try:
+        with open(meta_path, 'r') as f:
+            meta = json.load(f)
+        with open(body_path, 'rb') as f:
+            body = f.read()
+        return meta, body
+    except (OSError, ValueError):
+        return None, None
+
+
+def store(url, status_code, headers, body, encoding=None):
+    """Write a 200 response to the cache and return its metadata."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    meta_path, body_path = _paths(url)
+    meta = {
+        'url': url,
+        'status_code': status_code,
+        'etag': headers.get('ETag'),
+        'last_modified': headers.get('Last-Modified'),
+        'content_type': headers.get('Content-Type'),
+        'encoding': encoding,
+        'sha1': hashlib.sha1(body).hexdigest(),
+        'fetched_at': time.time(),
+    }
+    _atomic_write(body_path, body)
+    _atomic_write(meta_path, json.dumps(meta), mode='w')
+    return meta
+
+
+def touch(url, meta):
+    """Mark a cache entry as freshly revalidated (after a 304)."""
+    meta_path, _ = _paths(url)
+    meta['fetched_at'] = time.time()
+    _atomic_write(meta_path, json.dumps(meta), mode='w')
+    return meta
+
+
+def is_fresh(meta, ttl):
+    return meta is not None and time.time() - meta.get('fetched_at', 0) < ttl
+
+
+def conditional_headers(meta):
+    """Revalidation headers for a stale cache entry."""
+    headers = {}
+    if meta:
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+    return headers
+
+
+def _from_meta(meta, body):
+    headers = {'Content-Type': meta.get('content_type') or ''}
+    return CachedResponse(meta['url'], 200, headers, body, from_cache=True, meta=meta)
+
+
+def _timed_get(session, url, headers, timeout):
+    """session.get() reported to run_metrics (latency, bytes, urllib3 retries)."""
+    start = time.perf_counter()
+    try:
+        response = session.get(url, headers=headers, timeout=timeout)
+    except Exception:
+        run_metrics.observe_request(url, time.perf_counter() - start)
+        raise
+    retries = getattr(getattr(response.raw, 'retries', None), 'history', None) or ()
+    run_metrics.observe_request(url, time.perf_counter() - start, response.status_code,
+                                len(response.content), retries=len(retries))
+    return response
+
+
+def get(url, session=None, headers=None, timeout=10, ttl=None):
+    """
+    GET a URL through the on-disk cache.
+
+    Parameters:
+    -----------
+    url : str
+        URL to fetch
+    session : requests.Session, optional
+        Session to use for network requests (defaults to the pooled
+        http_client session: keep-alive, retries, circuit breaker)
+    headers : dict, optional
+        Extra request headers
+    timeout : int
+        Request timeout in seconds
+    ttl : int, optional
+        Override the TTL_RULES lifetime for this URL
+
+    Returns:
+    --------
+    CachedResponse (from_cache is True when no body was downloaded)
+    """
+    session = session or http_client.get_session()
+
+    if not ENABLED:
+        response = _timed_get(session, url, headers, timeout)
+        return CachedResponse(url, response.status_code, response.headers,
+                              response.content, from_cache=False,
+                              meta={'encoding': response.encoding})
+
+    ttl = ttl_for(url) if ttl is None else ttl
+    meta, body = load(url)
+
+    if is_fresh(meta, ttl):
+        run_metrics.cache_result('fresh')
+        return _from_meta(meta, body)
+
+    request_headers = dict(headers or {})
+    request_headers.update(conditional_headers(meta))
+    response = _timed_get(session, url, request_headers, timeout)
+
+    if response.status_code == 304 and meta is not None:
+        run_metrics.cache_result('revalidated')
+        return _from_meta(touch(url, meta), body)
+
+    run_metrics.cache_result('miss')
+    if response.status_code == 200:
+        meta = store(url, response.status_code, response.headers,
+                     response.content, encoding=response.encoding)
+        return CachedResponse(url, 200, response.headers, response.content,
+                              from_cache=False, meta=meta)
+
+    return CachedResponse(url, response.status_code, response.headers,
+                          response.content, from_cache=False,
+                          meta={'encoding': response.encoding})
+
+
+def code_version(*fns):
+    """
+    Short hash of the bytecode of fns (nested functions included), for
+    cached_parse(version=...) when parse_fn only wraps the real parsers.
+    """
+    digest = hashlib.sha1()
+
+    def add(code):
+        digest.update(code.co_code)
+        for const in code.co_consts:
+            if hasattr(const, 'co_code'):
+                add(const)
+            else:
+                digest.update(repr(const).encode())
+
+    for fn in fns:
+        add(fn.__code__)
+    return digest.hexdigest()[:12]
+
+
+def cached_parse(response, name, parse_fn, version=None):
+    """
+    Memoize parse_fn(response) on disk, keyed by URL, parser name, body hash
+    and parser version.
+
+    An unchanged page (fresh hit, 304, or identical body) returns the stored
+    result without calling parse_fn. version defaults to code_version(parse_fn),
+    so editing the parser invalidates its entries. The result must be
+    picklable (rows, dicts, DataFrames).
+    """
+    if not ENABLED or not response.ok:
+        return parse_fn(response)
+
+    version = version or code_version(parse_fn)
+    path = os.path.join(CACHE_DIR, f"{_key(response.url)}.{name}.pkl")
+    try:
+        with open(path, 'rb') as f:
+            body_hash, stored_version, result = pickle.load(f)
+        if body_hash == response.body_hash and stored_version == version:
+            return result
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        pass
+
+    result = parse_fn(response)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        _atomic_write(path, pickle.dumps((response.body_hash, version, result)))
+    except (OSError, pickle.PicklingError, TypeError):
+        pass
+    return result
+
+
+def clear(url=None):
+    """Remove one URL (or the whole cache) from disk."""
+    if url is None:
+        if os.path.isdir(CACHE_DIR):
+            for name in os.listdir(CACHE_DIR):
+                os.remove(os.path.join(CACHE_DIR, name))
+        return
+
+    key = _key(url)
+    if os.path.isdir(CACHE_DIR):
+        for name in os.listdir(CACHE_DIR):
+            if name.startswith(key):
+                os.remove(os.path.join(CACHE_DIR, name))
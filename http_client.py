@@ -0,0 +1,186 @@
+"""
+Shared pooled HTTP client.
+
+Every script used to open its own connections (bare requests.get, a module
+session per script, a session per scraper). make_session() builds a
+requests.Session whose adapter
+
+- keeps a keep-alive connection pool per host sized to the worker count,
+- applies a default (connect, read) timeout when the caller passes none,
+- retries 403/429/5xx and connection errors with jittered exponential
+  backoff (Retry-After is honoured), and
+- consults a per-host circuit breaker: after BREAKER_THRESHOLD consecutive
+  failures a host is skipped for BREAKER_RESET seconds (CircuitOpenError),
+  then a single trial request decides whether it is healthy again.
+
+get_session() returns the process-wide session that http_cache uses by
+default. The breaker is shared with the async fetch engine.
+"""
+
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_HEADERS = {"User-Agent": "Mozilla/5.0"}
+DEFAULT_TIMEOUT = (5, 20)  # (connect, read) seconds
+POOL_SIZE = 32
+
+RETRY_STATUSES = (403, 429, 500, 502, 503, 504)
+# Statuses that count against a host's circuit breaker (403 is usually a
+# per-page bot block, not a sick host)
+FAILURE_STATUSES = (429, 500, 502, 503, 504)
+
+BREAKER_THRESHOLD = 5
+BREAKER_RESET = 60
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request to a host whose breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Per-host consecutive-failure breaker.
+
+    Parameters:
+    -----------
+    threshold : int
+        Consecutive failures that open the breaker
+    reset_after : float
+        Seconds before an open breaker lets a trial request through
+    """
+
+    def __init__(self, threshold=BREAKER_THRESHOLD, reset_after=BREAKER_RESET):
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self._failures = {}
+        self._opened = {}
+        self._lock = threading.Lock()
+
+    def allow(self, host):
+        """True if a request to host may be sent (half-open allows one trial)."""
+        with self._lock:
+            opened = self._opened.get(host)
+            if opened is None:
+                return True
+            if time.monotonic() - opened >= self.reset_after:
+                # Half-open: let this request through, block the rest until it reports
+                self._opened[host] = time.monotonic()
+                return True
+            return False
+
+    def record(self, host, ok):
+        with self._lock:
+            if ok:
+                self._failures.pop(host, None)
+                self._opened.pop(host, None)
+                return
+            self._failures[host] = self._failures.get(host, 0) + 1
+            if self._failures[host] >= self.threshold:
+                if host not in self._opened:
+                    print(f"Circuit open for {host} after {self._failures[host]} failures")
+                self._opened[host] = time.monotonic()
+
+    def is_open(self, host):
+        with self._lock:
+            return host in self._opened
+
+
+breaker = CircuitBreaker()
+
+
+class JitterRetry(Retry):
+    """Retry whose exponential backoff is spread by +/-50% random jitter."""
+
+    def get_backoff_time(self):
+        backoff = super().get_backoff_time()
+        return backoff * random.uniform(0.5, 1.5) if backoff else backoff
+
+
+class PooledAdapter(HTTPAdapter):
+    """HTTPAdapter with a default timeout and circuit-breaker checks."""
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT, circuit=breaker, **kwargs):
+        self.timeout = timeout
+        self.circuit = circuit
+        super().__init__(**kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        host = urlsplit(request.url).netloc.lower()
+        if self.circuit is not None and not self.circuit.allow(host):
+            raise CircuitOpenError(f"Circuit open for {host}, request skipped", request=request)
+
+        try:
+            response = super().send(request, timeout=timeout or self.timeout, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if self.circuit is not None:
+                self.circuit.record(host, ok=False)
+            raise
+
+        if self.circuit is not None:
+            self.circuit.record(host, ok=response.status_code not in FAILURE_STATUSES)
+        return response
+
+
+def make_session(pool_size=POOL_SIZE, retries=3, backoff=0.5, timeout=DEFAULT_TIMEOUT,
+                 headers=None, circuit=breaker):
+    """
+    Build a pooled session.
+
+    Parameters:
+    -----------
+    pool_size : int
+        Connections kept alive per host (use at least the worker count)
+    retries : int
+        Retries for connection errors and RETRY_STATUSES
+    backoff : float
+        Exponential backoff factor in seconds (jittered)
+    timeout : float or tuple
+        Default (connect, read) timeout when a call passes none
+    headers : dict, optional
+        Default headers (DEFAULT_HEADERS otherwise)
+    circuit : CircuitBreaker or None
+        Breaker to consult (the shared one by default)
+    """
+    retry = JitterRetry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        raise_on_status=False,
+        respect_retry_after_header=True,
+    )
+    adapter = PooledAdapter(timeout=timeout, circuit=circuit, max_retries=retry,
+                            pool_connections=pool_size, pool_maxsize=pool_size)
+
+    session = requests.Session()
+    session.headers.update(headers or DEFAULT_HEADERS)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Process-wide pooled session (created on first use)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = make_session()
+        return _session
+
+
+def get(url, **kwargs):
+    """GET on the shared session (no disk cache; see http_cache.get for that)."""
+    return get_session().get(url, **kwargs)
@@ -0,0 +1,156 @@
+"""
+Logo manifest, SVG rasterization and sprite atlas.
+
+The manifest (logo_dir/manifest.json) records each team's source URL, the
+SHA-1 of the downloaded bytes and the output PNG, so logo_pull skips logos
+whose source has not changed. rasterize_svg() is a top-level function so it
+can run in a process pool.
+
+build_atlas() packs every PNG into one fixed-cell uint8 array
+(logos.atlas.npy, shape (n, cell, cell, 4)) plus a JSON index. Chart code
+opens it with LogoAtlas, which memory-maps the array, instead of opening
+hundreds of PNG files per chart.
+"""
+
+import hashlib
+import json
+import os
+from io import BytesIO
+
+import numpy as np
+from PIL import Image
+
+LOGO_DIR = os.path.join('.', 'PEAR', 'PEAR Baseball', 'logos')
+MANIFEST_NAME = 'manifest.json'
+ATLAS_NAME = 'logos.atlas.npy'
+ATLAS_INDEX_NAME = 'logos.atlas.json'
+
+# zlib level for saved PNGs (0 = none/fastest, 9 = smallest)
+PNG_COMPRESS_LEVEL = 6
+ATLAS_CELL = 256
+
+
+def content_hash(data):
+    return hashlib.sha1(data).hexdigest()
+
+
+def load_manifest(logo_dir=LOGO_DIR):
+    path = os.path.join(logo_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_manifest(manifest, logo_dir=LOGO_DIR):
+    path = os.path.join(logo_dir, MANIFEST_NAME)
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def is_unchanged(manifest, team_name, url, sha1):
+    """True if team_name's logo came from url with the same bytes and its PNG still exists."""
+    entry = manifest.get(team_name)
+    return (entry is not None
+            and entry.get('url') == url
+            and entry.get('sha1') == sha1
+            and os.path.exists(entry.get('path', '')))
+
+
+def rasterize_svg(svg_path, scale=4, compress_level=PNG_COMPRESS_LEVEL, remove_svg=True):
+    """
+    Render an SVG to a PNG next to it (process-pool friendly).
+
+    Returns:
+    --------
+    str: path of the PNG
+    """
+    from cairosvg import svg2png
+
+    png_path = os.path.splitext(svg_path)[0] + '.png'
+    png_bytes = svg2png(url=svg_path, scale=scale)
+    Image.open(BytesIO(png_bytes)).save(png_path, format='PNG', compress_level=compress_level)
+    if remove_svg:
+        os.remove(svg_path)
+    return png_path
+
+
+def _fit(img, cell):
+    """Scale img to fit a cell x cell square (aspect kept) and center it."""
+    img = img.convert('RGBA')
+    img.thumbnail((cell, cell), Image.Resampling.LANCZOS)
+    canvas = Image.new('RGBA', (cell, cell), (0, 0, 0, 0))
+    canvas.paste(img, ((cell - img.width) // 2, (cell - img.height) // 2))
+    return canvas, img.width, img.height
+
+
+def build_atlas(logo_dir=LOGO_DIR, cell=ATLAS_CELL):
+    """
+    Pack every PNG in logo_dir into logos.atlas.npy + logos.atlas.json.
+
+    Index entries are {team: {'i': row, 'w': width, 'h': height}} where w/h
+    are the logo's size inside its centered cell.
+
+    Returns:
+    --------
+    int: number of logos packed
+    """
+    names = sorted(
+        name for name in os.listdir(logo_dir)
+        if name.endswith('.png')
+    )
+
+    atlas_path = os.path.join(logo_dir, ATLAS_NAME)
+    tmp_path = atlas_path + '.tmp.npy'
+    atlas = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.uint8,
+                                      shape=(len(names), cell, cell, 4))
+    index = {}
+    for i, name in enumerate(names):
+        with Image.open(os.path.join(logo_dir, name)) as img:
+            canvas, width, height = _fit(img, cell)
+        atlas[i] = np.asarray(canvas)
+        index[os.path.splitext(name)[0]] = {'i': i, 'w': width, 'h': height}
+    atlas.flush()
+    del atlas
+    os.replace(tmp_path, atlas_path)
+
+    index_path = os.path.join(logo_dir, ATLAS_INDEX_NAME)
+    with open(index_path + '.tmp', 'w') as f:
+        json.dump({'cell': cell, 'logos': index}, f)
+    os.replace(index_path + '.tmp', index_path)
+
+    print(f"Packed {len(names)} logos into {atlas_path}")
+    return len(names)
+
+
+class LogoAtlas:
+    """
+    Memory-mapped read access to the sprite atlas.
+
+    Example:
+    --------
+    atlas = LogoAtlas()
+    img = atlas.get('Arkansas')   # (h, w, 4) uint8 view, ready for OffsetImage
+    """
+
+    def __init__(self, logo_dir=LOGO_DIR):
+        with open(os.path.join(logo_dir, ATLAS_INDEX_NAME)) as f:
+            meta = json.load(f)
+        self.cell = meta['cell']
+        self.index = meta['logos']
+        self.array = np.load(os.path.join(logo_dir, ATLAS_NAME), mmap_mode='r')
+
+    def __contains__(self, team_name):
+        return team_name in self.index
+
+    def get(self, team_name, trim=True):
+        """RGBA array for a team (trimmed to the logo, or the full cell)."""
+        entry = self.index[team_name]
+        tile = self.array[entry['i']]
+        if not trim:
+            return tile
+        top = (self.cell - entry['h']) // 2
+        left = (self.cell - entry['w']) // 2
+        return tile[top:top + entry['h'], left:left + entry['w']]
@@ -1,34 +1,33 @@
 import requests
 from bs4 import BeautifulSoup
-import pandas as pd
 from io import BytesIO
 from PIL import Image
-import matplotlib.pyplot as plt
-import matplotlib.offsetbox as offsetbox
-import pandas as pd
-import matplotlib.font_manager as fm
-custom_font = fm.FontProperties(fname="./PEAR/trebuc.ttf")
-plt.rcParams['font.family'] = custom_font.get_name()
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
-from sklearn.preprocessing import MinMaxScaler
 import warnings
-from datetime import datetime
-import pytz
-import numpy as np
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import http_cache
+import logo_assets
 warnings.filterwarnings("ignore")
 
 def get_soup(url):
-    response = requests.get(url, headers={"User-Agent": "Mozilla/5.0"})
+    response = http_cache.get(url, headers={"User-Agent": "Mozilla/5.0"})
     response.raise_for_status()
     return BeautifulSoup(response.text, "html.parser")
 
-def download_team_logos(url, logo_dir="./PEAR/PEAR Baseball/logos"):
-    """Download team logos from a website's table"""
+def download_team_logos(url, logo_dir="./PEAR/PEAR Baseball/logos",
+                        compress_level=logo_assets.PNG_COMPRESS_LEVEL):
+    """
+    Download team logos from a website's table.
+    
+    Logos whose source URL and content hash match the manifest (and whose
+    PNG still exists) are skipped.
+    
+    Returns:
+    --------
+    int: number of logos written (new or changed)
+    """
     os.makedirs(logo_dir, exist_ok=True)
+    manifest = logo_assets.load_manifest(logo_dir)
     
     all_logos = []
     page_num = 1
@@ -79,17 +78,25 @@ def download_team_logos(url, logo_dir="./PEAR/PEAR Baseball/logos"):
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
-            img_response = requests.get(img_url, timeout=10, headers=headers)
+            img_response = http_cache.get(img_url, timeout=10, headers=headers)
             img_response.raise_for_status()
             
+            sha1 = logo_assets.content_hash(img_response.content)
+            png_path = os.path.join(logo_dir, f"{team_name}.png")
+            entry = {'url': img_url, 'sha1': sha1, 'path': png_path}
+            
+            # Same source, same bytes, PNG still on disk: nothing to do
+            if logo_assets.is_unchanged(manifest, team_name, img_url, sha1):
+                return team_name, True, None
+            
             # Check if it's an SVG file
             if img_url.endswith('.svg') or 'svg' in img_response.headers.get('content-type', ''):
-                # Save SVG directly
+                # Save SVG directly (rasterized in a process pool afterwards)
                 file_path = os.path.join(logo_dir, f"{team_name}.svg")
                 with open(file_path, 'wb') as f:
                     f.write(img_response.content)
                 print(f"Saved SVG logo for {team_name}")
-                return team_name, True
+                return team_name, True, entry
             else:
                 # Handle raster images (PNG, JPG, etc.)
                 img = Image.open(BytesIO(img_response.content))
@@ -103,44 +110,65 @@ def download_team_logos(url, logo_dir="./PEAR/PEAR Baseball/logos"):
                 new_size = (img.width * upscale_factor, img.height * upscale_factor)
                 img = img.resize(new_size, Image.Resampling.LANCZOS)
                 
-                # Save with high quality
-                file_path = os.path.join(logo_dir, f"{team_name}.png")
-                img.save(file_path, format='PNG', optimize=False, compress_level=0)
+                # Lossless PNG; compress_level only trades CPU for file size
+                img.save(png_path, format='PNG', compress_level=compress_level)
                 print(f"Saved PNG logo for {team_name}")
-                return team_name, True
+                return team_name, True, entry
             
         except Exception as e:
             print(f"Error downloading logo for {team_name}: {e}")
             print(f"  URL: {img_url}")
-            return team_name, False
+            return team_name, False, None
     
     # Use ThreadPoolExecutor for parallel downloads
     with ThreadPoolExecutor(max_workers=20) as executor:
         results = list(executor.map(save_logo, all_logos))
     
-    print(f"\nSuccessfully saved {sum(success for _, success in results)}/{len(all_logos)} logos.")
+    # Manifest is only written from this thread
+    written = 0
+    for team_name, success, entry in results:
+        if entry is not None:
+            manifest[team_name] = entry
+            written += 1
+    logo_assets.save_manifest(manifest, logo_dir)
+    
+    print(f"\nSuccessfully saved {sum(success for _, success, _ in results)}/{len(all_logos)} logos "
+          f"({written} new or changed, {len(all_logos) - written} unchanged).")
+    return written
 
-from cairosvg import svg2png
 import glob
 
-def convert_all_svgs_to_png(logo_dir="./PEAR/PEAR Baseball/logos"):
-    """Convert all SVG logos to high-quality PNG and delete SVG files"""
+def convert_all_svgs_to_png(logo_dir="./PEAR/PEAR Baseball/logos", scale=4,
+                            compress_level=logo_assets.PNG_COMPRESS_LEVEL, max_workers=None):
+    """Convert all SVG logos to high-quality PNG (in a process pool) and delete the SVG files"""
     svg_files = glob.glob(os.path.join(logo_dir, "*.svg"))
     
-    for svg_path in svg_files:
-        png_path = svg_path.replace('.svg', '.png')
-        # scale=4 gives you 4x resolution for high quality
-        svg2png(url=svg_path, write_to=png_path, scale=4)
-        print(f"Converted {os.path.basename(svg_path)}")
-        
-        # Delete the SVG file after conversion
-        os.remove(svg_path)
-        print(f"Deleted {os.path.basename(svg_path)}")
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            # scale=4 gives you 4x resolution for high quality
+            executor.submit(logo_assets.rasterize_svg, svg_path, scale, compress_level): svg_path
+            for svg_path in svg_files
+        }
+        for future in as_completed(futures):
+            svg_path = futures[future]
+            try:
+                future.result()
+                print(f"Converted and deleted {os.path.basename(svg_path)}")
+            except Exception as e:
+                print(f"Error converting {os.path.basename(svg_path)}: {e}")
     
     print(f"\nConverted and deleted {len(svg_files)} SVG files")
 
 # Usage:
 # download_team_logos("https://www.ncaa.com/stats/baseball/...")
 BASE_URL = "https://www.ncaa.com"
-download_team_logos("https://www.ncaa.com/stats/baseball/d1/current/team/496")
-convert_all_svgs_to_png()
\ No newline at end of file
+
+# Guarded so the SVG process pool's workers can import this module safely
+if __name__ == "__main__":
+    changed = download_team_logos("https://www.ncaa.com/stats/baseball/d1/current/team/496")
+    convert_all_svgs_to_png()
+    
+    # Charts read logos from one memory-mapped sprite atlas (logo_assets.LogoAtlas)
+    atlas_path = os.path.join("./PEAR/PEAR Baseball/logos", logo_assets.ATLAS_NAME)
+    if changed or not os.path.exists(atlas_path):
+        logo_assets.build_atlas("./PEAR/PEAR Baseball/logos")
\ No newline at end of file
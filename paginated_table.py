@@ -0,0 +1,163 @@
+"""
+Paginated NCAA stat table extractor.
+
+ncaa.com splits every stat table across /p2, /p3, ... pages. Page 1 is fetched
+first to read the page count from its pager links; the remaining pages are
+then fetched concurrently on the shared fetch engine and their rows are kept in
+page order. A stat costs about two round trips instead of one per page.
+"""
+
+import asyncio
+import re
+from urllib.parse import urlsplit
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+import fetch_engine
+
+
+def page_url(url, page_num):
+    """URL of a given page of a paginated table (page 1 is the base URL)."""
+    return url if page_num == 1 else f"{url}/p{page_num}"
+
+
+def page_count(soup, url):
+    """Highest page number linked from the pager on page 1 (None if no pager)."""
+    base_path = urlsplit(url).path.rstrip('/')
+    pattern = re.compile(re.escape(base_path) + r'/p(\d+)/?$')
+    pages = [
+        int(match.group(1))
+        for a in soup.find_all('a', href=True)
+        for match in [pattern.search(urlsplit(a['href']).path)]
+        if match
+    ]
+    return max(pages) if pages else None
+
+
+def parse_table_page(soup, with_links=False):
+    """
+    Headers and rows of the first table on a page.
+
+    With with_links=True the Team cell is reduced to its link text and a
+    trailing 'link' column holds the team page URL.
+
+    Returns:
+    --------
+    tuple: (headers, rows), or None if the page has no table
+    """
+    table = soup.find("table")
+    if not table:
+        return None
+
+    headers = [th.text.strip() for th in table.find_all("th")]
+    if with_links:
+        headers.append("link")
+
+    rows = []
+    for row in table.find_all("tr")[1:]:
+        cols = row.find_all("td")
+        if not with_links:
+            rows.append([col.text.strip() for col in cols])
+            continue
+
+        row_data = []
+        link_val = None
+        for idx, col in enumerate(cols):
+            a = col.find("a") if headers[idx] == "Team" else None
+            if a:
+                link_val = "ncaa.com" + a["href"]
+                row_data.append(a.text.strip())
+            else:
+                row_data.append(col.text.strip())
+        row_data.append(link_val)
+        rows.append(row_data)
+
+    return headers, rows
+
+
+def table_dataframe(headers, rows):
+    """DataFrame with every column except Team / link converted to numeric."""
+    if not rows:
+        return None
+    df = pd.DataFrame(rows, columns=headers)
+    for col in df.columns:
+        if col not in ("Team", "link"):
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+    return df
+
+
+async def _fetch_page(fetcher, url, with_links):
+    response = await fetcher.fetch(url)
+    if not response.ok:
+        return None, None
+
+    def parse(text):
+        soup = BeautifulSoup(text, "html.parser")
+        return soup, parse_table_page(soup, with_links)
+
+    return await asyncio.to_thread(parse, response.text)
+
+
+async def fetch_paginated_table(fetcher, url, with_links=False, max_pages=None):
+    """
+    Fetch every page of a paginated table.
+
+    Parameters:
+    -----------
+    fetcher : fetch_engine.AsyncFetcher
+        Open fetcher to run the requests on
+    url : str
+        URL of page 1
+    with_links : bool
+        Keep the team page link as a 'link' column
+    max_pages : int, optional
+        Upper bound on pages fetched
+
+    Returns:
+    --------
+    DataFrame, or None if page 1 has no table
+    """
+    soup, first = await _fetch_page(fetcher, url, with_links)
+    if first is None:
+        return None
+
+    headers, rows = first
+    last_page = page_count(soup, url)
+    if max_pages is not None and last_page is not None:
+        last_page = min(last_page, max_pages)
+
+    if last_page is not None:
+        # Known page count: fan out pages 2..N together, keep page order
+        pages = await asyncio.gather(
+            *(_fetch_page(fetcher, page_url(url, n), with_links) for n in range(2, last_page + 1)),
+            return_exceptions=True,
+        )
+        for n, page in enumerate(pages, 2):
+            if isinstance(page, fetch_engine.ThrottledError):
+                raise page
+            if isinstance(page, Exception):
+                print(f"Error for {url}, page {n}: {page}")
+                continue
+            _, parsed = page
+            if parsed is not None:
+                rows.extend(parsed[1])
+    else:
+        # No pager on page 1: walk pages until one is missing
+        page_num = 2
+        while max_pages is None or page_num <= max_pages:
+            _, parsed = await _fetch_page(fetcher, page_url(url, page_num), with_links)
+            if parsed is None:
+                break
+            rows.extend(parsed[1])
+            page_num += 1
+
+    return table_dataframe(headers, rows)
+
+
+def get_paginated_table(url, with_links=False, max_pages=None, per_host=8):
+    """Synchronous wrapper around fetch_paginated_table."""
+    return fetch_engine.run(
+        lambda fetcher: fetch_paginated_table(fetcher, url, with_links, max_pages),
+        per_host=per_host,
+    )
@@ -0,0 +1,331 @@
+"""
+Scrape pipeline: the D1 stages as a small dependency graph.
+
+Each Stage names the stages whose outputs it takes as inputs and, if its
+output is a DataFrame worth keeping, the data_store dataset it is written to.
+Stages whose inputs are ready run concurrently in a thread pool, so the
+wall-clock time is the longest chain of dependent stages rather than the sum
+of every stage:
+
+    rpi_projected    rpi_live    rpi_ncaa
+    elo_table ──> elo
+              └─> schedules
+    stat_links ──> stats
+
+A stored stage whose output for today is already in the store is not run
+again; its output is read back from the store only if a stage that does run
+needs it. Stages without a dataset (elo_table, stat_links) run whenever a
+stage that consumes them runs.
+
+ncaa.com only serves the current season, so its stages (rpi_ncaa,
+stat_links, stats) are left out of a --season run for any other season;
+asking for one of them by name is an error.
+
+Usage:
+    python pipeline.py                 # every stage, reusing today's stored outputs
+    python pipeline.py stats           # re-run only the stats stage
+    python pipeline.py --force         # re-run everything
+    python pipeline.py --profile stats # cProfile the stats stage
+    python pipeline.py --season 2024   # a past season (Warren Nolan stages)
+    python pipeline.py --refresh schedules  # only teams with a game due since the last run
+    python pipeline.py --list
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+
+import data_store
+import run_metrics
+
+DIVISION = 'D1'
+SEASON = 2025
+
+
+class Stage:
+    """
+    One pipeline step.
+
+    Parameters:
+    -----------
+    name : str
+        Stage name (also the name its output is passed under)
+    func : callable
+        func(division, season, **inputs) -> output; inputs are passed as
+        keyword arguments named after the stages that produce them
+    inputs : tuple
+        Names of the stages this one needs
+    dataset : str, optional
+        data_store dataset the output is written to (and reused from)
+    current_only : bool
+        The source only serves the current season (scrape_data.CURRENT_SEASON)
+    """
+
+    def __init__(self, name, func, inputs=(), dataset=None, current_only=False):
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.dataset = dataset
+        self.current_only = current_only
+
+    def __repr__(self):
+        return f"Stage({self.name!r}, inputs={self.inputs}, dataset={self.dataset!r})"
+
+
+####################### Stage Functions #######################
+
+# Imported inside each stage so `python pipeline.py --list` and the store
+# checks stay fast
+
+def _rpi_projected(division, season):
+    import scrape_data
+    return scrape_data.get_projected_rpi(season)
+
+def _rpi_live(division, season):
+    import scrape_data
+    return scrape_data.get_live_rpi(season)
+
+def _rpi_ncaa(division, season):
+    import scrape_data
+    return scrape_data.get_ncaa_rpi(division)
+
+def _elo_table(division, season):
+    import scrape_data
+    elo_table = scrape_data.fetch_elo_table(season)
+    if elo_table is None:
+        raise ValueError("ELO table not found on the page")
+    return elo_table
+
+def _elo(division, season, elo_table):
+    import scrape_data
+    return scrape_data.elo_dataset(elo_table)
+
+def _stat_links(division, season):
+    import scrape_data
+    return scrape_data.get_stat_links(division)
+
+def _stats(division, season, stat_links):
+    import scrape_data
+    return scrape_data.get_baseball_stats(links=stat_links)
+
+# Streams its rows into the store itself (nothing is returned to write)
+def _schedules(division, season, elo_table):
+    import schedule_load
+    schedule_load.stream_schedules(elo_table, division, season)
+
+# --refresh: the whole season from the schedule snapshot, re-scraping only due teams
+def _refresh_schedules(division, season, elo_table):
+    import schedule_load
+    return schedule_load.refresh_schedules(elo_table, division, season)
+
+
+STAGES = [
+    Stage('rpi_projected', _rpi_projected, dataset='rpi_projected'),
+    Stage('rpi_live', _rpi_live, dataset='rpi_live'),
+    Stage('rpi_ncaa', _rpi_ncaa, dataset='rpi_ncaa', current_only=True),
+    Stage('elo_table', _elo_table),
+    Stage('elo', _elo, inputs=['elo_table'], dataset='elo'),
+    Stage('stat_links', _stat_links, current_only=True),
+    Stage('stats', _stats, inputs=['stat_links'], dataset='stats', current_only=True),
+    Stage('schedules', _schedules, inputs=['elo_table'], dataset='schedules'),
+]
+
+# Replaces the schedules stage under --refresh
+REFRESH_SCHEDULES = Stage('schedules', _refresh_schedules, inputs=['elo_table'], dataset='schedules')
+
+
+####################### Planning #######################
+
+def _is_stored(stage, division, season, scrape_date):
+    # A partition left behind by a stopped run is not reused
+    return (stage.dataset is not None
+            and data_store.is_complete(stage.dataset, division, season, scrape_date))
+
+
+def plan(stages, targets=None, rerun=(), force=False, division=DIVISION, season=SEASON, scrape_date=None):
+    """
+    Decide which stages run and which outputs are reused from the store.
+
+    Parameters:
+    -----------
+    stages : list of Stage
+    targets : list of str, optional
+        Stages whose outputs are wanted (every stage with a dataset by default)
+    rerun : iterable of str
+        Stages that run even if their output is already stored
+    force : bool
+        Ignore the store entirely
+
+    Returns:
+    --------
+    tuple: (names to run, names to load from the store), both in stage order
+    """
+    by_name = {stage.name: stage for stage in stages}
+    unknown = [name for name in list(targets or []) + list(rerun) if name not in by_name]
+    if unknown:
+        raise ValueError(f"Unknown stages: {unknown}. Available: {list(by_name)}")
+
+    scrape_date = scrape_date or datetime.today().strftime('%Y-%m-%d')
+    rerun = set(rerun)
+    to_run, to_load = set(), set()
+
+    # Stages whose source only serves the current season sit out other seasons
+    unavailable = set()
+    if any(stage.current_only for stage in stages):
+        import scrape_data
+        if season != scrape_data.CURRENT_SEASON:
+            unavailable = {stage.name for stage in stages if stage.current_only}
+            print(f"[skip] {', '.join(sorted(unavailable))}: "
+                  f"only the {scrape_data.CURRENT_SEASON} season can be scraped")
+
+    # Walk back from the targets; a stage that runs pulls in its inputs,
+    # a reused stage does not
+    pending = list(targets or [stage.name for stage in stages
+                               if stage.dataset is not None and stage.name not in unavailable])
+    while pending:
+        name = pending.pop()
+        stage = by_name[name]
+        if name in unavailable:
+            raise ValueError(f"Stage {name} only runs for the current season, not {season}")
+        if not force and name not in rerun and _is_stored(stage, division, season, scrape_date):
+            to_load.add(name)
+            continue
+        to_run.add(name)
+        for dep in stage.inputs:
+            if dep not in to_run and dep not in to_load:
+                pending.append(dep)
+
+    # Stored outputs are only read back when a running stage consumes them
+    consumed = {dep for name in to_run for dep in by_name[name].inputs}
+    to_load = {name for name in to_load if name in consumed}
+
+    order = [stage.name for stage in stages]
+    return [n for n in order if n in to_run], [n for n in order if n in to_load]
+
+
+####################### Execution #######################
+
+def run(stages=STAGES, targets=None, rerun=(), force=False, division=DIVISION, season=SEASON,
+        max_workers=None, store=True):
+    """
+    Run the pipeline.
+
+    Parameters:
+    -----------
+    stages : list of Stage
+    targets, rerun, force :
+        See plan()
+    division : str
+        Division to scrape and store
+    season : int
+        Season to scrape and store
+    max_workers : int, optional
+        Stages running at once (default: all that are ready)
+    store : bool
+        Write stage outputs that have a dataset to the store
+
+    Returns:
+    --------
+    tuple: (outputs {stage: output}, failures {stage: error})
+    """
+    by_name = {stage.name: stage for stage in stages}
+    scrape_date = datetime.today().strftime('%Y-%m-%d')
+    to_run, to_load = plan(stages, targets, rerun, force, division, season, scrape_date)
+
+    outputs = {}
+    for name in to_load:
+        outputs[name] = data_store.read(by_name[name].dataset, division, season, scrape_date=scrape_date)
+        print(f"[reuse] {name}: {len(outputs[name])} rows from the store")
+
+    failures = {}
+    timings = {}
+    remaining = list(to_run)
+    running = {}
+    start = time.monotonic()
+
+    def execute(stage, kwargs):
+        began = time.monotonic()
+        with run_metrics.stage(stage.name):
+            output = stage.func(division, season, **kwargs)
+        if store and stage.dataset is not None and output is not None and not output.empty:
+            data_store.write_partition(output, stage.dataset, division, season, scrape_date)
+        return output, began, time.monotonic()
+
+    with ThreadPoolExecutor(max_workers=max_workers or max(len(to_run), 1)) as executor:
+        while remaining or running:
+            # Skip stages whose inputs failed, submit the ones that are ready
+            for name in list(remaining):
+                stage = by_name[name]
+                failed = [dep for dep in stage.inputs if dep in failures]
+                if failed:
+                    remaining.remove(name)
+                    failures[name] = f"skipped, input failed: {', '.join(failed)}"
+                    print(f"[skip] {name}: {failures[name]}")
+                elif all(dep in outputs for dep in stage.inputs):
+                    remaining.remove(name)
+                    kwargs = {dep: outputs[dep] for dep in stage.inputs}
+                    running[executor.submit(execute, stage, kwargs)] = name
+                    print(f"[start] {name} (+{time.monotonic() - start:.1f}s)")
+
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    outputs[name], began, ended = future.result()
+                    timings[name] = (began - start, ended - start)
+                    print(f"[done] {name} in {ended - began:.1f}s")
+                except Exception as e:
+                    failures[name] = str(e)
+                    print(f"[fail] {name}: {e}")
+
+    wall = time.monotonic() - start
+    busy = sum(end - begin for begin, end in timings.values())
+    print(f"\nPipeline finished in {wall:.1f}s ({busy:.1f}s of stage time, "
+          f"{len(timings)} run, {len(to_load)} reused, {len(failures)} failed)")
+    run_metrics.metrics.count('stages_run', len(timings))
+    run_metrics.metrics.count('stages_reused', len(to_load))
+    run_metrics.metrics.count('stages_failed', len(failures))
+    run_metrics.write()
+    return outputs, failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the scrape stages as a dependency graph.")
+    parser.add_argument('stages', nargs='*', help='only (re-)run these stages')
+    parser.add_argument('--force', action='store_true', help='ignore outputs already in the store')
+    parser.add_argument('--season', type=int, default=SEASON)
+    parser.add_argument('--refresh', action='store_true',
+                        help='schedules: only re-scrape teams with a game due since the stored snapshot')
+    parser.add_argument('--workers', type=int, default=None, help='stages running at once')
+    parser.add_argument('--no-store', action='store_true', help='do not write outputs to the store')
+    parser.add_argument('--list', action='store_true', help='show the stages and exit')
+    parser.add_argument('--profile', action='append', default=[], metavar='STAGE',
+                        help="run STAGE under cProfile ('all' for every stage; repeatable)")
+    args = parser.parse_args(argv)
+    run_metrics.metrics.profile_stages.update(args.profile)
+
+    if args.list:
+        for stage in STAGES:
+            inputs = ', '.join(stage.inputs) or '-'
+            print(f"{stage.name:<14} inputs: {inputs:<12} dataset: {stage.dataset or '-'}")
+        return 0
+
+    stages = [REFRESH_SCHEDULES if args.refresh and stage.name == 'schedules' else stage
+              for stage in STAGES]
+    try:
+        _, failures = run(stages, targets=args.stages or None, rerun=args.stages, force=args.force,
+                          season=args.season,
+                          max_workers=args.workers, store=not args.no_store)
+    except ValueError as e:
+        print(e)
+        return 2
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Request rate governor shared by scrapers that talk to throttling sites.
+
+TokenBucket caps the sustained request rate across every thread that shares
+it, with a small burst allowance and a random jitter after each grant so the
+requests do not arrive on a fixed beat. RateGovernor adds batch cooldowns:
+after every batch_size completed units of work (teams, not requests; a team
+takes a varying number of requests) all workers pause for cooldown seconds.
+"""
+
+import random
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Parameters:
+    -----------
+    rate : float
+        Tokens added per second (sustained requests per second)
+    burst : int
+        Bucket capacity (requests allowed back to back)
+    jitter : tuple
+        (min, max) extra random delay in seconds after each acquire
+    """
+
+    def __init__(self, rate, burst=1, jitter=(0.0, 0.0)):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self.jitter = jitter
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Block until a token is available; returns the seconds waited."""
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    break
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+        low, high = self.jitter
+        if high > 0:
+            time.sleep(random.uniform(low, high))
+        return time.monotonic() - start
+
+
+class RateGovernor(TokenBucket):
+    """
+    Token bucket with batch cooldowns.
+
+    Parameters:
+    -----------
+    rate, burst, jitter :
+        See TokenBucket
+    batch_size : int or None
+        Pause every worker after this many complete() calls, e.g. teams
+        (None disables cooldowns)
+    cooldown : float
+        Length of the pause in seconds
+    """
+
+    def __init__(self, rate, burst=1, jitter=(0.0, 0.0), batch_size=None, cooldown=0.0):
+        super().__init__(rate, burst, jitter)
+        self.batch_size = batch_size
+        self.cooldown = cooldown
+        self._count = 0
+        self._resume_at = 0.0
+
+    def _wait_for_cooldown(self):
+        with self._lock:
+            remaining = self._resume_at - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def acquire(self):
+        start = time.monotonic()
+        self._wait_for_cooldown()
+        super().acquire()
+        # A cooldown may have started while this thread waited for its token
+        self._wait_for_cooldown()
+        return time.monotonic() - start
+
+    def complete(self):
+        """Count one finished unit of work; every batch_size-th starts a cooldown."""
+        if not self.batch_size:
+            return
+        with self._lock:
+            self._count += 1
+            if self._count % self.batch_size == 0:
+                self._resume_at = time.monotonic() + self.cooldown
+                print(f"Rate governor: {self._count} done, cooling down {self.cooldown:.0f}s")
@@ -0,0 +1,148 @@
+"""
+Bounded fetch -> parse -> write streaming for per-team scrapes.
+
+stream() runs three stages connected by bounded queues:
+
+    jobs ──> fetch workers ──[fetched]──> parse workers ──[parsed]──> sink
+
+Fetch workers block once `queue_size` pages are waiting to be parsed and
+parse workers block once `queue_size` teams' rows are waiting to be written,
+so at most about 2 * queue_size pages/row lists are in memory at any time,
+however many teams, divisions or seasons go through. The sink (usually
+data_store.PartitionWriter.write_rows) runs in the calling thread, so it
+needs no locking.
+
+A job that fails to fetch or parse is reported and skipped. If the sink
+raises, or the run is interrupted, the workers are stopped and the exception
+propagates; everything handed to the sink so far has already been written.
+"""
+
+import queue
+import threading
+
+import run_metrics
+
+_DONE = object()
+
+
+def stream(jobs, fetch, parse, sink, fetch_workers=8, parse_workers=2, queue_size=32):
+    """
+    Stream jobs through fetch, parse and sink.
+
+    Parameters:
+    -----------
+    jobs : iterable of (key, url)
+        Consumed lazily (a generator is fine)
+    fetch : callable
+        fetch(key, url) -> payload (e.g. a response)
+    parse : callable
+        parse(key, payload) -> rows for that key (list, DataFrame, ...)
+    sink : callable
+        sink(key, rows), called in this thread in completion order
+    fetch_workers : int
+        Concurrent fetches
+    parse_workers : int
+        Concurrent parsers
+    queue_size : int
+        Capacity of each queue between stages
+
+    Returns:
+    --------
+    dict: {'written': number of keys sunk, 'failed': [(key, error), ...]}
+    """
+    job_iter = iter(jobs)
+    job_lock = threading.Lock()
+    fetched = queue.Queue(maxsize=queue_size)
+    parsed = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    failed = []
+    failed_lock = threading.Lock()
+
+    def fail(key, error):
+        with failed_lock:
+            failed.append((key, str(error)[:200]))
+        print(f"[Stream Error] {key} → {error}")
+
+    def put(q, item):
+        # Blocks while the queue is full, but gives up once the run is stopped
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def next_job():
+        with job_lock:
+            return next(job_iter, None)
+
+    def fetch_worker():
+        while not stop.is_set():
+            job = next_job()
+            if job is None:
+                break
+            key, url = job
+            try:
+                payload = fetch(key, url)
+            except Exception as e:
+                fail(key, e)
+                continue
+            if not put(fetched, (key, payload)):
+                break
+
+    def parse_worker():
+        while not stop.is_set():
+            try:
+                item = fetched.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if item is _DONE:
+                break
+            key, payload = item
+            try:
+                rows = parse(key, payload)
+            except Exception as e:
+                fail(key, e)
+                continue
+            if not put(parsed, (key, rows)):
+                break
+
+    # Workers record their spans under the caller's run_metrics stage
+    fetchers = [threading.Thread(target=run_metrics.bind(fetch_worker), daemon=True)
+                for _ in range(max(1, fetch_workers))]
+    parsers = [threading.Thread(target=run_metrics.bind(parse_worker), daemon=True)
+               for _ in range(max(1, parse_workers))]
+    for thread in fetchers + parsers:
+        thread.start()
+
+    def close_stages():
+        # Runs after the fetchers finish: one stop token per parser, then one for the sink
+        for thread in fetchers:
+            thread.join()
+        for _ in parsers:
+            put(fetched, _DONE)
+        for thread in parsers:
+            thread.join()
+        put(parsed, _DONE)
+
+    closer = threading.Thread(target=close_stages, daemon=True)
+    closer.start()
+
+    written = 0
+    try:
+        while True:
+            try:
+                item = parsed.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if item is _DONE:
+                break
+            key, rows = item
+            sink(key, rows)
+            written += 1
+    finally:
+        stop.set()
+        closer.join(timeout=5)
+
+    return {'written': written, 'failed': failed}
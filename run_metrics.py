@@ -0,0 +1,329 @@
+"""
+Run metrics: timed spans, per-host request stats and cache hit rates.
+
+Every part of a run reports into the process-wide `metrics` object:
+
+- span(kind, stage, team) times a block of work. Kinds used across the
+  scripts are 'fetch', 'parse', 'clean', 'merge' and 'stage'. Totals are kept
+  per (stage, kind) and per team.
+- observe_request() records one network request: a latency histogram per
+  host, bytes received, urllib3 retries, errors and whether it went through
+  requests, aiohttp or Selenium. http_cache, fetch_engine and driver_pool
+  call it, so scrapers get it for free.
+- cache_result() counts http_cache lookups as 'fresh', 'revalidated' (304)
+  or 'miss'.
+
+write() saves a run as JSON and as a Prometheus text file
+(./PEAR/PEAR Baseball/metrics/run-<time>.json / .prom) so nightly runs can
+be compared or scraped by a node_exporter textfile collector.
+
+stage(name) opens a 'stage' span and makes name the default stage for spans
+in the same context. The stage is a contextvar, so asyncio tasks and
+asyncio.to_thread inherit it; plain threads and executor jobs get it when
+their target is wrapped with bind() at submit time. Stages listed in PEAR_PROFILE (comma separated, or
+'all') also run under cProfile and dump a .prof file next to the metrics.
+cProfile only sees the thread that entered the stage; a sampling profiler
+such as py-spy can be attached to the process from outside instead.
+"""
+
+import contextvars
+import cProfile
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from urllib.parse import urlsplit
+
+METRICS_DIR = os.path.join('.', 'PEAR', 'PEAR Baseball', 'metrics')
+
+# Upper bounds (seconds) of the request latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _host(url):
+    return urlsplit(url).netloc.lower() or url
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class RunMetrics:
+    """
+    Thread-safe metrics for one run.
+
+    Parameters:
+    -----------
+    profile_stages : iterable of str, optional
+        Stages to run under cProfile ('all' for every stage); defaults to the
+        PEAR_PROFILE environment variable
+    """
+
+    def __init__(self, profile_stages=None):
+        if profile_stages is None:
+            profile_stages = [s.strip() for s in os.environ.get('PEAR_PROFILE', '').split(',') if s.strip()]
+        self.profile_stages = set(profile_stages)
+        self._lock = threading.Lock()
+        self._stage = contextvars.ContextVar('pear_stage', default=None)
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started = time.time()
+            self.spans = {}    # (stage, kind) -> [count, seconds, max]
+            self.teams = {}    # (stage, team, kind) -> seconds
+            self.hosts = {}    # host -> request stats
+            self.cache = {}    # result -> count
+            self.counters = {}
+            self.profiles = []
+
+    # Recording
+
+    def current_stage(self):
+        return self._stage.get() or '-'
+
+    def add_span(self, kind, seconds, stage=None, team=None):
+        stage = stage or self.current_stage()
+        with self._lock:
+            entry = self.spans.setdefault((stage, kind), [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = max(entry[2], seconds)
+            if team is not None:
+                key = (stage, team, kind)
+                self.teams[key] = self.teams.get(key, 0.0) + seconds
+
+    @contextmanager
+    def span(self, kind, stage=None, team=None):
+        """Time the enclosed block as one `kind` span (recorded even if it raises)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_span(kind, time.perf_counter() - start, stage, team)
+
+    def count(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe_request(self, url, seconds, status=None, nbytes=0, via='requests', retries=0):
+        """
+        Record one network request.
+
+        Parameters:
+        -----------
+        url : str
+            Requested URL (only the host is kept)
+        seconds : float
+            Wall time of the request, retries included
+        status : int or None
+            HTTP status (None for a connection error or a browser load)
+        nbytes : int
+            Response body size
+        via : str
+            'requests', 'aiohttp' or 'selenium'
+        retries : int
+            Retries urllib3 made before this response
+        """
+        host = _host(url)
+        with self._lock:
+            stats = self.hosts.get(host)
+            if stats is None:
+                stats = self.hosts[host] = {
+                    'requests': 0, 'errors': 0, 'bytes': 0, 'retries': 0, 'seconds': 0.0,
+                    'via': {}, 'buckets': [0] * (len(LATENCY_BUCKETS) + 1),
+                }
+            stats['requests'] += 1
+            stats['bytes'] += nbytes or 0
+            stats['retries'] += retries or 0
+            stats['seconds'] += seconds
+            stats['via'][via] = stats['via'].get(via, 0) + 1
+            if via != 'selenium' and (status is None or status >= 400):
+                stats['errors'] += 1
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    stats['buckets'][i] += 1
+                    break
+            else:
+                stats['buckets'][-1] += 1
+
+    def cache_result(self, result):
+        """Count an http_cache lookup: 'fresh', 'revalidated' or 'miss'."""
+        with self._lock:
+            self.cache[result] = self.cache.get(result, 0) + 1
+
+    @contextmanager
+    def stage(self, name):
+        """Run a pipeline stage: default stage for spans in this context, optional cProfile."""
+        token = self._stage.set(name)
+        profiler = None
+        if name in self.profile_stages or 'all' in self.profile_stages:
+            profiler = cProfile.Profile()
+            profiler.enable()
+        try:
+            with self.span('stage', stage=name):
+                yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                self._dump_profile(name, profiler)
+            self._stage.reset(token)
+
+    def _dump_profile(self, name, profiler):
+        os.makedirs(METRICS_DIR, exist_ok=True)
+        run_id = datetime.fromtimestamp(self.started).strftime('%Y%m%d-%H%M%S')
+        path = os.path.join(METRICS_DIR, f'run-{run_id}-{name}.prof')
+        profiler.dump_stats(path)
+        with self._lock:
+            self.profiles.append(path)
+        print(f"Profile for stage {name} written to {path}")
+
+    # Output
+
+    def snapshot(self):
+        """Everything recorded so far as a JSON-ready dict."""
+        with self._lock:
+            teams = {}
+            for (stage, team, kind), seconds in self.teams.items():
+                teams.setdefault(stage, {}).setdefault(team, {})[kind] = round(seconds, 4)
+
+            hosts = {}
+            for host, stats in self.hosts.items():
+                hosts[host] = {
+                    'requests': stats['requests'],
+                    'errors': stats['errors'],
+                    'bytes': stats['bytes'],
+                    'retries': stats['retries'],
+                    'mean_seconds': round(stats['seconds'] / stats['requests'], 4),
+                    'via': dict(stats['via']),
+                    'latency_buckets': dict(zip([str(b) for b in LATENCY_BUCKETS] + ['+Inf'],
+                                                stats['buckets'])),
+                }
+
+            lookups = sum(self.cache.values())
+            return {
+                'started': datetime.fromtimestamp(self.started).isoformat(timespec='seconds'),
+                'duration_seconds': round(time.time() - self.started, 3),
+                'spans': [
+                    {'stage': stage, 'kind': kind, 'count': count,
+                     'seconds': round(seconds, 4), 'max_seconds': round(longest, 4)}
+                    for (stage, kind), (count, seconds, longest) in sorted(self.spans.items())
+                ],
+                'teams': teams,
+                'hosts': hosts,
+                'cache': dict(self.cache, hit_rate=round((lookups - self.cache.get('miss', 0)) / lookups, 4)
+                              if lookups else None),
+                'counters': dict(self.counters),
+                'profiles': list(self.profiles),
+            }
+
+    def to_prometheus(self):
+        """Prometheus text exposition of the run."""
+        snap = self.snapshot()
+        lines = [
+            '# TYPE pear_run_duration_seconds gauge',
+            f"pear_run_duration_seconds {snap['duration_seconds']}",
+            '# TYPE pear_span_seconds_total counter',
+        ]
+        for span in snap['spans']:
+            labels = f'stage="{_label(span["stage"])}",kind="{_label(span["kind"])}"'
+            lines.append(f"pear_span_seconds_total{{{labels}}} {span['seconds']}")
+        lines.append('# TYPE pear_span_count_total counter')
+        for span in snap['spans']:
+            labels = f'stage="{_label(span["stage"])}",kind="{_label(span["kind"])}"'
+            lines.append(f"pear_span_count_total{{{labels}}} {span['count']}")
+
+        lines.append('# TYPE pear_request_duration_seconds histogram')
+        with self._lock:
+            hosts = {host: dict(stats, via=dict(stats['via'])) for host, stats in self.hosts.items()}
+        for host, stats in sorted(hosts.items()):
+            h = _label(host)
+            cumulative = 0
+            for bound, n in zip(list(LATENCY_BUCKETS) + ['+Inf'], stats['buckets']):
+                cumulative += n
+                lines.append(f'pear_request_duration_seconds_bucket{{host="{h}",le="{bound}"}} {cumulative}')
+            lines.append(f'pear_request_duration_seconds_sum{{host="{h}"}} {round(stats["seconds"], 4)}')
+            lines.append(f'pear_request_duration_seconds_count{{host="{h}"}} {stats["requests"]}')
+
+        for name, key in (('pear_request_bytes_total', 'bytes'),
+                          ('pear_request_retries_total', 'retries'),
+                          ('pear_request_errors_total', 'errors')):
+            lines.append(f'# TYPE {name} counter')
+            for host, stats in sorted(hosts.items()):
+                lines.append(f'{name}{{host="{_label(host)}"}} {stats[key]}')
+
+        lines.append('# TYPE pear_requests_total counter')
+        for host, stats in sorted(hosts.items()):
+            for via, n in sorted(stats['via'].items()):
+                lines.append(f'pear_requests_total{{host="{_label(host)}",via="{_label(via)}"}} {n}')
+
+        lines.append('# TYPE pear_cache_lookups_total counter')
+        for result, n in sorted(snap['cache'].items()):
+            if result != 'hit_rate':
+                lines.append(f'pear_cache_lookups_total{{result="{_label(result)}"}} {n}')
+
+        lines.append('# TYPE pear_events_total counter')
+        for name, n in sorted(snap['counters'].items()):
+            lines.append(f'pear_events_total{{name="{_label(name)}"}} {n}')
+        return '\n'.join(lines) + '\n'
+
+    def write(self, directory=METRICS_DIR, name=None):
+        """
+        Save the run as <name>.json and <name>.prom.
+
+        Returns:
+        --------
+        tuple: (json path, prom path)
+        """
+        os.makedirs(directory, exist_ok=True)
+        name = name or 'run-' + datetime.fromtimestamp(self.started).strftime('%Y%m%d-%H%M%S')
+        json_path = os.path.join(directory, f'{name}.json')
+        prom_path = os.path.join(directory, f'{name}.prom')
+
+        with open(json_path + '.tmp', 'w') as f:
+            json.dump(self.snapshot(), f, indent=1)
+        os.replace(json_path + '.tmp', json_path)
+        with open(prom_path + '.tmp', 'w') as f:
+            f.write(self.to_prometheus())
+        os.replace(prom_path + '.tmp', prom_path)
+
+        print(f"Run metrics written to {json_path} and {prom_path}")
+        return json_path, prom_path
+
+
+metrics = RunMetrics()
+
+
+def span(kind, stage=None, team=None):
+    return metrics.span(kind, stage, team)
+
+
+def stage(name):
+    return metrics.stage(name)
+
+
+def bind(fn):
+    """
+    fn wrapped to run in the caller's context (current stage included), for
+    threading.Thread targets and executor jobs. Each call runs in its own
+    copy, so one bound function can run in several threads at once.
+    """
+    context = contextvars.copy_context()
+
+    def run(*args, **kwargs):
+        return context.copy().run(fn, *args, **kwargs)
+    return run
+
+
+def observe_request(url, seconds, status=None, nbytes=0, via='requests', retries=0):
+    metrics.observe_request(url, seconds, status, nbytes, via, retries)
+
+
+def cache_result(result):
+    metrics.cache_result(result)
+
+
+def write(directory=METRICS_DIR, name=None):
+    return metrics.write(directory, name)
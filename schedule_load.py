@@ -1,101 +1,29 @@
-import requests
+import argparse
+import sys
 from bs4 import BeautifulSoup
 import pandas as pd
-from sklearn.preprocessing import MinMaxScaler
-from datetime import datetime, timedelta
-import pytz
-import warnings
-import os
-import textwrap
-import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import numpy as np
-from scipy.optimize import differential_evolution
-from scipy.stats import spearmanr
-from PIL import Image # type: ignore
-from io import BytesIO # type: ignore
-import matplotlib.pyplot as plt # type: ignore
-import seaborn as sns # type: ignore
-import matplotlib.offsetbox as offsetbox # type: ignore
-import matplotlib.font_manager as fm # type: ignore
-from matplotlib.offsetbox import OffsetImage, AnnotationBbox
-import math
-from collections import Counter, defaultdict
-from plottable import Table # type: ignore
-from plottable.plots import image, circled_image # type: ignore
-from plottable import ColumnDefinition # type: ignore
-from matplotlib.ticker import MaxNLocator
-from matplotlib.colors import LinearSegmentedColormap
-import random
-
-# URL of the page to scrape
-url = 'https://www.warrennolan.com/baseball/2025/elo'
-
-# Fetch the webpage content
-response = requests.get(url)
-soup = BeautifulSoup(response.text, 'html.parser')
-
-# Find the table with the specified class
-table = soup.find('table', class_='normal-grid alternating-rows stats-table')
-
-if table:
-    # Extract table headers
-    headers = [th.text.strip() for th in table.find('thead').find_all('th')]
-    headers.insert(1, "Team Link")  # Adding extra column for team link
-
-    # Extract table rows
-    data = []
-    for row in table.find('tbody').find_all('tr'):
-        cells = row.find_all('td')
-        row_data = []
-        for i, cell in enumerate(cells):
-            # If it's the first cell, extract team name and link from 'name-subcontainer'
-            if i == 0:
-                name_container = cell.find('div', class_='name-subcontainer')
-                if name_container:
-                    team_name = name_container.text.strip()
-                    team_link_tag = name_container.find('a')
-                    team_link = team_link_tag['href'] if team_link_tag else ''
-                else:
-                    team_name = cell.text.strip()
-                    team_link = ''
-                row_data.append(team_name)
-                row_data.append(team_link)  # Add team link separately
-            else:
-                row_data.append(cell.text.strip())
-        data.append(row_data)
-
-
-    elo_data = pd.DataFrame(data, columns=[headers])
-    elo_data.columns = elo_data.columns.get_level_values(0)
-    elo_data = elo_data.drop_duplicates(subset='Team', keep='first')
-    elo_data = elo_data.astype({col: 'str' for col in elo_data.columns if col not in ['ELO', 'Rank']})
-    elo_data['ELO'] = elo_data['ELO'].astype(float, errors='ignore')
-    elo_data['Rank'] = elo_data['Rank'].astype(int, errors='ignore')
-
-else:
-    print("Table not found on the page.")
-print("Elo Load Done")
+import http_cache
+import fast_parse
+import fetch_engine
+import http_client
+import schedule_snapshot
+import data_store
+import team_registry
+import run_metrics
+import row_stream
+import scrape_data
 
 ####################### Schedule Load #######################
 
 BASE_URL = "https://www.warrennolan.com"
 
-session = requests.Session()
-session.headers.update({"User-Agent": "Mozilla/5.0"})
+def parse_schedule_page(team_name, html):
+    # lxml fast path, BeautifulSoup fallback below
+    if fast_parse.AVAILABLE:
+        return fast_parse.schedule_items(html, team_name)
 
-def extract_schedule_data(team_name, team_url, session):
-    schedule_url = BASE_URL + team_url
     team_schedule = []
-
-    try:
-        response = session.get(schedule_url, timeout=10)
-        response.raise_for_status()
-    except Exception as e:
-        print(f"[Error] {team_name} → {e}")
-        return []
-
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = BeautifulSoup(html, 'html.parser')
     schedule_lists = soup.find_all("ul", class_="team-schedule")
     if not schedule_lists:
         return []
@@ -152,115 +80,142 @@ def extract_schedule_data(team_name, team_url, session):
 
     return team_schedule
 
-# ThreadPool wrapper function
-def fetch_all_schedules(elo_df, session, max_workers=12):
+SCHEDULE_COLUMNS = ["Team", "Date", "Opponent", "Location", "Result", "home_team", "away_team", "home_score", "away_score"]
+
+# (team, schedule url) for every team in a season's ELO table
+# (the team links on a season's ELO page point at that season's schedules)
+def schedule_jobs(elo_data):
+    return [(row["Team"], BASE_URL + row["Team Link"]) for _, row in elo_data.iterrows()]
+
+# Bumps whenever either schedule parser changes, invalidating cached rows
+SCHEDULE_PARSER_VERSION = http_cache.code_version(parse_schedule_page, fast_parse.schedule_items)
+
+# Parsed rows of one fetched schedule page (unchanged pages reuse the cached rows)
+def parse_schedule_response(team_name, response):
+    with run_metrics.span('parse', 'schedules', team_name):
+        return http_cache.cached_parse(
+            response, 'schedule', lambda r: parse_schedule_page(team_name, r.text),
+            version=SCHEDULE_PARSER_VERSION
+        )
+
+# Async fetch of every team schedule, parsed as each page arrives
+# refresh=True only re-scrapes teams with a game due since the stored snapshot
+def fetch_all_schedules(elo_df, per_host=12, refresh=False, year=2025, division='D1'):
+    jobs = schedule_jobs(elo_df)
+
+    snapshot = None
+    if refresh:
+        snapshot = schedule_snapshot.ScheduleSnapshot(division, year)
+        full_sweep = snapshot.needs_full_sweep()
+        stale = set(snapshot.teams_to_refresh([team for team, _ in jobs]))
+        jobs = [(team, link) for team, link in jobs if team in stale]
+        print(f"Refreshing {len(jobs)} team schedules"
+              f"{' (full sweep)' if full_sweep else ''}")
+
+    def parse(team_name, response):
+        if not response.ok:
+            print(f"[Error] {team_name} → HTTP {response.status_code}")
+            return []
+        return parse_schedule_response(team_name, response)
+
+    results = fetch_engine.fetch_all(jobs, parse, per_host=per_host)
+
+    # Keep ELO order so reruns produce the same row order
     schedule_data = []
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {
-            executor.submit(extract_schedule_data, row["Team"], row["Team Link"], session): row["Team"]
-            for _, row in elo_df.iterrows()
-        }
-
-        for future in as_completed(futures):
-            try:
-                data = future.result()
-                schedule_data.extend(data)
-            except Exception as e:
-                print(f"[Thread Error] {e}")
-
-    return schedule_data
-
-schedule_data = fetch_all_schedules(elo_data, session, max_workers=12)
-
-# --- Team Name Replacements (Maps to be the same as teams on NCAA site) ---
-team_replacements = {
-    'North Carolina St.': 'NC State',
-    'Southern Miss': 'Southern Miss.',
-    'USC': 'Southern California',
-    'Dallas Baptist': 'DBU',
-    'Charleston': 'Col. of Charleston',
-    'Georgia Southern': 'Ga. Southern',
-    'UNCG': 'UNC Greensboro',
-    'East Tennessee St.': 'ETSU',
-    'Lamar': 'Lamar University',
-    "Saint Mary's College": "Saint Mary's (CA)",
-    'Western Kentucky': 'Western Ky.',
-    'FAU': 'Fla. Atlantic',
-    'Connecticut': 'UConn',
-    'Southeast Missouri': 'Southeast Mo. St.',
-    'Alcorn St.': 'Alcorn',
-    'Appalachian St.': 'App State',
-    'Arkansas-Pine Bluff': 'Ark.-Pine Bluff',
-    'Army': 'Army West Point',
-    'Cal St. Bakersfield': 'CSU Bakersfield',
-    'Cal St. Northridge': 'CSUN',
-    'Central Arkansas': 'Central Ark.',
-    'Central Michigan': 'Central Mich.',
-    'Charleston Southern': 'Charleston So.',
-    'Eastern Illinois': 'Eastern Ill.',
-    'Eastern Kentucky': 'Eastern Ky.',
-    'Eastern Michigan': 'Eastern Mich.',
-    'Fairleigh Dickinson': 'FDU',
-    'Grambling St.': 'Grambling',
-    'Incarnate Word': 'UIW',
-    'Long Island': 'LIU',
-    'Maryland Eastern Shore': 'UMES',
-    'Middle Tennessee': 'Middle Tenn.',
-    'Mississippi Valley St.': 'Mississippi Val.',
-    "Mount Saint Mary's": "Mount St. Mary's",
-    'North Alabama': 'North Ala.',
-    'North Carolina A&T': 'N.C. A&T',
-    'Northern Colorado': 'Northern Colo.',
-    'Northern Kentucky': 'Northern Ky.',
-    'Prairie View A&M': 'Prairie View',
-    'Presbyterian College': 'Presbyterian',
-    'Saint Bonaventure': 'St. Bonaventure',
-    "Saint John's": "St. John's (NY)",
-    'Sam Houston St.': 'Sam Houston',
-    'Seattle University': 'Seattle U',
-    'South Carolina Upstate': 'USC Upstate',
-    'South Florida': 'South Fla.',
-    'Southeastern Louisiana': 'Southeastern La.',
-    'Southern': 'Southern U.',
-    'Southern Illinois': 'Southern Ill.',
-    'Stephen F. Austin': 'SFA',
-    'Tennessee-Martin': 'UT Martin',
-    'Texas A&M-Corpus Christi': 'A&M-Corpus Christi',
-    'UMass-Lowell': 'UMass Lowell',
-    'UTA': 'UT Arlington',
-    'Western Carolina': 'Western Caro.',
-    'Western Illinois': 'Western Ill.',
-    'Western Michigan': 'Western Mich.',
-    'Albany': 'UAlbany',
-    'Southern Indiana': 'Southern Ind.',
-    'Queens': 'Queens (NC)',
-    'Central Connecticut': 'Central Conn. St.',
-    'Saint Thomas': 'St. Thomas (MN)',
-    'Northern Illinois': 'NIU',
-    'UMass': 'Massachusetts',
-    'Loyola-Marymount': 'LMU (CA)'
-}
-
-columns = ["Team", "Date", "Opponent", "Location", "Result", "home_team", "away_team", "home_score", "away_score"]
-schedule_df = pd.DataFrame(schedule_data, columns=columns)
-schedule_df = schedule_df.astype({col: 'str' for col in schedule_df.columns if col not in ['home_score', 'away_score']})
-schedule_df['home_score'] = schedule_df['home_score'].astype(int, errors='ignore')
-schedule_df['away_score'] = schedule_df['away_score'].astype(int, errors='ignore')
-schedule_df = schedule_df.merge(elo_data[['Team', 'ELO']], left_on='home_team', right_on='Team', how='left')
-schedule_df.rename(columns={'ELO': 'home_elo'}, inplace=True)
-schedule_df = schedule_df.merge(elo_data[['Team', 'ELO']], left_on='away_team', right_on='Team', how='left')
-schedule_df.rename(columns={'ELO': 'away_elo'}, inplace=True)
-schedule_df.drop(columns=['Team', 'Team_y'], inplace=True)
-schedule_df.rename(columns={'Team_x':'Team'}, inplace=True)
-schedule_df = schedule_df[~(schedule_df['Result'] == 'Canceled')].reset_index(drop=True)
-schedule_df = schedule_df[~(schedule_df['Result'] == 'Postponed')].reset_index(drop=True)
-
-# Apply replacements and standardize 'State' to 'St.'
-columns_to_replace = ['Team', 'home_team', 'away_team', 'Opponent']
-
-for col in columns_to_replace:
-    schedule_df[col] = schedule_df[col].str.replace('State', 'St.', regex=False)
-    schedule_df[col] = schedule_df[col].replace(team_replacements)
-elo_data['Team'] = elo_data['Team'].str.replace('State', 'St.', regex=False)
-elo_data['Team'] = elo_data['Team'].replace(team_replacements)
+    for team_name, _ in jobs:
+        schedule_data.extend(results.get(team_name, []))
+
+    if snapshot is None:
+        return schedule_data
+
+    new_rows = pd.DataFrame(schedule_data, columns=SCHEDULE_COLUMNS)
+    diff = snapshot.merge(new_rows, [team for team, _ in jobs], full_sweep=full_sweep)
+    snapshot.save()
+    print(f"Snapshot updated: {diff}")
+    return snapshot.rows.reindex(columns=SCHEDULE_COLUMNS).values.tolist()
+
+# team_id -> ELO lookup for finish_schedule_rows()
+def elo_by_team_id(elo_data):
+    elo = scrape_data.elo_dataset(elo_data)
+    return elo.dropna(subset=['team_id']).drop_duplicates('team_id').set_index('team_id')['ELO']
+
+# Clean a batch of schedule rows, key them by team id and join ELO
+# (row-wise only, so it works on any slice of the season)
+def finish_schedule_rows(schedule_df, elo_by_id, season=2025):
+    schedule_df = schedule_df.astype({col: 'str' for col in schedule_df.columns if col not in ['home_score', 'away_score']})
+    schedule_df['home_score'] = schedule_df['home_score'].astype(int, errors='ignore')
+    schedule_df['away_score'] = schedule_df['away_score'].astype(int, errors='ignore')
+    schedule_df = schedule_df[~(schedule_df['Result'] == 'Canceled')].reset_index(drop=True)
+    schedule_df = schedule_df[~(schedule_df['Result'] == 'Postponed')].reset_index(drop=True)
+
+    # Canonical names (Maps to be the same as teams on NCAA site) and integer team keys
+    columns_to_replace = ['Team', 'home_team', 'away_team', 'Opponent']
+
+    for col in columns_to_replace:
+        schedule_df[col] = team_registry.canonical_names(schedule_df[col], source='warrennolan')
+    schedule_df['home_team_id'] = team_registry.team_ids(schedule_df['home_team'])
+    schedule_df['away_team_id'] = team_registry.team_ids(schedule_df['away_team'])
+
+    # ELO lookup joined on team id
+    schedule_df['home_elo'] = schedule_df['home_team_id'].map(elo_by_id)
+    schedule_df['away_elo'] = schedule_df['away_team_id'].map(elo_by_id)
+    return schedule_df.assign(Date=schedule_snapshot.game_dates(schedule_df['Date'], season))
+
+# Stream every team schedule straight into the store: pages are fetched,
+# parsed and written in batches through bounded queues, so memory does not
+# grow with the number of teams. Returns (rows written, failed teams).
+def stream_schedules(elo_data, division='D1', season=2025, per_host=12, batch_size=5000, queue_size=32):
+    elo_by_id = elo_by_team_id(elo_data)
+    jobs = schedule_jobs(elo_data)
+    session = http_client.make_session(pool_size=per_host)
+
+    def fetch(team_name, url):
+        with run_metrics.span('fetch', 'schedules', team_name):
+            response = http_cache.get(url, session=session, timeout=10)
+            response.raise_for_status()
+            return response
+
+    writer = data_store.PartitionWriter(
+        'schedules', division, season, columns=SCHEDULE_COLUMNS, batch_size=batch_size,
+        transform=lambda batch: finish_schedule_rows(batch, elo_by_id, season),
+    )
+    with writer:
+        result = row_stream.stream(
+            jobs, fetch, parse_schedule_response, lambda team_name, rows: writer.write_rows(rows),
+            fetch_workers=per_host, parse_workers=2, queue_size=queue_size,
+        )
+    print(f"Schedules: {writer.rows_written} rows from {result['written']} teams written to {writer.path}")
+    return writer.rows_written, result['failed']
+
+# Whole-season schedule from the stored snapshot, re-scraping only the teams
+# with a game due since the last run (plus a periodic full sweep)
+def refresh_schedules(elo_data, division='D1', season=2025, per_host=12):
+    rows = fetch_all_schedules(elo_data, per_host=per_host, refresh=True, year=season, division=division)
+    schedule_df = pd.DataFrame(rows, columns=SCHEDULE_COLUMNS)
+    return finish_schedule_rows(schedule_df, elo_by_team_id(elo_data), season)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape the Warren Nolan ELO table and every D1 schedule.")
+    parser.add_argument('--season', type=int, default=2025)
+    parser.add_argument('--refresh', action='store_true',
+                        help='only re-scrape teams with a game due since the stored snapshot')
+    args = parser.parse_args(argv)
+
+    with run_metrics.stage('elo'):
+        elo_data = scrape_data.fetch_elo_table(args.season)
+    if elo_data is None:
+        return 1
+    with run_metrics.stage('schedules'):
+        if args.refresh:
+            data_store.write_partition(refresh_schedules(elo_data, 'D1', args.season), 'schedules', 'D1', args.season)
+        else:
+            stream_schedules(elo_data, 'D1', args.season, per_host=12)
+
+    # --- Store ---
+    data_store.write_partition(scrape_data.elo_dataset(elo_data), 'elo', 'D1', args.season)
+    run_metrics.write()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
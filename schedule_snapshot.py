@@ -0,0 +1,183 @@
+"""
+Stored schedule snapshot for incremental refreshes.
+
+The snapshot keeps the last scraped schedule rows for a division/season plus a
+per-team marker (last completed game, next scheduled game). A refresh only
+re-scrapes teams whose next scheduled game is due, with a periodic full sweep
+to pick up schedule changes, and the scraped rows are merged in as a diff.
+"""
+
+import os
+import pickle
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+# A finished game has a score after the W/L/T ("W 5-3", "L, 2-4"); "TBA"/"TBD" do not
+RESULT_PATTERN = r'^\s*[WLT]\s*,?\s*\d'
+# Never played, so never scheduled either (same list finish_team_schedule drops)
+CANCELED_RESULTS = ['Cancelled', 'Postponed', 'Canceled']
+
+
+def snapshot_path(division, year):
+    return os.path.join('.', 'PEAR', 'PEAR Baseball', division, f'y{year}', 'schedule_snapshot.pkl')
+
+
+def game_dates(dates, year):
+    """
+    Parse schedule dates ("Feb 14 (Fri)", "Fri, Feb 14", "Feb 14") into datetimes.
+    Unparseable dates become NaT.
+    """
+    if pd.api.types.is_datetime64_any_dtype(dates):
+        return dates
+    cleaned = (
+        dates.astype(str)
+        .str.replace(r'\s*\([^)]*\)', '', regex=True)
+        .str.replace(r'^[A-Za-z]+,\s*', '', regex=True)
+        .str.strip()
+    )
+    return pd.to_datetime(cleaned + f' {year}', format='%b %d %Y', errors='coerce')
+
+
+def build_markers(rows, year, team_col='Team'):
+    """
+    Per-team last completed / next scheduled game dates. Canceled and
+    postponed games count as neither.
+    """
+    if rows.empty:
+        return {}
+
+    dates = game_dates(rows['Date'], year)
+    results = rows['Result'].astype(str)
+    completed = results.str.match(RESULT_PATTERN)
+    canceled = results.str.strip().isin(CANCELED_RESULTS)
+    frame = pd.DataFrame({'team': rows[team_col].values, 'date': dates.values,
+                          'completed': completed.values, 'canceled': canceled.values})
+
+    last_completed = frame[frame['completed']].groupby('team')['date'].max()
+    next_scheduled = frame[~frame['completed'] & ~frame['canceled']].groupby('team')['date'].min()
+
+    return {
+        team: {
+            'last_completed': last_completed.get(team, pd.NaT),
+            'next_scheduled': next_scheduled.get(team, pd.NaT),
+        }
+        for team in frame['team'].unique()
+    }
+
+
+class ScheduleSnapshot:
+    """
+    Schedule rows and refresh markers for one division and season.
+
+    Parameters:
+    -----------
+    division : str
+        Division name (e.g., 'D1', 'D2')
+    year : int or str
+        Season year
+    full_sweep_days : int
+        Re-scrape every team when the last full sweep is older than this
+    """
+
+    def __init__(self, division, year, full_sweep_days=7):
+        self.division = division
+        self.year = int(year)
+        self.full_sweep_days = full_sweep_days
+        self.path = snapshot_path(division, year)
+        self.rows = pd.DataFrame()
+        self.markers = {}
+        self.last_full_sweep = None
+        self.load()
+
+    def load(self):
+        if os.path.exists(self.path):
+            with open(self.path, 'rb') as f:
+                state = pickle.load(f)
+            self.rows = state['rows']
+            self.markers = state['markers']
+            self.last_full_sweep = state['last_full_sweep']
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + '.tmp'
+        with open(tmp, 'wb') as f:
+            pickle.dump({'rows': self.rows, 'markers': self.markers,
+                         'last_full_sweep': self.last_full_sweep}, f)
+        os.replace(tmp, self.path)
+
+    def needs_full_sweep(self, now=None):
+        now = now or datetime.now()
+        return (self.last_full_sweep is None
+                or now - self.last_full_sweep > timedelta(days=self.full_sweep_days))
+
+    def teams_to_refresh(self, teams, today=None):
+        """
+        Teams that need re-scraping: every team on a full sweep, otherwise
+        teams with no marker yet and teams whose next scheduled game is due.
+        """
+        if self.needs_full_sweep():
+            return list(teams)
+
+        today = pd.Timestamp(today or datetime.now().date())
+        stale = []
+        for team in teams:
+            marker = self.markers.get(team)
+            if marker is None:
+                stale.append(team)
+            elif pd.notna(marker['next_scheduled']) and marker['next_scheduled'] <= today:
+                stale.append(team)
+        return stale
+
+    def merge(self, new_rows, refreshed_teams, full_sweep=False, team_col='Team'):
+        """
+        Replace the rows of refreshed teams with newly scraped rows.
+
+        Teams that were scheduled for refresh but returned nothing keep their
+        old rows. A full sweep that returned nothing (an outage or a block)
+        is not recorded, so the next run sweeps again.
+        Returns a diff summary: {'added', 'removed', 'changed', 'teams'}.
+        """
+        scraped = set()
+        if new_rows is not None and not new_rows.empty:
+            scraped = set(new_rows[team_col]) & set(refreshed_teams)
+        if not scraped:
+            if full_sweep:
+                print(f"⚠ Full sweep of {len(refreshed_teams)} {self.division} teams returned no games; "
+                      f"the next refresh sweeps again")
+            return {'added': 0, 'removed': 0, 'changed': 0, 'teams': 0}
+
+        new_rows = new_rows[new_rows[team_col].isin(scraped)]
+
+        if self.rows.empty:
+            old_rows = new_rows.iloc[0:0]
+            kept = new_rows.iloc[0:0]
+        else:
+            in_scope = self.rows[team_col].isin(scraped)
+            old_rows = self.rows[in_scope]
+            kept = self.rows[~in_scope]
+
+        diff = self._diff(old_rows, new_rows, team_col)
+
+        self.rows = pd.concat([kept, new_rows], ignore_index=True)
+        self.markers.update(build_markers(new_rows, self.year, team_col))
+        if full_sweep:
+            self.last_full_sweep = datetime.now()
+
+        diff['teams'] = len(scraped)
+        return diff
+
+    @staticmethod
+    def _diff(old_rows, new_rows, team_col):
+        key = [team_col, 'Date', 'Opponent']
+        old = old_rows.set_index(key)['Result'].astype(str)
+        new = new_rows.set_index(key)['Result'].astype(str)
+        old = old[~old.index.duplicated()]
+        new = new[~new.index.duplicated()]
+
+        common = old.index.intersection(new.index)
+        return {
+            'added': len(new.index.difference(old.index)),
+            'removed': len(old.index.difference(new.index)),
+            'changed': int((old.loc[common] != new.loc[common]).sum()),
+        }
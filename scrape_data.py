@@ -1,41 +1,40 @@
-import requests
+import argparse
+import sys
 from bs4 import BeautifulSoup
 import pandas as pd
-from sklearn.preprocessing import MinMaxScaler
-from datetime import datetime, timedelta
-import pytz
-import warnings
-import os
-import textwrap
-import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import numpy as np
-from scipy.optimize import differential_evolution
-from scipy.stats import spearmanr
-from PIL import Image # type: ignore
-from io import BytesIO # type: ignore
-import matplotlib.pyplot as plt # type: ignore
-import seaborn as sns # type: ignore
-import matplotlib.offsetbox as offsetbox # type: ignore
-import matplotlib.font_manager as fm # type: ignore
-from matplotlib.offsetbox import OffsetImage, AnnotationBbox
-import math
-from collections import Counter, defaultdict
-from plottable import Table # type: ignore
-from plottable.plots import image, circled_image # type: ignore
-from plottable import ColumnDefinition # type: ignore
-from matplotlib.ticker import MaxNLocator
-from matplotlib.colors import LinearSegmentedColormap
-import random
+import http_cache
+import fast_parse
+import fetch_engine
+import paginated_table
+import data_store
+import team_registry
+import run_metrics
+import asyncio
 
 # --- Warren Nolan Helper Functions ---
+# Warren Nolan keeps every season's pages under its year (D1 only)
+def warrennolan_url(page, season=2025):
+    return f'https://www.warrennolan.com/baseball/{int(season)}/{page}'
+
 def get_soup(url):
-    response = requests.get(url, headers={"User-Agent": "Mozilla/5.0"})
+    response = http_cache.get(url, headers={"User-Agent": "Mozilla/5.0"})
     response.raise_for_status()
     return BeautifulSoup(response.text, "html.parser")
 
 def scrape_warrennolan_table(url, expected_columns):
-    soup = get_soup(url)
+    response = http_cache.get(url, headers={"User-Agent": "Mozilla/5.0"})
+    response.raise_for_status()
+    return parse_warrennolan_table(response.text, expected_columns)
+
+def parse_warrennolan_table(html, expected_columns):
+    # lxml fast path, BeautifulSoup fallback
+    if fast_parse.AVAILABLE:
+        columns = fast_parse.warrennolan_rankings(html)
+        if columns is None:
+            return pd.DataFrame(columns=expected_columns)
+        return pd.DataFrame(dict(zip(expected_columns, columns.values())))
+
+    soup = BeautifulSoup(html, "html.parser")
     table = soup.find('table', class_='normal-grid alternating-rows stats-table')
     data = []
     if table:
@@ -50,34 +49,37 @@ def scrape_warrennolan_table(url, expected_columns):
                 data.append([cells[0].text.strip(), team_name, conference])
     return pd.DataFrame(data, columns=expected_columns)
 
+# Maps Warren Nolan names to be the same as teams on NCAA site
 def clean_team_names(df, column='Team'):
-    df[column] = df[column].str.replace('State', 'St.', regex=False)
-    df[column] = df[column].replace(team_replacements)
+    df[column] = team_registry.canonical_names(df[column], source='warrennolan')
     return df
 
 # --- Projected RPI ---
-projected_rpi = scrape_warrennolan_table(
-    'https://www.warrennolan.com/baseball/2025/rpi-predict',
-    expected_columns=["RPI", "Team", "Conference"]
-)
+def get_projected_rpi(season=2025):
+    return clean_team_names(scrape_warrennolan_table(
+        warrennolan_url('rpi-predict', season),
+        expected_columns=["RPI", "Team", "Conference"]
+    ))
 
 # --- Live RPI ---
-live_rpi = scrape_warrennolan_table(
-    'https://www.warrennolan.com/baseball/2025/rpi-live',
-    expected_columns=["Live_RPI", "Team", "Conference"]
-)
+def get_live_rpi(season=2025):
+    return clean_team_names(scrape_warrennolan_table(
+        warrennolan_url('rpi-live', season),
+        expected_columns=["Live_RPI", "Team", "Conference"]
+    ))
 
-# --- ELO Ratings ---
-url = 'https://www.warrennolan.com/baseball/2025/elo'
+def parse_elo_table(html):
+    # lxml fast path, BeautifulSoup fallback
+    if fast_parse.AVAILABLE:
+        return fast_parse.elo_table(html)
 
-# Fetch the webpage content
-response = requests.get(url)
-soup = BeautifulSoup(response.text, 'html.parser')
+    soup = BeautifulSoup(html, 'html.parser')
 
-# Find the table with the specified class
-table = soup.find('table', class_='normal-grid alternating-rows stats-table')
+    # Find the table with the specified class
+    table = soup.find('table', class_='normal-grid alternating-rows stats-table')
+    if not table:
+        return None
 
-if table:
     # Extract table headers
     headers = [th.text.strip() for th in table.find('thead').find_all('th')]
     headers.insert(1, "Team Link")  # Adding extra column for team link
@@ -103,195 +105,145 @@ if table:
             else:
                 row_data.append(cell.text.strip())
         data.append(row_data)
+    return headers, data
 
+# --- ELO Ratings ---
+# raw ELO table: Warren Nolan team names, their schedule links, Rank and ELO
+def fetch_elo_table(season=2025):
+    url = warrennolan_url('elo', season)
+
+    # Fetch the webpage content
+    response = http_cache.get(url)
+    parsed = parse_elo_table(response.text)
+
+    if not parsed:
+        print("Table not found on the page.")
+        return None
 
+    headers, data = parsed
     elo_data = pd.DataFrame(data, columns=[headers])
     elo_data.columns = elo_data.columns.get_level_values(0)
     elo_data = elo_data.drop_duplicates(subset='Team', keep='first')
     elo_data = elo_data.astype({col: 'str' for col in elo_data.columns if col not in ['ELO', 'Rank']})
     elo_data['ELO'] = elo_data['ELO'].astype(float, errors='ignore')
     elo_data['Rank'] = elo_data['Rank'].astype(int, errors='ignore')
-    elo_data.rename(columns={'Rank': 'ELO_Rank'}, inplace=True)
-
-else:
-    print("Table not found on the page.")
-
-# --- Team Name Replacements (Maps to be the same as teams on NCAA site) ---
-team_replacements = {
-    'North Carolina St.': 'NC State',
-    'Southern Miss': 'Southern Miss.',
-    'USC': 'Southern California',
-    'Dallas Baptist': 'DBU',
-    'Charleston': 'Col. of Charleston',
-    'Georgia Southern': 'Ga. Southern',
-    'UNCG': 'UNC Greensboro',
-    'East Tennessee St.': 'ETSU',
-    'Lamar': 'Lamar University',
-    "Saint Mary's College": "Saint Mary's (CA)",
-    'Western Kentucky': 'Western Ky.',
-    'FAU': 'Fla. Atlantic',
-    'Connecticut': 'UConn',
-    'Southeast Missouri': 'Southeast Mo. St.',
-    'Alcorn St.': 'Alcorn',
-    'Appalachian St.': 'App State',
-    'Arkansas-Pine Bluff': 'Ark.-Pine Bluff',
-    'Army': 'Army West Point',
-    'Cal St. Bakersfield': 'CSU Bakersfield',
-    'Cal St. Northridge': 'CSUN',
-    'Central Arkansas': 'Central Ark.',
-    'Central Michigan': 'Central Mich.',
-    'Charleston Southern': 'Charleston So.',
-    'Eastern Illinois': 'Eastern Ill.',
-    'Eastern Kentucky': 'Eastern Ky.',
-    'Eastern Michigan': 'Eastern Mich.',
-    'Fairleigh Dickinson': 'FDU',
-    'Grambling St.': 'Grambling',
-    'Incarnate Word': 'UIW',
-    'Long Island': 'LIU',
-    'Maryland Eastern Shore': 'UMES',
-    'Middle Tennessee': 'Middle Tenn.',
-    'Mississippi Valley St.': 'Mississippi Val.',
-    "Mount Saint Mary's": "Mount St. Mary's",
-    'North Alabama': 'North Ala.',
-    'North Carolina A&T': 'N.C. A&T',
-    'Northern Colorado': 'Northern Colo.',
-    'Northern Kentucky': 'Northern Ky.',
-    'Prairie View A&M': 'Prairie View',
-    'Presbyterian College': 'Presbyterian',
-    'Saint Bonaventure': 'St. Bonaventure',
-    "Saint John's": "St. John's (NY)",
-    'Sam Houston St.': 'Sam Houston',
-    'Seattle University': 'Seattle U',
-    'South Carolina Upstate': 'USC Upstate',
-    'South Florida': 'South Fla.',
-    'Southeastern Louisiana': 'Southeastern La.',
-    'Southern': 'Southern U.',
-    'Southern Illinois': 'Southern Ill.',
-    'Stephen F. Austin': 'SFA',
-    'Tennessee-Martin': 'UT Martin',
-    'Texas A&M-Corpus Christi': 'A&M-Corpus Christi',
-    'UMass-Lowell': 'UMass Lowell',
-    'UTA': 'UT Arlington',
-    'Western Carolina': 'Western Caro.',
-    'Western Illinois': 'Western Ill.',
-    'Western Michigan': 'Western Mich.',
-    'Albany': 'UAlbany',
-    'Southern Indiana': 'Southern Ind.',
-    'Queens': 'Queens (NC)',
-    'Central Connecticut': 'Central Conn. St.',
-    'Saint Thomas': 'St. Thomas (MN)',
-    'Northern Illinois': 'NIU',
-    'UMass': 'Massachusetts',
-    'Loyola-Marymount': 'LMU (CA)'
-}
+    return elo_data
+
+# ELO table with ELO_Rank and canonical team names
+def clean_elo_data(elo_data):
+    elo_data = elo_data.rename(columns={'Rank': 'ELO_Rank'})
 
-# Apply team name cleanup
-elo_data = clean_team_names(elo_data)
-projected_rpi = clean_team_names(projected_rpi)
-live_rpi = clean_team_names(live_rpi)
+    # Apply team name cleanup
+    return clean_team_names(elo_data)
 
+# The stored 'elo' dataset (ELO_Rank, canonical names and integer team keys);
+# every writer of 'elo' builds it here so its partitions share one schema
+def elo_dataset(elo_table):
+    elo_data = clean_elo_data(elo_table)
+    elo_data['team_id'] = team_registry.team_ids(elo_data['Team'])
+    return elo_data
 
+def get_elo_data(season=2025):
+    elo_data = fetch_elo_table(season)
+    return None if elo_data is None else elo_dataset(elo_data)
 
 
 #### NCAA Site stuff ####
+# ncaa.com only serves the current season's stats and rankings, so these
+# take a division but no season and are only stored for CURRENT_SEASON
+CURRENT_SEASON = 2025
+
 # --- NCAA Stats Dropdown ---
-base_url = "https://www.ncaa.com"
-soup = get_soup(f"{base_url}/stats/baseball/d1")
-dropdown = soup.find("select", {"id": "select-container-team"})
-stat_links = {
-    option.text.strip(): base_url + option["value"]
-    for option in dropdown.find_all("option") if option.get("value")
-}
-# use stat_links for urls to Team Stats
+_stat_links = {}
+
+# stat_name -> URL for every Team Stats page (fetched once per division per process)
+def get_stat_links(division='D1'):
+    if division not in _stat_links:
+        base_url = "https://www.ncaa.com"
+        soup = get_soup(f"{base_url}/stats/baseball/{division.lower()}")
+        dropdown = soup.find("select", {"id": "select-container-team"})
+        _stat_links[division] = {
+            option.text.strip(): base_url + option["value"]
+            for option in dropdown.find_all("option") if option.get("value")
+        }
+    return _stat_links[division]
 
 # --- NCAA RPI Table ---
-rpi_url = "https://www.ncaa.com/rankings/baseball/d1/rpi"
-rpi_soup = get_soup(rpi_url)
-table = rpi_soup.find("table", class_="sticky")
-
-if table:
-    headers = [th.text.strip() for th in table.find_all("th")]
-    data = [
-        [td.text.strip() for td in row.find_all("td")]
-        for row in table.find_all("tr")[1:]
-    ]
+def get_ncaa_rpi(division='D1'):
+    rpi_url = f"https://www.ncaa.com/rankings/baseball/{division.lower()}/rpi"
+    rpi_response = http_cache.get(rpi_url, headers={"User-Agent": "Mozilla/5.0"})
+    rpi_response.raise_for_status()
+
+    if fast_parse.AVAILABLE:
+        rpi_table = fast_parse.simple_table(rpi_response.text, "sticky")
+    else:
+        table = BeautifulSoup(rpi_response.text, "html.parser").find("table", class_="sticky")
+        rpi_table = None
+        if table:
+            rpi_table = (
+                [th.text.strip() for th in table.find_all("th")],
+                [[td.text.strip() for td in row.find_all("td")] for row in table.find_all("tr")[1:]],
+            )
+
+    if not rpi_table:
+        print("NCAA RPI Table not found.")
+        return pd.DataFrame()
+
+    headers, data = rpi_table
     rpi = pd.DataFrame(data, columns=headers).drop(columns=["Previous"])
     rpi.rename(columns={"School": "Team"}, inplace=True)
-else:
-    print("NCAA RPI Table not found.")
-    rpi = pd.DataFrame()
-
-
-####################### CONFIG #######################
+    return rpi
 
-# Must be defined elsewhere in your script:
-# - stat_links: dict of stat_name -> URL
-# - get_soup(url): function that returns BeautifulSoup of given URL
 
 ####################### Core Stat Fetching #######################
 
-# returns a dataframe for a specific stat name in stat_links
-def get_stat_dataframe(stat_name):
-    if stat_name not in stat_links:
-        print(f"Stat '{stat_name}' not found. Available stats: {list(stat_links.keys())}")
+# returns a dataframe for a specific stat name in the stat links
+def get_stat_dataframe(stat_name, links=None):
+    links = links or get_stat_links()
+    if stat_name not in links:
+        print(f"Stat '{stat_name}' not found. Available stats: {list(links.keys())}")
         return None
 
-    all_data = []
-    page_num = 1
+    return fetch_engine.run(lambda fetcher: fetch_stat_dataframe(fetcher, stat_name, links))
 
-    while True:
-        url = stat_links[stat_name]
-        if page_num > 1:
-            url = f"{url}/p{page_num}"
+####################### Async Fetching #######################
 
-        try:
-            soup = get_soup(url)
-            table = soup.find("table")
-            if not table:
-                break
-
-            headers = [th.text.strip() for th in table.find_all("th")]
-            data = []
-            for row in table.find_all("tr")[1:]:
-                cols = row.find_all("td")
-                data.append([col.text.strip() for col in cols])
-
-            all_data.extend(data)
-
-        except requests.exceptions.HTTPError:
-            break
-        except Exception as e:
-            print(f"Error for {stat_name}, page {page_num}: {e}")
-            break
-
-        page_num += 1
-
-    if all_data:
-        df = pd.DataFrame(all_data, columns=headers)
-        for col in df.columns:
-            if col != "Team":
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-        return df
-    else:
+# page 1 gives the page count, the rest of the pages are fetched together
+async def fetch_stat_dataframe(fetcher, stat_name, links=None):
+    links = links or get_stat_links()
+    if stat_name not in links:
+        print(f"Stat '{stat_name}' not found. Available stats: {list(links.keys())}")
+        return None
+
+    try:
+        return await paginated_table.fetch_paginated_table(fetcher, links[stat_name])
+    except fetch_engine.ThrottledError:
+        raise
+    except Exception as e:
+        print(f"Error for {stat_name}: {e}")
         return None
 
-####################### Threading #######################
+# stat retrieval for every stat at once (name kept for existing callers)
+def threaded_stat_fetch(stat_names, max_workers=10, links=None):
+    links = links or get_stat_links()
 
-# threaded stat retrieval
-def threaded_stat_fetch(stat_names, max_workers=10):
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_stat = {
-            executor.submit(get_stat_dataframe, stat): stat
-            for stat in stat_names
-        }
+    async def main(fetcher):
+        tasks = {stat: asyncio.create_task(fetch_stat_dataframe(fetcher, stat, links)) for stat in stat_names}
         results = {}
-        for future in as_completed(future_to_stat):
-            stat = future_to_stat[future]
-            try:
-                results[stat] = future.result()
-            except Exception as e:
-                print(f"Failed to fetch {stat}: {e}")
-    return results
+        try:
+            for stat, task in tasks.items():
+                try:
+                    results[stat] = await task
+                except fetch_engine.ThrottledError as e:
+                    print(f"[Throttled] {e} ({len(results)} stats kept)")
+                    break
+                except Exception as e:
+                    print(f"Failed to fetch {stat}: {e}")
+        finally:
+            await fetch_engine.cancel_all(list(tasks.values()))
+        return results
+
+    return fetch_engine.run(main, per_host=max_workers)
 
 ####################### Utility #######################
 
@@ -343,28 +295,91 @@ STAT_TRANSFORMS = {
 ####################### Merging + Final Stats #######################
 
 # cleaning, merging it all into one dataframe. Calculating OPS and PYTHAG
+# every stat frame is indexed by team once and joined in a single aligned concat
 def clean_and_merge(stats_raw, transforms_dict):
-    dfs = []
+    frames = []
+    column_frame = {}  # column -> index of the frame that holds it
     for stat, df in stats_raw.items():
-        if df is not None and stat in transforms_dict:
-            df["Team"] = df["Team"].str.strip()
-            df_clean = transforms_dict[stat](df)
-            dfs.append(df_clean)
-
-    merged = dfs[0]
-    for df in dfs[1:]:
-        merged = pd.merge(merged, df, on="Team", how="inner")
-
-    merged = merged.loc[:, ~merged.columns.duplicated()].sort_values('Team').reset_index(drop=True)
-    merged["OPS"] = merged["SLG"] + merged["OBP"]
-    merged["PYTHAG"] = round(
-        (merged["RS"] ** 1.83) / ((merged["RS"] ** 1.83) + (merged["RA"] ** 1.83)), 3
+        if df is None or stat not in transforms_dict:
+            continue
+
+        df_clean = transforms_dict[stat](df.assign(Team=df["Team"].str.strip()))
+        df_clean = df_clean.set_index("Team")
+        # the aligned concat needs one row per team; the old chained merge
+        # multiplied duplicate rows instead, so the first one is kept and
+        # the others are reported
+        duplicated = df_clean.index.duplicated(keep="first")
+        if duplicated.any():
+            print(f"[{stat}] dropped duplicate rows for {sorted(set(df_clean.index[duplicated]))}")
+            df_clean = df_clean[~duplicated]
+
+        # a column two stats share gets pd.merge's _x/_y suffixes, as the
+        # chained merge gave it
+        for col in [col for col in df_clean.columns if col in column_frame]:
+            i = column_frame.pop(col)
+            frames[i] = frames[i].rename(columns={col: f"{col}_x"})
+            column_frame[f"{col}_x"] = i
+            df_clean = df_clean.rename(columns={col: f"{col}_y"})
+        column_frame.update({col: len(frames) for col in df_clean.columns})
+        frames.append(df_clean)
+
+    merged = pd.concat(frames, axis=1, join="inner")
+    merged = merged.loc[:, ~merged.columns.duplicated()]
+    merged = merged.sort_index().rename_axis("Team").reset_index()
+
+    rs = merged["RS"] ** 1.83
+    ra = merged["RA"] ** 1.83
+    return merged.assign(
+        OPS=merged["SLG"] + merged["OBP"],
+        PYTHAG=(rs / (rs + ra)).round(3),
     )
-    return merged
 
 ####################### Run It #######################
 
 # Stat pull for the stats in STAT_TRANSFORMS
-stat_list = list(STAT_TRANSFORMS.keys())
-raw_stats = threaded_stat_fetch(stat_list, max_workers=10)
-baseball_stats = clean_and_merge(raw_stats, STAT_TRANSFORMS)
\ No newline at end of file
+def get_baseball_stats(links=None, max_workers=10, division='D1'):
+    links = links or get_stat_links(division)
+    stat_list = list(STAT_TRANSFORMS.keys())
+    with run_metrics.span('fetch'):
+        raw_stats = threaded_stat_fetch(stat_list, max_workers=max_workers, links=links)
+    with run_metrics.span('merge'):
+        return clean_and_merge(raw_stats, STAT_TRANSFORMS)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape the D1 RPI, ELO and team stats.")
+    parser.add_argument('--season', type=int, default=CURRENT_SEASON,
+                        help=f'Warren Nolan season (the ncaa.com stats and RPI are only scraped for {CURRENT_SEASON})')
+    args = parser.parse_args(argv)
+    season = args.season
+    current = season == CURRENT_SEASON
+    if not current:
+        print(f"ncaa.com only serves the {CURRENT_SEASON} season; skipping its RPI and stats for {season}")
+
+    with run_metrics.stage('rpi_projected'):
+        projected_rpi = get_projected_rpi(season)
+    with run_metrics.stage('rpi_live'):
+        live_rpi = get_live_rpi(season)
+    with run_metrics.stage('elo'):
+        elo_data = get_elo_data(season)
+    if current:
+        with run_metrics.stage('rpi_ncaa'):
+            rpi = get_ncaa_rpi('D1')
+        with run_metrics.stage('stats'):
+            baseball_stats = get_baseball_stats(division='D1')
+
+    ####################### Store #######################
+
+    if current:
+        data_store.write_partition(baseball_stats, 'stats', 'D1', season)
+        if not rpi.empty:
+            data_store.write_partition(rpi, 'rpi_ncaa', 'D1', season)
+    if elo_data is not None:
+        data_store.write_partition(elo_data, 'elo', 'D1', season)
+    data_store.write_partition(projected_rpi, 'rpi_projected', 'D1', season)
+    data_store.write_partition(live_rpi, 'rpi_live', 'D1', season)
+    run_metrics.write()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
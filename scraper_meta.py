@@ -0,0 +1,213 @@
+"""
+SQLite store for per-team scraper metadata (page format, static/dynamic).
+
+Replaces SidearmScraper's format_map.pkl / static_teams.pkl. One row per
+(team, url) carries the schema version, probe results, last probe / success
+times and a failure count. An entry is trusted while it is younger than its
+TTL, was written by the current SCHEMA_VERSION and has fewer than
+MAX_FAILURES consecutive failures; anything else is re-probed. A probe that
+finds no Sidearm layout in the page stores the definite negative DYNAMIC
+(the page needs a browser), which is trusted for the shorter DYNAMIC_TTL. Every thread
+gets its own connection and writes are single-row transactions in WAL mode,
+so worker threads can record results concurrently.
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+SCHEMA_VERSION = 2  # 2: pages without a known layout are stored as DYNAMIC
+
+DAY = 24 * 60 * 60
+DEFAULT_TTL = 14 * DAY
+DYNAMIC_TTL = 3 * DAY
+# Consecutive failed scrapes before a team goes back to probing (one
+# timeout or blocked request should not throw away a good entry)
+MAX_FAILURES = 3
+
+# Stored format for a page that renders its schedule in the browser
+DYNAMIC = 'dynamic'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS teams (
+    team           TEXT NOT NULL,
+    url            TEXT NOT NULL,
+    schema_version INTEGER NOT NULL,
+    format         TEXT,
+    static         INTEGER NOT NULL DEFAULT 0,
+    games          INTEGER,
+    last_probe     REAL,
+    last_success   REAL,
+    failures       INTEGER NOT NULL DEFAULT 0,
+    last_error     TEXT,
+    PRIMARY KEY (team, url)
+)
+"""
+
+
+class ScraperMeta:
+    """
+    Per-team metadata for one scraper cache directory.
+
+    Parameters:
+    -----------
+    path : str
+        SQLite file
+    ttl : float
+        Seconds before a probe result has to be refreshed
+    dynamic_ttl : float
+        Seconds before a DYNAMIC probe result has to be refreshed
+    """
+
+    def __init__(self, path, ttl=DEFAULT_TTL, dynamic_ttl=DYNAMIC_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.dynamic_ttl = dynamic_ttl
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with self._conn() as conn:
+            conn.execute(_SCHEMA)
+
+    def _conn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _write(self, sql, params):
+        with self._write_lock:
+            conn = self._conn()
+            with conn:
+                conn.execute(sql, params)
+
+    def _upsert(self, team, url, **fields):
+        fields['schema_version'] = SCHEMA_VERSION
+        columns = ', '.join(fields)
+        placeholders = ', '.join('?' for _ in fields)
+        updates = ', '.join(f'{col} = excluded.{col}' for col in fields)
+        self._write(
+            f"INSERT INTO teams (team, url, {columns}) VALUES (?, ?, {placeholders}) "
+            f"ON CONFLICT(team, url) DO UPDATE SET {updates}",
+            (team, url, *fields.values()),
+        )
+
+    # Reads
+
+    def entries(self):
+        """{(team, url): row dict} for every stored entry."""
+        rows = self._conn().execute('SELECT * FROM teams').fetchall()
+        return {(row['team'], row['url']): dict(row) for row in rows}
+
+    def get(self, team, url):
+        row = self._conn().execute(
+            'SELECT * FROM teams WHERE team = ? AND url = ?', (team, url)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def is_trusted(self, entry, now=None):
+        now = now or time.time()
+        if (entry is None
+                or entry['schema_version'] != SCHEMA_VERSION
+                or entry['last_probe'] is None
+                or entry['format'] is None
+                or entry['failures'] >= MAX_FAILURES):
+            return False
+        ttl = self.dynamic_ttl if entry['format'] == DYNAMIC else self.ttl
+        return now - entry['last_probe'] < ttl
+
+    def stale_teams(self, url_dict):
+        """Teams with no entry, an old or outdated entry, or MAX_FAILURES failures in a row."""
+        entries = self.entries()
+        now = time.time()
+        return [team for team, url in url_dict.items()
+                if not self.is_trusted(entries.get((team, url)), now)]
+
+    def format_map(self, url_dict):
+        entries = self.entries()
+        return {team: entries[(team, url)]['format']
+                for team, url in url_dict.items() if (team, url) in entries}
+
+    def static_teams(self, url_dict):
+        entries = self.entries()
+        return {team for team, url in url_dict.items()
+                if (team, url) in entries and entries[(team, url)]['static']}
+
+    # Writes
+
+    def record_probe(self, team, url, fmt, static, games, error=None):
+        """
+        Store a probe result (a failed probe counts as a failure). A page
+        with no known layout ('unknown' or None) is stored as DYNAMIC.
+        """
+        if error is not None:
+            self.record_failure(team, url, error)
+            return
+        if fmt in (None, 'unknown'):
+            fmt = DYNAMIC
+        self._upsert(team, url, format=fmt, static=int(bool(static)), games=games,
+                     last_probe=time.time(), failures=0, last_error=None)
+
+    def record_success(self, team, url, fmt):
+        """A scrape worked with fmt: reset the failure count."""
+        now = time.time()
+        entry = self.get(team, url)
+        last_probe = entry['last_probe'] if entry and entry['format'] == fmt else now
+        self._upsert(team, url, format=fmt, last_success=now, last_probe=last_probe,
+                     failures=0, last_error=None)
+
+    def record_failure(self, team, url, error):
+        self._write(
+            "INSERT INTO teams (team, url, schema_version, failures, last_error) VALUES (?, ?, ?, 1, ?) "
+            "ON CONFLICT(team, url) DO UPDATE SET failures = failures + 1, last_error = excluded.last_error",
+            (team, url, SCHEMA_VERSION, str(error)[:500]),
+        )
+
+    def set_static(self, team, url, static=True):
+        self._upsert(team, url, static=int(bool(static)))
+
+    def invalidate(self, team):
+        """Forget everything about a team (all of its URLs)."""
+        self._write('DELETE FROM teams WHERE team = ?', (team,))
+
+    def migrate_pickles(self, cache_dir, url_dict):
+        """
+        Import a legacy format_map.pkl / static_teams.pkl once.
+
+        Imported entries keep the pickle's modification time as their probe
+        time, and the pickles are renamed to *.migrated.
+        """
+        format_file = os.path.join(cache_dir, 'format_map.pkl')
+        static_file = os.path.join(cache_dir, 'static_teams.pkl')
+        if not os.path.exists(format_file):
+            return 0
+
+        with open(format_file, 'rb') as f:
+            format_map = pickle.load(f)
+        static_teams = set()
+        if os.path.exists(static_file):
+            with open(static_file, 'rb') as f:
+                static_teams = pickle.load(f)
+
+        probed_at = os.path.getmtime(format_file)
+        migrated = 0
+        for team, fmt in format_map.items():
+            url = url_dict.get(team)
+            if url is None:
+                continue
+            self._upsert(team, url, format=DYNAMIC if fmt in (None, 'unknown') else fmt,
+                         static=int(team in static_teams),
+                         last_probe=probed_at, failures=0)
+            migrated += 1
+
+        for path in (format_file, static_file):
+            if os.path.exists(path):
+                os.replace(path, path + '.migrated')
+        print(f"Migrated {migrated} teams from pickle caches to {self.path}")
+        return migrated
@@ -0,0 +1,224 @@
+"""
+Browserless schedule sources for Sidearm pages.
+
+Many Sidearm schedule pages that render their game cards with JavaScript also
+ship the schedule as data: schema.org SportsEvent items in a
+<script type="application/ld+json"> block, and/or a linked calendar (.ics)
+export. find_sources() detects those on the plain HTML and parse_sources()
+turns the first usable one into the same rows parse_soup_v1/v2/v3 return, so
+Selenium is only needed for pages that expose neither.
+"""
+
+import json
+import re
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+from urllib.parse import urljoin
+
+import pandas as pd
+
+import team_registry
+
+COLUMNS = ['Team', 'Date', 'Opponent', 'Location', 'Result',
+           'home_team', 'away_team', 'home_score', 'away_score']
+
+JSON_LD = re.compile(r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.S | re.I)
+ICS_LINK = re.compile(r'href=["\']([^"\']*(?:\.ics|calendar\.ashx)[^"\']*)["\']', re.I)
+MATCHUP = re.compile(r'\s(vs\.?|at)\s+(.+?)\s*(?:\((?:[WLT]\b|cancel|postpon)|$)', re.I)
+RESULT = re.compile(r'\b([WLT])\s*,?\s*(\d+)\s*-\s*(\d+)')
+CANCELED = re.compile(r'cancel|postpone|\bppd\b', re.I)
+
+# UTC start times are shifted to US local time so night games keep their date
+LOCAL_TZ = ZoneInfo('America/Chicago')
+
+
+def _format_date(dt):
+    """Same text layout as the v1 cards: 'Feb 14 (Fri)'."""
+    return f"{dt:%b} {dt.day} ({dt:%a})"
+
+
+def _similarity(a, b):
+    ta = team_registry.trigrams(team_registry.normalize(a))
+    tb = team_registry.trigrams(team_registry.normalize(b))
+    return len(ta & tb) / max(len(ta | tb), 1)
+
+
+def _game_row(team_name, date, opponent, is_home, result_text):
+    """One schedule row in the parse_soup_* layout."""
+    game = {'Team': team_name, 'Date': date, 'Opponent': opponent,
+            'Location': 'Home' if is_home else 'Away',
+            'Result': None, 'home_score': None, 'away_score': None}
+    if is_home:
+        game['home_team'], game['away_team'] = team_name, opponent
+    else:
+        game['home_team'], game['away_team'] = opponent, team_name
+
+    match = RESULT.search(result_text or '')
+    if match:
+        win_loss, score1, score2 = match.group(1), int(match.group(2)), int(match.group(3))
+        if win_loss == 'W':
+            team_score, opponent_score = max(score1, score2), min(score1, score2)
+        elif win_loss == 'L':
+            team_score, opponent_score = min(score1, score2), max(score1, score2)
+        else:
+            team_score, opponent_score = score1, score2
+        game['Result'] = f"{win_loss}{team_score}-{opponent_score}"
+        if is_home:
+            game['home_score'], game['away_score'] = team_score, opponent_score
+        else:
+            game['home_score'], game['away_score'] = opponent_score, team_score
+    elif result_text and CANCELED.search(result_text):
+        game['Result'] = 'Canceled'
+    return game
+
+
+def find_sources(html, url):
+    """
+    Data sources exposed by a schedule page, best first.
+
+    Returns:
+    --------
+    list of (kind, payload): ('jsonld', [event dicts]) and/or ('ics', url)
+    """
+    sources = []
+
+    events = []
+    for block in JSON_LD.findall(html):
+        try:
+            data = json.loads(block.strip())
+        except ValueError:
+            continue
+        stack = [data]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, list):
+                stack.extend(item)
+            elif isinstance(item, dict):
+                if 'SportsEvent' in str(item.get('@type', '')):
+                    events.append(item)
+                stack.extend(v for k, v in item.items() if k in ('@graph', 'itemListElement', 'item'))
+    if events:
+        sources.append(('jsonld', events))
+
+    match = ICS_LINK.search(html)
+    if match:
+        sources.append(('ics', urljoin(url, match.group(1).replace('&amp;', '&'))))
+
+    return sources
+
+
+def _event_team_name(team):
+    if isinstance(team, dict):
+        return team.get('name')
+    return team if isinstance(team, str) else None
+
+
+def parse_jsonld_events(events, team_name):
+    """Schedule rows from schema.org SportsEvent items."""
+    rows = []
+    for event in events:
+        start = pd.to_datetime(event.get('startDate'), errors='coerce')
+        if pd.isna(start):
+            continue
+        if start.tzinfo is not None:
+            start = start.tz_convert(LOCAL_TZ)
+
+        home = _event_team_name(event.get('homeTeam'))
+        away = _event_team_name(event.get('awayTeam'))
+        if home and away:
+            is_home = _similarity(home, team_name) >= _similarity(away, team_name)
+            opponent = away if is_home else home
+        else:
+            matchup = MATCHUP.search(' ' + str(event.get('name', '')))
+            if not matchup:
+                continue
+            is_home = matchup.group(1).lower().startswith('vs')
+            opponent = matchup.group(2)
+
+        result_text = ' '.join(str(event.get(k, '')) for k in ('name', 'description', 'eventStatus'))
+        rows.append(_game_row(team_name, _format_date(start), opponent.strip(), is_home, result_text))
+    return rows
+
+
+def _ics_events(text):
+    """VEVENT property dicts from an iCalendar body (lines unfolded)."""
+    text = re.sub(r'\r?\n[ \t]', '', text)
+    events, current = [], None
+    for line in text.splitlines():
+        if line == 'BEGIN:VEVENT':
+            current = {}
+        elif line == 'END:VEVENT':
+            if current is not None:
+                events.append(current)
+            current = None
+        elif current is not None and ':' in line:
+            key, value = line.split(':', 1)
+            current[key.split(';', 1)[0].upper()] = value.replace('\\,', ',').replace('\\n', ' ')
+    return events
+
+
+def parse_ics(text, team_name):
+    """Schedule rows from a Sidearm calendar export."""
+    rows = []
+    for event in _ics_events(text):
+        raw_start = event.get('DTSTART', '')
+        try:
+            if raw_start.endswith('Z'):
+                start = (datetime.strptime(raw_start, '%Y%m%dT%H%M%SZ')
+                         .replace(tzinfo=timezone.utc).astimezone(LOCAL_TZ))
+            else:
+                start = datetime.strptime(raw_start[:8], '%Y%m%d')
+        except ValueError:
+            continue
+
+        summary = event.get('SUMMARY', '')
+        matchup = MATCHUP.search(' ' + summary)
+        if not matchup:
+            continue
+        is_home = matchup.group(1).lower().startswith('vs')
+        result_text = f"{summary} {event.get('DESCRIPTION', '')}"
+        rows.append(_game_row(team_name, _format_date(start), matchup.group(2).strip(), is_home, result_text))
+    return rows
+
+
+def parse_sources(sources, team_name, fetch, standardize=None, min_games=3):
+    """
+    Rows from the first source that yields games.
+
+    Parameters:
+    -----------
+    sources : list
+        Output of find_sources()
+    team_name : str
+        Team the schedule belongs to
+    fetch : callable
+        fetch(url) -> response with .text and .raise_for_status() (for .ics links)
+    standardize : callable, optional
+        Opponent name clean-up applied to Opponent / home_team / away_team
+    min_games : int
+        Sources with fewer games (e.g. a single "next game" item) are skipped
+
+    Returns:
+    --------
+    tuple: (DataFrame, kind); raises ValueError if no source has games
+    """
+    for kind, payload in sources:
+        try:
+            if kind == 'jsonld':
+                rows = parse_jsonld_events(payload, team_name)
+            else:
+                response = fetch(payload)
+                response.raise_for_status()
+                rows = parse_ics(response.text, team_name)
+        except Exception:
+            continue
+
+        if len(rows) >= min_games:
+            df = pd.DataFrame(rows)[COLUMNS]
+            if standardize is not None:
+                df['Opponent'] = df['Opponent'].map(standardize)
+                for col in ['home_team', 'away_team']:
+                    df[col] = df[col].where(df[col] == team_name, df['Opponent'])
+            return df, kind
+
+    raise ValueError("No schedule data source found")
@@ -0,0 +1,1330 @@
+"""
+Canonical team registry shared by every scraper.
+
+All team naming lives here: TEAM_REPLACEMENTS (Warren Nolan -> NCAA names),
+TEAM_NAME_MAPPING (school sites -> accepted NCAA names) and the NCAA team ids
+in ncaa_team_ids.csv. They are loaded once into an alias -> canonical id hash
+index, so joins across Warren Nolan, ncaa.com and school sites can use integer
+keys. Names that miss the index fall back to a trigram similarity index that
+returns ranked candidates; confident fuzzy matches are cached on disk.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import defaultdict
+
+import pandas as pd
+
+TEAM_IDS_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ncaa_team_ids.csv')
+CACHE_PATH = os.path.join('.', 'PEAR', 'PEAR Baseball', 'team_registry_cache.json')
+
+# --- Team Name Replacements (Maps Warren Nolan names to be the same as teams on NCAA site) ---
+# Applied after 'State' -> 'St.'
+TEAM_REPLACEMENTS = {
+    'North Carolina St.': 'NC State',
+    'Southern Miss': 'Southern Miss.',
+    'USC': 'Southern California',
+    'Dallas Baptist': 'DBU',
+    'Charleston': 'Col. of Charleston',
+    'Georgia Southern': 'Ga. Southern',
+    'UNCG': 'UNC Greensboro',
+    'East Tennessee St.': 'ETSU',
+    'Lamar': 'Lamar University',
+    "Saint Mary's College": "Saint Mary's (CA)",
+    'Western Kentucky': 'Western Ky.',
+    'FAU': 'Fla. Atlantic',
+    'Connecticut': 'UConn',
+    'Southeast Missouri': 'Southeast Mo. St.',
+    'Alcorn St.': 'Alcorn',
+    'Appalachian St.': 'App State',
+    'Arkansas-Pine Bluff': 'Ark.-Pine Bluff',
+    'Army': 'Army West Point',
+    'Cal St. Bakersfield': 'CSU Bakersfield',
+    'Cal St. Northridge': 'CSUN',
+    'Central Arkansas': 'Central Ark.',
+    'Central Michigan': 'Central Mich.',
+    'Charleston Southern': 'Charleston So.',
+    'Eastern Illinois': 'Eastern Ill.',
+    'Eastern Kentucky': 'Eastern Ky.',
+    'Eastern Michigan': 'Eastern Mich.',
+    'Fairleigh Dickinson': 'FDU',
+    'Grambling St.': 'Grambling',
+    'Incarnate Word': 'UIW',
+    'Long Island': 'LIU',
+    'Maryland Eastern Shore': 'UMES',
+    'Middle Tennessee': 'Middle Tenn.',
+    'Mississippi Valley St.': 'Mississippi Val.',
+    "Mount Saint Mary's": "Mount St. Mary's",
+    'North Alabama': 'North Ala.',
+    'North Carolina A&T': 'N.C. A&T',
+    'Northern Colorado': 'Northern Colo.',
+    'Northern Kentucky': 'Northern Ky.',
+    'Prairie View A&M': 'Prairie View',
+    'Presbyterian College': 'Presbyterian',
+    'Saint Bonaventure': 'St. Bonaventure',
+    "Saint John's": "St. John's (NY)",
+    'Sam Houston St.': 'Sam Houston',
+    'Seattle University': 'Seattle U',
+    'South Carolina Upstate': 'USC Upstate',
+    'South Florida': 'South Fla.',
+    'Southeastern Louisiana': 'Southeastern La.',
+    'Southern': 'Southern U.',
+    'Southern Illinois': 'Southern Ill.',
+    'Stephen F. Austin': 'SFA',
+    'Tennessee-Martin': 'UT Martin',
+    'Texas A&M-Corpus Christi': 'A&M-Corpus Christi',
+    'UMass-Lowell': 'UMass Lowell',
+    'UTA': 'UT Arlington',
+    'Western Carolina': 'Western Caro.',
+    'Western Illinois': 'Western Ill.',
+    'Western Michigan': 'Western Mich.',
+    'Albany': 'UAlbany',
+    'Southern Indiana': 'Southern Ind.',
+    'Queens': 'Queens (NC)',
+    'Central Connecticut': 'Central Conn. St.',
+    'Saint Thomas': 'St. Thomas (MN)',
+    'Northern Illinois': 'NIU',
+    'UMass': 'Massachusetts',
+    'Loyola-Marymount': 'LMU (CA)'
+}
+
+# Mapping dictionary: scraped name variations -> standardized accepted names
+TEAM_NAME_MAPPING = {
+    # Adams State variations
+    'Adams State': 'Adams St.',
+    'Adams State University': 'Adams St.',
+    
+    # Adelphi
+    'Adelphi University': 'Adelphi',
+    
+    # Alabama A&M
+    'Alabama A&M': 'Alabama A&M',
+    'Alabama A&M University': 'Alabama A&M',
+    
+    # Alabama Huntsville
+    'Alabama Huntsville': 'UAH',
+    'The University of Alabama in Huntsville': 'UAH',
+    'University of Alabama in Huntsville': 'UAH',
+    'Alabama-Huntsville': 'UAH',
+    'Alabama - Huntsville': 'UAH',
+    
+    # Albany State
+    'Albany State': 'Albany St. (GA)',
+    'Albany State University': 'Albany St. (GA)',
+    
+    # American International
+    'American International': "American Int'l",
+    'American International College': "American Int'l",
+    
+    # Anderson
+    'Anderson': 'Anderson (SC)',
+    'Anderson University (SC)': 'Anderson (SC)',
+    'Anderson (S.C.)': 'Anderson (SC)',
+    
+    # Angelo State
+    'Angelo State': 'Angelo St.',
+    'Angelo State University': 'Angelo St.',
+    
+    # Arkansas Fort Smith
+    'Ark. - Fort Smith': 'Ark.-Fort Smith',
+    'Arkansas Fort Smith': 'Ark.-Fort Smith',
+    'Arkansas-Fort Smith': 'Ark.-Fort Smith',
+    'University of Arkansas Fort Smith': 'Ark.-Fort Smith',
+    'University of Arkansas-Fort Smith': 'Ark.-Fort Smith',
+    'Arkansas- Fort Smith': 'Ark.-Fort Smith',
+    'UA-Fort Smith': 'Ark.-Fort Smith',
+    
+    # Arkansas Monticello
+    'Arkansas Monticello': 'Ark.-Monticello',
+    'Arkansas-Monticello': 'Ark.-Monticello',
+    'Arkansas - Monticello': 'Ark.-Monticello',
+    'University of Arkansas at Monticello': 'Ark.-Monticello',
+    'Arkansas-Monticello (7)': 'Ark.-Monticello',
+    
+    # Arkansas Tech
+    'Arkansas Tech University': 'Arkansas Tech',
+    'Arkansas Tech (7)': 'Arkansas Tech',
+    
+    # Ashland
+    'Ashland (OH)': 'Ashland',
+    'Ashland University': 'Ashland',
+    
+    # Assumption
+    'Assumption (MA)': 'Assumption',
+    'Assumption University': 'Assumption',
+    
+    # Auburn Montgomery
+    'Auburn Montgomery': 'AUM',
+    'Auburn University Montgomery': 'AUM',
+    'Auburn University Montgomery (Ala.)': 'AUM',
+    
+    # Augusta
+    'Augusta University': 'Augusta',
+    
+    # Augustana
+    'Augustana': 'Augustana (SD)',
+    'Augustana (S.D.)': 'Augustana (SD)',
+    'Augustana University': 'Augustana (SD)',
+    'Augustana University (SD)': 'Augustana (SD)',
+    
+    # Azusa Pacific
+    'Azusa Pacific Cougars': 'Azusa Pacific',
+    'Azusa Pacific University': 'Azusa Pacific',
+    'APU': 'Azusa Pacific',
+    
+    # Barry
+    'Barry University': 'Barry',
+    
+    # Barton
+    'Barton College': 'Barton',
+    
+    # Belmont Abbey
+    'Belmont Abbey College': 'Belmont Abbey',
+    
+    # Bemidji State
+    'Bemidji State': 'Bemidji St.',
+    'Bemidji State University': 'Bemidji St.',
+    
+    # Benedict
+    'Benedict College': 'Benedict',
+    
+    # Bentley
+    'Bentley University': 'Bentley',
+    
+    # Biola
+    'Biola Eagles': 'Biola',
+    'Biola University (Calif.)': 'Biola',
+    
+    # Bloomfield
+    'Bloomfield College': 'Bloomfield',
+    'Bloomfield (NJ)': 'Bloomfield',
+    
+    # Bloomsburg
+    'Bloomsburg University': 'Bloomsburg',
+    
+    # Bluefield State
+    'Bluefield State': 'Bluefield St.',
+    'Bluefield State University': 'Bluefield St.',
+
+    # Bridgeport
+    'University of Bridgeport': 'Bridgeport',
+    
+    # Cal State variations
+    'CSU San Bernardino': 'CSUSB',
+    'Cal State San Bernardino': 'CSUSB',
+    'Cal State University San Bernardino': 'CSUSB',
+    'California State University, San Bernardino': 'CSUSB',
+    
+    'CSU San Marcos': 'Cal St. San Marcos',
+    'Cal State San Marcos': 'Cal St. San Marcos',
+    
+    'Cal State Dominguez Hills': 'Cal St. Dom. Hills',
+    'California State University, Dominguez Hills': 'Cal St. Dom. Hills',
+    'Seed Cal State Dominguez Hills': 'Cal St. Dom. Hills',
+    
+    'Cal State East Bay': 'Cal St. East Bay',
+    
+    'Cal State Los Angeles': 'Cal State LA',
+    'California State University, Los Angeles': 'Cal State LA',
+    'CSU Los Angeles': 'Cal State LA',
+    
+    'Cal State Monterey Bay': 'Cal St. Monterey Bay',
+    'California State University Monterey Bay': 'Cal St. Monterey Bay',
+    'Seed Cal State Monterey Bay': 'Cal St. Monterey Bay',
+    'CSU Monterey Bay': 'Cal St. Monterey Bay',
+
+    'Seed Cal State San Marcos': 'Cal St. San Marcos',
+    
+    'Cal State Stanislaus': 'Stanislaus St.',
+    'Stanislaus State': 'Stanislaus St.',
+    
+    # Caldwell
+    'Caldwell University': 'Caldwell',
+    
+    # California PA
+    'California (Pa.)': 'California (PA)',
+    'California University of Pennsylvania': 'California (PA)',
+    
+    # Cameron
+    'Cameron University': 'Cameron',
+    
+    # Carson-Newman
+    'Carson-Newman': 'Carson-Newman',
+    'Carson-Newman University': 'Carson-Newman',
+    
+    # Catawba
+    'Catawba College': 'Catawba',
+    
+    # Cedarville
+    'Cedarville University': 'Cedarville',
+    
+    # Central Missouri
+    'Central Missouri': 'Central Mo.',
+    'University of Central Missouri': 'Central Mo.',
+    
+    # Central Oklahoma
+    'Central Oklahoma': 'Central Okla.',
+    'University of Central Oklahoma': 'Central Okla.',
+    
+    # Central Washington
+    'Central Washington': 'Central Wash.',
+    'Central Washington University': 'Central Wash.',
+    
+    # Chaminade
+    'Chaminade Silverswords': 'Chaminade',
+    'Chaminade University': 'Chaminade',
+    'Chaminade (Hawaii)': 'Chaminade',
+    
+    # Charleston WV
+    'Concord University': 'Concord',
+    'University of Charleston': 'Charleston (WV)',
+    'University of Charleston (WV)': 'Charleston (WV)',
+    'Charleston': 'Charleston (WV)',
+    'Charleston (W.V)': 'Charleston (WV)',
+    'RV Charleston (W.V)': 'Charleston (WV)',
+    
+    # Chestnut Hill
+    'Chestnut Hill College': 'Chestnut Hill',
+    
+    # Chico State
+    'Chico State': 'Chico St.',
+    
+    # Chowan
+    'Chowan University': 'Chowan',
+    
+    # Christian Brothers
+    'Christian Brothers University': 'Christian Brothers',
+    
+    # Claflin
+    'Claflin University': 'Claflin',
+    
+    # Clarion
+    'Clarion University': 'Clarion',
+    
+    # Clark Atlanta
+    'Clark Atlanta University': 'Clark Atlanta',
+    'Clark-Atlanta University': 'Clark Atlanta',
+    
+    # Coker
+    'Coker': 'Coker',
+    'Coker University': 'Coker',
+    
+    # Colorado Christian
+    'Colorado Christian': 'Colo. Christian',
+    'Colorado Christian University': 'Colo. Christian',
+    
+    # Colorado Mesa
+    'Colorado Mesa University': 'Colorado Mesa',
+    
+    # Colorado School of Mines
+    'Colorado School of Mines': 'Colo. Sch. of Mines',
+    'Mines': 'Colo. Sch. of Mines',
+    
+    # Colorado State Pueblo
+    'Colorado State Pueblo': 'CSU Pueblo',
+    'Colorado State University Pueblo': 'CSU Pueblo',
+    
+    # Columbus State
+    'Columbus State': 'Columbus St.',
+    'Columbus State University': 'Columbus St.',
+    
+    # Concordia
+    'Concordia': 'CUI',
+    'Concordia Golden Eagles': 'CUI',
+    'Concordia University Irvine': 'CUI',
+    
+    # Concordia St. Paul
+    'Concordia - St. Paul': 'Concordia-St. Paul',
+    'Concordia University, St. Paul': 'Concordia-St. Paul',
+    'Concordia, St. Paul': 'Concordia-St. Paul',
+    
+    # D'Youville
+    "D'Youville University": "D'Youville",
+    
+    # Davenport
+    'Davenport University': 'Davenport',
+    
+    # Davis & Elkins
+    'Davis & Elkins College': 'Davis & Elkins',
+    
+    # Delta State
+    'Delta State': 'Delta St.',
+    'Delta State University': 'Delta St.',
+    
+    # Dominican
+    'Dominican (NY)': 'Dominican (NY)',
+    'Dominican (NY) University': 'Dominican (NY)',
+    'Dominican University': 'Dominican (NY)',
+    'Dominican University of New York': 'Dominican (NY)',
+    'Dominican': 'Dominican (NY)',
+    'Dominican (N.Y.)': 'Dominican (NY)',
+    'NDominican (N.Y.)': 'Dominican (NY)',
+
+    # Drury
+    'Drury University': 'Drury',
+    
+    # East Central
+    'East Central University': 'East Central',
+    'East Central (7)': 'East Central',
+    
+    # East Stroudsburg
+    'East Stroudsburg University': 'East Stroudsburg',
+    
+    # Eastern New Mexico
+    'Eastern New Mexico': 'Eastern N.M.',
+    'Eastern New Mexico University': 'Eastern N.M.',
+    
+    # Eckerd
+    'Eckerd College': 'Eckerd',
+    
+    # Edward Waters
+    'Edward Waters University': 'Edward Waters',
+    
+    # Embry-Riddle
+    'Embry-Riddle': 'Embry-Riddle (FL)',
+    'Embry-Riddle (Fla.)': 'Embry-Riddle (FL)',
+    'Embry-Riddle University (Fla.)': 'Embry-Riddle (FL)',
+    
+    # Emmanuel
+    'Emmanuel': 'Emmanuel (GA)',
+    'Emmanuel (Ga.)': 'Emmanuel (GA)',
+    'Emmanuel University (Ga.)': 'Emmanuel (GA)',
+    'Emmanuel University': 'Emmanuel (GA)',
+
+    # Emory & Henry
+    'Emory & Henry College': 'Emory & Henry',
+    'Emory & Henry University': 'Emory & Henry',
+
+    # Emporia State
+    'Emporia State': 'Emporia St.',
+    'Emporia State (Kan.)': 'Emporia St.',
+    'Emporia State University': 'Emporia St.',
+    
+    # Erskine
+    'Erskine College': 'Erskine',
+    
+    # Fairmont State
+    'Fairmont State': 'Fairmont St.',
+    'Fairmont State University': 'Fairmont St.',
+    
+    # Felician
+    'Felician University': 'Felician',
+    'NFelician': 'Felician',
+    
+    # Findlay
+    'University of Findlay': 'Findlay',
+    
+    # Florida Southern
+    'Florida Southern': 'Fla. Southern',
+    'Florida Southern College': 'Fla. Southern',
+    
+    # Florida Tech
+    'Florida Tech': 'Florida Tech',
+    
+    # Flagler
+    'Flagler College': 'Flagler',
+    
+    # Fort Hays State
+    'Fort Hays State': 'Fort Hays St.',
+    'Fort Hays State (Kan.)': 'Fort Hays St.',
+    'Fort Hays State University': 'Fort Hays St.',
+    
+    # Francis Marion
+    'Francis Marion University': 'Francis Marion',
+    
+    # Franklin Pierce
+    'Franklin Pierce University': 'Franklin Pierce',
+    
+    # Fresno Pacific
+    'Fresno Pacific Sunbirds': 'Fresno Pacific',
+    'Fresno Pacific University (Calif.)': 'Fresno Pacific',
+    'FPU': 'Fresno Pacific',
+    
+    # Frostburg State
+    'Frostburg State': 'Frostburg St.',
+    'Frostburg State (MD) University': 'Frostburg St.',
+    'Frostburg State University': 'Frostburg St.',
+    
+    # Gannon
+    'Gannon University': 'Gannon',
+    'Gannon (Pa.)': 'Gannon',
+    
+    # Georgia Southwestern
+    'Georgia Southwestern': 'Ga. Southwestern',
+    'Georgia Southwestern State': 'Ga. Southwestern',
+    'Georgia Southwestern State University': 'Ga. Southwestern',
+    
+    # GCSU
+    'GCSU': 'Georgia College',
+    'Georgia College and State University': 'Georgia College',
+    
+    # Georgian Court
+    'Georgian Court University': 'Georgian Court',
+    
+    # Glenville State
+    'Glenville State': 'Glenville St.',
+    'Glenville State University': 'Glenville St.',
+    
+    # Goldey-Beacom
+    'Goldey Beacom College': 'Goldey-Beacom',
+    'Goldey-Beacom College': 'Goldey-Beacom',
+    
+    # Grand Valley State
+    'Grand Valley State': 'Grand Valley St.',
+    'Grand Valley State University': 'Grand Valley St.',
+    'Grand Valley': 'Grand Valley St.',
+    
+    # Harding
+    'Harding (Ark.)': 'Harding',
+    'Harding University': 'Harding',
+    'Harding (7)': 'Harding',
+    
+    # Hawaii Hilo
+    "Hawai'i Hilo": 'Hawaii Hilo',
+    "Hawai'i": 'Hawaii Hilo',
+    'Hawaii at Hilo': 'Hawaii Hilo',
+    'University of Hawaii at Hilo': 'Hawaii Hilo',
+    'Hawaii-Hilo': 'Hawaii Hilo',
+    'UHH': 'Hawaii Hilo',
+    'University of Hawaii': 'Hawaii Hilo',
+    
+    # Hawaii Pacific
+    "Hawai'i Pacific": 'Hawaii Pacific',
+    'Hawaii Pacific University': 'Hawaii Pacific',
+    'HPU Sharks': 'Hawaii Pacific',
+    
+    # Henderson State
+    'Henderson State': 'Henderson St.',
+    'Henderson State University': 'Henderson St.',
+    'Henderson State (7)': 'Henderson St.',
+
+    # Hillsdale
+    'Hillsdale College': 'Hillsdale',
+    'Hillsdale': 'Hillsdale',
+
+    # Holy Family
+    'Holy Family University': 'Holy Family',
+    
+    # Illinois Springfield
+    'Illinois Springfield': 'Ill. Springfield',
+    'Illinois-Springfield': 'Ill. Springfield',
+    'University of Illinois Springfield': 'Ill. Springfield',
+    'Ill.-Springfield': 'Ill. Springfield',
+    
+    # Indiana PA
+    'Indiana (Pa.)': 'Indiana (PA)',
+    'Indiana University (PA)': 'Indiana (PA)',
+    'Indiana University (Pa.)': 'Indiana (PA)',
+    'Indiana University of Pennsylvania': 'Indiana (PA)',
+    'IUP': 'Indiana (PA)',
+    
+    # Indianapolis
+    'Indianapolis': 'UIndy',
+    'University of Indianapolis': 'UIndy',
+    
+    # Jefferson
+    'Jefferson University': 'Jefferson',
+    'Jefferson (Pa.)': 'Jefferson',
+    'SJefferson': 'Jefferson',
+    
+    # Kentucky State
+    'Kentucky State': 'Kentucky St.',
+    'Kentucky State University': 'Kentucky St.',
+    
+    # Kentucky Wesleyan
+    'Kentucky Wesleyan': 'Ky. Wesleyan',
+    'Kentucky Wesleyan College': 'Ky. Wesleyan',
+    
+    # King
+    'King': 'King (TN)',
+    'King (Tenn.)': 'King (TN)',
+    'King University (Tenn.)': 'King (TN)',
+    'King University': 'King (TN)',
+    
+    # Kutztown
+    'Kutztown University': 'Kutztown',
+    
+    # Lake Erie
+    'Lake Erie': 'Lake Erie',
+    'Lake Erie College': 'Lake Erie',
+    
+    # Lander
+    'Lander University': 'Lander',
+    
+    # Lane
+    'Lane College': 'Lane',
+    
+    # LeMoyne-Owen
+    'LeMoyne-Owen College': 'LeMoyne-Owen',
+    
+    # Lee
+    'Lee (Tenn.)': 'Lee',
+    'Lee University': 'Lee',
+    'Lee University (Tenn.)': 'Lee',
+    
+    # Lenoir-Rhyne
+    'Lenoir-Rhyne (NC) University': 'Lenoir-Rhyne',
+    'Lenoir-Rhyne University': 'Lenoir-Rhyne',
+    'Lenoir Rhyne University': 'Lenoir-Rhyne',
+    
+    # Lewis
+    'Lewis University': 'Lewis',
+    
+    # Limestone
+    'Limestone University': 'Limestone',
+    
+    # Lincoln MO
+    'Lincoln University of Missouri': 'Lincoln (MO)',
+    'Lincoln': 'Lincoln (MO)',
+    
+    # Lincoln PA
+    'Lincoln (Pa.)': 'Lincoln (PA)',
+    'Lincoln University': 'Lincoln (PA)',
+    'Lincoln University (Pa.)': 'Lincoln (PA)',
+    
+    # Lincoln Memorial
+    'Lincoln Memorial University': 'Lincoln Memorial',
+    
+    # Lock Haven
+    'Lock Haven University': 'Lock Haven',
+
+    # Lubbock Christian
+    'Lubbock Christian University (Texas)': 'Lubbock Christian',
+    'Lubbock Christian University': 'Lubbock Christian',
+    
+    # Lynn
+    'Lynn University': 'Lynn',
+    
+    # Malone
+    'Malone University': 'Malone',
+    'Malone (OH) University': 'Malone',
+    
+    # Mansfield
+    'Mansfield University': 'Mansfield',
+    
+    # Mars Hill
+    'Mars Hill': 'Mars Hill',
+    'Mars Hill University': 'Mars Hill',
+    
+    # Mary
+    'Mary (N.D.)': 'Mary',
+    'UMary': 'Mary',
+    'UMary (N.D.)': 'Mary',
+    'University of Mary': 'Mary',
+    
+    # Maryville
+    'Maryville': 'Maryville (MO)',
+    'Maryville University': 'Maryville (MO)',
+    'Maryville (Mo.)': 'Maryville (MO)',
+    
+    # McKendree
+    'McKendree University': 'McKendree',
+    
+    # Menlo
+    'Menlo College': 'Menlo',
+    'Menlo Oaks': 'Menlo',
+    
+    # Mercy
+    'Mercy University': 'Mercy',
+    
+    # Metropolitan State Denver
+    'Metropolitan State - Denver': 'MSU Denver',
+    'Metropolitan State University of Denver': 'MSU Denver',
+    'Metro State': 'MSU Denver',
+    
+    # Miles
+    'Miles College': 'Miles',
+    
+    # Millersville
+    'Millersville University': 'Millersville',
+    
+    # Minnesota Crookston
+    'Minnesota Crookston': 'Minn.-Crookston',
+    'Minnesota-Crookston': 'Minn.-Crookston',
+    'University of Minnesota Crookston': 'Minn.-Crookston',
+    
+    # Minnesota Duluth
+    'Minnesota Duluth': 'Minn. Duluth',
+    'University of Minnesota Duluth': 'Minn. Duluth',
+    
+    # Minnesota State
+    'Minnesota State': 'Minnesota St.',
+    'University of Minnesota State, Mankato': 'Minnesota St.',
+    'Minnesota State Mankato': 'Minnesota St.',
+    'Minnesota State - Mankato': 'Minnesota St.',
+    'Minnesota State University': 'Minnesota St.',
+    'Minnesota State, Mankato': 'Minnesota St.',
+    
+    # Minot State
+    'Minot State': 'Minot St.',
+    'Minot State University': 'Minot St.',
+    
+    # Mississippi College
+    'Mississippi College': 'Mississippi Col.',
+    
+    # Missouri S&T
+    'Missouri S&T': 'Missouri S&T',
+    
+    # Missouri Southern
+    'Missouri Southern': 'Mo. Southern St.',
+    'Missouri Southern State': 'Mo. Southern St.',
+    
+    # Missouri St. Louis
+    'Missouri - St. Louis': 'Mo.-St. Louis',
+    'Missouri-St. Louis': 'Mo.-St. Louis',
+    'University of Missouri - St. Louis': 'Mo.-St. Louis',
+    'UMSL': 'Mo.-St. Louis',
+    'Missouri - St Louis': 'Mo.-St. Louis',
+    'Missouri St. Louis': 'Mo.-St. Louis',
+    
+    # Missouri Western
+    'Missouri Western State University': 'Missouri Western',
+    'Missouri Western State': 'Missouri Western',
+    
+    # Molloy
+    'Molloy University': 'Molloy',
+    
+    # Montana State Billings
+    'Montana State Billings': 'Mont. St. Billings',
+    'Montana State University Billings': 'Mont. St. Billings',
+    'MSU Billings': 'Mont. St. Billings',
+    
+    # Montevallo
+    'University of Montevallo': 'Montevallo',
+    
+    # Morehouse
+    'Moorehouse College': 'Morehouse',
+    'Morehouse College': 'Morehouse',
+    
+    # Mount Olive
+    'University of Mount Olive': 'Mount Olive',
+    
+    # New Haven
+    'University of New Haven': 'New Haven',
+    
+    # New Mexico Highlands
+    'New Mexico Highlands': 'N.M. Highlands',
+    'New Mexico Highlands University': 'N.M. Highlands',
+    
+    # Newberry
+    'Newberry College': 'Newberry',
+    
+    # Newman
+    'Newman (Kan.)': 'Newman',
+    'Newman University': 'Newman',
+    
+    # North Georgia
+    'University of North Georgia': 'North Georgia',
+    
+    # North Greenville
+    'North Greenville University': 'North Greenville',
+    
+    # Northeastern State
+    'Northeastern State': 'Northeastern St.',
+    'Northeastern State (Okla.)': 'Northeastern St.',
+    'Northeastern State University': 'Northeastern St.',
+    
+    # Northern State
+    'Northern State': 'Northern St.',
+    'Northern State University': 'Northern St.',
+    
+    # Northwest Missouri State
+    'Northwest Missouri': 'Northwest Mo. St.',
+    'Northwest Missouri State': 'Northwest Mo. St.',
+    'Northwest Missouri State University': 'Northwest Mo. St.',
+    'NW Missouri State': 'Northwest Mo. St.',
+    
+    # Northwest Nazarene
+    'Northwest Nazarene University': 'Northwest Nazarene',
+    
+    # Northwestern Oklahoma
+    'Northwestern Oklahoma State': 'Northwestern Okla.',
+    'Northwestern Oklahoma State University': 'Northwestern Okla.',
+    'Northwestern Oklahoma': 'Northwestern Okla.',
+    'Northwestern Oklahoma State (7)': 'Northwestern Okla.',
+
+    # Northwood
+    'Northwood (MI)': 'Northwood',
+    'Northwood University': 'Northwood',
+    
+    # Nova Southeastern
+    'Nova Southeastern University': 'Nova Southeastern',
+    
+    # Ohio Dominican
+    'Ohio Dominican': 'Ohio Dominican',
+    'Ohio Dominican University': 'Ohio Dominican',
+    
+    # Oklahoma Baptist
+    'Oklahoma Baptist': 'Okla. Baptist',
+    'Oklahoma Baptist University': 'Okla. Baptist',
+    'Oklahoma Baptist (7)': 'Okla. Baptist',
+    
+    # Oklahoma Christian
+    'Oklahoma Christian': 'Okla. Christian',
+    'Oklahoma Christian University': 'Okla. Christian',
+    
+    # Ouachita Baptist
+    'Ouachita Baptist University': 'Ouachita Baptist',
+    'Ouachita Baprtist': 'Ouachita Baptist',
+    
+    # Pace
+    'Pace (NY) University': 'Pace',
+    'Pace University': 'Pace',
+    'NE10SW No. 2 Pace': 'Pace',
+    
+    # Palm Beach Atlantic
+    'Palm Beach Atlantic': 'Palm Beach Atl.',
+    'Palm Beach Atlantic University': 'Palm Beach Atl.',
+    
+    # Pitt-Johnstown
+    'Pitt-Johnstown': 'Pitt.-Johnstown',
+    'University of Pittsburgh at Johnstown': 'Pitt.-Johnstown',
+    
+    # Pittsburg State
+    'Pittsburg State': 'Pittsburg St.',
+    'Pittsburg State (Kan.)': 'Pittsburg St.',
+    'Pittsburg State University': 'Pittsburg St.',
+    '#16 Pittsburg State': 'Pittsburg St.',
+    
+    # Point Loma
+    'Point Loma Sea Lions': 'Point Loma',
+    'Point Loma Nazarene': 'Point Loma',
+    'PLNU': 'Point Loma',
+    
+    # Post
+    'Post University': 'Post',
+    
+    # Purdue Northwest
+    'Purdue Northwest': 'Purdue Northwest',
+    'Purdue University Northwest': 'Purdue Northwest',
+    
+    # Queens NY
+    'Queens College': 'Queens (NY)',
+    'Queens': 'Queens (NY)',
+    'Queens (N.Y.)': 'Queens (NY)',
+    
+    # Quincy
+    'Quincy University': 'Quincy',
+    
+    # Regis
+    'Regis': 'Regis (CO)',
+    'Regis University': 'Regis (CO)',
+
+    # Rockhurst
+    'Rockhurst University': 'Rockhurst',
+    
+    # Rogers State
+    'Rogers State': 'Rogers St.',
+    'Rogers State (Okla.)': 'Rogers St.',
+    'Rogers State University': 'Rogers St.',
+    'Rogers State University (Okla.)': 'Rogers St.',
+    
+    # Rollins
+    'Rollins College': 'Rollins',
+
+    # Saginaw Valley
+    'Saginaw Valley State University': 'Saginaw Valley',
+    'Saginaw Valley State': 'Saginaw Valley',
+    
+    # Saint Anselm
+    'Saint Anselm College': 'Saint Anselm',
+    
+    # Saint Leo
+    'Saint Leo University': 'Saint Leo',
+    
+    # Saint Martin's
+    "Saint Martin's University": "Saint Martin's",
+    
+    # Saint Michael's
+    "Saint Michael's College": "Saint Michael's",
+    "St. Michael's": "Saint Michael's",
+    
+    # Salem
+    'Salem': 'Salem (WV)',
+    'Salem University': 'Salem (WV)',
+    
+    # San Francisco State
+    'San Francisco State': 'San Fran. St.',
+    'San Francisco State University': 'San Fran. St.',
+    
+    # Savannah State
+    'Savannah State': 'Savannah St.',
+    'Savannah State University': 'Savannah St.',
+    
+    # Seton Hill
+    'Seton Hill (Pa.)': 'Seton Hill',
+    'Seton Hill University': 'Seton Hill',
+    
+    # Shepherd
+    'Shepherd (WV) University': 'Shepherd',
+    'Shepherd University': 'Shepherd',
+    
+    # Shippensburg
+    'Shippensburg University': 'Shippensburg',
+    
+    # Shorter
+    'Shorter University': 'Shorter',
+    'Shorter University (Ga.)': 'Shorter',
+    
+    # Sioux Falls
+    'Sioux Falls (S.D.)': 'Sioux Falls',
+    'Sioux Falls Cougars': 'Sioux Falls',
+    'University of Sioux Falls': 'Sioux Falls',
+    'University of Sioux Falls (S.D.)': 'Sioux Falls',
+    
+    # Slippery Rock
+    'Slippery Rock University': 'Slippery Rock',
+    
+    # Sonoma State
+    'Sonoma State': 'Sonoma St.',
+    'Sonoma State University': 'Sonoma St.',
+    
+    # South Carolina Aiken
+    'South Carolina Aiken': 'USC Aiken',
+    'USC Aiken': 'USC Aiken',
+    'University of South Carolina Aiken': 'USC Aiken',
+    'S.C. Aiken': 'USC Aiken',
+
+    # South Carolina Beaufort
+    'South Carolina Beaufort': 'USC Beaufort',
+    'USC Beaufort': 'USC Beaufort',
+    'University of South Carolina Beaufort': 'USC Beaufort',
+
+    # Southeastern Oklahoma
+    'Southeastern Oklahoma': 'Southeastern Okla.',
+    'Southeastern Oklahoma State': 'Southeastern Okla.',
+    'Southeastern Oklahoma State University': 'Southeastern Okla.',
+    'Southeastern Oklahoma State (7)': 'Southeastern Okla.',
+    
+    # Southern Arkansas
+    'Southern Arkansas': 'Southern Ark.',
+    'Southern Arkansas University': 'Southern Ark.',
+    'Southern Arkansas (7)': 'Southern Ark.',
+    'Southern Arkanas': 'Southern Ark.',
+    
+    # Southern Connecticut State
+    'Southern Connecticut': 'Southern Conn. St.',
+    'Southern Connecticut State': 'Southern Conn. St.',
+    'Southern Connecticut State University': 'Southern Conn. St.',
+    
+    # Southern New Hampshire
+    'Southern NH': 'Southern N.H.',
+    'Southern New Hampshire': 'Southern N.H.',
+    'Southern New Hampshire University': 'Southern N.H.',
+    'Southern N.H': 'Southern N.H.',
+    
+    # Southern Nazarene
+    'Southern Naz.': 'Southern Nazarene',
+    'Southern Nazarene University': 'Southern Nazarene',
+    'Southern Nazarene (7)': 'Southern Nazarene',
+    
+    # Southern Wesleyan
+    'Southern Wesleyan University (S.C.)': 'Southern Wesleyan',
+    'Southern Wesleyan University': 'Southern Wesleyan',
+    
+    # Southwest Baptist
+    'Southwest Baptist University': 'Southwest Baptist',
+    
+    # Southwest Minnesota State
+    'Southwest Minnesota State': 'Southwest Minn. St.',
+    'Southwest Minnesota State University': 'Southwest Minn. St.',
+    
+    # Southwestern Oklahoma
+    'Southwestern Oklahoma State': 'Southwestern Okla.',
+    'Southwestern Oklahoma State University': 'Southwestern Okla.',
+    'Southwestern Oklahoma': 'Southwestern Okla.',
+    'Southwestern Oklahoma State (7)': 'Southwestern Okla.',
+    'Southwestern OK': 'Southwestern Okla.',
+    
+    # Spring Hill
+    'Spring Hill College': 'Spring Hill',
+    'Spring Hill College (Ala.)': 'Spring Hill',
+    
+    # St. Cloud State
+    'St. Cloud State': 'St. Cloud St.',
+    'St. Cloud State University': 'St. Cloud St.',
+    
+    # St. Edward's
+    "St. Edward's University": "St. Edward's",
+    'St. Edwards': "St. Edward's",
+    
+    # St. Mary's
+    "St. Mary's": "St. Mary's (TX)",
+    "St. Mary's University (TX)": "St. Mary's (TX)",
+
+    # St. Thomas Aquinas
+    'Saint Thomas Aquinas': 'St. Thomas Aquinas',
+    'St. Thomas Aquinas College': 'St. Thomas Aquinas',
+    
+    # Staten Island
+    'College of Staten Island': 'Staten Island',
+
+    # Tampa
+    'University of Tampa': 'Tampa',
+
+    # Texas A&M International
+    'Texas A&M International': "Tex. A&M Int'l",
+    'Texas A&M International University': "Tex. A&M Int'l",
+    
+    # Texas A&M Kingsville
+    'Texas A&M - Kingsville': 'Tex. A&M-Kingsville',
+    'Texas A&M University - Kingsville': 'Tex. A&M-Kingsville',
+    'Texas A&M-Kingsville': 'Tex. A&M-Kingsville',
+    'Texas A&M Kingsville': 'Tex. A&M-Kingsville',
+
+    # Tiffin
+    'Tiffin (OH)': 'Tiffin',
+    'Tiffin University (Ohio)': 'Tiffin',
+    'Tiffin (Ohio)': 'Tiffin',
+    
+    # Trevecca Nazarene
+    'Trevecca Naz.': 'Trevecca Nazarene',
+    'Trevecca Nazarene University': 'Trevecca Nazarene',
+    
+    # Truman State
+    'Truman State': 'Truman St.',
+    'Truman State University': 'Truman St.',
+    'Truman': 'Truman St.',
+    
+    # Tusculum
+    'Tusculum': 'Tusculum',
+    'Tusculum University': 'Tusculum',
+    
+    # Tuskegee
+    'Tuskegee University': 'Tuskegee',
+    
+    # UNC Pembroke
+    'UNC Pembroke': 'UNC Pembroke',
+    'RV UNC Pembroke': 'UNC Pembroke',
+    
+    # UCCS
+    'University of Colorado at Colorado Springs': 'UCCS',
+    'University of Colorado Colorado Springs': 'UCCS',
+    'CU': 'UCCS',
+    'UC - Colorado Springs': 'UCCS',
+    'UC Colorado Springs': 'UCCS',
+    
+    # Union
+    'Union': 'Union (TN)',
+    'Union (Tenn.)': 'Union (TN)',
+    'Union University': 'Union (TN)',
+    'Union University (Tenn.)': 'Union (TN)',
+    
+    # Upper Iowa
+    'Upper Iowa University': 'Upper Iowa',
+
+    # UT Permian Basin
+    'Texas Permian Basin': 'UT Permian Basin',
+    'University of Texas of the Permian Basin': 'UT Permian Basin',
+    
+    # UT Tyler
+    'University of Texas at Tyler': 'UT Tyler',
+    'Texas-Tyler': 'UT Tyler',
+    
+    # UVA Wise
+    'UVA Wise': 'UVA Wise',
+    'UVA-Wise': 'UVA Wise',
+    'UVa.-Wise': 'UVA Wise',
+    'Virginia-Wise': 'UVA Wise',
+    
+    # Valdosta State
+    'Valdosta State': 'Valdosta St.',
+    'Valdosta State University': 'Valdosta St.',
+    
+    # Virginia State
+    'Virginia State': 'Virginia St.',
+    'Virginia State University': 'Virginia St.',
+    
+    # Walsh
+    'Walsh (OH)': 'Walsh',
+    'Walsh University': 'Walsh',
+    'Walsh (Ohio)': 'Walsh',
+    'Walsh University (Ohio)': 'Walsh',
+    
+    # Washburn
+    'Washburn (Kan.)': 'Washburn',
+    'Washburn University': 'Washburn',
+    
+    # Wayne State MI
+    'Wayne State': 'Wayne St. (MI)',
+    'Wayne State University': 'Wayne St. (MI)',
+    'Wayne State (Mich.)': 'Wayne St. (MI)',
+    
+    # Wayne State NE
+    'Wayne State College': 'Wayne St. (NE)',
+    'Wayne State (Neb.)': 'Wayne St. (NE)',
+    
+    # West Alabama
+    'West Alabama': 'West Ala.',
+    'University of West Alabama': 'West Ala.',
+    
+    # West Chester
+    'West Chester University of Pennsylvania': 'West Chester',
+    
+    # West Florida
+    'University of West Florida': 'West Florida',
+    
+    # West Liberty
+    'West Liberty University': 'West Liberty',
+    
+    # West Texas A&M
+    'West Texas A&M': 'West Tex. A&M',
+    'West Texas A&M University': 'West Tex. A&M',
+    
+    # West Virginia State
+    'West Virginia State': 'West Virginia St.',
+    'West Virginia State University': 'West Virginia St.',
+    
+    # West Virginia Wesleyan
+    'West Virginia Wesleyan': 'West Va. Wesleyan',
+    'West Virginia Wesleyan College': 'West Va. Wesleyan',
+    
+    # Western Oregon
+    'Western Oregon': 'Western Ore.',
+    'Western Oregon University': 'Western Ore.',
+    
+    # Westmont
+    'Westmont College (Calif.)': 'Westmont',
+    'Westmont Warriors': 'Westmont',
+    
+    # Wheeling (formerly Wheeling Jesuit)
+    'Wheeling University': 'Wheeling',
+    'Wheeling Jesuit University': 'Wheeling',
+
+    # Wilmington (DE)
+    'Wilmington': 'Wilmington (DE)',
+    'Wilmington (DE) University': 'Wilmington (DE)',
+    'Wilmington (Del.)': 'Wilmington (DE)',
+    'Wilmington University': 'Wilmington (DE)',
+    'Wilmington University (Del.)': 'Wilmington (DE)',
+    
+    # William Jewell
+    'William Jewell College (Mo.)': 'William Jewell',
+    'William Jewell': 'William Jewell',
+    
+    # Wingate
+    'Wingate University': 'Wingate',
+    
+    # Winona State
+    'Winona State': 'Winona St.',
+    'Winona State University': 'Winona St.',
+    
+    # Wisconsin-Parkside
+    'Wisconsin-Parkside': 'Wis.-Parkside',
+    'Parkside': 'Wis.-Parkside',
+    'UW Parkside': 'Wis.-Parkside',
+    
+    # Young Harris
+    'Young Harris College': 'Young Harris',
+    'Young Harris': 'Young Harris',
+    'RV Young Harris': 'Young Harris',
+}
+
+# Alias sources, checked before the global index when a source is given
+SOURCES = {
+    'warrennolan': TEAM_REPLACEMENTS,
+    'school_sites': TEAM_NAME_MAPPING,
+}
+
+
+def normalize(name):
+    """Index key for a team name: lowercase alphanumerics and '&', single-spaced."""
+    return re.sub(r'[^a-z0-9&]+', ' ', str(name).lower()).strip()
+
+
+def trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _synthetic_id(name):
+    """Stable negative id for canonical names that are not in ncaa_team_ids.csv."""
+    return -int(hashlib.sha1(normalize(name).encode('utf-8')).hexdigest()[:12], 16)
+
+
+class TeamRegistry:
+    """
+    Alias -> canonical id index with trigram fallback.
+
+    Parameters:
+    -----------
+    csv_path : str
+        Path to ncaa_team_ids.csv (team_id, team_name, ...)
+    cache_path : str
+        JSON file holding previously accepted fuzzy matches
+    """
+
+    def __init__(self, csv_path=TEAM_IDS_CSV, cache_path=CACHE_PATH):
+        self.cache_path = cache_path
+        self.names = {}                 # id -> canonical name
+        self.index = {}                 # normalized name -> id
+        self.source_index = {}          # source -> {normalized alias -> id}
+        self._trigrams = defaultdict(set)
+        self._key_ids = {}
+        self._lock = threading.Lock()
+
+        if os.path.exists(csv_path):
+            with open(csv_path, newline='') as f:
+                for row in csv.DictReader(f):
+                    self._add_canonical(row['team_name'], int(row['team_id']))
+
+        for source, aliases in SOURCES.items():
+            self.source_index[source] = {}
+            for alias, canonical in aliases.items():
+                team_id = self._add_canonical(canonical)
+                self.source_index[source][normalize(alias)] = team_id
+
+        # Source aliases also resolve globally unless they clash with a canonical name
+        for aliases in self.source_index.values():
+            for key, team_id in aliases.items():
+                self.index.setdefault(key, team_id)
+
+        for key, team_id in self.index.items():
+            self._key_ids[key] = team_id
+            for gram in trigrams(key):
+                self._trigrams[gram].add(key)
+
+        self.cache = {}
+        self._cache_dirty = False       # fuzzy matches not yet saved
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'r') as f:
+                    self.cache = {name: int(team_id) for name, team_id in json.load(f).items()}
+            except (OSError, ValueError):
+                self.cache = {}
+
+    def _add_canonical(self, name, team_id=None):
+        key = normalize(name)
+        if key in self.index:
+            return self.index[key]
+        team_id = team_id if team_id is not None else _synthetic_id(name)
+        self.index[key] = team_id
+        self.names.setdefault(team_id, name)
+        return team_id
+
+    def candidates(self, name, limit=5):
+        """
+        Ranked fuzzy matches for a name.
+
+        Returns:
+        --------
+        list of (canonical_name, team_id, score) with score in [0, 1]
+        """
+        query = trigrams(normalize(name))
+        shared = defaultdict(int)
+        for gram in query:
+            for key in self._trigrams.get(gram, ()):
+                shared[key] += 1
+
+        best = {}
+        for key, hits in shared.items():
+            score = hits / (len(query) + len(trigrams(key)) - hits)
+            team_id = self._key_ids[key]
+            if score > best.get(team_id, 0):
+                best[team_id] = score
+
+        ranked = sorted(best.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [(self.names[team_id], team_id, round(score, 3)) for team_id, score in ranked]
+
+    def resolve(self, name, source=None, fuzzy=True, min_score=0.75):
+        """
+        Canonical id for a name, or None if it cannot be resolved.
+
+        Lookup order: source aliases, global index, the 'State' -> 'St.'
+        spelling, the persistent cache, then the trigram index (matches at or
+        above min_score are accepted and cached).
+        """
+        if name is None or pd.isna(name):
+            return None
+
+        keys = [normalize(name)]
+        if 'State' in name:
+            keys.append(normalize(name.replace('State', 'St.')))
+
+        source_aliases = self.source_index.get(source, {})
+        for key in keys:
+            if key in source_aliases:
+                return source_aliases[key]
+        for key in keys:
+            if key in self.index:
+                return self.index[key]
+
+        if name in self.cache:
+            return self.cache[name]
+
+        if not fuzzy:
+            return None
+
+        matches = self.candidates(name, limit=1)
+        if matches and matches[0][2] >= min_score:
+            team_id = matches[0][1]
+            with self._lock:
+                self.cache[name] = team_id
+                self._cache_dirty = True
+            return team_id
+        return None
+
+    def canonical_name(self, name, source=None, fuzzy=False):
+        """Canonical name for a name, or the name itself if it is unknown."""
+        team_id = self.resolve(name, source=source, fuzzy=fuzzy)
+        return self.names[team_id] if team_id is not None else name
+
+    def save_cache(self):
+        with self._lock:
+            if not self._cache_dirty:
+                return
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp = self.cache_path + '.tmp'
+            with open(tmp, 'w') as f:
+                json.dump(self.cache, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.cache_path)
+            self._cache_dirty = False
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry():
+    """The process-wide registry, loaded on first use."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = TeamRegistry()
+    return _registry
+
+
+def canonical_names(series, source=None, fuzzy=False):
+    """
+    Vectorized canonical_name: each distinct value is resolved once.
+
+    Unknown names keep their spelling, with 'State' -> 'St.' applied for
+    Warren Nolan names (the convention the replacement table relies on).
+    """
+    registry = get_registry()
+
+    def lookup(name):
+        team_id = registry.resolve(name, source=source, fuzzy=fuzzy)
+        if team_id is not None:
+            return registry.names[team_id]
+        return name.replace('State', 'St.') if source == 'warrennolan' else name
+
+    uniques = series.dropna().unique()
+    mapped = series.map({name: lookup(name) for name in uniques})
+    if fuzzy:
+        registry.save_cache()
+    return mapped.where(series.notna(), series)
+
+
+def team_ids(series, source=None, fuzzy=False):
+    """Vectorized resolve: nullable integer ids (pd.Int64) for a column of names."""
+    registry = get_registry()
+    uniques = series.dropna().unique()
+    ids = series.map({name: registry.resolve(name, source=source, fuzzy=fuzzy) for name in uniques})
+    if fuzzy:
+        registry.save_cache()
+    return ids.astype('Int64')
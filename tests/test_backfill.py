@@ -0,0 +1,39 @@
+"""Season ranges and partition planning for backfills."""
+
+import backfill
+import data_store
+
+
+def stored(monkeypatch, *partitions):
+    monkeypatch.setattr(data_store, 'complete_scrape_dates',
+                        lambda dataset, division, season:
+                        ['2025-06-30'] if (dataset, division, season) in partitions else [])
+
+
+def labels(partitions):
+    return [backfill._label(source, season) for source, season in partitions]
+
+
+def test_parse_seasons_expands_ranges_and_drops_duplicates():
+    assert backfill.parse_seasons(['2019-2021', '2024']) == [2019, 2020, 2021, 2024]
+    assert backfill.parse_seasons(['2024', '2023-2024', 2022]) == [2022, 2023, 2024]
+
+
+def test_plan_skips_complete_partitions(monkeypatch):
+    stored(monkeypatch, ('elo', 'D1', 2023), ('schedules', 'D2', 2024))
+
+    todo, done = backfill.plan([2023, 2024], ['D1', 'D2'], ['elo', 'schedules'])
+
+    assert labels(done) == ['elo/D1/2023', 'schedules/D2/2024']
+    assert labels(todo) == ['schedules/D1/2023', 'schedules/D2/2023',
+                            'elo/D1/2024', 'schedules/D1/2024']
+
+
+def test_plan_filters_divisions_and_datasets_and_force_rescrapes(monkeypatch):
+    stored(monkeypatch, ('schedules', 'D1', 2024))
+
+    todo, done = backfill.plan([2024], ['D1'], ['schedules'])
+    assert (labels(todo), labels(done)) == ([], ['schedules/D1/2024'])
+
+    todo, done = backfill.plan([2024], ['D1'], ['schedules'], force=True)
+    assert (labels(todo), labels(done)) == (['schedules/D1/2024'], [])
@@ -0,0 +1,81 @@
+"""Partition completeness, PartitionWriter schemas and date columns."""
+
+import os
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+import data_store
+
+
+@pytest.fixture(autouse=True)
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_store, 'STORE_DIR', str(tmp_path))
+
+
+def test_latest_skips_partial_partitions():
+    data_store.write_partition(pd.DataFrame({'Team': ['Augusta']}), 'elo', 'D1', 2025, '2025-04-01')
+    writer = data_store.PartitionWriter('elo', 'D1', 2025, '2025-04-02')
+    writer.write_frame(pd.DataFrame({'Team': ['Tampa']}))
+    writer.close(complete=False)
+
+    assert data_store.scrape_dates('elo', 'D1', 2025) == ['2025-04-01', '2025-04-02']
+    assert data_store.read('elo', 'D1', 2025)['Team'].tolist() == ['Augusta']
+
+
+def test_writer_rejects_batches_with_other_columns():
+    writer = data_store.PartitionWriter('schedules', 'D1', 2025, '2025-04-01', batch_size=1)
+    writer.write_frame(pd.DataFrame({'Team': ['Augusta'], 'Result': ['W 5-3']}))
+    writer.write_frame(pd.DataFrame({'Result': ['L 2-7'], 'Team': ['Tampa']}))
+    with pytest.raises(ValueError, match='added'):
+        writer.write_frame(pd.DataFrame({'Team': ['Lander'], 'Result': ['W 1-0'], 'home_elo': [1500.0]}))
+    writer.close()
+
+    stored = data_store.read('schedules', 'D1', 2025)
+    assert stored.columns.tolist() == ['Team', 'Result']
+    assert stored['Team'].tolist() == ['Augusta', 'Tampa']
+
+
+def test_unparsed_dates_are_reported_not_guessed(capsys):
+    data_store.write_partition(pd.DataFrame({
+        'Team': ['Augusta', 'Tampa', 'Lander'],
+        'Date': [pd.Timestamp('2025-03-01'), 'Sat, Mar 1', None],
+    }), 'schedules', 'D2', 2025, '2025-04-01')
+
+    dates = data_store.read('schedules', 'D2', 2025)['Date']
+    assert dates.iloc[0] == pd.Timestamp('2025-03-01')
+    assert dates.iloc[1:].isna().all()
+    assert "1 values are not dates" in capsys.readouterr().out
+
+
+def test_team_ids_are_stored_as_integers():
+    path = data_store.write_partition(pd.DataFrame({
+        'Team': ['Augusta', 'Tampa'],
+        'home_team_id': pd.array([5, None], dtype='Int64'),
+        'away_team_id': [7.0, 8.0],
+        'runs': [3, 4],
+    }), 'schedules', 'D1', 2025, '2025-04-01')
+
+    schema = pq.read_schema(path)
+    assert {name: str(schema.field(name).type) for name in ['home_team_id', 'away_team_id', 'runs']} == \
+        {'home_team_id': 'int64', 'away_team_id': 'int64', 'runs': 'int64'}
+    assert data_store.read('schedules', 'D1', 2025)['away_team_id'].tolist() == [7, 8]
+
+
+def test_stopped_rerun_keeps_the_complete_partition(tmp_path):
+    data_store.write_partition(pd.DataFrame({'Team': ['Augusta', 'Tampa']}), 'elo', 'D1', 2025, '2025-04-01')
+
+    with pytest.raises(RuntimeError):
+        with data_store.PartitionWriter('elo', 'D1', 2025, '2025-04-01', batch_size=1) as writer:
+            writer.write_frame(pd.DataFrame({'Team': ['Lander']}))
+            raise RuntimeError('scrape crashed')
+
+    assert data_store.is_complete('elo', 'D1', 2025, '2025-04-01')
+    assert data_store.read('elo', 'D1', 2025)['Team'].tolist() == ['Augusta', 'Tampa']
+    partial = os.path.join(writer.out_dir, '.part-0.partial.parquet')
+    assert pq.read_table(partial).to_pandas()['Team'].tolist() == ['Lander']
+
+    with data_store.PartitionWriter('elo', 'D1', 2025, '2025-04-01') as writer:
+        writer.write_frame(pd.DataFrame({'Team': ['Lander']}))
+    assert data_store.read('elo', 'D1', 2025)['Team'].tolist() == ['Lander']
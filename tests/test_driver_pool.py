@@ -0,0 +1,83 @@
+"""Driver checkout, discard and page budgets."""
+
+import threading
+
+import pytest
+
+import driver_pool
+
+
+class FakeDriver:
+    current_url = 'about:blank'
+
+    def __init__(self):
+        self.quit_called = False
+
+    def get(self, url):
+        pass
+
+    def delete_all_cookies(self):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_discarding_a_broken_driver_wakes_a_waiter():
+    pool = driver_pool.DriverPool(size=1, factory=FakeDriver)
+    broken = pool.acquire()
+    acquired = []
+    waiter = threading.Thread(target=lambda: acquired.append(pool.acquire(timeout=5)))
+    waiter.start()
+
+    pool.release(broken, broken=True)
+    waiter.join(timeout=5)
+
+    assert broken.quit_called
+    assert len(acquired) == 1 and acquired[0] is not broken
+
+
+def test_acquire_times_out_when_every_driver_is_out():
+    pool = driver_pool.DriverPool(size=1, factory=FakeDriver)
+    pool.acquire()
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.05)
+
+
+def test_page_budget_counts_every_load_across_threads():
+    pool = driver_pool.DriverPool(size=1, max_pages=1000, factory=FakeDriver)
+    driver = pool.acquire()
+
+    def load():
+        for _ in range(200):
+            pool.get(driver, 'https://example.edu/schedule')
+
+    threads = [threading.Thread(target=load) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert pool._page_count(driver) == 800
+
+
+def test_failed_renew_releases_the_old_driver_once():
+    started = []
+
+    def factory():
+        if started:
+            raise RuntimeError('chrome failed to start')
+        started.append(FakeDriver())
+        return started[-1]
+
+    pool = driver_pool.DriverPool(size=1, max_pages=1, factory=factory)
+    driver = pool.acquire()
+    pool.get(driver, 'https://example.edu/schedule')
+
+    with pytest.raises(RuntimeError):
+        driver = pool.renew(driver)
+
+    assert driver.quit_called
+    assert pool._live == 0
+    started.clear()
+    assert pool.acquire(timeout=0.05) is not driver
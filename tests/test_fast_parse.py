@@ -0,0 +1,36 @@
+"""lxml fast paths."""
+
+import os
+
+import pytest
+
+import fast_parse
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'bench_fixtures')
+
+pytestmark = pytest.mark.skipif(not fast_parse.AVAILABLE, reason='lxml is not installed')
+
+
+def test_fragment_keeps_nested_tables():
+    html = ('<table class="normal-grid stats-table"><tbody>'
+            '<tr><td><table class="box"><tr><td>1</td></tr></table></td><td>Augusta</td></tr>'
+            '<tr><td>2</td><td>Tampa</td></tr>'
+            '</tbody></table><table><tr><td>Footer</td></tr></table>')
+
+    table = fast_parse._fragment(html, 'table', 'stats-table')
+
+    assert [fast_parse._text(row[-1]) for row in table.xpath('./tbody/tr')] == ['Augusta', 'Tampa']
+    assert 'Footer' not in table.text_content()
+
+
+@pytest.mark.parametrize('team', ['Arkansas', 'LSU'])
+def test_schedule_items_match_the_beautifulsoup_parser(team, monkeypatch):
+    import schedule_load
+
+    with open(os.path.join(FIXTURES, 'warrennolan_schedule', f'{team}.html'), encoding='utf-8') as f:
+        html = f.read()
+
+    fast_rows = fast_parse.schedule_items(html, team)
+    monkeypatch.setattr(fast_parse, 'AVAILABLE', False)
+
+    assert fast_rows and fast_rows == schedule_load.parse_schedule_page(team, html)
@@ -0,0 +1,47 @@
+"""Running the fetch engine from sync code and on throttling."""
+
+import asyncio
+
+import pytest
+
+import fetch_engine
+import http_cache
+
+
+def test_run_sync_inside_a_running_event_loop():
+    async def answer():
+        await asyncio.sleep(0)
+        return 42
+
+    async def failing():
+        raise ValueError('bad page')
+
+    async def notebook_cell():
+        # A notebook already runs a loop; _run_sync moves to its own thread
+        value = fetch_engine._run_sync(answer())
+        with pytest.raises(ValueError, match='bad page'):
+            fetch_engine._run_sync(failing())
+        return value
+
+    assert asyncio.run(notebook_cell()) == 42
+    assert fetch_engine._run_sync(answer()) == 42
+
+
+def test_fetch_all_returns_partial_results_when_throttled(monkeypatch, capsys):
+    async def fetch(self, url, headers=None):
+        if 'throttled' in url:
+            await asyncio.sleep(0.05)
+            raise fetch_engine.ThrottledError('slow.edu')
+        if 'broken' in url:
+            raise ConnectionError('refused')
+        return http_cache.CachedResponse(url, 200, {}, url.encode(), from_cache=True)
+
+    monkeypatch.setattr(fetch_engine.AsyncFetcher, 'fetch', fetch)
+    jobs = [('Augusta', 'https://augustajags.com'), ('Tampa', 'https://tampaspartans.com'),
+            ('Lander', 'https://broken.edu'), ('Flagler', 'https://throttled.edu'),
+            ('Later', 'https://throttled.edu/later')]
+
+    results = fetch_engine.fetch_all(jobs, lambda key, response: response.text, parse_in_thread=False)
+
+    assert results == {'Augusta': 'https://augustajags.com', 'Tampa': 'https://tampaspartans.com'}
+    assert '[Throttled] slow.edu is throttling requests' in capsys.readouterr().out
@@ -0,0 +1,51 @@
+"""Cache lifetimes for season URLs and parser-versioned parse results."""
+
+from datetime import datetime
+
+import http_cache
+
+
+def test_season_of_academic_year_uses_end_year():
+    assert http_cache.season_of('https://ubknights.com/sports/bsb/2024-25/schedule') == 2025
+    assert http_cache.season_of('https://example.edu/sports/bsb/1999-00/schedule') == 2000
+    assert http_cache.season_of('https://augustajags.com/sports/baseball/schedule/2025') == 2025
+    assert http_cache.season_of('https://www.ncaa.com/stats/baseball/d1') is None
+
+
+def test_live_presto_season_is_not_cached_as_past():
+    upcoming = datetime.today().year + 1
+    url = f'https://ubknights.com/sports/bsb/{upcoming - 1}-{upcoming % 100:02d}/schedule'
+    assert http_cache.ttl_for(url) < http_cache.PAST_SEASON_TTL
+
+
+def test_finished_season_gets_past_season_ttl():
+    finished = datetime.today().year - 1
+    assert http_cache.ttl_for(f'https://www.warrennolan.com/baseball/{finished}/elo') == http_cache.PAST_SEASON_TTL
+    url = f'https://ubknights.com/sports/bsb/{finished - 1}-{finished % 100:02d}/schedule'
+    assert http_cache.ttl_for(url) == http_cache.PAST_SEASON_TTL
+
+
+def test_changed_parser_version_reparses_unchanged_page(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache, 'CACHE_DIR', str(tmp_path))
+    response = http_cache.CachedResponse('https://example.edu/schedule', 200, {}, b'<html></html>',
+                                         from_cache=True)
+    calls = []
+
+    def parse(r):
+        calls.append(r.url)
+        return len(calls)
+
+    assert http_cache.cached_parse(response, 'schedule', parse, version='a') == 1
+    assert http_cache.cached_parse(response, 'schedule', parse, version='a') == 1
+    assert http_cache.cached_parse(response, 'schedule', parse, version='b') == 2
+
+
+def test_code_version_follows_the_parser_code():
+    def parse_v1(html):
+        return html.split()
+
+    def parse_v2(html):
+        return html.split(',')
+
+    assert http_cache.code_version(parse_v1) == http_cache.code_version(parse_v1)
+    assert http_cache.code_version(parse_v1) != http_cache.code_version(parse_v2)
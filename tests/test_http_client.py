@@ -0,0 +1,72 @@
+"""Per-host circuit breaker states."""
+
+import http_client
+
+HOST = 'augustajags.com'
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def breaker(monkeypatch, threshold=2, reset_after=30):
+    clock = Clock()
+    monkeypatch.setattr(http_client.time, 'monotonic', clock)
+    return http_client.CircuitBreaker(threshold=threshold, reset_after=reset_after), clock
+
+
+def test_opens_after_threshold_consecutive_failures(monkeypatch):
+    circuit, _ = breaker(monkeypatch)
+
+    circuit.record(HOST, ok=False)
+    assert circuit.allow(HOST) and not circuit.is_open(HOST)
+
+    circuit.record(HOST, ok=False)
+    assert circuit.is_open(HOST)
+    assert not circuit.allow(HOST)
+    assert circuit.allow('tampaspartans.com')
+
+
+def test_success_resets_the_failure_count(monkeypatch):
+    circuit, _ = breaker(monkeypatch)
+
+    circuit.record(HOST, ok=False)
+    circuit.record(HOST, ok=True)
+    circuit.record(HOST, ok=False)
+
+    assert not circuit.is_open(HOST)
+
+
+def test_half_open_lets_one_trial_through(monkeypatch):
+    circuit, clock = breaker(monkeypatch)
+    circuit.record(HOST, ok=False)
+    circuit.record(HOST, ok=False)
+
+    clock.now += 29
+    assert not circuit.allow(HOST)
+
+    clock.now += 1
+    assert circuit.allow(HOST)
+    assert not circuit.allow(HOST)  # the rest wait for the trial
+
+
+def test_failed_trial_reopens_and_successful_trial_closes(monkeypatch):
+    circuit, clock = breaker(monkeypatch)
+    circuit.record(HOST, ok=False)
+    circuit.record(HOST, ok=False)
+
+    clock.now += 30
+    assert circuit.allow(HOST)
+    circuit.record(HOST, ok=False)
+    clock.now += 29
+    assert not circuit.allow(HOST)
+
+    clock.now += 1
+    assert circuit.allow(HOST)
+    circuit.record(HOST, ok=True)
+    assert not circuit.is_open(HOST)
+    assert circuit.allow(HOST) and circuit.allow(HOST)
@@ -0,0 +1,63 @@
+"""Page fan-out and the sequential fallback for NCAA stat tables."""
+
+import asyncio
+
+import http_cache
+import paginated_table
+
+URL = 'https://www.ncaa.com/stats/baseball/d1/current/team/211'
+
+
+def page(rows, pager=''):
+    body = ''.join(f'<tr><td>{team}</td><td>{value}</td></tr>' for team, value in rows)
+    return f'<html>{pager}<table><tr><th>Team</th><th>HR</th></tr>{body}</table></html>'
+
+
+class FakeFetcher:
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested = []
+
+    async def fetch(self, url):
+        self.requested.append(url)
+        if url not in self.pages:
+            return http_cache.CachedResponse(url, 404, {}, b'', from_cache=False)
+        return http_cache.CachedResponse(url, 200, {}, self.pages[url].encode(), from_cache=True)
+
+
+def test_pages_without_a_pager_are_walked_until_one_is_missing():
+    fetcher = FakeFetcher({
+        URL: page([('Arkansas', 90)]),
+        f'{URL}/p2': page([('LSU', 85)]),
+        f'{URL}/p3': page([('Tennessee', 80)]),
+    })
+
+    df = asyncio.run(paginated_table.fetch_paginated_table(fetcher, URL))
+
+    assert fetcher.requested == [URL, f'{URL}/p2', f'{URL}/p3', f'{URL}/p4']
+    assert df['Team'].tolist() == ['Arkansas', 'LSU', 'Tennessee']
+    assert df['HR'].tolist() == [90, 85, 80]
+
+
+def test_sequential_walk_stops_at_max_pages():
+    fetcher = FakeFetcher({URL: page([('Arkansas', 90)]), f'{URL}/p2': page([('LSU', 85)]),
+                           f'{URL}/p3': page([('Tennessee', 80)])})
+
+    df = asyncio.run(paginated_table.fetch_paginated_table(fetcher, URL, max_pages=2))
+
+    assert fetcher.requested == [URL, f'{URL}/p2']
+    assert df['Team'].tolist() == ['Arkansas', 'LSU']
+
+
+def test_pager_fans_out_and_keeps_page_order():
+    pager = f'<a href="/stats/baseball/d1/current/team/211/p2">2</a><a href="{URL}/p3">3</a>'
+    fetcher = FakeFetcher({
+        URL: page([('Arkansas', 90)], pager),
+        f'{URL}/p2': page([('LSU', 85)]),
+        f'{URL}/p3': page([('Tennessee', 80)]),
+    })
+
+    df = asyncio.run(paginated_table.fetch_paginated_table(fetcher, URL))
+
+    assert sorted(fetcher.requested) == sorted([URL, f'{URL}/p2', f'{URL}/p3'])
+    assert df['Team'].tolist() == ['Arkansas', 'LSU', 'Tennessee']
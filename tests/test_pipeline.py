@@ -0,0 +1,62 @@
+"""Stage planning against the store."""
+
+import pytest
+
+import data_store
+import pipeline
+import scrape_data
+
+
+def stored(monkeypatch, *datasets):
+    monkeypatch.setattr(data_store, 'is_complete',
+                        lambda dataset, division, season, scrape_date: dataset in datasets)
+
+
+def noop(division, season, **inputs):
+    return None
+
+
+def test_stored_outputs_are_reused_and_their_inputs_skipped(monkeypatch):
+    stored(monkeypatch, 'rpi_projected', 'rpi_live', 'rpi_ncaa', 'elo', 'schedules')
+
+    to_run, to_load = pipeline.plan(pipeline.STAGES, season=scrape_data.CURRENT_SEASON)
+
+    assert to_run == ['stat_links', 'stats']
+    assert to_load == []
+
+
+def test_stored_input_is_loaded_only_for_a_stage_that_runs(monkeypatch):
+    stages = [pipeline.Stage('ratings', noop, dataset='ratings'),
+              pipeline.Stage('report', noop, inputs=['ratings'], dataset='report'),
+              pipeline.Stage('archive', noop, dataset='archive')]
+    stored(monkeypatch, 'ratings', 'archive')
+
+    assert pipeline.plan(stages) == (['report'], ['ratings'])
+    assert pipeline.plan(stages, targets=['archive']) == ([], [])
+    assert pipeline.plan(stages, rerun=['archive']) == (['report', 'archive'], ['ratings'])
+
+
+def test_force_runs_every_stage(monkeypatch):
+    stored(monkeypatch, 'rpi_projected', 'rpi_live', 'rpi_ncaa', 'elo', 'stats', 'schedules')
+
+    to_run, to_load = pipeline.plan(pipeline.STAGES, force=True, season=scrape_data.CURRENT_SEASON)
+
+    assert to_run == [stage.name for stage in pipeline.STAGES]
+    assert to_load == []
+
+
+def test_past_season_leaves_out_current_only_stages(monkeypatch):
+    stored(monkeypatch)
+    past = scrape_data.CURRENT_SEASON - 1
+
+    to_run, _ = pipeline.plan(pipeline.STAGES, season=past)
+
+    assert to_run == ['rpi_projected', 'rpi_live', 'elo_table', 'elo', 'schedules']
+    with pytest.raises(ValueError, match='current season'):
+        pipeline.plan(pipeline.STAGES, targets=['stats'], season=past)
+
+
+def test_unknown_stage_is_rejected(monkeypatch):
+    stored(monkeypatch)
+    with pytest.raises(ValueError, match='Unknown stages'):
+        pipeline.plan(pipeline.STAGES, targets=['standings'])
@@ -0,0 +1,81 @@
+"""Token bucket pacing and governor cooldowns on a fake clock."""
+
+import threading
+
+import rate_limit
+
+
+class Clock:
+    """Stands in for the time module: sleep() advances monotonic()."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.lock = threading.Lock()
+
+    def monotonic(self):
+        with self.lock:
+            return self.now
+
+    def sleep(self, seconds):
+        with self.lock:
+            self.now += max(seconds, 0)
+
+
+def clock(monkeypatch):
+    fake = Clock()
+    monkeypatch.setattr(rate_limit, 'time', fake)
+    return fake
+
+
+def test_bucket_allows_a_burst_then_paces_at_the_rate(monkeypatch):
+    fake = clock(monkeypatch)
+    bucket = rate_limit.TokenBucket(rate=2, burst=2)
+
+    waits = [round(bucket.acquire(), 3) for _ in range(4)]
+
+    assert waits == [0, 0, 0.5, 0.5]
+    assert fake.now == 101.0
+
+
+def test_bucket_refills_while_idle_up_to_the_burst(monkeypatch):
+    fake = clock(monkeypatch)
+    bucket = rate_limit.TokenBucket(rate=1, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+
+    fake.sleep(10)
+
+    assert [round(bucket.acquire(), 3) for _ in range(3)] == [0, 0, 1.0]
+
+
+def test_jitter_is_added_after_each_grant(monkeypatch):
+    clock(monkeypatch)
+    monkeypatch.setattr(rate_limit.random, 'uniform', lambda low, high: high)
+    bucket = rate_limit.TokenBucket(rate=100, burst=1, jitter=(0.1, 5.0))
+
+    assert bucket.acquire() == 5.0
+
+
+def test_governor_cools_down_after_each_batch_of_teams(monkeypatch):
+    fake = clock(monkeypatch)
+    governor = rate_limit.RateGovernor(rate=1000, burst=10, batch_size=2, cooldown=120)
+
+    for _ in range(3):  # one team can take several requests
+        assert governor.acquire() == 0
+    governor.complete()
+    assert governor.acquire() == 0
+    governor.complete()
+
+    assert governor.acquire() == 120
+    assert fake.now == 220.0
+    governor.complete()
+    assert governor.acquire() == 0
+
+
+def test_governor_without_batch_size_never_cools_down(monkeypatch):
+    clock(monkeypatch)
+    governor = rate_limit.RateGovernor(rate=1000, burst=10)
+
+    for _ in range(5):
+        governor.complete()
+        assert governor.acquire() == 0
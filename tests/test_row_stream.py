@@ -0,0 +1,63 @@
+"""Failures, sink errors and exactly-once delivery in the streaming pipeline."""
+
+import threading
+
+import pytest
+
+import row_stream
+
+
+def jobs(n):
+    return [(f'team{i}', f'https://example.edu/{i}') for i in range(n)]
+
+
+def test_every_key_is_written_exactly_once():
+    written = []
+
+    result = row_stream.stream(jobs(200), fetch=lambda key, url: url,
+                               parse=lambda key, page: [key, page],
+                               sink=lambda key, rows: written.append(key),
+                               fetch_workers=8, parse_workers=3, queue_size=4)
+
+    assert result == {'written': 200, 'failed': []}
+    assert sorted(written) == sorted(key for key, _ in jobs(200))
+
+
+def test_failed_fetches_and_parses_are_reported_and_skipped():
+    def fetch(key, url):
+        if key == 'team1':
+            raise ConnectionError('refused')
+        return url
+
+    def parse(key, page):
+        if key == 'team2':
+            raise ValueError('no schedule table')
+        return [page]
+
+    written = []
+    result = row_stream.stream(jobs(5), fetch, parse, lambda key, rows: written.append(key))
+
+    assert sorted(written) == ['team0', 'team3', 'team4']
+    assert result['written'] == 3
+    assert sorted(result['failed']) == [('team1', 'refused'), ('team2', 'no schedule table')]
+
+
+def test_sink_error_stops_the_workers_and_propagates():
+    fetched = []
+    lock = threading.Lock()
+
+    def fetch(key, url):
+        with lock:
+            fetched.append(key)
+        return url
+
+    def sink(key, rows):
+        raise OSError('disk full')
+
+    threads_before = threading.active_count()
+    with pytest.raises(OSError, match='disk full'):
+        row_stream.stream(jobs(1000), fetch, lambda key, page: [page], sink,
+                          fetch_workers=2, parse_workers=1, queue_size=2)
+
+    assert threading.active_count() == threads_before
+    assert len(fetched) < 1000
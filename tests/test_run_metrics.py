@@ -0,0 +1,79 @@
+"""Stage labels across threads and the JSON / Prometheus output."""
+
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import row_stream
+import run_metrics
+
+
+def stages(metrics, kind):
+    return sorted(stage for stage, span_kind in metrics.spans if span_kind == kind)
+
+
+def test_worker_threads_record_spans_under_the_callers_stage(monkeypatch):
+    metrics = run_metrics.RunMetrics(profile_stages=[])
+    monkeypatch.setattr(run_metrics, 'metrics', metrics)
+
+    def fetch(key, url):
+        with run_metrics.span('fetch'):
+            return url
+
+    with run_metrics.stage('schedules'):
+        row_stream.stream([('Augusta', 'https://augustajags.com')], fetch,
+                          lambda key, page: [page], lambda key, rows: None)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(run_metrics.bind(lambda _: fetch(None, None)), range(4)))
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(fetch, None, None).result()
+
+    assert metrics.spans[('schedules', 'fetch')][0] == 5
+    assert stages(metrics, 'fetch') == ['-', 'schedules']
+
+
+def prometheus_samples(text):
+    """{(name, frozenset(labels)): value} for every sample line."""
+    samples = {}
+    for line in text.splitlines():
+        if not line or line.startswith('#'):
+            continue
+        metric, value = line.rsplit(' ', 1)
+        name, _, labels = metric.partition('{')
+        pairs = re.findall(r'(\w+)="((?:[^"\\]|\\.)*)"', labels)
+        samples[(name, frozenset(pairs))] = float(value)
+    return samples
+
+
+def test_write_outputs_histograms_and_cache_counters(tmp_path):
+    metrics = run_metrics.RunMetrics(profile_stages=[])
+    for seconds in (0.01, 0.3, 0.3, 45.0):
+        metrics.observe_request('https://stats.ncaa.org/teams/1', seconds, 200, nbytes=100)
+    metrics.observe_request('https://stats.ncaa.org/teams/2', 0.2, 503, via='aiohttp')
+    for result in ('fresh', 'fresh', 'revalidated', 'miss'):
+        metrics.cache_result(result)
+    metrics.add_span('fetch', 1.5, stage='stats')
+    metrics.count('sidearm_teams_selenium', 3)
+
+    json_path, prom_path = metrics.write(str(tmp_path), name='run')
+
+    with open(prom_path) as f:
+        samples = prometheus_samples(f.read())
+    host = ('host', 'stats.ncaa.org')
+
+    def bucket(le):
+        return samples[('pear_request_duration_seconds_bucket', frozenset([host, ('le', le)]))]
+
+    assert [bucket(le) for le in ('0.05', '0.1', '0.25', '0.5', '30.0', '+Inf')] == [1, 1, 2, 4, 4, 5]
+    assert samples[('pear_request_duration_seconds_count', frozenset([host]))] == 5
+    assert samples[('pear_request_duration_seconds_sum', frozenset([host]))] == 45.81
+    assert samples[('pear_request_errors_total', frozenset([host]))] == 1
+    assert samples[('pear_request_bytes_total', frozenset([host]))] == 400
+    assert samples[('pear_requests_total', frozenset([host, ('via', 'aiohttp')]))] == 1
+    assert samples[('pear_cache_lookups_total', frozenset([('result', 'fresh')]))] == 2
+    assert samples[('pear_cache_lookups_total', frozenset([('result', 'miss')]))] == 1
+    assert samples[('pear_span_seconds_total', frozenset([('stage', 'stats'), ('kind', 'fetch')]))] == 1.5
+    assert samples[('pear_events_total', frozenset([('name', 'sidearm_teams_selenium')]))] == 3
+
+    with open(json_path) as f:
+        assert json.load(f)['cache']['hit_rate'] == 0.75
@@ -0,0 +1,63 @@
+"""Snapshot merges and full sweeps."""
+
+import pandas as pd
+
+import schedule_snapshot
+
+COLUMNS = ['Team', 'Date', 'Opponent', 'Result']
+
+
+def snapshot(tmp_path, monkeypatch):
+    monkeypatch.setattr(schedule_snapshot, 'snapshot_path',
+                        lambda division, year: str(tmp_path / f'{division}_{year}.pkl'))
+    return schedule_snapshot.ScheduleSnapshot('D1', 2025)
+
+
+def test_merge_replaces_refreshed_teams_only(tmp_path, monkeypatch):
+    snap = snapshot(tmp_path, monkeypatch)
+    snap.merge(pd.DataFrame([['Augusta', 'Feb 14 (Fri)', 'Tampa', '3:00 PM'],
+                             ['Lander', 'Feb 14 (Fri)', 'Flagler', '3:00 PM']], columns=COLUMNS),
+               ['Augusta', 'Lander'], full_sweep=True)
+
+    diff = snap.merge(pd.DataFrame([['Augusta', 'Feb 14 (Fri)', 'Tampa', 'W 5-3']], columns=COLUMNS),
+                      ['Augusta'])
+
+    assert diff == {'added': 0, 'removed': 0, 'changed': 1, 'teams': 1}
+    assert sorted(snap.rows['Result']) == ['3:00 PM', 'W 5-3']
+    assert snap.markers['Augusta']['next_scheduled'] is pd.NaT
+
+
+def test_empty_full_sweep_is_not_recorded(tmp_path, monkeypatch):
+    snap = snapshot(tmp_path, monkeypatch)
+    assert snap.needs_full_sweep()
+
+    snap.merge(pd.DataFrame(columns=COLUMNS), ['Augusta'], full_sweep=True)
+
+    assert snap.needs_full_sweep()
+
+
+def test_tba_results_are_still_scheduled(tmp_path, monkeypatch):
+    markers = schedule_snapshot.build_markers(pd.DataFrame([
+        ['Augusta', 'Feb 14 (Fri)', 'Tampa', 'W, 5-3'],
+        ['Augusta', 'Feb 15 (Sat)', 'Tampa', 'TBA'],
+        ['Augusta', 'Feb 16 (Sun)', 'Tampa', 'TBD'],
+    ], columns=COLUMNS), 2025)
+
+    assert markers['Augusta']['last_completed'] == pd.Timestamp('2025-02-14')
+    assert markers['Augusta']['next_scheduled'] == pd.Timestamp('2025-02-15')
+
+    snap = snapshot(tmp_path, monkeypatch)
+    snap.merge(pd.DataFrame([['Augusta', 'Feb 15 (Sat)', 'Tampa', 'TBA']], columns=COLUMNS),
+               ['Augusta'], full_sweep=True)
+    assert snap.teams_to_refresh(['Augusta'], today='2025-02-16') == ['Augusta']
+
+
+def test_canceled_games_are_not_scheduled(tmp_path, monkeypatch):
+    snap = snapshot(tmp_path, monkeypatch)
+    snap.merge(pd.DataFrame([['Augusta', 'Feb 14 (Fri)', 'Tampa', 'Canceled'],
+                             ['Augusta', 'Feb 15 (Sat)', 'Tampa', 'Postponed'],
+                             ['Lander', 'Feb 14 (Fri)', 'Flagler', 'L 2-4']], columns=COLUMNS),
+               ['Augusta', 'Lander'], full_sweep=True)
+
+    assert snap.markers['Augusta']['next_scheduled'] is pd.NaT
+    assert snap.teams_to_refresh(['Augusta', 'Lander'], today='2025-03-01') == []
@@ -0,0 +1,38 @@
+"""Stat frame merging."""
+
+import pandas as pd
+
+import scrape_data
+
+
+def test_clean_and_merge_suffixes_shared_columns_like_pd_merge():
+    teams = ['Arkansas ', 'LSU', 'Tennessee']
+    stats_raw = {
+        'Runs': pd.DataFrame({'Team': teams, 'RS': [400, 380, 420], 'HBP': [60, 55, 70]}),
+        'Earned Run Average': pd.DataFrame({'Team': teams, 'RA': [250, 260, 240], 'HBP': [40, 45, 30]}),
+        'Slugging Percentage': pd.DataFrame({'Team': teams, 'SLG': [0.48, 0.46, 0.50]}),
+        'On Base Percentage': pd.DataFrame({'Team': teams, 'OBP': [0.39, 0.38, 0.40]}),
+    }
+    transforms = {stat: (lambda df: df) for stat in stats_raw}
+
+    merged = scrape_data.clean_and_merge(stats_raw, transforms)
+
+    assert merged.columns.tolist() == ['Team', 'RS', 'HBP_x', 'RA', 'HBP_y', 'SLG', 'OBP', 'OPS', 'PYTHAG']
+    assert merged['Team'].tolist() == ['Arkansas', 'LSU', 'Tennessee']
+    assert merged['HBP_x'].tolist() == [60, 55, 70]
+    assert merged['HBP_y'].tolist() == [40, 45, 30]
+
+
+def test_clean_and_merge_reports_duplicate_team_rows(capsys):
+    stats_raw = {
+        'Runs': pd.DataFrame({'Team': ['LSU', 'LSU ', 'Tennessee'], 'RS': [380, 10, 420]}),
+        'Earned Run Average': pd.DataFrame({'Team': ['LSU', 'Tennessee'], 'RA': [260, 240]}),
+        'Slugging Percentage': pd.DataFrame({'Team': ['LSU', 'Tennessee'], 'SLG': [0.46, 0.50]}),
+        'On Base Percentage': pd.DataFrame({'Team': ['LSU', 'Tennessee'], 'OBP': [0.38, 0.40]}),
+    }
+    transforms = {stat: (lambda df: df) for stat in stats_raw}
+
+    merged = scrape_data.clean_and_merge(stats_raw, transforms)
+
+    assert merged['RS'].tolist() == [380, 420]
+    assert "[Runs] dropped duplicate rows for ['LSU']" in capsys.readouterr().out
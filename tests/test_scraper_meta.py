@@ -0,0 +1,99 @@
+"""Trust rules, expiry and concurrent writes for stored Sidearm probe results."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import scraper_meta
+
+URL = 'https://augustajags.com/sports/baseball/schedule/2025'
+
+
+def meta(tmp_path):
+    return scraper_meta.ScraperMeta(str(tmp_path / 'meta.sqlite'))
+
+
+def test_dynamic_page_is_a_trusted_negative_with_its_own_ttl(tmp_path):
+    store = meta(tmp_path)
+    store.record_probe('Augusta', URL, 'unknown', static=False, games=0)
+
+    entry = store.get('Augusta', URL)
+    assert entry['format'] == scraper_meta.DYNAMIC
+    assert store.is_trusted(entry)
+    assert not store.is_trusted(entry, now=entry['last_probe'] + scraper_meta.DYNAMIC_TTL)
+    assert store.stale_teams({'Augusta': URL}) == []
+
+
+def test_a_good_entry_survives_a_transient_failure(tmp_path):
+    store = meta(tmp_path)
+    store.record_probe('Augusta', URL, 'v2', static=True, games=50)
+
+    for _ in range(scraper_meta.MAX_FAILURES - 1):
+        store.record_failure('Augusta', URL, 'Request timeout')
+    assert store.is_trusted(store.get('Augusta', URL))
+
+    store.record_failure('Augusta', URL, 'Request timeout')
+    assert not store.is_trusted(store.get('Augusta', URL))
+
+    store.record_success('Augusta', URL, 'v2')
+    assert store.is_trusted(store.get('Augusta', URL))
+
+
+def test_entries_expire_after_the_ttl(tmp_path):
+    store = meta(tmp_path)
+    store.record_probe('Augusta', URL, 'v1', static=True, games=40)
+    entry = store.get('Augusta', URL)
+
+    assert store.is_trusted(entry, now=entry['last_probe'] + store.ttl - 1)
+    assert not store.is_trusted(entry, now=entry['last_probe'] + store.ttl)
+
+
+def test_entries_from_another_schema_version_are_not_trusted(tmp_path, monkeypatch):
+    store = meta(tmp_path)
+    store.record_probe('Augusta', URL, 'v1', static=True, games=40)
+
+    monkeypatch.setattr(scraper_meta, 'SCHEMA_VERSION', scraper_meta.SCHEMA_VERSION + 1)
+
+    assert not store.is_trusted(store.get('Augusta', URL))
+    assert store.stale_teams({'Augusta': URL}) == ['Augusta']
+
+
+def test_failures_count_up_and_reset_on_success(tmp_path):
+    store = meta(tmp_path)
+    store.record_failure('Augusta', URL, 'HTTP 503')
+    store.record_failure('Augusta', URL, 'HTTP 404')
+
+    entry = store.get('Augusta', URL)
+    assert (entry['failures'], entry['last_error']) == (2, 'HTTP 404')
+
+    store.record_success('Augusta', URL, 'v3')
+    entry = store.get('Augusta', URL)
+    assert (entry['failures'], entry['last_error'], entry['format']) == (0, None, 'v3')
+
+
+def test_stale_teams_are_new_failing_or_moved(tmp_path):
+    store = meta(tmp_path)
+    url_dict = {team: f'https://{team.lower()}.edu/schedule' for team in ['Augusta', 'Lander', 'Tampa', 'Flagler']}
+    store.record_probe('Augusta', url_dict['Augusta'], 'v1', static=True, games=40)
+    store.record_probe('Lander', url_dict['Lander'], 'v2', static=True, games=40)
+    for _ in range(scraper_meta.MAX_FAILURES):
+        store.record_failure('Lander', url_dict['Lander'], 'HTTP 500')
+    store.record_probe('Tampa', 'https://old.tampa.edu/schedule', 'v1', static=True, games=40)
+
+    assert store.stale_teams(url_dict) == ['Lander', 'Tampa', 'Flagler']
+
+
+def test_concurrent_writes_from_worker_threads(tmp_path):
+    store = meta(tmp_path)
+    teams = [f'Team {i}' for i in range(40)]
+
+    def record(team):
+        store.record_probe(team, URL, 'v2', static=True, games=30)
+        store.record_failure(team, URL, 'HTTP 503')
+        store.record_success(team, URL, 'v2')
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(record, teams))
+
+    entries = store.entries()
+    assert len(entries) == 40
+    assert all(entry['format'] == 'v2' and entry['failures'] == 0 for entry in entries.values())
+    assert store.stale_teams({team: URL for team in teams}) == []
@@ -0,0 +1,213 @@
+"""Sidearm JSON-LD / .ics parsing against saved schedule pages (tests/fixtures/sidearm)."""
+
+import os
+
+import pytest
+
+import sidearm_data
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'sidearm')
+PAGE_URL = 'https://augustajags.com/sports/baseball/schedule/2025'
+ICS_URL = 'https://augustajags.com/services/calendar.ashx?schedule=1234&type=ics'
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+class FakeResponse:
+    def __init__(self, text, status_code=200):
+        self.text = text
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise ValueError(f"HTTP {self.status_code}")
+
+
+def fetch_ics(url):
+    assert url == ICS_URL
+    return FakeResponse(read_fixture('augusta.ics'))
+
+
+def by_opponent(rows):
+    return {row['Opponent']: row for row in rows}
+
+
+####################### find_sources #######################
+
+def test_find_sources_collects_nested_jsonld_events():
+    sources = sidearm_data.find_sources(read_fixture('augusta_jsonld.html'), PAGE_URL)
+
+    assert [kind for kind, _ in sources] == ['jsonld']
+    events = sources[0][1]
+    assert len(events) == 5  # the Organization block is ignored, the ItemList event is found
+    assert all('SportsEvent' in event['@type'] for event in events)
+
+
+def test_find_sources_resolves_ics_link():
+    sources = sidearm_data.find_sources(read_fixture('augusta_ics.html'), PAGE_URL)
+
+    assert [kind for kind, _ in sources] == ['jsonld', 'ics']
+    assert sources[1][1] == ICS_URL
+
+
+def test_find_sources_plain_page_has_none():
+    assert sidearm_data.find_sources('<html><body><p>Schedule</p></body></html>', PAGE_URL) == []
+
+
+####################### parse_jsonld_events #######################
+
+@pytest.fixture
+def jsonld_rows():
+    events = sidearm_data.find_sources(read_fixture('augusta_jsonld.html'), PAGE_URL)[0][1]
+    return by_opponent(sidearm_data.parse_jsonld_events(events, 'Augusta'))
+
+
+def test_jsonld_home_win(jsonld_rows):
+    game = jsonld_rows['No. 15 Tampa']
+    assert game['Location'] == 'Home'
+    assert (game['home_team'], game['away_team']) == ('Augusta', 'No. 15 Tampa')
+    assert game['Result'] == 'W5-3'
+    assert (game['home_score'], game['away_score']) == (5, 3)
+    assert game['Date'] == 'Feb 14 (Fri)'
+
+
+def test_jsonld_away_loss_orders_scores(jsonld_rows):
+    # "L, 7-2" is written winner first: Augusta scored 2 on the road
+    game = jsonld_rows['Lander']
+    assert game['Location'] == 'Away'
+    assert (game['home_team'], game['away_team']) == ('Lander', 'Augusta')
+    assert game['Result'] == 'L2-7'
+    assert (game['home_score'], game['away_score']) == (7, 2)
+
+
+def test_jsonld_night_game_keeps_local_date(jsonld_rows):
+    # 00:30 UTC on Feb 19 is 6:30 pm on Feb 18 in US time
+    assert jsonld_rows['Lander']['Date'] == 'Feb 18 (Tue)'
+    assert jsonld_rows['Georgia College']['Date'] == 'Apr 25 (Fri)'
+
+
+def test_jsonld_matchup_from_event_name(jsonld_rows):
+    game = jsonld_rows['Columbus State']
+    assert game['Location'] == 'Away'
+    assert game['Result'] == 'L4-6'
+    assert (game['home_score'], game['away_score']) == (6, 4)
+    assert game['Date'] == 'Mar 1 (Sat)'
+
+
+def test_jsonld_canceled_and_unplayed(jsonld_rows):
+    assert jsonld_rows['Flagler']['Result'] == 'Canceled'
+    assert jsonld_rows['Flagler']['Date'] == 'Mar 8 (Sat)'
+    assert jsonld_rows['Flagler']['home_score'] is None
+    assert jsonld_rows['Georgia College']['Result'] is None
+
+
+def test_jsonld_skips_events_without_date_or_matchup():
+    events = [{'@type': 'SportsEvent', 'name': 'Augusta vs Tampa'},
+              {'@type': 'SportsEvent', 'name': 'Alumni Day', 'startDate': '2025-02-01'}]
+    assert sidearm_data.parse_jsonld_events(events, 'Augusta') == []
+
+
+####################### parse_ics #######################
+
+@pytest.fixture
+def ics_rows():
+    return by_opponent(sidearm_data.parse_ics(read_fixture('augusta.ics'), 'Augusta'))
+
+
+def test_ics_home_win(ics_rows):
+    game = ics_rows['Tampa']
+    assert game['Location'] == 'Home'
+    assert game['Result'] == 'W6-2'
+    assert (game['home_score'], game['away_score']) == (6, 2)
+    # 00:30 UTC on Feb 15 is the evening of Feb 14 locally
+    assert game['Date'] == 'Feb 14 (Fri)'
+
+
+def test_ics_away_loss_all_day_event(ics_rows):
+    game = ics_rows['Lander']
+    assert game['Location'] == 'Away'
+    assert (game['home_team'], game['away_team']) == ('Lander', 'Augusta')
+    assert game['Result'] == 'L1-3'
+    assert (game['home_score'], game['away_score']) == (3, 1)
+    assert game['Date'] == 'Feb 22 (Sat)'
+
+
+def test_ics_folded_canceled_game(ics_rows):
+    assert ics_rows['Flagler']['Result'] == 'Canceled'
+    assert ics_rows['Flagler']['Location'] == 'Home'
+
+
+def test_ics_unplayed_game(ics_rows):
+    assert ics_rows['Georgia College']['Result'] is None
+    assert ics_rows['Georgia College']['Location'] == 'Away'
+
+
+####################### parse_sources #######################
+
+def test_parse_sources_prefers_jsonld():
+    sources = sidearm_data.find_sources(read_fixture('augusta_jsonld.html'), PAGE_URL)
+    df, kind = sidearm_data.parse_sources(sources, 'Augusta', fetch=fetch_ics)
+
+    assert kind == 'jsonld'
+    assert list(df.columns) == sidearm_data.COLUMNS
+    assert len(df) == 5
+
+
+def test_parse_sources_falls_back_to_ics_when_jsonld_is_too_short():
+    # The ics page only has a single "next game" JSON-LD item
+    sources = sidearm_data.find_sources(read_fixture('augusta_ics.html'), PAGE_URL)
+    df, kind = sidearm_data.parse_sources(sources, 'Augusta', fetch=fetch_ics)
+
+    assert kind == 'ics'
+    assert sorted(df['Opponent']) == ['Flagler', 'Georgia College', 'Lander', 'Tampa']
+
+
+def test_parse_sources_standardizes_opponents():
+    sources = sidearm_data.find_sources(read_fixture('augusta_jsonld.html'), PAGE_URL)
+    df, _ = sidearm_data.parse_sources(sources, 'Augusta', fetch=fetch_ics,
+                                       standardize=lambda name: name.replace('No. 15 ', ''))
+
+    tampa = df[df['Opponent'] == 'Tampa'].iloc[0]
+    assert (tampa['home_team'], tampa['away_team']) == ('Augusta', 'Tampa')
+
+
+def test_parse_sources_raises_without_usable_source():
+    def failing_fetch(url):
+        return FakeResponse('', status_code=404)
+
+    sources = sidearm_data.find_sources(read_fixture('augusta_ics.html'), PAGE_URL)
+    with pytest.raises(ValueError):
+        sidearm_data.parse_sources(sources, 'Augusta', fetch=failing_fetch)
+    with pytest.raises(ValueError):
+        sidearm_data.parse_sources([], 'Augusta', fetch=failing_fetch)
+
+
+####################### scrape_sidearm_data_sources #######################
+
+def test_scrape_sidearm_data_sources_jsonld_page():
+    import d2_schedule_scrape
+
+    df, kind = d2_schedule_scrape.scrape_sidearm_data_sources(
+        'Augusta', PAGE_URL, html=read_fixture('augusta_jsonld.html'))
+
+    assert kind == 'jsonld'
+    # Rankings are stripped from opponent names
+    assert 'Tampa' in set(df['Opponent'])
+    tampa = df[df['Opponent'] == 'Tampa'].iloc[0]
+    assert (tampa['home_team'], tampa['home_score'], tampa['away_score']) == ('Augusta', 5, 3)
+
+
+def test_scrape_sidearm_data_sources_fetches_ics(monkeypatch):
+    import d2_schedule_scrape
+
+    monkeypatch.setattr(d2_schedule_scrape.http_cache, 'get',
+                        lambda url, **kwargs: fetch_ics(url))
+    df, kind = d2_schedule_scrape.scrape_sidearm_data_sources(
+        'Augusta', PAGE_URL, html=read_fixture('augusta_ics.html'))
+
+    assert kind == 'ics'
+    assert len(df) == 4
+    assert df.loc[df['Opponent'] == 'Flagler', 'Result'].iloc[0] == 'Canceled'
@@ -0,0 +1,66 @@
+"""Team name resolution: aliases, trigram matches and the cache."""
+
+import json
+
+import pytest
+
+import team_registry
+
+
+@pytest.fixture
+def paths(tmp_path):
+    csv_path = tmp_path / 'team_ids.csv'
+    csv_path.write_text('team_id,team_name\n1,Southern Miss.\n2,Arkansas\n3,Mississippi St.\n')
+    return str(csv_path), str(tmp_path / 'cache' / 'team_registry_cache.json')
+
+
+def test_exact_and_alias_hits(paths):
+    registry = team_registry.TeamRegistry(*paths)
+
+    assert registry.resolve('Arkansas', fuzzy=False) == 2
+    assert registry.resolve('Mississippi State', fuzzy=False) == 3
+    assert registry.resolve('Southern Miss', source='warrennolan', fuzzy=False) == 1
+    assert registry.resolve('Wingate University', source='school_sites', fuzzy=False) < 0
+    assert registry.cache == {}
+
+
+def test_names_missing_from_the_csv_get_stable_negative_ids(paths):
+    registry = team_registry.TeamRegistry(*paths)
+
+    team_id = registry.resolve('North Carolina St.', source='warrennolan', fuzzy=False)
+
+    assert team_id == team_registry._synthetic_id('NC State') < 0
+    assert registry.names[team_id] == 'NC State'
+
+
+def test_fuzzy_hit_is_cached(paths):
+    registry = team_registry.TeamRegistry(*paths)
+
+    assert registry.candidates('Missisippi St', limit=1) == [('Mississippi St.', 3, 0.929)]
+    assert registry.resolve('Missisippi St', fuzzy=False) is None
+    assert registry.resolve('Missisippi St') == 3
+    assert registry.cache == {'Missisippi St': 3}
+
+
+def test_match_below_the_threshold_is_rejected(paths):
+    registry = team_registry.TeamRegistry(*paths)
+
+    assert registry.candidates('Arkansass', limit=1)[0][2] < 0.75
+    assert registry.resolve('Arkansass') is None
+    assert registry.resolve('Arkansass', min_score=0.7) == 2
+    assert registry.resolve('Zzyzx Tech') is None
+    assert 'Zzyzx Tech' not in registry.cache
+
+
+def test_cache_round_trip(paths):
+    csv_path, cache_path = paths
+    registry = team_registry.TeamRegistry(csv_path, cache_path)
+    registry.save_cache()
+    assert not registry._cache_dirty  # nothing to write yet
+
+    registry.resolve('Southern Mis.')
+    registry.save_cache()
+
+    with open(cache_path) as f:
+        assert json.load(f) == {'Southern Mis.': 1}
+    assert team_registry.TeamRegistry(csv_path, cache_path).resolve('Southern Mis.', fuzzy=False) == 1